@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -249,9 +249,13 @@ class BOSV2Client(BOSClientCommon):
 
         self.put(self.session_template_path, name, json=session_template_data)
 
-    def get_components(self):
+    def get_components(self, params=None):
         """Get the full collection of components from BOS v2.
 
+        Args:
+            params (dict or None): query parameters which narrow the
+                components returned, e.g. {'ids': 'x1000c0s0b0n0,x1000c0s0b0n1'}
+
         Returns:
             list of dict: components managed by BOS v2
 
@@ -260,7 +264,7 @@ class BOSV2Client(BOSClientCommon):
                 v2
         """
         try:
-            return self.get('components').json()
+            return self.get('components', params=params).json()
         except APIError as err:
             raise APIError(f'Failed to get BOS components: {err}')
         except ValueError as err:
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -83,3 +83,25 @@ def build_out_subparsers(subparser_hook):
 
     for builder in parser_builders:
         builder(subparser_hook)
+
+
+def get_subcommand_function(command):
+    """Get the function which runs a subcommand.
+
+    The subcommand module is imported when this is called, so that only the
+    code relevant to the subcommands which are run is imported.
+
+    Args:
+        command (str): the name of the subcommand.
+
+    Returns:
+        The function `sat.cli.<command>.main.do_<command>`, which takes the
+        parsed arguments as its only argument.
+
+    Raises:
+        AttributeError: if the subcommand module has no such function.
+    """
+    subcommand_module = importlib.import_module('sat.cli.{}.main'.format(command))
+    # Subcommand main-routines need to follow a naming convention
+    # of do_<subcommand>.
+    return getattr(subcommand_module, 'do_{}'.format(command))
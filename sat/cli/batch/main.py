@@ -0,0 +1,310 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Entry point for the batch subcommand.
+"""
+from collections import namedtuple
+import logging
+import shlex
+import sys
+import time
+
+from oauthlib.oauth2 import InvalidGrantError
+import yaml
+
+from sat.cli import get_subcommand_function
+from sat.config import command_line_overrides
+from sat.parser import create_parent_parser
+from sat.report import Report
+from sat.session import share_all_sessions
+
+LOGGER = logging.getLogger(__name__)
+
+ERR_COMMAND_FAILED = 1
+ERR_INVALID_BATCH = 2
+
+# Subcommands which cannot be run in a batch. The auth and init subcommands
+# create the token and config file which the batch has already loaded.
+UNSUPPORTED_COMMANDS = ('auth', 'batch', 'init')
+
+# Global options which configure the session and logging shared by all the
+# commands of a batch, and so must be given to "sat batch" itself.
+BATCH_LEVEL_OPTIONS = {
+    'username': '--username',
+    'token_file': '--token-file',
+    'tenant_name': '--tenant-name',
+    'api_timeout': '--api-timeout',
+    'api_retries': '--api-retries',
+    'api_backoff': '--api-backoff',
+    'logfile': '--logfile',
+    'loglevel_stderr': '--loglevel-stderr',
+    'loglevel_file': '--loglevel-file',
+}
+
+SUMMARY_HEADINGS = ['#', 'Command', 'Exit Status', 'Time (s)']
+
+BatchCommand = namedtuple('BatchCommand', ('command', 'args'))
+BatchResult = namedtuple('BatchResult', ('command', 'exit_status', 'duration'))
+
+
+class BatchError(Exception):
+    """The commands of a batch could not be read or parsed."""
+    pass
+
+
+def get_command_argv(command, description):
+    """Get the arguments of one command from a line or an entry of a YAML list.
+
+    Args:
+        command (str or list): the command as a shell-quoted str, or as a list
+            of its arguments. A leading "sat" is optional.
+        description (str): where the command came from, used in errors.
+
+    Returns:
+        list of str: the arguments of the command, excluding "sat". This is
+            empty if the command has no arguments, e.g. if it is a comment.
+
+    Raises:
+        BatchError: if the command cannot be split into arguments.
+    """
+    if isinstance(command, str):
+        try:
+            argv = shlex.split(command, comments=True)
+        except ValueError as err:
+            raise BatchError(f'Unable to parse command on {description}: {err}')
+    elif isinstance(command, list) and all(isinstance(arg, (str, int, float)) for arg in command):
+        argv = [str(arg) for arg in command]
+    else:
+        raise BatchError(f'The command on {description} must be a string or a list of arguments.')
+
+    if argv and argv[0] == 'sat':
+        argv = argv[1:]
+    return argv
+
+
+def read_batch_commands(contents):
+    """Get the commands of a batch.
+
+    The contents are either a YAML list of commands, or one command per line.
+    Blank lines and comments starting with '#' are ignored in either format.
+
+    Args:
+        contents (str): the contents of the batch file.
+
+    Returns:
+        list of list of str: the arguments of each command.
+
+    Raises:
+        BatchError: if any command cannot be split into arguments.
+    """
+    try:
+        loaded = yaml.safe_load(contents)
+    except yaml.YAMLError:
+        loaded = None
+
+    if isinstance(loaded, list):
+        commands = (get_command_argv(command, f'entry {index}')
+                    for index, command in enumerate(loaded, start=1))
+    else:
+        commands = (get_command_argv(line, f'line {index}')
+                    for index, line in enumerate(contents.splitlines(), start=1))
+
+    return [argv for argv in commands if argv]
+
+
+def parse_batch_commands(parser, commands):
+    """Parse the arguments of each command of a batch.
+
+    All the commands are parsed before any of them is run, so that a mistake
+    in the batch does not leave it partially run.
+
+    Args:
+        parser (argparse.ArgumentParser): the parser for the sat command.
+        commands (list of list of str): the arguments of each command.
+
+    Returns:
+        list of BatchCommand: the command line and the parsed arguments of
+            each command.
+
+    Raises:
+        BatchError: if any command is invalid, cannot be run in a batch, or
+            gives a global option which applies to the whole batch.
+    """
+    batch_commands = []
+    for index, argv in enumerate(commands, start=1):
+        command_str = f'sat {shlex.join(argv)}'
+        try:
+            command_args = parser.parse_args(argv)
+        except SystemExit:
+            # The parser has already printed the reason to stderr.
+            raise BatchError(f'Invalid command {index}: {command_str}')
+        if command_args.command in UNSUPPORTED_COMMANDS:
+            raise BatchError(f'The {command_args.command} subcommand cannot be run in a batch '
+                             f'(command {index}: {command_str})')
+        batch_options = [option for dest, option in BATCH_LEVEL_OPTIONS.items()
+                         if getattr(command_args, dest, None) is not None]
+        if batch_options:
+            raise BatchError(f'The global option(s) {", ".join(batch_options)} apply to the whole batch '
+                             f'and must be given before "batch" instead of in command {index}: {command_str}')
+        batch_commands.append(BatchCommand(command_str, command_args))
+    return batch_commands
+
+
+def get_exit_status(code):
+    """Get the exit status given by the code of a SystemExit.
+
+    Args:
+        code: the code of the SystemExit.
+
+    Returns:
+        int: the exit status which the process would have exited with.
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    # As with sys.exit, any other value is printed and means failure.
+    LOGGER.error(code)
+    return 1
+
+
+def run_batch_command(command_args):
+    """Run one command of a batch.
+
+    Args:
+        command_args (argparse.Namespace): the parsed arguments of the command.
+
+    Returns:
+        int: the exit status of the command.
+    """
+    try:
+        subcommand = get_subcommand_function(command_args.command)
+    except AttributeError:
+        LOGGER.error("Couldn't find function 'sat.%s.main.do_%s'. Is it named correctly?",
+                     command_args.command, command_args.command)
+        return 1
+
+    with command_line_overrides(command_args):
+        try:
+            subcommand(command_args)
+        except SystemExit as err:
+            return get_exit_status(err.code)
+        except InvalidGrantError:
+            LOGGER.error("The token is not active or is invalid. "
+                         "Please re-authenticate using 'sat auth' to obtain a new token")
+            return 1
+        except Exception as err:
+            LOGGER.error('Command failed with an unexpected error: %s', err, exc_info=True)
+            return 1
+    return 0
+
+
+def run_batch(batch_commands, stop_on_error=False):
+    """Run the commands of a batch in sequence.
+
+    The output of each command is preceded by a line naming the command and
+    followed by a line giving its exit status and wall time. The commands
+    share one API session and its connection pool, which is created before
+    the first command runs using the options given to "sat batch". The
+    request deadline of the session is restarted for each command.
+
+    Args:
+        batch_commands (list of BatchCommand): the commands to run.
+        stop_on_error (bool): if True, stop after the first command which
+            fails.
+
+    Returns:
+        list of BatchResult: the results of the commands which were run.
+    """
+    results = []
+    total = len(batch_commands)
+    with share_all_sessions() as session:
+        for index, batch_command in enumerate(batch_commands, start=1):
+            print(f'==> [{index}/{total}] {batch_command.command}', flush=True)
+
+            # Each command gets the full request deadline, as it would if run alone.
+            session.reset_request_deadline()
+
+            start = time.monotonic()
+            exit_status = run_batch_command(batch_command.args)
+            duration = time.monotonic() - start
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            print(f'<== [{index}/{total}] exit status {exit_status} in {duration:.2f}s\n', flush=True)
+            results.append(BatchResult(batch_command.command, exit_status, duration))
+
+            if exit_status and stop_on_error:
+                LOGGER.error('Stopping after command %s failed; %s command(s) were not run.',
+                             index, total - index)
+                break
+    return results
+
+
+def do_batch(args):
+    """Runs several subcommands in one process.
+
+    Args:
+        args: The argparse.Namespace object containing the parsed arguments
+            passed to this subcommand.
+
+    Returns:
+        None
+
+    Raises:
+        SystemExit: if the batch cannot be read or parsed, or if any command
+            in the batch fails.
+    """
+    start = time.monotonic()
+    try:
+        if args.file == '-':
+            contents = sys.stdin.read()
+        else:
+            with open(args.file, 'r') as f:
+                contents = f.read()
+    except OSError as err:
+        LOGGER.error('Unable to read batch file %s: %s', args.file, err)
+        raise SystemExit(ERR_INVALID_BATCH)
+
+    parser = getattr(args, 'parser', None) or create_parent_parser()
+    try:
+        batch_commands = parse_batch_commands(parser, read_batch_commands(contents))
+    except BatchError as err:
+        LOGGER.error(err)
+        raise SystemExit(ERR_INVALID_BATCH)
+
+    results = run_batch(batch_commands, stop_on_error=args.stop_on_error)
+
+    report = Report(SUMMARY_HEADINGS, title='Batch Summary')
+    report.add_rows([
+        [index, result.command, result.exit_status, f'{result.duration:.2f}']
+        for index, result in enumerate(results, start=1)
+    ])
+    print(report)
+
+    failed = sum(1 for result in results if result.exit_status)
+    print(f'Ran {len(results)} of {len(batch_commands)} command(s) in '
+          f'{time.monotonic() - start:.2f}s; {failed} failed.')
+    if failed or len(results) < len(batch_commands):
+        raise SystemExit(ERR_COMMAND_FAILED)
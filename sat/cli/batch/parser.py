@@ -0,0 +1,53 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+The parser for the batch subcommand.
+"""
+
+
+def add_batch_subparser(subparsers):
+    """Add the batch subparser to the parent parser.
+
+    Args:
+        subparsers: The argparse.ArgumentParser object returned by the
+            add_subparsers method.
+
+    Returns:
+        None
+    """
+
+    batch_parser = subparsers.add_parser(
+        'batch', help='Run several sat subcommands in one process.',
+        description='Run several sat subcommands in sequence in one process which '
+                    'shares one API session and its connections. The commands are '
+                    'read from a file with one command per line, or from a YAML '
+                    'list of commands.')
+
+    batch_parser.add_argument(
+        'file', metavar='FILE',
+        help='The file to read the commands from, or "-" to read from standard input.')
+
+    batch_parser.add_argument(
+        '--stop-on-error', action='store_true',
+        help='Stop running commands after the first command which fails.')
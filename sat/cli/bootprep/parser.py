@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -217,7 +217,7 @@ def _add_bootprep_run_subparser(subparsers):
         None
     """
     run_subparser = subparsers.add_parser(
-        'run', help='Run sat bootprep.', parents=[create_format_options()],
+        'run', help='Run sat bootprep.', parents=[create_format_options(limit_options=False)],
         description='Create images, configurations and session templates.'
     )
     run_subparser.add_argument(
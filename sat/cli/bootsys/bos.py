@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -43,7 +43,8 @@ from sat.apiclient import APIError, HSMClient
 from sat.apiclient.bos import BOSClientCommon
 from sat.cli.bootsys.defaults import PARALLEL_CHECK_INTERVAL
 from sat.config import get_config_value
-from sat.session import SATSession
+from sat.node_directory import NodeDirectory
+from sat.session import SATSession, get_shared_client
 from sat.util import pester, prompt_continue
 from sat.waiting import Waiter, WaitingFailure
 from sat.xname import XName
@@ -99,7 +100,7 @@ class BOSLimitString:
                 under it, or there is a problem querying HSM to recursively
                 expand an xname.
         """
-        hsm_client = HSMClient(SATSession())
+        node_directory = get_shared_client(NodeDirectory.from_session)
         xnames = set()
         roles_groups = set()
 
@@ -118,7 +119,7 @@ class BOSLimitString:
                                      f'BOS operations require node xnames.')
 
                 try:
-                    limit_node_xnames = hsm_client.get_node_components(ancestor=limit_str)
+                    limit_node_xnames = node_directory.get_descendant_xnames(limit_str)
                 except APIError as err:
                     raise BOSFailure(f'Could not retrieve node xnames from HSM: {err}') from err
 
@@ -126,8 +127,7 @@ class BOSLimitString:
                     raise BOSFailure(f'Recursively expanding xname {limit_str} failed; '
                                      f'no node xnames were found.')
 
-                for node_component in limit_node_xnames:
-                    xnames.add(node_component['ID'])
+                xnames.update(limit_node_xnames)
 
         return cls(xnames, roles_groups)
 
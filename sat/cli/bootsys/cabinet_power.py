@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -35,7 +35,8 @@ from sat.cli.bootsys.power import PCSPowerWaiter
 from sat.config import get_config_value
 from sat.hms_discovery import (HMSDiscoveryCronJob, HMSDiscoveryError,
                                HMSDiscoveryScheduledWaiter)
-from sat.session import SATSession
+from sat.node_directory import NodeDirectory
+from sat.session import get_shared_client
 from sat.util import prompt_continue
 
 LOGGER = logging.getLogger(__name__)
@@ -50,30 +51,27 @@ def do_air_cooled_cabinets_power_off(args):
     Returns:
         None
     """
-    hsm_client = HSMClient(SATSession())
+    node_directory = get_shared_client(NodeDirectory.from_session)
     try:
-        river_nodes = hsm_client.get_component_xnames({'type': 'Node',
-                                                       'class': 'River'})
+        river_nodes = node_directory.get_class_members('River')
     except APIError as err:
         LOGGER.error(f'Failed to get the xnames of the air-cooled components: {err}')
         raise SystemExit(1)
 
     try:
-        river_mgmt_nodes = hsm_client.get_component_xnames({'type': 'Node',
-                                                            'role': 'Management',
-                                                            'class': 'River'})
+        mgmt_nodes = node_directory.get_role_members('Management')
     except APIError as err:
         LOGGER.error(f'Failed to get the xnames of the management nodes: {err}')
         raise SystemExit(1)
 
-    node_xnames = list(set(river_nodes) - set(river_mgmt_nodes))
+    node_xnames = sorted(river_nodes - mgmt_nodes)
 
     if not node_xnames:
         LOGGER.info('No non-management nodes in air-cooled cabinets to power off.')
         return
 
     LOGGER.info(f'Powering off {len(node_xnames)} non-management nodes in air-cooled cabinets.')
-    pcs_client = PCSClient(SATSession())
+    pcs_client = get_shared_client(PCSClient)
     try:
         pcs_client.set_xnames_power_state(node_xnames, 'off', force=True)
     except APIError as err:
@@ -121,7 +119,7 @@ def do_liquid_cooled_cabinets_power_off(args):
     Returns:
         None
     """
-    hsm_client = HSMClient(SATSession())
+    hsm_client = get_shared_client(HSMClient)
     try:
         xnames_to_power_off = get_xnames_for_power_action(hsm_client)
     except APIError as err:
@@ -130,7 +128,7 @@ def do_liquid_cooled_cabinets_power_off(args):
 
     LOGGER.info(f'Powering off all liquid-cooled chassis, compute modules, and router modules. '
                 f'({len(xnames_to_power_off)} components total)')
-    pcs_client = PCSClient(SATSession())
+    pcs_client = get_shared_client(PCSClient)
     try:
         pcs_client.set_xnames_power_state(xnames_to_power_off, 'off')
     except APIError as err:
@@ -217,7 +215,7 @@ def do_cabinets_power_on(args):
         raise SystemExit(1)
 
     LOGGER.info('Waiting for ComputeModules in liquid-cooled cabinets to be powered on.')
-    hsm_client = HSMClient(SATSession())
+    hsm_client = get_shared_client(HSMClient)
     try:
         xnames_to_power_on = get_xnames_for_power_action(hsm_client)
     except APIError as err:
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -39,5 +39,21 @@ HSN_STATE_DIR = 'hsn-states/'
 # The prefix used for files that record HSN state
 HSN_STATE_FILE_PREFIX = 'hsn-state'
 
+# The number of pods to request per page when listing all k8s pods
+POD_LIST_PAGE_SIZE = 500
+
 # The number of seconds to wait between checks on parallel BOS operations
 PARALLEL_CHECK_INTERVAL = 10
+
+# The interval, in seconds, between keep-alive packets sent on pooled SSH connections
+SSH_KEEPALIVE_INTERVAL = 30
+# The maximum number of hosts on which pooled SSH commands are run at once
+MAX_PARALLEL_SSH_HOSTS = 16
+
+# The timeout, in seconds, for a single ipmitool command to complete
+IPMI_COMMAND_TIMEOUT = 30
+# The maximum number of ipmitool commands which are run at once
+MAX_PARALLEL_IPMI_COMMANDS = 16
+
+# The timeout, in seconds, for probing whether hosts accept connections on the SSH port
+SSH_PROBE_TIMEOUT = 5
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021, 2023 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2023, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -52,13 +52,16 @@ class EtcdInactiveFailure(EtcdSnapshotFailure):
     pass
 
 
-def save_etcd_snapshot_on_host(hostname, host_keys=None):
+def save_etcd_snapshot_on_host(hostname, host_keys=None, ssh_pool=None):
     """Connect to the given host and save an etcd snapshot to a file.
 
     Args:
         hostname (str): the hostname to connect to
         host_keys (paramiko.HostKeys or None): the hostkeys to use when
             connecting over SSH
+        ssh_pool (sat.cli.bootsys.ssh_pool.SSHSessionPool or None): if not
+            None, use the pooled SSH session for the host instead of opening
+            a new connection
 
     Raises:
         EtcdInactiveFailure: if the etcd service is inactive, indicating that
@@ -66,10 +69,12 @@ def save_etcd_snapshot_on_host(hostname, host_keys=None):
         EtcdSnapshotFailure: if there is a failure to create the directory for
             the snapshot or a failure to create the snapshot
     """
-    ssh_client = get_ssh_client(host_keys=host_keys)
-
     try:
-        ssh_client.connect(hostname)
+        if ssh_pool is not None:
+            ssh_client = ssh_pool.get_client(hostname)
+        else:
+            ssh_client = get_ssh_client(host_keys=host_keys)
+            ssh_client.connect(hostname)
     except (SSHException, socket.error) as err:
         raise EtcdSnapshotFailure(f'Failed to connect to {hostname}: {err}')
 
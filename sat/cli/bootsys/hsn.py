@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -26,7 +26,7 @@ Performs High-speed Network (HSN) bringup and waits for it to be healthy.
 """
 import logging
 import sys
-from collections import namedtuple
+from collections import Counter, namedtuple
 
 import inflect
 
@@ -35,7 +35,7 @@ from sat.cached_property import cached_property
 from sat.cli.bootsys.state_recorder import HSNStateRecorder, StateError
 from sat.waiting import GroupWaiter
 from sat.config import get_config_value
-from sat.session import SATSession
+from sat.session import get_shared_client
 from sat.util import BeginEndLogger
 
 LOGGER = logging.getLogger(__name__)
@@ -52,10 +52,16 @@ class HSNBringupWaiter(GroupWaiter):
     def __init__(self, timeout, poll_interval=1):
         """Create a new HSNBringupWaiter."""
         super().__init__(set(), timeout, poll_interval)
-        self.fabric_client = FabricControllerClient(SATSession())
+        self.fabric_client = get_shared_client(FabricControllerClient)
         self.hsn_state_recorder = HSNStateRecorder()
         # dict mapping from port set name to dict mapping from port xname to enabled status
         self.current_hsn_state = {}
+        # set of HSNPorts which are in their desired state according to current_hsn_state
+        self.completed_ports = set()
+        # dicts mapping from port set name to the number of member ports in that port set,
+        # and to the number of those ports which are not yet in their desired state
+        self.total_port_counts = {}
+        self.outstanding_port_counts = {}
 
     def condition_name(self):
         return "HSN bringup"
@@ -67,10 +73,53 @@ class HSNBringupWaiter(GroupWaiter):
         self.members = {HSNPort(port_set, port_xname)
                         for port_set, port_xnames in self.fabric_client.get_fabric_edge_ports().items()
                         for port_xname in port_xnames}
+        self.total_port_counts = dict(Counter(port.port_set for port in self.members))
 
     def on_check_action(self):
-        """Get the latest HSN state from the fabric controller API."""
+        """Get the latest HSN state from the fabric controller API and diff it against the stored state."""
         self.current_hsn_state = self.fabric_client.get_fabric_edge_ports_enabled_status()
+        self.completed_ports = self.get_completed_ports()
+        self.log_progress()
+
+    def get_completed_ports(self):
+        """Get the ports which are in their desired state.
+
+        The current state of each port set is compared to the stored state with
+        set operations, in a single pass over each port set.
+
+        A port is in its desired state if it is currently enabled, or if it
+        currently has a reported status and was disabled before the shutdown.
+        Ports with no stored state are expected to be enabled, e.g. if a switch
+        or cable was added while the system was shut down.
+
+        Returns:
+            set of HSNPort: the ports which are in their desired state.
+        """
+        completed_ports = set()
+        for port_set, current_states in self.current_hsn_state.items():
+            stored_states = self.stored_hsn_state.get(port_set, {})
+            enabled = {xname for xname, is_enabled in current_states.items() if is_enabled}
+            disabled_before = {xname for xname, was_enabled in stored_states.items() if not was_enabled}
+            completed_xnames = enabled | (current_states.keys() & disabled_before)
+            completed_ports.update(HSNPort(port_set, xname) for xname in completed_xnames)
+        return completed_ports
+
+    def log_progress(self):
+        """Log the number of ports in each port set which are not yet in their desired state.
+
+        The counts are only logged when they have changed since the last check.
+        """
+        outstanding_ports = (self.pending - self.failed) - self.completed_ports
+        outstanding_port_counts = {port_set: 0 for port_set in self.total_port_counts}
+        outstanding_port_counts.update(Counter(port.port_set for port in outstanding_ports))
+        if outstanding_port_counts == self.outstanding_port_counts:
+            return
+
+        self.outstanding_port_counts = outstanding_port_counts
+        for port_set, count in sorted(outstanding_port_counts.items()):
+            LOGGER.info(f'Waiting for {count} of {self.total_port_counts.get(port_set, count)} '
+                        f'{INF.plural("port", self.total_port_counts.get(port_set, count))} '
+                        f'in port set {port_set} to reach desired state.')
 
     @cached_property
     def stored_hsn_state(self):
@@ -94,25 +143,11 @@ class HSNBringupWaiter(GroupWaiter):
             member (HSNPort): the port to check for completion.
 
         Returns:
-            True if the port status is enabled or if the port was disabled
-            before the shutdown. False otherwise.
+            True if the port status is enabled, or if the port has a reported
+            status and was disabled before the shutdown, as of the latest
+            check. False otherwise.
         """
-        try:
-            expected_state = self.stored_hsn_state[member.port_set][member.port_xname]
-        except KeyError:
-            # If the port was not known before shutdown, assume it should be enabled.
-            # E.g., this could happen if a switch or cable was added while the system
-            # was shut down.
-            expected_state = True
-
-        try:
-            current_state = self.current_hsn_state[member.port_set][member.port_xname]
-        except KeyError:
-            # If no state is reported for this port, then it is not healthy
-            return False
-
-        # if expected state is true, then current state must be true
-        return current_state or not expected_state
+        return member in self.completed_ports
 
 
 def do_hsn_bringup(args):
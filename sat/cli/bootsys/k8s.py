@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020, 2023, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020, 2023-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -28,7 +28,9 @@ import logging
 
 from csm_api_client.k8s import load_kube_api
 import inflect
+from kubernetes.client.rest import ApiException
 from kubernetes.config import ConfigException
+from kubernetes.watch import Watch
 import urllib3
 
 from sat.cached_property import cached_property
@@ -49,22 +51,38 @@ class KubernetesPodStatusWaiter(GroupWaiter):
     This waits for all pods to be in the same state they were in before the
     previous shutdown and for any new pods to be in the 'Running' or 'Complete'
     state.
+
+    The pods are listed once when the waiter is created. After that, changes
+    in pod phase are applied incrementally from a Kubernetes watch which
+    resumes from the last seen resourceVersion, and only pods which have
+    changed since the last check are re-evaluated. If the resourceVersion has
+    expired (410 Gone), the pods are listed again.
     """
 
-    def __init__(self, timeout, poll_interval=10):
+    def __init__(self, timeout, poll_interval=2, watch_timeout=1):
         """Initialize the Kubernetes waiter.
 
-        See GroupWaiter documentation.
+        Args:
+            watch_timeout (int): the number of seconds for which to watch for
+                pod events during each check.
+
+        See GroupWaiter documentation for other arguments.
         """
 
         super().__init__(set(), timeout, poll_interval=poll_interval)
 
         # Load k8s configuration before trying to use API
         self.k8s_api = load_kube_api()
+        self.watch_timeout = watch_timeout
 
         self.new_pods = set()  # pods not present when shut down
 
         self.k8s_pod_status = {}
+        self.resource_version = None
+        # Members whose phase changed since the last check, and the cached
+        # result of the last completion check for each member.
+        self.changed_members = set()
+        self.member_completion = {}
         self.update_k8s_pod_status()
         self.members = [(ns, name)
                         for ns, names in self.k8s_pod_status.items()
@@ -88,17 +106,64 @@ class KubernetesPodStatusWaiter(GroupWaiter):
         """Helper function to grab the status of all pods.
 
         Updates the internal k8s_pod_status dict to be consistent with
-        the status of the pods.
+        the status of the pods, and records the resourceVersion of the list
+        from which subsequent watches are started. Every pod is considered
+        changed afterwards.
 
         Args: None.
         Returns: None.
         """
         all_pods = self.k8s_api.list_pod_for_all_namespaces()
         self.k8s_pod_status = k8s_pods_to_status_dict(all_pods)
+        self.resource_version = all_pods.metadata.resource_version
+        self.member_completion = {}
+
+    def apply_pod_event(self, event):
+        """Apply a single watch event to the internal k8s_pod_status dict.
+
+        Args:
+            event (dict): an event yielded by `kubernetes.watch.Watch.stream`.
+
+        Returns:
+            None.
+        """
+        pod = event['object']
+        member = (pod.metadata.namespace, pod.metadata.name)
+        if event['type'] == 'DELETED':
+            self.k8s_pod_status[member[0]].pop(member[1], None)
+        else:
+            self.k8s_pod_status[member[0]][member[1]] = pod.status.phase
+        self.changed_members.add(member)
+
+    def watch_k8s_pod_status(self):
+        """Apply pod phase changes since the last seen resourceVersion.
+
+        Falls back to listing all pods if the resourceVersion has expired.
+
+        Args: None.
+        Returns: None.
+        """
+        watch = Watch()
+        try:
+            for event in watch.stream(self.k8s_api.list_pod_for_all_namespaces,
+                                      resource_version=self.resource_version,
+                                      timeout_seconds=self.watch_timeout):
+                self.apply_pod_event(event)
+        except ApiException as err:
+            if err.status != 410:
+                raise
+            LOGGER.debug('Watch of k8s pods expired at resourceVersion %s; listing pods again.',
+                         self.resource_version)
+            self.update_k8s_pod_status()
+            return
+
+        if watch.resource_version is not None:
+            self.resource_version = watch.resource_version
 
     def on_check_action(self):
         """Update pod status before doing each check for completion."""
-        self.update_k8s_pod_status()
+        self.changed_members = set()
+        self.watch_k8s_pod_status()
 
     def post_wait_action(self):
         report = Report(['Namespace', 'Pod name'])
@@ -108,14 +173,30 @@ class KubernetesPodStatusWaiter(GroupWaiter):
     def member_has_completed(self, member):
         """Check if a pod has "completed" its boot.
 
+        The result of the last check is reused for a pod whose phase has not
+        changed since that check.
+
         A pod is considered to have "completed" if either a pod with
         its name was present at the previous shutdown, and the current
         pod has reached the same state as its counterpart, or if the
         pod was not present, and its state is either "Running" or
         "Succeeded".
         """
+        if member in self.member_completion and member not in self.changed_members:
+            return self.member_completion[member]
+
+        completed = self._pod_has_completed(member)
+        self.member_completion[member] = completed
+        return completed
+
+    def _pod_has_completed(self, member):
+        """Check the current phase of a pod against its expected phase.
+
+        See member_has_completed for details.
+        """
         ns, name = member
-        simple_answer = self.k8s_pod_status[ns][name] in ('Succeeded', 'Running')
+        phase = self.k8s_pod_status.get(ns, {}).get(name)
+        simple_answer = phase in ('Succeeded', 'Running')
 
         if member in self.new_pods:
             return simple_answer
@@ -138,7 +219,7 @@ class KubernetesPodStatusWaiter(GroupWaiter):
         # last shutdown and had the same name. Thus we should be able
         # to tell if it's "completed" if it is in the same state as it
         # was at the last shutdown.
-        return self.k8s_pod_status[ns][name] == self.stored_k8s_pod_status[ns][name]
+        return phase == self.stored_k8s_pod_status[ns][name]
 
 
 class KubernetesAPIAvailableWaiter(Waiter):
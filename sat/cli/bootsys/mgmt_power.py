@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021, 2023-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2023-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,6 +25,7 @@
 Management cluster boot, shutdown, and IPMI power support.
 """
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 import logging
 import shlex
@@ -36,10 +37,21 @@ import re
 import inflect
 from paramiko.ssh_exception import SSHException
 
+from sat.cli.bootsys.defaults import (
+    IPMI_COMMAND_TIMEOUT,
+    MAX_PARALLEL_IPMI_COMMANDS,
+    MAX_PARALLEL_SSH_HOSTS,
+    SSH_PROBE_TIMEOUT
+)
 from sat.cli.bootsys.filesystems import FilesystemError, do_ceph_unmounts, modify_ensure_ceph_mounts_cron_job
 from sat.cli.bootsys.hostkeys import FilteredHostKeys
 from sat.cli.bootsys.ipmi_console import IPMIConsoleLogger, ConsoleLoggingError
-from sat.cli.bootsys.util import get_and_verify_ncn_groups, get_ssh_client, FatalBootsysError
+from sat.cli.bootsys.util import (
+    get_and_verify_ncn_groups,
+    get_hosts_accepting_connections,
+    get_ssh_client,
+    FatalBootsysError
+)
 from sat.cli.bootsys.platform import do_ceph_freeze, do_ceph_unfreeze, FatalPlatformError
 from sat.waiting import GroupWaiter, WaitingFailure
 from sat.config import get_config_value
@@ -49,10 +61,92 @@ LOGGER = logging.getLogger(__name__)
 INF = inflect.engine()
 
 
+class IPMICommandExecutor:
+    """Runs ipmitool commands against the BMCs of many hosts concurrently."""
+
+    def __init__(self, username, password, timeout=IPMI_COMMAND_TIMEOUT,
+                 max_workers=MAX_PARALLEL_IPMI_COMMANDS):
+        """Constructor for an IPMICommandExecutor object.
+
+        Args:
+            username (str): the username to use when running ipmitool commands
+            password (str): the password to use when running ipmitool commands
+            timeout (int): the timeout, in seconds, for each ipmitool command
+            max_workers (int): the maximum number of ipmitool commands to run
+                at once
+        """
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    def get_ipmi_command(self, host, command):
+        """Get the full command-line for an ipmitool command.
+
+        Args:
+            host (str): the host to query
+            command (str): the ipmitool command to run, e.g. `chassis power status`
+
+        Returns:
+            The command to run, split into a list of args by shlex.split.
+        """
+        return shlex.split(
+            'ipmitool -I lanplus -U {} -P {} -H {}-mgmt {}'.format(
+                self.username, self.password, host, command
+            )
+        )
+
+    def run_on_host(self, host, command):
+        """Run an ipmitool command against a single host.
+
+        Args:
+            host (str): the host to run the command against
+            command (str): the ipmitool command to run
+
+        Returns:
+            subprocess.CompletedProcess: the completed ipmitool process
+
+        Raises:
+            OSError: if ipmitool could not be executed
+            subprocess.TimeoutExpired: if ipmitool did not complete within
+                `self.timeout` seconds
+        """
+        return subprocess.run(self.get_ipmi_command(host, command), stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, encoding='utf-8', timeout=self.timeout)
+
+    def run_on_hosts(self, hosts, command):
+        """Run an ipmitool command against several hosts in parallel.
+
+        The command is run against every host, even if it fails for some.
+
+        Args:
+            hosts (Iterable[str]): the hosts to run the command against
+            command (str): the ipmitool command to run
+
+        Returns:
+            dict: a mapping from each host to its subprocess.CompletedProcess,
+                or to the OSError or subprocess.TimeoutExpired raised when
+                running the command against that host.
+        """
+        hosts = list(hosts)
+        if not hosts:
+            return {}
+
+        def run_on_host(host):
+            try:
+                return self.run_on_host(host, command)
+            except (OSError, subprocess.TimeoutExpired) as err:
+                return err
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(hosts))) as executor:
+            return dict(zip(hosts, executor.map(run_on_host, hosts)))
+
+
 class IPMIPowerStateWaiter(GroupWaiter):
     """Implementation of a waiter for IPMI power states.
 
-    Waits for all members to reach the given IPMI power state."""
+    Waits for all members to reach the given IPMI power state. The power
+    state of every pending member is queried in parallel on each check."""
 
     def __init__(self, members, power_state, timeout, username, password,
                  send_command=False, poll_interval=1, failure_threshold=3):
@@ -73,9 +167,14 @@ class IPMIPowerStateWaiter(GroupWaiter):
         self.username = username
         self.password = password
         self.send_command = send_command
+        self.ipmi_executor = IPMICommandExecutor(username, password)
 
         self.failure_threshold = failure_threshold
         self.consecutive_failures = defaultdict(int)
+        # Results of the latest parallel power status query, consumed by member_has_completed
+        self.power_status_results = {}
+        # Results of sending the power command to each member in pre_wait_action
+        self.send_command_results = {}
 
         super().__init__(members, timeout, poll_interval=poll_interval)
 
@@ -92,101 +191,164 @@ class IPMIPowerStateWaiter(GroupWaiter):
         Returns:
             The command to run, split into a list of args by shlex.split.
         """
-        return shlex.split(
-            'ipmitool -I lanplus -U {} -P {} -H {}-mgmt {}'.format(
-                self.username, self.password, member, command
-            )
-        )
+        return self.ipmi_executor.get_ipmi_command(member, command)
+
+    def on_check_action(self):
+        """Query the power status of all pending members in parallel."""
+        self.power_status_results = self.ipmi_executor.run_on_hosts(self.pending - self.failed,
+                                                                    'chassis power status')
 
     def member_has_completed(self, member):
         """Check if a host is in the desired state.
 
+        The result of the latest parallel query from `on_check_action` is used
+        if there is one for the member. Otherwise, the member is queried.
+
         Return:
             If the powerstate of the host matches that which was given
             in the constructor, return True. Otherwise, return False.
+
+        Raises:
+            WaitingFailure: if ipmitool cannot be executed, or if it has failed
+                `self.failure_threshold` times in a row for the member.
         """
-        ipmi_command = self.get_ipmi_command(member, 'chassis power status')
-        try:
-            proc = subprocess.run(ipmi_command, stdout=subprocess.PIPE,
-                                  stderr=subprocess.PIPE, encoding='utf-8')
-        except OSError as err:
-            raise WaitingFailure(f'Unable to find ipmitool: {err}')
-
-        if proc.returncode:
-            if not self.consecutive_failures[member]:
-                LOGGER.warning("impitool command failed with code %d: %s",
-                               proc.returncode, proc.stderr)
-
-            self.consecutive_failures[member] += 1
-            if self.consecutive_failures[member] >= self.failure_threshold:
-                raise WaitingFailure(f'ipmitool command failed {self.consecutive_failures[member]} time(s) '
-                                     f'with code {proc.returncode}; stderr: {proc.stderr}')
-            return False
-        elif self.consecutive_failures[member]:
-            self.consecutive_failures[member] = 0
+        result = self.power_status_results.pop(member, None)
+        if result is None:
+            try:
+                result = self.ipmi_executor.run_on_host(member, 'chassis power status')
+            except (OSError, subprocess.TimeoutExpired) as err:
+                result = err
+
+        if isinstance(result, OSError):
+            raise WaitingFailure(f'Unable to find ipmitool: {result}')
+
+        if isinstance(result, subprocess.TimeoutExpired):
+            failure_description = f'timed out after {result.timeout} seconds'
+        elif result.returncode:
+            failure_description = f'failed with code {result.returncode}: {result.stderr}'
+        else:
+            if self.consecutive_failures[member]:
+                self.consecutive_failures[member] = 0
+            return self.power_state in result.stdout
+
+        if not self.consecutive_failures[member]:
+            LOGGER.warning("ipmitool command for %s %s", member, failure_description)
 
-        return self.power_state in proc.stdout
+        self.consecutive_failures[member] += 1
+        if self.consecutive_failures[member] >= self.failure_threshold:
+            raise WaitingFailure(f'ipmitool command failed {self.consecutive_failures[member]} time(s); '
+                                 f'last attempt {failure_description}')
+        return False
 
     def pre_wait_action(self):
         """Send IPMI power commands to given hosts.
 
-        This will issue IPMI power commands to put the given hosts in the power
-        state given by `self.power_state`.
+        This will issue IPMI power commands in parallel to put the given hosts
+        in the power state given by `self.power_state`. The command is sent to
+        every host, and any failures are logged.
 
         Returns:
             None
         """
         LOGGER.debug("Entered pre_wait_action with self.send_command: %s.", self.send_command)
-        if self.send_command:
-            for member in self.members:
-                LOGGER.info('Sending IPMI power %s command to host %s', self.power_state, member)
-                ipmi_command = self.get_ipmi_command(member,
-                                                     'chassis power {}'.format(self.power_state))
-                try:
-                    proc = subprocess.run(ipmi_command, stdout=subprocess.PIPE,
-                                          stderr=subprocess.PIPE, encoding='utf-8')
-                except OSError as err:
-                    # TODO (SAT-552): Improve handling of ipmitool errors
-                    LOGGER.error('Unable to find ipmitool: %s', err)
-                    return
-
-                if proc.returncode:
-                    # TODO (SAT-552): Improve handling of ipmitool errors
-                    LOGGER.error('ipmitool command failed with code %s: stderr: %s',
-                                 proc.returncode, proc.stderr)
-                    return
+        if not self.send_command:
+            return
+
+        members = sorted(self.members)
+        LOGGER.info('Sending IPMI power %s command to hosts: %s', self.power_state, ', '.join(members))
+        self.send_command_results = self.ipmi_executor.run_on_hosts(members, f'chassis power {self.power_state}')
+        for member, result in self.send_command_results.items():
+            # TODO (SAT-552): Improve handling of ipmitool errors
+            if isinstance(result, OSError):
+                LOGGER.error('Unable to find ipmitool: %s', result)
+            elif isinstance(result, subprocess.TimeoutExpired):
+                LOGGER.error('ipmitool command for host %s timed out after %s seconds',
+                             member, result.timeout)
+            elif result.returncode:
+                LOGGER.error('ipmitool command for host %s failed with code %s: stderr: %s',
+                             member, result.returncode, result.stderr)
 
 
 class SSHAvailableWaiter(GroupWaiter):
     """A waiter which waits for all member nodes to be accessible via SSH.
+
+    On each check, all pending members are first probed with non-blocking TCP
+    connections to the SSH port, and then only the members which accept
+    those connections are checked with SSH handshakes in parallel.
     """
 
-    def __init__(self, members, timeout, poll_interval=1):
-        host_keys = FilteredHostKeys(hostnames=members)
-        self.ssh_client = get_ssh_client(host_keys=host_keys)
+    SSH_PORT = 22
+
+    def __init__(self, members, timeout, poll_interval=1, probe_timeout=SSH_PROBE_TIMEOUT):
+        self.host_keys = FilteredHostKeys(hostnames=members)
+        self.ssh_client = get_ssh_client(host_keys=self.host_keys)
+        self.probe_timeout = probe_timeout
+        # Results of the latest parallel probe, consumed by member_has_completed
+        self.probe_results = {}
 
         super().__init__(members, timeout, poll_interval=poll_interval)
 
     def condition_name(self):
         return 'Hosts accessible via SSH'
 
-    def member_has_completed(self, member):
-        """Check if a node is accessible by SSH.
+    def _ssh_connects(self, member, ssh_client):
+        """Check if an SSH connection to a node can be established.
 
         Args:
             member (str): a hostname to check
+            ssh_client (paramiko.SSHClient): the client to connect with
 
         Returns:
             True if SSH connecting succeeded, and
                 False otherwise.
         """
         try:
-            self.ssh_client.connect(member)
+            ssh_client.connect(member, timeout=self.probe_timeout)
         except (SSHException, socket.error):
             return False
         else:
             return True
 
+    def _new_client_connects(self, member):
+        """Check if an SSH connection to a node can be established with a new client.
+
+        The host keys loaded for the waiter are shared by the new client.
+        """
+        ssh_client = get_ssh_client(host_keys=self.host_keys, load_host_keys=False)
+        try:
+            return self._ssh_connects(member, ssh_client)
+        finally:
+            ssh_client.close()
+
+    def on_check_action(self):
+        """Probe all pending members in parallel."""
+        candidates = self.pending - self.failed
+        accepting = get_hosts_accepting_connections(candidates, self.SSH_PORT, self.probe_timeout)
+        self.probe_results = {member: False for member in candidates - accepting}
+        if accepting:
+            LOGGER.debug('Hosts accepting connections on port %s: %s',
+                         self.SSH_PORT, ', '.join(sorted(accepting)))
+            accepting = list(accepting)
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_SSH_HOSTS, len(accepting))) as executor:
+                self.probe_results.update(zip(accepting, executor.map(self._new_client_connects, accepting)))
+
+    def member_has_completed(self, member):
+        """Check if a node is accessible by SSH.
+
+        The result of the latest parallel probe from `on_check_action` is used
+        if there is one for the member. Otherwise, the member is checked.
+
+        Args:
+            member (str): a hostname to check
+
+        Returns:
+            True if SSH connecting succeeded, and
+                False otherwise.
+        """
+        if member in self.probe_results:
+            return self.probe_results.pop(member)
+        return self._ssh_connects(member, self.ssh_client)
+
 
 # Failures are logged, but otherwise ignored. They may be considered "stalled shutdowns" and
 # forcibly powered off as allowed for in the process.
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021, 2023-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2023-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -49,6 +49,7 @@ from sat.cli.bootsys.ceph import (
 from sat.cli.bootsys.etcd import save_etcd_snapshot_on_host, EtcdInactiveFailure, EtcdSnapshotFailure
 from sat.cli.bootsys.hostkeys import FilteredHostKeys
 from sat.cli.bootsys.k8s import KubernetesAPIAvailableWaiter
+from sat.cli.bootsys.ssh_pool import SSHSessionPool
 from sat.cli.bootsys.util import get_and_verify_ncn_groups, get_ssh_client, FatalBootsysError
 from sat.config import get_config_value
 from sat.cronjob import recreate_namespaced_stuck_cronjobs
@@ -93,7 +94,8 @@ class RemoteServiceWaiter(Waiter):
     VALID_TARGET_STATE_VALUES = ('active', 'inactive')
     VALID_TARGET_ENABLED_VALUES = ('enabled', 'disabled')
 
-    def __init__(self, host, service_name, target_state, timeout, poll_interval=5, target_enabled=None, host_keys=None):
+    def __init__(self, host, service_name, target_state, timeout, poll_interval=5, target_enabled=None, host_keys=None,
+                 ssh_pool=None):
         """Construct a new RemoteServiceWaiter.
 
         Args:
@@ -108,6 +110,8 @@ class RemoteServiceWaiter(Waiter):
                 If 'disabled', disable the service. If None, do neither.
             host_keys (paramiko.hostkeys.HostKeys): If not None, use the given host
                 keys object instead of loading the system host keys.
+            ssh_pool (SSHSessionPool or None): If not None, use the pooled SSH
+                session for the host instead of opening a new connection.
         """
         super().__init__(timeout, poll_interval=poll_interval)
 
@@ -123,7 +127,8 @@ class RemoteServiceWaiter(Waiter):
         self.service_name = service_name
         self.target_state = target_state
         self.target_enabled = target_enabled
-        self.ssh_client = get_ssh_client(host_keys=host_keys)
+        self.ssh_pool = ssh_pool
+        self.ssh_client = get_ssh_client(host_keys=host_keys) if ssh_pool is None else None
 
     def _run_remote_command(self, command, nonzero_error=True):
         """Run the given command on the remote host.
@@ -176,7 +181,10 @@ class RemoteServiceWaiter(Waiter):
             RuntimeError, SSHException: from _run_remote_command.
         """
         systemctl_action = ('stop', 'start')[self.target_state == 'active']
-        self.ssh_client.connect(self.host)
+        if self.ssh_pool is None:
+            self.ssh_client.connect(self.host)
+        else:
+            self.ssh_client = self.ssh_pool.get_client(self.host)
         if self.has_completed():
             self.completed = True
         else:
@@ -397,7 +405,7 @@ class ContainerStopProcess(Process):
 
 
 def do_service_action_on_hosts(hosts, service, target_state,
-                               timeout=SERVICE_ACTION_TIMEOUT, target_enabled=None):
+                               timeout=SERVICE_ACTION_TIMEOUT, target_enabled=None, ssh_pool=None):
     """Do a service start/stop and optionally enable/disable across hosts in parallel.
 
     Args:
@@ -407,6 +415,8 @@ def do_service_action_on_hosts(hosts, service, target_state,
         timeout (int): The timeout of the service operation on each host.
         target_enabled (str or None): The desired enabled/disabled state of the
             service or None if not applicable.
+        ssh_pool (SSHSessionPool or None): The pool of SSH sessions to use, or
+            None to open a new connection to each host.
 
     Returns:
         None
@@ -414,10 +424,10 @@ def do_service_action_on_hosts(hosts, service, target_state,
     Raises:
         FatalPlatformError: if the service action fails on any of the given hosts
     """
-    host_keys = FilteredHostKeys(hostnames=hosts)
+    host_keys = FilteredHostKeys(hostnames=hosts) if ssh_pool is None else None
     service_action_waiters = [RemoteServiceWaiter(host, service, target_state=target_state,
                                                   timeout=timeout, target_enabled=target_enabled,
-                                                  host_keys=host_keys)
+                                                  host_keys=host_keys, ssh_pool=ssh_pool)
                               for host in hosts]
     for waiter in service_action_waiters:
         waiter.wait_for_completion_async()
@@ -430,9 +440,12 @@ def do_service_action_on_hosts(hosts, service, target_state,
                                  f'on all hosts.')
 
 
-def do_stop_containers(ncn_groups):
+def do_stop_containers(ncn_groups, ssh_pool=None):
     """Stop containers in containerd and stop containerd itself on all K8s NCNs.
 
+    The `ssh_pool` is not used since containers are stopped from separate
+    processes, each of which opens its own SSH connection.
+
     Raises:
         FatalPlatformError: if any nodes fail to stop containerd
     """
@@ -459,43 +472,47 @@ def do_stop_containers(ncn_groups):
                                     f'{", ".join(failed_ncns)}')
 
 
-def do_containerd_stop(ncn_groups):
+def do_containerd_stop(ncn_groups, ssh_pool=None):
     """Stop containerd on all K8s NCNs.
 
     Raises:
         FatalPlatformError: if any nodes fail to stop containerd
     """
-    do_service_action_on_hosts(ncn_groups['kubernetes'], 'containerd', target_state='inactive')
+    do_service_action_on_hosts(ncn_groups['kubernetes'], 'containerd', target_state='inactive',
+                               ssh_pool=ssh_pool)
 
 
-def do_containerd_start(ncn_groups):
+def do_containerd_start(ncn_groups, ssh_pool=None):
     """Start and enable containerd on all K8s NCNs.
 
     Raises:
         FatalPlatformError: if any nodes fail to start containerd
     """
     do_service_action_on_hosts(ncn_groups['kubernetes'], 'containerd',
-                               target_state='active', target_enabled='enabled')
+                               target_state='active', target_enabled='enabled',
+                               ssh_pool=ssh_pool)
 
 
-def do_kubelet_stop(ncn_groups):
+def do_kubelet_stop(ncn_groups, ssh_pool=None):
     """Stop and disable kubelet on all K8s NCNs.
 
     Raises:
         FatalPlatformError: if any nodes fail to stop kubelet
     """
     do_service_action_on_hosts(ncn_groups['kubernetes'], 'kubelet',
-                               target_state='inactive', target_enabled='disabled')
+                               target_state='inactive', target_enabled='disabled',
+                               ssh_pool=ssh_pool)
 
 
-def do_kubelet_start(ncn_groups):
+def do_kubelet_start(ncn_groups, ssh_pool=None):
     """Start and enable kubelet on all K8s NCNs.
 
     Raises:
         FatalPlatformError: if any nodes fail to start kubelet.
     """
     do_service_action_on_hosts(ncn_groups['kubernetes'], 'kubelet',
-                               target_state='active', target_enabled='enabled')
+                               target_state='active', target_enabled='enabled',
+                               ssh_pool=ssh_pool)
     LOGGER.info("Waiting up to 300 seconds for the Kubernetes API to become available")
     kube_api_waiter = KubernetesAPIAvailableWaiter(timeout=300)  # Adjust timeout as needed
     if not kube_api_waiter.wait_for_completion():
@@ -653,8 +670,8 @@ def do_ceph_unfreeze(ncn_groups):
             LOGGER.info('Ceph is healthy.')
 
 
-def do_etcd_snapshot(ncn_groups):
-    """Save an etcd snapshot on all manager NCNs.
+def do_etcd_snapshot(ncn_groups, ssh_pool=None):
+    """Save an etcd snapshot on all manager NCNs in parallel.
 
     Raises:
         NonFatalPlatformError: if etcd is inactive on some managers and thus
@@ -662,15 +679,16 @@ def do_etcd_snapshot(ncn_groups):
         FatalPlatformError: if etcd snapshot command fails for another reason
     """
     managers = ncn_groups['managers']
-    host_keys = FilteredHostKeys(hostnames=managers)
-    # A dict mapping from failed hostnames to EtcdSnapshotFailure instances
-    snapshot_errs = {}
+    if ssh_pool is None:
+        with SSHSessionPool(managers) as managers_ssh_pool:
+            return do_etcd_snapshot(ncn_groups, ssh_pool=managers_ssh_pool)
 
-    for manager in managers:
-        try:
-            save_etcd_snapshot_on_host(manager, host_keys=host_keys)
-        except EtcdSnapshotFailure as err:
-            snapshot_errs[manager] = err
+    # Snapshots are saved on all managers in parallel, each using its pooled session
+    results = ssh_pool.map_hosts(lambda manager, _: save_etcd_snapshot_on_host(manager, ssh_pool=ssh_pool),
+                                 hosts=managers)
+    # A dict mapping from failed hostnames to the exceptions raised while saving snapshots
+    snapshot_errs = {manager: result for manager, result in results.items()
+                     if isinstance(result, Exception)}
 
     if snapshot_errs:
         for hostname, err in snapshot_errs.items():
@@ -682,19 +700,22 @@ def do_etcd_snapshot(ncn_groups):
                       f'{", ".join(snapshot_errs.keys())}')
 
 
-def do_etcd_stop(ncn_groups):
+def do_etcd_stop(ncn_groups, ssh_pool=None):
     """Stop etcd service on all manager NCNs."""
-    do_service_action_on_hosts(ncn_groups['managers'], 'etcd', target_state='inactive')
+    do_service_action_on_hosts(ncn_groups['managers'], 'etcd', target_state='inactive',
+                               ssh_pool=ssh_pool)
 
 
-def do_etcd_start(ncn_groups):
+def do_etcd_start(ncn_groups, ssh_pool=None):
     """Ensure etcd service is started and enabled on all manager NCNs."""
     do_service_action_on_hosts(ncn_groups['managers'], 'etcd', target_state='active',
-                               target_enabled='enabled')
+                               target_enabled='enabled',
+                               ssh_pool=ssh_pool)
 
 
 # Each step has a description that is printed and an action that is called
-# with the single argument being a dict mapping from NCN group names to hosts.
+# with a dict mapping from NCN group names to hosts and the keyword argument
+# `ssh_pool`, the SSHSessionPool shared by all the steps.
 PlatformServicesStep = namedtuple('PlatformServicesStep', ('description', 'action'))
 STEPS_BY_ACTION = {
     # The ordered steps to start platform services
@@ -743,24 +764,26 @@ def do_platform_action(args, action):
         LOGGER.error(f'Not proceeding with platform {action}: {err}')
         raise SystemExit(1)
 
-    for step in steps:
-        try:
-            info_message = f'Executing step: {step.description}'
-            LOGGER.info(info_message)
-            step.action(ncn_groups)
-        except NonFatalPlatformError as err:
-            LOGGER.warning(f'Non-fatal error in step "{step.description}" of '
-                           f'platform services {action}: {err}')
-            answer = pester_choices(f'Continue with platform services {action}?', ('yes', 'no'))
-            if answer == 'yes':
-                LOGGER.info('Continuing.')
-            else:
-                LOGGER.info('Aborting.')
+    # SSH sessions are shared by all steps so that each host is connected to at most once
+    with SSHSessionPool(ncn_groups['kubernetes']) as ssh_pool:
+        for step in steps:
+            try:
+                info_message = f'Executing step: {step.description}'
+                LOGGER.info(info_message)
+                step.action(ncn_groups, ssh_pool=ssh_pool)
+            except NonFatalPlatformError as err:
+                LOGGER.warning(f'Non-fatal error in step "{step.description}" of '
+                               f'platform services {action}: {err}')
+                answer = pester_choices(f'Continue with platform services {action}?', ('yes', 'no'))
+                if answer == 'yes':
+                    LOGGER.info('Continuing.')
+                else:
+                    LOGGER.info('Aborting.')
+                    raise SystemExit(1)
+            except FatalPlatformError as err:
+                LOGGER.error(f'Fatal error in step "{step.description}" of '
+                             f'platform services {action}: {err}')
                 raise SystemExit(1)
-        except FatalPlatformError as err:
-            LOGGER.error(f'Fatal error in step "{step.description}" of '
-                         f'platform services {action}: {err}')
-            raise SystemExit(1)
 
 
 def do_platform_stop(args):
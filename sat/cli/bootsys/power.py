@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -28,9 +28,10 @@ import logging
 
 from inflect import engine
 
-from sat.apiclient import APIError, HSMClient
+from sat.apiclient import APIError
 from sat.apiclient.pcs import PCSClient, PCSError
-from sat.session import SATSession
+from sat.node_directory import NodeDirectory
+from sat.session import get_shared_client
 from sat.waiting import GroupWaiter
 
 LOGGER = logging.getLogger(__name__)
@@ -51,10 +52,10 @@ def get_nodes_by_role_and_state(role, power_state):
         APIError: if there is a failure to get the needed information from HSM
             or PCS.
     """
-    hsm_client = HSMClient(SATSession())
-    pcs_client = PCSClient(SATSession())
+    node_directory = get_shared_client(NodeDirectory.from_session)
+    pcs_client = get_shared_client(PCSClient)
 
-    role_nodes = hsm_client.get_component_xnames({'type': 'Node', 'role': role})
+    role_nodes = sorted(node_directory.get_role_members(role))
     LOGGER.debug('Found %s node(s) with role %s: %s', len(role_nodes), role, role_nodes)
     if not role_nodes:
         return role_nodes
@@ -87,7 +88,7 @@ class PCSPowerWaiter(GroupWaiter):
         """
         super().__init__(members, timeout, poll_interval)
         self.power_state = power_state
-        self.pcs_client = PCSClient(SATSession())
+        self.pcs_client = get_shared_client(PCSClient)
 
     def condition_name(self):
         return 'PCS power ' + self.power_state
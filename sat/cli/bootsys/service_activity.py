@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -26,6 +26,7 @@ Various checks on system services to ensure idleness before shutdown.
 """
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import socket
 import sys
@@ -42,7 +43,8 @@ from sat.apiclient import (
     NMDClient
 )
 from sat.apiclient.bos import BOSClientCommon
-from sat.cli.bootsys.util import get_mgmt_ncn_groups, get_ssh_client
+from sat.cli.bootsys.ssh_pool import SSHSessionPool
+from sat.cli.bootsys.util import get_mgmt_ncn_groups
 from sat.config import get_config_value
 from sat.constants import MISSING_VALUE
 from sat.apiclient import FASClient
@@ -160,7 +162,6 @@ class SDUActivityChecker(ActivityChecker):
         self.service_name = 'SDU'
         self.session_name = 'session'
 
-        self.ssh_client = get_ssh_client()
         mgmt_ncns, _ = get_mgmt_ncn_groups()
         self.remote_manager_ncns = mgmt_ncns['managers']
 
@@ -169,6 +170,8 @@ class SDUActivityChecker(ActivityChecker):
     def get_active_sessions(self):
         """Get any active SDU sessions.
 
+        All manager NCNs are checked in parallel.
+
         Returns:
             A list of OrderedDicts representing the active SDU sessions.
 
@@ -177,19 +180,18 @@ class SDUActivityChecker(ActivityChecker):
         """
         self.active_sdu_sessions = []
 
-        for ncn in self.remote_manager_ncns:
-            try:
-                self.ssh_client.connect(ncn)
-                command = 'sdu bash pgrep sdu'
-                LOGGER.debug("Running command %s on NCN \"%s\"", command, ncn)
-                channel = self.ssh_client.get_transport().open_session()
-                channel.exec_command(command)
-
-                self.interpret_return_value(ncn, channel.recv_exit_status(), channel.makefile_stderr().read())
-            except (SSHException, socket.error) as err:
-                raise self.get_err(f'Unable to connect to management NCN "{ncn}": {str(err)}')
-            finally:
-                self.ssh_client.close()
+        command = 'sdu bash pgrep sdu'
+        LOGGER.debug('Running command "%s" on management NCNs: %s',
+                     command, ', '.join(self.remote_manager_ncns))
+        with SSHSessionPool(self.remote_manager_ncns) as ssh_pool:
+            results = ssh_pool.run_on_hosts(command)
+
+        for ncn, result in results.items():
+            if isinstance(result, (SSHException, socket.error)):
+                raise self.get_err(f'Unable to connect to management NCN "{ncn}": {str(result)}')
+            elif isinstance(result, Exception):
+                raise result
+            self.interpret_return_value(ncn, result.exit_status, result.stderr)
 
         return self.active_sdu_sessions
 
@@ -214,7 +216,7 @@ class SDUActivityChecker(ActivityChecker):
             ncn (str): the hostname of the NCN being checked for an SDU session
             retval (int): the return code of the sdu/pgrep process checking for SDU
                 sessions
-            stderr (bytes): the raw contents of stderr from the sdu/pgrep process
+            stderr (str): the contents of stderr from the sdu/pgrep process
 
         Raises:
             ServiceCheckError: if an error occurred while checking for an SDU session.
@@ -229,7 +231,7 @@ class SDUActivityChecker(ActivityChecker):
         elif retval == 127:
             LOGGER.warning("The `sdu` command was not found on %s.", ncn)
         else:
-            stderr_contents = stderr.decode().strip()
+            stderr_contents = stderr.strip()
             err_details = f'(return code: {retval}, stderr: "{stderr_contents}")'
             errmsg = {
                 2:   f"Syntax error on pgrep commandline on {ncn}. {stderr_contents}",
@@ -480,10 +482,35 @@ class NMDActivityChecker(ServiceActivityChecker):
         ]
 
 
+def _get_all_active_sessions(service_activity_checkers):
+    """Get the active sessions of various services concurrently.
+
+    Args:
+        service_activity_checkers: A list of ServiceActivityChecker objects to
+            be queried for service activity.
+
+    Returns:
+        A list containing, for each checker in the same order, either the list
+        of its active sessions or the ServiceCheckError raised when getting them.
+    """
+    def get_active_sessions(checker):
+        try:
+            return checker.get_active_sessions()
+        except ServiceCheckError as err:
+            return err
+
+    if not service_activity_checkers:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(service_activity_checkers)) as executor:
+        return list(executor.map(get_active_sessions, service_activity_checkers))
+
+
 def _report_active_sessions(service_activity_checkers):
     """Reports on the active sessions of various services on the system.
 
-    Prints information about active sessions of the various services.
+    The services are all queried at once, and then information about the
+    active sessions of each service is printed in the given order.
 
     Args:
         service_activity_checkers: A list of ServiceActivityChecker objects to
@@ -499,10 +526,12 @@ def _report_active_sessions(service_activity_checkers):
 
     for checker in service_activity_checkers:
         LOGGER.info('Checking for {}.'.format(checker.active_sessions_desc))
-        try:
-            sessions = checker.get_active_sessions()
-        except ServiceCheckError as err:
-            LOGGER.error(str(err))
+
+    all_sessions = _get_all_active_sessions(service_activity_checkers)
+
+    for checker, sessions in zip(service_activity_checkers, all_sessions):
+        if isinstance(sessions, ServiceCheckError):
+            LOGGER.error(str(sessions))
             failed_services.append(checker.service_name)
             continue
 
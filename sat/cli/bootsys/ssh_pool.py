@@ -0,0 +1,241 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+A pool of SSH sessions shared between the bootsys steps which operate on NCNs.
+"""
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import socket
+from threading import Lock
+import time
+
+from sat.cli.bootsys.defaults import MAX_PARALLEL_SSH_HOSTS, SSH_KEEPALIVE_INTERVAL
+from sat.cli.bootsys.hostkeys import FilteredHostKeys
+from sat.cli.bootsys.util import get_ssh_client
+
+LOGGER = logging.getLogger(__name__)
+
+# The known hosts file loaded by paramiko.SSHClient.load_system_host_keys
+KNOWN_HOSTS_FILE = '~/.ssh/known_hosts'
+# The number of bytes to read from a channel at a time
+RECV_SIZE = 32768
+# The number of seconds to wait for a command's output before checking again
+OUTPUT_POLL_INTERVAL = 0.1
+
+RemoteCommandResult = namedtuple('RemoteCommandResult', ('exit_status', 'stdout', 'stderr'))
+
+
+class SSHSessionPool:
+    """A pool of lazily-connected SSH sessions keyed by hostname.
+
+    Each host gets at most one paramiko.SSHClient, which is connected the
+    first time it is needed and then reused until the pool is closed. The
+    known hosts file is parsed a single time for the whole pool.
+    """
+
+    def __init__(self, hosts, keepalive_interval=SSH_KEEPALIVE_INTERVAL,
+                 max_workers=MAX_PARALLEL_SSH_HOSTS):
+        """Create a new SSHSessionPool.
+
+        Args:
+            hosts (list of str): the hostnames which sessions may be opened to.
+                These are used to filter the known hosts file, and are the
+                default hosts for `run_on_hosts`.
+            keepalive_interval (int): the interval, in seconds, between
+                keep-alive packets on each connection. If 0, keep-alive
+                packets are not sent.
+            max_workers (int): the maximum number of hosts to operate on at once.
+        """
+        self.hosts = list(hosts)
+        self.keepalive_interval = keepalive_interval
+        self.max_workers = max_workers
+
+        self._host_keys = None
+        self._host_keys_lock = Lock()
+        self._clients = {}
+        self._host_locks = {}
+        self._host_locks_lock = Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def host_keys(self):
+        """FilteredHostKeys: the known host keys, loaded once for all hosts in the pool."""
+        with self._host_keys_lock:
+            if self._host_keys is None:
+                host_keys = FilteredHostKeys(hostnames=self.hosts)
+                try:
+                    host_keys.load(os.path.expanduser(KNOWN_HOSTS_FILE))
+                except IOError as err:
+                    LOGGER.debug('Unable to load known hosts file: %s', err)
+                self._host_keys = host_keys
+            return self._host_keys
+
+    def _get_host_lock(self, host):
+        """Get the lock which serializes connection setup for the given host."""
+        with self._host_locks_lock:
+            return self._host_locks.setdefault(host, Lock())
+
+    def get_client(self, host):
+        """Get an SSH client connected to the given host.
+
+        The connection is established if it has not been already, or if the
+        existing connection is no longer active.
+
+        Args:
+            host (str): the hostname to connect to.
+
+        Returns:
+            paramiko.SSHClient: a client connected to `host`.
+
+        Raises:
+            SSHException, socket.error: if connecting to the host fails.
+        """
+        with self._get_host_lock(host):
+            ssh_client = self._clients.get(host)
+            if ssh_client is not None:
+                transport = ssh_client.get_transport()
+                if transport is not None and transport.is_active():
+                    return ssh_client
+                LOGGER.debug('SSH connection to %s is no longer active; reconnecting.', host)
+                ssh_client.close()
+
+            ssh_client = get_ssh_client(host_keys=self.host_keys, load_host_keys=False)
+            LOGGER.debug('Opening SSH connection to %s', host)
+            ssh_client.connect(host)
+            if self.keepalive_interval:
+                ssh_client.get_transport().set_keepalive(self.keepalive_interval)
+            self._clients[host] = ssh_client
+            return ssh_client
+
+    def run_on_host(self, host, command, timeout=None):
+        """Run a command on a single host.
+
+        Args:
+            host (str): the hostname on which to run the command.
+            command (str): the command to run.
+            timeout (int or None): the number of seconds to wait for the
+                command to complete. If None, wait indefinitely.
+
+        Returns:
+            RemoteCommandResult: the exit status of the command and its decoded
+                stdout and stderr.
+
+        Raises:
+            SSHException, socket.error: if connecting to the host or executing
+                the command fails.
+            socket.timeout: if the command does not complete within `timeout`.
+        """
+        ssh_client = self.get_client(host)
+        LOGGER.debug('Executing command "%s" on host %s', command, host)
+        _, stdout, _ = ssh_client.exec_command(command, timeout=timeout)
+        channel = stdout.channel
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stdout_chunks, stderr_chunks = [], []
+
+        # Output must be read while the command runs. Once the channel's
+        # window is full, the remote command blocks until it is read, and
+        # it never exits.
+        while True:
+            received = False
+            if channel.recv_ready():
+                stdout_chunks.append(channel.recv(RECV_SIZE))
+                received = True
+            if channel.recv_stderr_ready():
+                stderr_chunks.append(channel.recv_stderr(RECV_SIZE))
+                received = True
+            if received:
+                continue
+            if channel.exit_status_ready():
+                break
+
+            wait_time = OUTPUT_POLL_INTERVAL
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    channel.close()
+                    raise socket.timeout(f'Command "{command}" on host {host} did not complete '
+                                         f'within {timeout} seconds')
+                wait_time = min(wait_time, remaining)
+            channel.status_event.wait(wait_time)
+
+        return RemoteCommandResult(channel.recv_exit_status(),
+                                   b''.join(stdout_chunks).decode(), b''.join(stderr_chunks).decode())
+
+    def map_hosts(self, func, hosts=None):
+        """Call a function for each host in parallel.
+
+        Args:
+            func (callable): the function to call. It is called with the
+                hostname and an SSH client connected to that host.
+            hosts (list of str or None): the hosts to call `func` for. If None,
+                use all hosts in the pool.
+
+        Returns:
+            dict: a mapping from each hostname to the value returned by `func`
+                for that host, or to the exception raised while connecting
+                to the host or calling `func`.
+        """
+        if hosts is None:
+            hosts = self.hosts
+        if not hosts:
+            return {}
+
+        def call_on_host(host):
+            try:
+                return func(host, self.get_client(host))
+            except Exception as err:
+                return err
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(hosts))) as executor:
+            return dict(zip(hosts, executor.map(call_on_host, hosts)))
+
+    def run_on_hosts(self, command, hosts=None, timeout=None):
+        """Run a command on several hosts in parallel.
+
+        Args:
+            command (str): the command to run.
+            hosts (list of str or None): the hosts on which to run the command.
+                If None, use all hosts in the pool.
+            timeout (int or None): the number of seconds to wait for the
+                command to complete on each host. If None, wait indefinitely.
+
+        Returns:
+            dict: a mapping from each hostname to its RemoteCommandResult, or to
+                the exception raised while running the command on that host.
+        """
+        return self.map_hosts(lambda host, _: self.run_on_host(host, command, timeout=timeout),
+                              hosts=hosts)
+
+    def close(self):
+        """Close all SSH connections opened by the pool."""
+        for ssh_client in self._clients.values():
+            ssh_client.close()
+        self._clients.clear()
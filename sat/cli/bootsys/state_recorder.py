@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020,2023 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020,2023, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -34,16 +34,17 @@ from datetime import datetime
 from boto3.exceptions import Boto3Error
 from botocore.exceptions import BotoCoreError, ClientError
 from csm_api_client.k8s import load_kube_api
+from kubernetes.client.rest import ApiException
 from kubernetes.config import ConfigException
 
 from sat.apiclient import FabricControllerClient
-from sat.session import SATSession
+from sat.session import get_shared_client
 from sat.cli.bootsys.defaults import (
     DEFAULT_LOCAL_STATE_DIR,
     POD_STATE_DIR, POD_STATE_FILE_PREFIX,
     HSN_STATE_DIR, HSN_STATE_FILE_PREFIX
 )
-from sat.cli.bootsys.util import k8s_pods_to_status_dict
+from sat.cli.bootsys.util import get_k8s_pod_status_dict
 from sat.config import get_config_value
 from sat.util import BeginEndLogger, get_s3_resource, S3ResourceCreationError
 
@@ -265,12 +266,16 @@ class PodStateRecorder(StateRecorder):
     def get_state_data(self):
         """Get K8s pod information in a dictionary.
 
+        Only the namespace, name and phase of each pod are extracted from raw,
+        paginated list responses.
+
         Returns:
             K8s pod information as a dictionary mapping from namespace to pod
             name to pod phase string.
 
         Raises:
-            PodStateError: if we failed to load kubernetes config
+            PodStateError: if we failed to load kubernetes config or failed to
+                list pods
         """
         # Load k8s configuration before trying to use API
         try:
@@ -278,8 +283,12 @@ class PodStateRecorder(StateRecorder):
         except ConfigException as err:
             raise PodStateError(f'Failed to load kubernetes config: {err}') from err
 
-        all_pods = k8s_api.list_pod_for_all_namespaces()
-        return k8s_pods_to_status_dict(all_pods)
+        try:
+            return get_k8s_pod_status_dict(k8s_api)
+        except ApiException as err:
+            raise PodStateError(f'Failed to list kubernetes pods: {err}') from err
+        except ValueError as err:
+            raise PodStateError(f'Failed to parse JSON from kubernetes pod list: {err}') from err
 
 
 class HSNStateRecorder(StateRecorder):
@@ -292,7 +301,7 @@ class HSNStateRecorder(StateRecorder):
         super().__init__('high-speed network (HSN) state', HSN_STATE_DIR,
                          HSN_STATE_FILE_PREFIX, num_to_keep, s3, bucket_name)
 
-        self.fabric_client = FabricControllerClient(SATSession())
+        self.fabric_client = get_shared_client(FabricControllerClient)
 
     def get_state_data(self):
         """Get HSN state information in a dictionary.
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021, 2023-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2023-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,13 +25,19 @@
 Generic common utilities for the bootsys subcommand.
 """
 
+import errno
+import json
 import logging
 import re
+import selectors
+import socket
+import time
 from collections import defaultdict
 
 import yaml
 from paramiko import SSHClient, AutoAddPolicy
 
+from sat.cli.bootsys.defaults import POD_LIST_PAGE_SIZE
 from sat.util import pester_choices
 
 LOGGER = logging.getLogger(__name__)
@@ -124,6 +130,46 @@ def k8s_pods_to_status_dict(v1_pod_list):
     return pods_dict
 
 
+def get_k8s_pod_status_dict(k8s_api, page_size=POD_LIST_PAGE_SIZE):
+    """Get the phase of every pod in the system without deserializing pod objects.
+
+    Pods are listed in pages of `page_size` pods. Each page is requested as raw
+    JSON rather than as a V1PodList, and only the namespace, name and phase of
+    each pod are kept, so memory use is bounded by the size of one page.
+
+    Args:
+        k8s_api (kubernetes.client.CoreV1Api): the Kubernetes API client
+        page_size (int): the maximum number of pods to request per page
+
+    Returns:
+        a defaultdict in the form described in `k8s_pods_to_status_dict`
+
+    Raises:
+        kubernetes.client.rest.ApiException: if a request to list pods fails
+        ValueError: if a response cannot be parsed as JSON
+    """
+    pods_dict = defaultdict(dict)
+    continue_token = None
+    while True:
+        list_kwargs = {'limit': page_size, '_preload_content': False}
+        if continue_token:
+            list_kwargs['_continue'] = continue_token
+
+        response = k8s_api.list_pod_for_all_namespaces(**list_kwargs)
+        try:
+            page = json.loads(response.data)
+        finally:
+            response.release_conn()
+
+        for pod in page.get('items') or []:
+            metadata = pod.get('metadata', {})
+            pods_dict[metadata.get('namespace')][metadata.get('name')] = pod.get('status', {}).get('phase')
+
+        continue_token = page.get('metadata', {}).get('continue')
+        if not continue_token:
+            return pods_dict
+
+
 def get_mgmt_ncn_groups(excluded_ncns=None):
     """Get included and excluded management NCNs grouped by subrole.
 
@@ -215,9 +261,16 @@ def get_and_verify_ncn_groups(excluded_ncns=None):
     return incl_ncns_by_subrole
 
 
-def get_ssh_client(host_keys=None):
+def get_ssh_client(host_keys=None, load_host_keys=True):
     """Get a paramiko SSH client.
 
+    Args:
+        host_keys (paramiko.HostKeys or None): if not None, use the given host
+            keys object instead of a new one for the system host keys.
+        load_host_keys (bool): if True, load the system host keys file into
+            the client's host keys. Set to False if `host_keys` has already
+            been loaded.
+
     Returns:
         A paramiko.SSHClient instance with host keys loaded and the policy for
         missing host keys set to warn rather than fail.
@@ -225,7 +278,63 @@ def get_ssh_client(host_keys=None):
     ssh_client = SSHClient()
     if host_keys is not None:
         ssh_client._system_host_keys = host_keys
-    ssh_client.load_system_host_keys()
+    if load_host_keys:
+        ssh_client.load_system_host_keys()
     ssh_client.set_missing_host_key_policy(AutoAddPolicy)
 
     return ssh_client
+
+
+def get_hosts_accepting_connections(hosts, port, timeout):
+    """Find which hosts accept TCP connections on a port.
+
+    Connections to all hosts are started at once without blocking, and then
+    awaited together, so the time taken does not grow with the number of
+    hosts which are unreachable.
+
+    Args:
+        hosts (Iterable[str]): the hostnames to probe
+        port (int): the TCP port to connect to
+        timeout (float): the number of seconds to wait for all connections
+
+    Returns:
+        set of str: the hosts which accepted a connection within the timeout
+    """
+    accepting_hosts = set()
+    selector = selectors.DefaultSelector()
+    try:
+        for host in hosts:
+            try:
+                family, sock_type, proto, _, address = socket.getaddrinfo(host, port,
+                                                                          type=socket.SOCK_STREAM)[0]
+            except socket.gaierror as err:
+                LOGGER.debug('Unable to resolve host %s: %s', host, err)
+                continue
+
+            sock = socket.socket(family, sock_type, proto)
+            sock.setblocking(False)
+            connect_err = sock.connect_ex(address)
+            if connect_err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                LOGGER.debug('Unable to connect to port %s on host %s: %s',
+                             port, host, errno.errorcode.get(connect_err, connect_err))
+                sock.close()
+                continue
+            selector.register(sock, selectors.EVENT_WRITE, data=host)
+
+        deadline = time.monotonic() + timeout
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                sock = key.fileobj
+                selector.unregister(sock)
+                if not sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+                    accepting_hosts.add(key.data)
+                sock.close()
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+    return accepting_hosts
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -134,7 +134,8 @@ def get_current_firmware(client, xnames):
     return {None: client.make_fw_table(device_firmwares)}
 
 
-def print_reports_from_tables(fw_tables, sort_by, reverse, filter_strs, output_format, display_headings):
+def print_reports_from_tables(fw_tables, sort_by, reverse, filter_strs, output_format, display_headings,
+                              limit=None, offset=0):
     """Print a report given one or more firmware tables.
 
     Args:
@@ -146,6 +147,8 @@ def print_reports_from_tables(fw_tables, sort_by, reverse, filter_strs, output_f
         filter_strs (list): Specify options to filter output.
         output_format (str): Specify how to format output.
         display_headings (list): a list of columns to show in the output.
+        limit (int or None): the maximum number of rows to show in each table.
+        offset (int): the number of rows to skip at the start of each table.
     """
     for title, table in sorted(fw_tables.items()):
         report = Report(
@@ -155,7 +158,9 @@ def print_reports_from_tables(fw_tables, sort_by, reverse, filter_strs, output_f
             get_config_value('format.no_borders'),
             filter_strs=filter_strs,
             display_headings=display_headings,
-            print_format=output_format
+            print_format=output_format,
+            limit=limit,
+            offset=offset
         )
         report.add_rows(table)
 
@@ -201,7 +206,8 @@ def do_firmware(args):
         firmware_tables = get_current_firmware(client, args.xnames)
 
     print_reports_from_tables(
-        firmware_tables, args.sort_by, args.reverse, args.filter_strs, args.format, args.fields
+        firmware_tables, args.sort_by, args.reverse, args.filter_strs, args.format, args.fields,
+        limit=args.limit, offset=args.offset
     )
 
     LOGGER.info(f'Use `sat firmware --delete-snapshot` to delete the snapshot if it is no longer needed')
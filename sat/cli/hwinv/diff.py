@@ -0,0 +1,177 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Comparison of two hardware inventories.
+"""
+from collections import namedtuple
+
+from sat.constants import EMPTY_VALUE, MISSING_VALUE
+
+# The kinds of change to a FRU between two inventories
+ADDED = 'added'
+REMOVED = 'removed'
+MOVED = 'moved'
+REPLACED = 'replaced'
+CHANGED = 'changed'
+
+DIFF_HEADINGS = ['xname', 'Type', 'Change', 'FRUID', 'Details']
+
+HardwareChange = namedtuple('HardwareChange', ('xname', 'type', 'change', 'fruid', 'details'))
+
+
+def _get_fru_key(component):
+    """Get the key which identifies the FRU of a component.
+
+    Args:
+        component (sat.system.component.BaseComponent): the component.
+
+    Returns:
+        tuple: the FRU ID of the component, or the xname of the component if
+            it has no FRU ID.
+    """
+    fruid = component.fruid
+    if fruid in (MISSING_VALUE, EMPTY_VALUE):
+        return 'xname', str(component.xname)
+    return 'fruid', fruid
+
+
+def _get_components_by_fru(components):
+    """Get the components keyed by the FRU which identifies them.
+
+    Components which share a FRU ID with another component, which can happen
+    when HSM reports placeholder FRU IDs, are keyed by their xnames instead.
+
+    Args:
+        components (Iterable): the components.
+
+    Returns:
+        dict: a mapping from the FRU key returned by `_get_fru_key` to component.
+    """
+    components_by_fru = {}
+    duplicate_keys = set()
+    for component in components:
+        fru_key = _get_fru_key(component)
+        if fru_key in components_by_fru or fru_key in duplicate_keys:
+            duplicate_keys.add(fru_key)
+            other_component = components_by_fru.pop(fru_key, None)
+            if other_component is not None:
+                components_by_fru['xname', str(other_component.xname)] = other_component
+            fru_key = 'xname', str(component.xname)
+        components_by_fru[fru_key] = component
+    return components_by_fru
+
+
+def _get_changed_fields(old_component, new_component, fields):
+    """Get a description of the fields whose values differ between two components.
+
+    Args:
+        old_component (sat.system.component.BaseComponent): the old component.
+        new_component (sat.system.component.BaseComponent): the new component.
+        fields (list of ComponentField): the fields to compare.
+
+    Returns:
+        list of str: a description of each field which changed.
+    """
+    changed_fields = []
+    for field in fields:
+        old_value = getattr(old_component, field.property_name)
+        new_value = getattr(new_component, field.property_name)
+        if old_value != new_value:
+            changed_fields.append(f'{field.pretty_name}: {old_value} -> {new_value}')
+    return changed_fields
+
+
+def get_component_type_changes(component_type, old_components, new_components):
+    """Get the changes to the FRUs of one type of component.
+
+    Components are matched by FRU ID, or by xname if they have no FRU ID. A
+    FRU found at a different xname is moved, and a FRU found at the same
+    xname with different field values is changed. A FRU only in the new
+    inventory is added, and a FRU only in the old inventory is removed,
+    unless a FRU was both removed from and added to the same xname, in which
+    case it was replaced.
+
+    Args:
+        component_type (type): the BaseComponent subclass of the components.
+        old_components (dict): a mapping from xname to component in the old
+            inventory.
+        new_components (dict): a mapping from xname to component in the new
+            inventory.
+
+    Returns:
+        list of HardwareChange: the changes to the FRUs.
+    """
+    fields = [field for field in component_type.get_listable_fields()
+              if field.property_name not in ('xname', 'fruid')]
+    old_frus = _get_components_by_fru(old_components.values())
+    new_frus = _get_components_by_fru(new_components.values())
+
+    changes = []
+    added = {}
+    for fru_key, new_component in new_frus.items():
+        old_component = old_frus.get(fru_key)
+        if old_component is None:
+            added[new_component.xname] = new_component
+        elif old_component.xname != new_component.xname:
+            changes.append(HardwareChange(new_component.xname, component_type.pretty_name, MOVED,
+                                          new_component.fruid, f'from {old_component.xname}'))
+        else:
+            changed_fields = _get_changed_fields(old_component, new_component, fields)
+            if changed_fields:
+                changes.append(HardwareChange(new_component.xname, component_type.pretty_name, CHANGED,
+                                              new_component.fruid, '; '.join(changed_fields)))
+
+    for fru_key, old_component in old_frus.items():
+        if fru_key in new_frus:
+            continue
+        new_component = added.pop(old_component.xname, None)
+        if new_component is None:
+            changes.append(HardwareChange(old_component.xname, component_type.pretty_name, REMOVED,
+                                          old_component.fruid, 'not in new inventory'))
+        else:
+            changes.append(HardwareChange(new_component.xname, component_type.pretty_name, REPLACED,
+                                          new_component.fruid, f'replaced {old_component.fruid}'))
+
+    changes.extend(HardwareChange(new_component.xname, component_type.pretty_name, ADDED,
+                                  new_component.fruid, 'not in old inventory')
+                   for new_component in added.values())
+    return changes
+
+
+def get_inventory_changes(old_system, new_system):
+    """Get the changes to the FRUs between two hardware inventories.
+
+    Args:
+        old_system (sat.system.system.System): the old hardware inventory.
+        new_system (sat.system.system.System): the new hardware inventory.
+
+    Returns:
+        list of HardwareChange: the changes to the FRUs of every type of
+            component.
+    """
+    changes = []
+    for component_type, old_components in old_system.components_by_type.items():
+        new_components = new_system.components_by_type.get(component_type, {})
+        changes.extend(get_component_type_changes(component_type, old_components, new_components))
+    return changes
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -33,12 +33,19 @@ import inflect
 from parsec import ParseError
 
 from sat.apiclient import APIError, HSMClient
+from sat.cli.hwinv.diff import DIFF_HEADINGS, get_inventory_changes
 from sat.cli.hwinv.summary import ComponentSummary
 from sat.config import get_config_value
 from sat.filtering import parse_multiple_query_strings
 from sat.report import Report
 from sat.session import SATSession
-from sat.system.system import System
+from sat.system.database import InventoryDatabaseError, export_inventory, iter_database_inventory
+from sat.system.system import (
+    COMPONENT_TYPES,
+    System,
+    get_required_component_types,
+    iter_hardware_inventory,
+)
 from sat.util import yaml_dump, json_dump
 
 LOGGER = logging.getLogger(__name__)
@@ -85,6 +92,33 @@ def set_default_args(args):
         args.summarize_all = True
 
 
+def get_requested_component_types(args):
+    """Gets the component types which are listed or summarized according to the args.
+
+    Args:
+        args: The argparse.Namespace object containing the parsed arguments
+            passed to this subcommand.
+
+    Returns:
+        A set of the BaseComponent subclasses which are listed or summarized.
+    """
+    inflector = inflect.engine()
+    requested_types = set()
+
+    for object_type in COMPONENT_TYPES:
+        plural_arg_name = inflector.plural(object_type.arg_name)
+        list_arg_name = f'list_{plural_arg_name}'
+        summarize_arg_name = f'summarize_{plural_arg_name}'
+
+        listed = args.list_all or getattr(args, list_arg_name)
+        summarized = (hasattr(args, summarize_arg_name) and
+                      (args.summarize_all or getattr(args, summarize_arg_name)))
+        if listed or summarized:
+            requested_types.add(object_type)
+
+    return requested_types
+
+
 def report_unused_options(args):
     """Reports any unused options that have no effect.
 
@@ -258,7 +292,9 @@ def get_all_lists(system, args):
             show_empty=args.show_empty,
             show_missing=args.show_missing,
             display_headings=display_fields,
-            print_format=args.format
+            print_format=args.format,
+            limit=args.limit,
+            offset=args.offset
         )
         component_report.add_rows(component_dicts)
 
@@ -391,6 +427,54 @@ def get_all_output(system, args):
         return get_formatted_output(summaries, lists, args.format)
 
 
+def get_database_system(path):
+    """Get the hardware inventory stored in a SQLite database.
+
+    Args:
+        path (str): the path of the database created by `export_inventory`.
+
+    Returns:
+        sat.system.system.System: the parsed hardware inventory.
+
+    Raises:
+        InventoryDatabaseError: if the database cannot be read.
+    """
+    system = System(iter_database_inventory(path))
+    system.parse_all()
+    return system
+
+
+def get_diff_report(args):
+    """Get a report of the changes between the hardware inventories given in args.
+
+    Args:
+        args: The argparse.Namespace object containing the parsed arguments
+            passed to this subcommand.
+
+    Returns:
+        A Report containing a row for each change to a FRU.
+
+    Raises:
+        InventoryDatabaseError: if either database cannot be read.
+    """
+    old_path, new_path = args.diff
+    changes = get_inventory_changes(get_database_system(old_path), get_database_system(new_path))
+
+    report = Report(
+        headings=DIFF_HEADINGS, title='Hardware Inventory Changes',
+        sort_by=args.sort_by, reverse=args.reverse,
+        no_headings=get_config_value('format.no_headings'),
+        no_borders=get_config_value('format.no_borders'),
+        filter_strs=args.filter_strs,
+        display_headings=args.fields,
+        print_format=args.format,
+        limit=args.limit,
+        offset=args.offset
+    )
+    report.add_rows(changes)
+    return report
+
+
 def do_hwinv(args):
     """Executes the hwinv command with the given arguments.
 
@@ -402,24 +486,52 @@ def do_hwinv(args):
         None
     """
     LOGGER.debug('do_hwinv received the following args: %s', args)
+
+    if args.export_sqlite:
+        client = HSMClient(SATSession())
+        try:
+            count = export_inventory(iter_hardware_inventory(client), args.export_sqlite)
+        except APIError as err:
+            LOGGER.error('Failed to get hardware inventory from HSM: %s', err)
+            sys.exit(1)
+        except ValueError as err:
+            LOGGER.error('Failed to parse JSON from hardware inventory response: %s', err)
+            sys.exit(1)
+        except InventoryDatabaseError as err:
+            LOGGER.error(err)
+            sys.exit(1)
+        LOGGER.info('Exported %d components to %s', count, args.export_sqlite)
+        return
+
+    if args.diff:
+        try:
+            print(get_diff_report(args))
+        except InventoryDatabaseError as err:
+            LOGGER.error(err)
+            sys.exit(1)
+        return
+
     set_default_args(args)
     warning_messages = report_unused_options(args)
 
-    client = HSMClient(SATSession())
+    component_types = get_required_component_types(get_requested_component_types(args))
 
     try:
-        response = client.get('Inventory', 'Hardware')
+        if args.from_sqlite:
+            raw_components = iter_database_inventory(args.from_sqlite, component_types)
+        else:
+            raw_components = iter_hardware_inventory(HSMClient(SATSession()), component_types)
+        full_system = System(raw_components, component_types)
     except APIError as err:
         LOGGER.error('Failed to get hardware inventory from HSM: %s', err)
         sys.exit(1)
-
-    try:
-        response_json = response.json()
     except ValueError as err:
         LOGGER.error('Failed to parse JSON from hardware inventory response: %s', err)
         sys.exit(1)
+    except InventoryDatabaseError as err:
+        LOGGER.error(err)
+        sys.exit(1)
 
-    full_system = System(response_json)
     full_system.parse_all()
     print(get_all_output(full_system, args))
 
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2020, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2020, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -144,6 +144,25 @@ def add_hwinv_subparser(subparsers):
         description='Show hardware inventory as lists and/or summaries.',
         parents=[format_options, filter_options])
 
+    database_group = hwinv_parser.add_mutually_exclusive_group()
+    database_group.add_argument(
+        '--export-sqlite', metavar='PATH',
+        help='Export the full hardware inventory to a SQLite database at PATH '
+             'instead of summarizing or listing components. An existing file '
+             'at PATH is replaced.'
+    )
+    database_group.add_argument(
+        '--from-sqlite', metavar='PATH',
+        help='Read the hardware inventory from a SQLite database created by '
+             '--export-sqlite instead of querying HSM.'
+    )
+    database_group.add_argument(
+        '--diff', nargs=2, metavar=('OLD', 'NEW'),
+        help='Show the FRUs which were added, removed, moved, replaced, or '
+             'changed between two SQLite databases created by --export-sqlite '
+             'instead of summarizing or listing components.'
+    )
+
     summarize_group = hwinv_parser.add_argument_group(
         'Summarize Options',
         'Options to summarize components by various fields.'
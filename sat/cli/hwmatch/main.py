@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -31,12 +31,13 @@ import sys
 from sat.apiclient import APIError, HSMClient
 from sat.config import get_config_value
 from sat.session import SATSession
+from sat.system.database import InventoryDatabaseError, iter_database_inventory
 from sat.system.field import ComponentField
 from sat.system.memory_module import MemoryModule
 from sat.system.node import Node
 from sat.system.processor import Processor
 from sat.report import Report
-from sat.system.system import System
+from sat.system.system import System, iter_hardware_inventory
 
 LOGGER = logging.getLogger(__name__)
 
@@ -100,18 +101,23 @@ def do_hwmatch(args):
     LOGGER.debug('do_hwmatch received the following args: %s', args)
 
     # Obtain hardware inventory.
-    client = HSMClient(SATSession())
+    component_types = {comp_type for type_to_fields in MATCH_FIELDS_BY_LEVEL.values()
+                       for comp_type in type_to_fields}
     try:
-        response = client.get('Inventory', 'Hardware')
+        if args.from_sqlite:
+            raw_components = iter_database_inventory(args.from_sqlite, component_types)
+        else:
+            raw_components = iter_hardware_inventory(HSMClient(SATSession()), component_types)
+        full_system = System(raw_components, component_types)
     except APIError as err:
         LOGGER.error('Failed to get hardware inventory from HSM: %s', err)
         sys.exit(1)
-    try:
-        response_json = response.json()
     except ValueError as err:
         LOGGER.error('Failed to parse JSON from hardware inventory response: %s', err)
         sys.exit(1)
-    full_system = System(response_json)
+    except InventoryDatabaseError as err:
+        LOGGER.error(err)
+        sys.exit(1)
     full_system.parse_all()
 
     records_by_level = {}
@@ -160,7 +166,7 @@ def do_hwmatch(args):
         no_headings=get_config_value('format.no_headings'),
         no_borders=get_config_value('format.no_borders'),
         filter_strs=args.filter_strs, display_headings=args.fields,
-        print_format=args.format
+        print_format=args.format, limit=args.limit, offset=args.offset
     )
     report.add_rows(rows)
     if not rows and args.format == 'pretty':
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2020 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2020, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -56,3 +56,8 @@ def add_hwmatch_subparser(subparsers):
         '--show-matches', '-s', action='store_true',
         help='Show matches in addition to mismatches.'
     )
+    hwmatch_parser.add_argument(
+        '--from-sqlite', metavar='PATH',
+        help='Read the hardware inventory from a SQLite database created by '
+             '"sat hwinv --export-sqlite" instead of querying HSM.'
+    )
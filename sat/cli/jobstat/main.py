@@ -1,6 +1,6 @@
 # MIT License
 #
-# (C) Copyright 2022 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2022, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -85,6 +85,8 @@ def do_jobstat(args):
             filter_strs=args.filter_strs,
             display_headings=args.fields,
             print_format=args.format,
+            limit=args.limit,
+            offset=args.offset,
         )
 
         for row in application_data:
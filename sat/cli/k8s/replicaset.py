@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020, 2023 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020, 2023, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -39,37 +39,27 @@ from sat.cached_property import cached_property
 LOGGER = logging.getLogger(__name__)
 
 
+# Only pods in the Running phase are relevant for co-located replicas.
+RUNNING_POD_FIELD_SELECTOR = 'status.phase=Running'
+
+
 class ReplicaSet(kubernetes.client.models.v1_replica_set.V1ReplicaSet):
 
+    # Maps from ReplicaSet UID to the list of pods owned by that ReplicaSet.
+    # This is set by get_all_replica_sets from a single cluster-wide pod query.
+    pods_by_owner_uid = {}
+
     @cached_property
     def pods(self):
-        """Get all pods owned by this replicaset.
+        """Get the pods owned by this replicaset.
 
-        Returns:
-            All pods associated with this ReplicaSet in a list.
+        The pods are looked up by the UID of this ReplicaSet in the index of
+        pods which was built by get_all_replica_sets.
 
-        Raises:
-            ApiException: If the call to get all pods failed.
+        Returns:
+            All indexed pods associated with this ReplicaSet in a list.
         """
-        try:
-            hash_ = self.metadata.labels['pod-template-hash']
-        except KeyError:
-            LOGGER.warning(
-                'Replicaset {} had no "pod-template-hash" field.'.format(
-                    self.metadata.name))
-            return []
-
-        ns = self.metadata.namespace
-
-        label = 'pod-template-hash={}'.format(hash_)
-        try:
-            corev1 = kubernetes.client.CoreV1Api()
-            return corev1.list_namespaced_pod(ns, label_selector=label).items
-        except ApiException as err:
-            LOGGER.warning(
-                'Could not retrieve pods in namespace {} with label selector '
-                '{}: {}'.format(ns, label, err))
-            return []
+        return self.pods_by_owner_uid.get(self.metadata.uid, [])
 
     @cached_property
     def running_pods(self):
@@ -102,12 +92,43 @@ class ReplicaSet(kubernetes.client.models.v1_replica_set.V1ReplicaSet):
 
         return entry
 
+    @staticmethod
+    def get_pods_by_owner_uid(field_selector=RUNNING_POD_FIELD_SELECTOR):
+        """Get pods in all namespaces grouped by the UID of their owning ReplicaSet.
+
+        Args:
+            field_selector (str): the field selector to use when listing pods.
+
+        Returns:
+            A dict mapping from ReplicaSet UID to a list of pods owned by that
+            ReplicaSet.
+
+        Raises:
+            ApiException: An error occurred while retrieving data.
+            ConfigException: An error occurred while reading the K8s config.
+        """
+        corev1 = load_kube_api()
+
+        try:
+            pods = corev1.list_pod_for_all_namespaces(field_selector=field_selector).items
+        except ApiException as err:
+            raise ApiException('Could not retrieve list of pods: {}'.format(err))
+
+        pods_by_owner_uid = defaultdict(list)
+        for pod in pods:
+            for owner in pod.metadata.owner_references or []:
+                if owner.kind == 'ReplicaSet':
+                    pods_by_owner_uid[owner.uid].append(pod)
+
+        return pods_by_owner_uid
+
     @classmethod
     def get_all_replica_sets(cls):
         """Returns a list of all available replica sets.
 
-        This method also maps each replica set to Pod objects returned by
-        the Kubernetes API.
+        This method also maps each replica set to its running Pod objects
+        returned by the Kubernetes API. All pods are retrieved with a single
+        request, so this makes two Kubernetes API requests in total.
 
         Returns:
             A list of replica sets.
@@ -123,7 +144,10 @@ class ReplicaSet(kubernetes.client.models.v1_replica_set.V1ReplicaSet):
         except ApiException as err:
             raise ApiException('Could not retrieve list of replicasets: {}'.format(err))
 
+        pods_by_owner_uid = cls.get_pods_by_owner_uid()
+
         for rs in replica_sets:
             rs.__class__ = ReplicaSet
+            rs.pods_by_owner_uid = pods_by_owner_uid
 
         return replica_sets
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -28,6 +28,7 @@ import logging
 
 from sat.apiclient import APIError, HSMClient
 from sat.constants import MISSING_VALUE
+from sat.node_directory import NodeDirectory
 from sat.session import SATSession
 
 
@@ -37,30 +38,33 @@ ERR_MISSING_NAMES = 1
 ERR_HSM_API_FAILED = 2
 
 
-def get_xname_using_nid(nid, components):
-    """Get the xname for a given nid from node component data from the HSM API.
+def get_xname_using_nid(nid, node_directory):
+    """Get the xname for a given nid from the node directory.
 
     Args:
         nid(str): The nid.
-        components(list): A list of dictionaries representing the node components
-            in the system.
+        node_directory(sat.node_directory.NodeDirectory): The directory of
+            the node components in the system.
 
     Returns:
         An xname corresponding to the nid.
+
+    Raises:
+        APIError: if the request to the HSM API fails.
     """
 
     xname = None
-    for component in components:
-        cnid = component.get('NID')
-        if not cnid:
-            continue
-        if str(cnid) == nid:
-            xname = component.get('ID')
-            if xname:
-                LOGGER.debug(f'xname: {xname}, nid: {nid}')
-            else:
-                LOGGER.error(f'HSM API has no ID for valid NID: {cnid}')
-            break
+    try:
+        component = node_directory.get_component_by_nid(int(nid))
+    except ValueError:
+        component = None
+
+    if component:
+        xname = component.get('ID')
+        if xname:
+            LOGGER.debug(f'xname: {xname}, nid: {nid}')
+        else:
+            LOGGER.error(f'HSM API has no ID for valid NID: {component.get("NID")}')
 
     if not xname:
         LOGGER.error(f'xname: {MISSING_VALUE}, nid: {nid}')
@@ -226,10 +230,10 @@ def do_nid2xname(args):
     Raises:
         SystemExit: if request to HSM API fails.
     """
-    hsm_client = HSMClient(SATSession())
+    node_directory = NodeDirectory(HSMClient(SATSession()))
 
     try:
-        components = hsm_client.get_node_components()
+        node_directory.get_node_components()
     except APIError as err:
         LOGGER.error('Request to HSM API failed: %s', err)
         raise SystemExit(ERR_HSM_API_FAILED)
@@ -251,7 +255,11 @@ def do_nid2xname(args):
         # the arg no longer has prefix[nid...]s
         for nid_arg in [n for n in new_arg.split(',') if n]:
             for nid in parse_nid_arg(nid_arg):
-                xname = get_xname_using_nid(nid, components)
+                try:
+                    xname = get_xname_using_nid(nid, node_directory)
+                except APIError as err:
+                    LOGGER.error('Request to HSM API failed: %s', err)
+                    raise SystemExit(ERR_HSM_API_FAILED)
                 if not xname:
                     any_missing_xnames = True
                 else:
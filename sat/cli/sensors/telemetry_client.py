@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -33,7 +33,7 @@ import time
 import sseclient
 
 from sat.apiclient import APIError, ReadTimeout, TelemetryAPIClient
-from sat.session import SATSession
+from sat.session import get_shared_client
 
 from sat.cli.sensors.sensor_fields import UNIQUE_SENSOR_FIELD_MAPPING
 
@@ -89,7 +89,7 @@ class TelemetryClient(threading.Thread):
             'Metrics': metrics
         }
         all_results[results_index] = self.results
-        self.api_client = TelemetryAPIClient(SATSession())
+        self.api_client = get_shared_client(TelemetryAPIClient)
 
     def get_topic(self):
         """Get the Kafka topic being consumed using this thread.
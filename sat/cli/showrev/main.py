@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -97,7 +97,7 @@ def do_showrev(args):
             reports.append(Report(
                 headings, title, sort_by, reverse, no_headings, no_borders,
                 filter_strs=args.filter_strs, display_headings=args.fields,
-                print_format=args.format))
+                print_format=args.format, limit=args.limit, offset=args.offset))
             reports[-1].add_rows(data)
 
     assign_default_args(args)
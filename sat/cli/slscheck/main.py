@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021, 2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2025-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -425,7 +425,9 @@ def do_slscheck(args):
         get_config_value('format.no_borders'),
         filter_strs=args.filter_strs,
         display_headings=args.fields,
-        print_format=args.format)
+        print_format=args.format,
+        limit=args.limit,
+        offset=args.offset)
     report.add_rows(crosscheck_results)
 
     print(report)
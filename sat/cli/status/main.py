@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2022, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2022, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -24,17 +24,27 @@
 """
 Entry point for the status subcommand.
 """
+from functools import lru_cache
 import logging
+import sys
 
 from csm_api_client.service.gateway import APIError
-from csm_api_client.service.hsm import HSMClient
+from parsec import ParseError
 
 from sat.apiclient.bos import BOSClientCommon
 from sat.cli.status.constants import COMPONENT_TYPES
 import sat.cli.status.status_module
+from sat.cli.status.snapshot import (
+    CHANGE_HEADING,
+    SnapshotError,
+    StatusSnapshot,
+    get_changed_rows
+)
 from sat.cli.status.status_module import StatusModule
+from sat.cli.status.watch import StatusWatcher
 from sat.config import get_config_value
-from sat.filtering import CustomFilter
+from sat.filtering import CustomFilter, get_required_equalities, parse_multiple_query_strings
+from sat.node_directory import NodeDirectory
 from sat.report import Report
 from sat.session import SATSession
 from sat.xname import XName
@@ -45,6 +55,19 @@ LOGGER = logging.getLogger(__name__)
 # When possible, put Aliases right after xnames for ease of reading
 DEFAULT_HEADING_ORDER = ['xname', 'Aliases']
 
+# Map from HSM status headings to the HSM State Components query parameters
+# which select components by the value under that heading
+HSM_FILTER_PARAMS = {
+    'State': 'state',
+    'Flag': 'flag',
+    'Enabled': 'enabled',
+    'Arch': 'arch',
+    'Class': 'class',
+    'Role': 'role',
+    'SubRole': 'subrole',
+    'Net Type': 'nettype',
+}
+
 
 class UsageError(Exception):
     pass
@@ -119,7 +142,7 @@ def group_dicts_by(key, dicts):
     return grouped
 
 
-def get_bos_template_filter_fn(bos_template, session):
+def get_bos_template_filter_fn(bos_template, session, node_directory=None):
     """Get a function which filters nodes based on session template.
 
     The returned filter function will filter xnames based on whether they are
@@ -129,6 +152,9 @@ def get_bos_template_filter_fn(bos_template, session):
     Args:
         bos_template (str): the name of the BOS session template
         session (SATSession): a SATSession object to connect to the API gateway
+        node_directory (sat.node_directory.NodeDirectory or None): the directory
+            used to get the members of node groups. If None, a new one is
+            created with `session`.
 
     Returns:
         A CustomFilter object which can filter rows based on nodes' belonging
@@ -136,7 +162,7 @@ def get_bos_template_filter_fn(bos_template, session):
     """
 
     skip_filter = False
-    hsm_client = HSMClient(session)
+    node_directory = node_directory or NodeDirectory.from_session(session)
     bos_client = BOSClientCommon.get_bos_client(session)
 
     nodes = set()
@@ -148,9 +174,7 @@ def get_bos_template_filter_fn(bos_template, session):
             roles |= set(boot_set.get('node_roles_groups', []))
             nodes |= set(boot_set.get('node_list', []))
             for node_group in boot_set.get('node_groups', []):
-                nodes |= set(hsm_client.get_component_xnames(params={
-                    'group': node_group
-                }))
+                nodes |= node_directory.get_group_members(node_group)
 
     except APIError as err:
         LOGGER.warning('Could not get nodes from the given session template: %s', err)
@@ -164,53 +188,115 @@ def get_bos_template_filter_fn(bos_template, session):
     return CustomFilter(filter_fn, ['xname'])
 
 
-def do_status(args):
-    """Displays node status.
+def get_hsm_filter_params(filter_strs, component_types, limit_modules=None):
+    """Get HSM query parameters which implement part of the given filters.
 
-    Results are sorted by the "sort_column" member of args, which defaults
-    to xname. xnames are tokenized for the purposes of sorting, so that their
-    numeric elements are sorted by their value, not lexicographically. Sort
-    order is reversed if the "reverse" member of args is True.
+    Only the exact string comparisons on HSM fields which every row must
+    satisfy, for every one of the given component types, are translated to
+    query parameters. The filters must still be applied to the returned rows
+    in full, since the remaining comparisons are not translated.
 
     Args:
-        args: The argparse.Namespace object containing the parsed arguments
-            passed to this subcommand.
+        filter_strs (list of str or None): the filter strings given by the user.
+        component_types (list of str): the component types being queried.
+        limit_modules (list or None): the status modules being queried, or None
+            if all modules are being queried.
 
     Returns:
-        None
+        dict: the HSM State Components query parameters, which is empty if no
+            part of the filters can be translated to query parameters.
     """
-    session = SATSession()
+    if not filter_strs:
+        return {}
 
-    modules = args.status_module_names
-    if modules is not None:
-        modules = []
-        seen_module_names = set()
-        for module_name in args.status_module_names:
-            if module_name in seen_module_names:
+    params_by_type = []
+    for component_type in component_types:
+        headings = StatusModule.get_all_headings(
+            primary_key='xname',
+            limit_modules=limit_modules,
+            component_type=component_type,
+            initial_headings=DEFAULT_HEADING_ORDER
+        )
+        try:
+            filter_fn = parse_multiple_query_strings(filter_strs, headings)
+        except ParseError:
+            # Leave reporting the invalid filter to the Report.
+            return {}
+
+        params = {}
+        conflicting = set()
+        for field, value in get_required_equalities(filter_fn):
+            param = HSM_FILTER_PARAMS.get(field)
+            if param is None:
                 continue
+            if param == 'enabled':
+                value = value.lower()
+                if value not in ('true', 'false'):
+                    continue
+            if params.get(param, value).lower() != value.lower():
+                conflicting.add(param)
+            params[param] = value
+        params_by_type.append({param: value for param, value in params.items()
+                               if param not in conflicting})
 
-            module_cls = getattr(sat.cli.status.status_module, module_name)
-            can_use, err_reason = module_cls.can_use()
-            if not can_use:
-                LOGGER.warning('Cannot retrieve status information from %s: %s',
-                               module_cls.source_name, err_reason)
-            else:
-                modules.append(module_cls)
-            seen_module_names.add(module_name)
+    if not params_by_type:
+        return {}
+    return {param: value for param, value in params_by_type[0].items()
+            if all(params.get(param) == value for params in params_by_type[1:])}
 
-    # Safeguard against `args.types` being None even though the default value is ["Node"]
-    types = COMPONENT_TYPES if args.types is None or 'all' in args.types else args.types
-    multiple_reports = len(types) != 1
-    report_strings = []
 
-    components = StatusModule.get_populated_rows(
-        primary_key='xname',
-        session=session,
-        component_types=types,
-        limit_modules=modules,
-        primary_key_type=XName,
-    )
+def get_status_module_classes(module_names):
+    """Get the status module classes with the given names which can be used.
+
+    Args:
+        module_names (list of str or None): the names of the status module
+            classes, or None to use all status modules.
+
+    Returns:
+        list of type or None: the usable StatusModule subclasses with the given
+            names, or None if `module_names` is None.
+    """
+    if module_names is None:
+        return None
+
+    modules = []
+    seen_module_names = set()
+    for module_name in module_names:
+        if module_name in seen_module_names:
+            continue
+
+        module_cls = getattr(sat.cli.status.status_module, module_name)
+        can_use, err_reason = module_cls.can_use()
+        if not can_use:
+            LOGGER.warning('Cannot retrieve status information from %s: %s',
+                           module_cls.source_name, err_reason)
+        else:
+            modules.append(module_cls)
+        seen_module_names.add(module_name)
+    return modules
+
 
+def get_status_reports(args, components, modules, multiple_reports, get_bos_template_filter,
+                       extra_headings=None):
+    """Get a Report for each type of component.
+
+    Args:
+        args: The argparse.Namespace object containing the parsed arguments
+            passed to this subcommand.
+        components (list of dict): the populated status rows of the components.
+        modules (list of type or None): the status modules being queried, or
+            None if all modules are being queried.
+        multiple_reports (bool): if True, give each report a title naming the
+            component type.
+        get_bos_template_filter (Callable[[], CustomFilter]): a function which
+            returns the filter for the BOS session template given in `args`.
+        extra_headings (list of str or None): headings not provided by any
+            status module to show after the primary key.
+
+    Returns:
+        list of Report: the report for each type of component.
+    """
+    reports = []
     for component_type, components_by_type in group_dicts_by('Type', components).items():
         title = f'{component_type} Status' if multiple_reports else None
         headings = StatusModule.get_all_headings(
@@ -223,13 +309,13 @@ def do_status(args):
             LOGGER.warning('None of the selected fields are relevant to component type %s; skipping.',
                            component_type)
             continue
+        if extra_headings:
+            headings = [headings[0], *extra_headings, *headings[1:]]
 
         extra_filter_fns = []
         if args.bos_template:
             if component_type == 'Node':
-                extra_filter_fns.append(
-                    get_bos_template_filter_fn(args.bos_template, session)
-                )
+                extra_filter_fns.append(get_bos_template_filter())
             else:
                 LOGGER.warning('%s components cannot be filtered by BOS session template; '
                                'all components will be shown.',
@@ -243,10 +329,114 @@ def do_status(args):
             filter_strs=args.filter_strs,
             filter_fns=extra_filter_fns,
             display_headings=args.fields,
-            print_format=args.format
+            print_format=args.format,
+            limit=args.limit,
+            offset=args.offset
         )
 
         report.add_rows(components_by_type)
-        report_strings.append(str(report))
+        reports.append(report)
+    return reports
+
+
+def do_status(args):
+    """Displays node status.
+
+    Results are sorted by the "sort_column" member of args, which defaults
+    to xname. xnames are tokenized for the purposes of sorting, so that their
+    numeric elements are sorted by their value, not lexicographically. Sort
+    order is reversed if the "reverse" member of args is True.
+
+    If the "watch" member of args is set, the status is polled repeatedly at
+    that interval, in seconds, using the same session, and the changes are
+    shown until interrupted.
+
+    If the "since" member of args is set, only the components which changed,
+    were added, or were removed since the snapshot at that path are shown. If
+    the "save_snapshot" member of args is set, the status of all components is
+    saved to a snapshot at that path.
+
+    Args:
+        args: The argparse.Namespace object containing the parsed arguments
+            passed to this subcommand.
+
+    Returns:
+        None
+    """
+    if args.watch and (args.since or args.save_snapshot):
+        LOGGER.error('The --watch option cannot be used with --since or --save-snapshot.')
+        sys.exit(1)
+
+    old_snapshot = None
+    if args.since:
+        try:
+            old_snapshot = StatusSnapshot.load(args.since)
+        except SnapshotError as err:
+            LOGGER.error(err)
+            sys.exit(1)
+
+    session = SATSession()
+    # The node directory is shared so node aliases and groups are each queried once
+    node_directory = NodeDirectory.from_session(session)
+    modules = get_status_module_classes(args.status_module_names)
+
+    # Safeguard against `args.types` being None even though the default value is ["Node"]
+    types = COMPONENT_TYPES if args.types is None or 'all' in args.types else args.types
+    multiple_reports = len(types) != 1
+
+    # When comparing with or saving a snapshot, all components of the given
+    # types are queried, so that a component which no longer matches the
+    # filters is shown as changed rather than as removed, and so that the
+    # snapshot is not limited by the filters.
+    hsm_filter_params = {}
+    if old_snapshot is None and not args.save_snapshot:
+        hsm_filter_params = get_hsm_filter_params(args.filter_strs, types, limit_modules=modules)
+    if hsm_filter_params:
+        LOGGER.debug('Querying HSM for components with parameters: %s', hsm_filter_params)
+
+    # Rows from status modules whose data does not change are only queried once
+    row_cache = {}
+
+    @lru_cache(maxsize=1)
+    def get_bos_template_filter():
+        return get_bos_template_filter_fn(args.bos_template, session, node_directory)
+
+    def get_components():
+        return StatusModule.get_populated_rows(
+            primary_key='xname',
+            session=session,
+            component_types=types,
+            limit_modules=modules,
+            primary_key_type=XName,
+            hsm_filter_params=hsm_filter_params,
+            node_directory=node_directory,
+            row_cache=row_cache,
+        )
 
-    print('\n\n'.join(report_strings))
+    if args.watch:
+        StatusWatcher(lambda: get_status_reports(args, get_components(), modules, multiple_reports,
+                                                 get_bos_template_filter),
+                      args.watch, session=session).watch()
+        return
+
+    components = get_components()
+    if args.save_snapshot:
+        try:
+            StatusSnapshot.from_rows(components).save(args.save_snapshot)
+        except SnapshotError as err:
+            LOGGER.error(err)
+            sys.exit(1)
+        LOGGER.info('Saved status snapshot of %d components to %s', len(components), args.save_snapshot)
+
+    extra_headings = None
+    if old_snapshot is not None:
+        LOGGER.info('Showing changes since snapshot created at %s', old_snapshot.created)
+        components = get_changed_rows(old_snapshot, components, primary_key_type=XName,
+                                      component_types=types)
+        extra_headings = [CHANGE_HEADING]
+        if not components:
+            LOGGER.info('No components have changed since the snapshot was created.')
+
+    reports = get_status_reports(args, components, modules, multiple_reports,
+                                 get_bos_template_filter, extra_headings=extra_headings)
+    print('\n\n'.join(str(report) for report in reports))
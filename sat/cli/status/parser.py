@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2022, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2022, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -24,11 +24,33 @@
 """
 The parser for the status subcommand.
 """
+from argparse import ArgumentTypeError
 
 from sat.cli.status.constants import COMPONENT_TYPES, DEFAULT_TYPE
 import sat.parsergroups
 
 
+def positive_float(value):
+    """Converts a string to a positive float.
+
+    Args:
+        value (str): The value, which should be a positive number.
+
+    Returns:
+        The converted float value.
+
+    Raises:
+        argparse.ArgumentTypeError: if the value is invalid.
+    """
+    try:
+        converted = float(value)
+    except ValueError:
+        converted = None
+    if converted is None or not converted > 0:
+        raise ArgumentTypeError(f"Expected a positive number, got '{value}'.")
+    return converted
+
+
 def add_status_subparser(subparsers):
     """Add the status subparser to the parent parser.
 
@@ -103,3 +125,23 @@ def add_status_subparser(subparsers):
         choices=['v2', 'v3'],
         help='The version of the CFS API to use for CFS operations',
     )
+
+    status_parser.add_argument(
+        '--watch', metavar='INTERVAL', type=positive_float,
+        help='Poll the status every INTERVAL seconds until interrupted, showing '
+             'only what changed since the previous poll. On a terminal, changed '
+             'rows are redrawn in place and highlighted; otherwise a timestamped '
+             'line is printed for each change.'
+    )
+
+    status_parser.add_argument(
+        '--save-snapshot', metavar='PATH',
+        help='Save the status of the queried components to a snapshot file at '
+             'PATH, which can later be given to --since.'
+    )
+
+    status_parser.add_argument(
+        '--since', metavar='SNAPSHOT',
+        help='Only show components whose status changed, which were added, or '
+             'which were removed since the given snapshot file was saved.'
+    )
@@ -0,0 +1,259 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Saving and comparing snapshots of component status.
+"""
+from collections import namedtuple
+from datetime import datetime, timezone
+import json
+
+from sat.constants import MISSING_VALUE
+
+# The version of the snapshot file format. Increment this when the format
+# changes in a way which older versions of this module cannot read.
+SNAPSHOT_VERSION = 1
+# The heading of the field which gives the type of each component
+TYPE_HEADING = 'Type'
+
+# The heading under which the kind of change to each component is shown
+CHANGE_HEADING = 'Change'
+
+StatusDiff = namedtuple('StatusDiff', ('changed', 'added', 'removed'))
+
+
+class SnapshotError(Exception):
+    """An error occurred while saving or loading a status snapshot."""
+
+
+def _normalize_value(value):
+    """Convert a status value to a value which is preserved by JSON."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+class StatusSnapshot:
+    """The status of a set of components at a point in time, keyed by primary key.
+
+    A snapshot is stored as a JSON object containing the format version, the
+    time the snapshot was created, the primary key, the list of headings, and
+    a list of the values of each row in the same order as the headings.
+    """
+
+    def __init__(self, headings, rows, primary_key='xname', created=None):
+        """Create a new StatusSnapshot.
+
+        Args:
+            headings (list of str): the headings of the fields in each row,
+                starting with the primary key.
+            rows (dict): a mapping from the str value of the primary key of
+                each row to a dict mapping from heading to value.
+            primary_key (str): the heading of the field which identifies each row.
+            created (str or None): the ISO 8601 time the snapshot was created,
+                or None to use the current time.
+        """
+        self.headings = headings
+        self.rows = rows
+        self.primary_key = primary_key
+        self.created = created or datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+    @classmethod
+    def from_rows(cls, rows, primary_key='xname'):
+        """Create a snapshot from rows of status information.
+
+        Args:
+            rows (list of dict): the rows, as returned by
+                `StatusModule.get_populated_rows`.
+            primary_key (str): the heading of the field which identifies each row.
+
+        Returns:
+            StatusSnapshot: the snapshot of the rows.
+        """
+        headings = {primary_key: None}
+        snapshot_rows = {}
+        for row in rows:
+            headings.update(dict.fromkeys(row))
+            snapshot_rows[str(row[primary_key])] = {heading: _normalize_value(value)
+                                                    for heading, value in row.items()}
+        return cls(list(headings), snapshot_rows, primary_key=primary_key)
+
+    @classmethod
+    def load(cls, path):
+        """Load a snapshot from a file.
+
+        Args:
+            path (str): the path to the snapshot file.
+
+        Returns:
+            StatusSnapshot: the snapshot loaded from the file.
+
+        Raises:
+            SnapshotError: if the file cannot be read or is not a valid snapshot.
+        """
+        try:
+            with open(path, 'r') as f:
+                contents = json.load(f)
+        except OSError as err:
+            raise SnapshotError(f'Unable to read snapshot file {path}: {err}') from err
+        except ValueError as err:
+            raise SnapshotError(f'Unable to parse snapshot file {path}: {err}') from err
+
+        if not isinstance(contents, dict):
+            raise SnapshotError(f'Snapshot file {path} does not contain a JSON object.')
+        version = contents.get('version')
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f'Snapshot file {path} has unsupported version {version}; '
+                                f'expected version {SNAPSHOT_VERSION}.')
+
+        try:
+            headings = contents['headings']
+            primary_key = contents['primary_key']
+            key_index = headings.index(primary_key)
+            rows = {str(values[key_index]): dict(zip(headings, values))
+                    for values in contents['rows']}
+        except (KeyError, TypeError, ValueError, IndexError) as err:
+            raise SnapshotError(f'Snapshot file {path} is not a valid snapshot: {err}') from err
+
+        return cls(headings, rows, primary_key=primary_key, created=contents.get('created'))
+
+    def save(self, path):
+        """Save the snapshot to a file.
+
+        Args:
+            path (str): the path to the snapshot file.
+
+        Raises:
+            SnapshotError: if the file cannot be written.
+        """
+        contents = {
+            'version': SNAPSHOT_VERSION,
+            'created': self.created,
+            'primary_key': self.primary_key,
+            'headings': self.headings,
+            'rows': [[row.get(heading, MISSING_VALUE) for heading in self.headings]
+                     for row in self.rows.values()],
+        }
+        try:
+            with open(path, 'w') as f:
+                json.dump(contents, f, separators=(',', ':'))
+        except OSError as err:
+            raise SnapshotError(f'Unable to write snapshot file {path}: {err}') from err
+
+    def get_row_hashes(self, headings):
+        """Get a hash of the values of each row under the given headings.
+
+        Args:
+            headings (list of str): the headings of the values to hash.
+
+        Returns:
+            dict: a mapping from the primary key of each row to its hash.
+        """
+        return {key: hash(tuple([row.get(heading) for heading in headings]))
+                for key, row in self.rows.items()}
+
+
+def diff_snapshots(old, new):
+    """Get the differences between two snapshots.
+
+    Only the headings present in both snapshots are compared, so that
+    snapshots taken with different sets of fields can still be compared.
+    Rows are compared by hash, and only the rows whose hashes differ are
+    compared field by field.
+
+    Args:
+        old (StatusSnapshot): the earlier snapshot.
+        new (StatusSnapshot): the later snapshot.
+
+    Returns:
+        StatusDiff: the differences between the snapshots, where `changed` is
+            a mapping from the primary key of each changed row to the list of
+            headings whose values changed, `added` is the list of primary keys
+            only in `new`, and `removed` is the list of primary keys only in `old`.
+    """
+    old_headings = set(old.headings)
+    headings = [heading for heading in new.headings if heading in old_headings]
+    old_hashes = old.get_row_hashes(headings)
+    new_hashes = new.get_row_hashes(headings)
+
+    changed = {}
+    added = []
+    for key, row_hash in new_hashes.items():
+        old_hash = old_hashes.get(key)
+        if old_hash is None:
+            added.append(key)
+        elif old_hash != row_hash:
+            old_row, new_row = old.rows[key], new.rows[key]
+            changed_headings = [heading for heading in headings
+                                if old_row.get(heading) != new_row.get(heading)]
+            # Guard against hash collisions between equal rows
+            if changed_headings:
+                changed[key] = changed_headings
+    removed = [key for key in old_hashes if key not in new_hashes]
+
+    return StatusDiff(changed, added, removed)
+
+
+def get_changed_rows(old, rows, primary_key='xname', primary_key_type=str, component_types=None):
+    """Get the rows which changed, were added, or were removed since a snapshot.
+
+    Args:
+        old (StatusSnapshot): the earlier snapshot.
+        rows (list of dict): the current rows, as returned by
+            `StatusModule.get_populated_rows`.
+        primary_key (str): the heading of the field which identifies each row.
+        primary_key_type (str -> Any): a callable (or type) which converts the
+            primary key of removed rows from a string.
+        component_types (list of str or None): the component types which were
+            queried to get `rows`. Rows of `old` whose type is not one of these
+            are not reported as removed, because they were not queried. If
+            None, every row of `old` not in `rows` is reported as removed.
+
+    Returns:
+        list of dict: the current rows which changed or were added, and the
+            rows from `old` which were removed, each with a description of the
+            change under the CHANGE_HEADING heading.
+    """
+    diff = diff_snapshots(old, StatusSnapshot.from_rows(rows, primary_key=primary_key))
+    added = set(diff.added)
+
+    changed_rows = []
+    for row in rows:
+        key = str(row[primary_key])
+        if key in diff.changed:
+            change = f'changed: {", ".join(diff.changed[key])}'
+        elif key in added:
+            change = 'added'
+        else:
+            continue
+        changed_rows.append({**row, CHANGE_HEADING: change})
+
+    for key in diff.removed:
+        if component_types is not None and old.rows[key].get(TYPE_HEADING) not in component_types:
+            continue
+        removed_row = dict(old.rows[key])
+        removed_row[primary_key] = primary_key_type(removed_row[primary_key])
+        removed_row[CHANGE_HEADING] = 'removed'
+        changed_rows.append(removed_row)
+
+    return changed_rows
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2022, 2024-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2022, 2024-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -35,10 +35,10 @@ from csm_api_client.service.gateway import APIError
 from csm_api_client.service.hsm import HSMClient
 
 from sat.apiclient.bos import BOSClientCommon
-from sat.apiclient.sls import SLSClient
 from sat.config import get_config_value
 from sat.constants import MISSING_VALUE
-from sat.util import get_val_by_path
+from sat.node_directory import NodeDirectory
+from sat.util import compile_path, get_val_by_path
 
 
 LOGGER = logging.getLogger(__name__)
@@ -66,6 +66,10 @@ class StatusModule(ABC):
     `component_types` attribute to `{"Node"}`. If a set of relevant component
     types is not supplied, then the module is implicitly relevant to all
     component types.
+
+    Modules whose data does not change while the system is running, such as
+    hostnames from SLS, may set the `static` class attribute to `True` so that
+    their rows are only retrieved once when the status is polled repeatedly.
     """
 
     # The `_modules` class attribute should not be set by subclasses; if it is,
@@ -74,6 +78,7 @@ class StatusModule(ABC):
     _modules = []
     primary = False
     component_types = set()
+    static = False
 
     def __init__(self, *, session, **_):
         """Construct a StatusModule.
@@ -271,7 +276,7 @@ class StatusModule(ABC):
 
     @classmethod
     def get_populated_rows(cls, *, primary_key, session, component_types, limit_modules=None,
-                           primary_key_type=str, **kwargs):
+                           primary_key_type=str, row_cache=None, **kwargs):
         """Return a list of rows joining data from all defined modules.
 
         Additional keyword arguments are passed through to StatusModule
@@ -289,6 +294,9 @@ class StatusModule(ABC):
                 and returns an object. The primary key of the populated rows
                 will have this type.
             component_types (list of str): the list of component types to get data for
+            row_cache (dict or None): if given, a dict used to store the rows of
+                static modules between calls, so that they are only retrieved
+                from their data source once.
 
         Returns:
             [dict]: data from the status modules as described above,
@@ -321,7 +329,14 @@ class StatusModule(ABC):
                     row.update({heading: MISSING_VALUE for heading in module.headings
                                 if heading != primary_key})
 
-                for row in module_instance.rows:
+                if module.static and row_cache is not None:
+                    if module not in row_cache:
+                        row_cache[module] = list(module_instance.rows)
+                    module_rows = row_cache[module]
+                else:
+                    module_rows = module_instance.rows
+
+                for row in module_rows:
                     mapped_row = {}
 
                     for heading, value in row.items():
@@ -358,9 +373,19 @@ class HSMStatusModule(StatusModule):
     source_name = 'HSM'
     primary = True
 
-    def __init__(self, *, session, component_types, **_):
+    def __init__(self, *, session, component_types, hsm_filter_params=None, **_):
+        """Construct an HSMStatusModule.
+
+        Args:
+            session (sat.session.SATSession): a session for connecting to the
+                API gateway
+            component_types (list of str): the component types to query
+            hsm_filter_params (dict or None): additional HSM State Components
+                query parameters which narrow the components that are returned
+        """
         super().__init__(session=session)
         self.component_types = [] if 'all' in component_types else component_types
+        self.hsm_filter_params = hsm_filter_params or {}
 
     @staticmethod
     def map_heading(heading):
@@ -376,8 +401,21 @@ class HSMStatusModule(StatusModule):
     @property
     def rows(self):
         hsm_client = HSMClient(self.session)
+        params = {'type': self.component_types}
         try:
-            response = hsm_client.get('State', 'Components', params={'type': self.component_types})
+            if self.hsm_filter_params:
+                try:
+                    response = hsm_client.get('State', 'Components',
+                                              params={**params, **self.hsm_filter_params})
+                except APIError as err:
+                    # HSM rejects values it does not recognize, which should
+                    # match no rows rather than fail, so fall back to querying
+                    # all components and leave filtering to the report.
+                    LOGGER.debug('Failed to query HSM with parameters %s; querying all '
+                                 'components instead: %s', self.hsm_filter_params, err)
+                    response = hsm_client.get('State', 'Components', params=params)
+            else:
+                response = hsm_client.get('State', 'Components', params=params)
         except APIError as err:
             raise StatusModuleException(f'Request to HSM API failed: {err}') from err
 
@@ -405,31 +443,34 @@ class SLSStatusModule(StatusModule):
     headings = ['xname', 'Aliases']
     component_types = {'Node'}
     source_name = 'SLS'
+    static = True
+
+    def __init__(self, *, session, node_directory=None, **_):
+        """Construct an SLSStatusModule.
+
+        Args:
+            session (sat.session.SATSession): a session for connecting to the
+                API gateway
+            node_directory (sat.node_directory.NodeDirectory or None): the
+                directory used to get the aliases of nodes. If None, a new one
+                is created with `session`.
+        """
+        super().__init__(session=session)
+        self.node_directory = node_directory or NodeDirectory.from_session(session)
 
     @property
     def rows(self):
-        sls_client = SLSClient(self.session)
-
         try:
             # Per SLSStatusModule.component_types, this module only applies to the Node type in
-            # HSM, for which the corresponding SLS type is comptype_node. In the future, if other
+            # HSM, for which the node directory gets the aliases from SLS. In the future, if other
             # types may have aliases that should be presented by `sat status`, this may need to be
             # extended.
-            sls_response = sls_client.get('search', 'hardware', params={'type': 'comptype_node'}).json()
+            aliases_by_xname = self.node_directory.get_all_aliases()
         except APIError as err:
             raise StatusModuleException(f'Could not query SLS for component aliases: {err}') from err
-        except ValueError as err:
-            raise StatusModuleException(f'Failed to parse JSON from SLS: {err}') from err
 
-        xname_aliases = []
-        for component in sls_response:
-            if ({'Xname', 'ExtraProperties'}.issubset(set(component.keys()))
-                    and 'Aliases' in component.get('ExtraProperties')):
-                xname_aliases.append({
-                    'xname': component.get('Xname'),
-                    'Aliases': ', '.join(get_val_by_path(component, 'ExtraProperties.Aliases'))
-                })
-        return xname_aliases
+        return [{'xname': xname, 'Aliases': ', '.join(aliases)}
+                for xname, aliases in aliases_by_xname.items()]
 
 
 class CFSStatusModule(StatusModule):
@@ -476,8 +517,24 @@ class BOSStatusModule(StatusModule):
     source_name = 'BOS'
     component_types = {'Node'}
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    # The maximum number of component IDs to request from BOS at once
+    COMPONENT_ID_BATCH_SIZE = 200
+
+    def __init__(self, *, session, primary_keys=None, hsm_filter_params=None, **_):
+        """Construct a BOSStatusModule.
+
+        Args:
+            session (sat.session.SATSession): a session for connecting to the
+                API gateway
+            primary_keys (Iterable or None): the xnames retrieved from HSM. If
+                given, only the BOS components with these IDs are processed.
+            hsm_filter_params (dict or None): the query parameters which
+                narrowed the xnames retrieved from HSM. If not empty, only the
+                BOS components with the IDs in `primary_keys` are requested.
+        """
+        super().__init__(session=session)
+        self.primary_keys = primary_keys
+        self.narrowed = bool(hsm_filter_params) and primary_keys is not None
         # Cache mappings of BOS IDs to BOS sessions to reduce calls to BOS.
         self._cached_bos_sessions = {}
         self.missing_sessions = {}
@@ -512,9 +569,17 @@ class BOSStatusModule(StatusModule):
     @property
     def rows(self):
         bos_client = BOSClientCommon.get_bos_client(self.session, version='v2')
+        wanted_ids = None if self.primary_keys is None else {str(key) for key in self.primary_keys}
 
         try:
-            raw_components = bos_client.get_components()
+            if self.narrowed:
+                ids = sorted(wanted_ids)
+                raw_components = []
+                for start in range(0, len(ids), self.COMPONENT_ID_BATCH_SIZE):
+                    batch = ids[start:start + self.COMPONENT_ID_BATCH_SIZE]
+                    raw_components.extend(bos_client.get_components(params={'ids': ','.join(batch)}))
+            else:
+                raw_components = bos_client.get_components()
         except APIError as err:
             raise StatusModuleException(f'Failed to query BOS for component information: {err}') from err
 
@@ -523,15 +588,19 @@ class BOSStatusModule(StatusModule):
             'Most Recent BOS Session': 'session',
             'Boot Status': 'status.status',
         }
+        headings_to_getters = {heading: compile_path(path) for heading, path in headings_to_paths.items()}
 
         components = []
         for raw_component in raw_components:
             if 'id' not in raw_component:
                 raise StatusModuleException('A component in BOS response is missing the "id" field')
+            if wanted_ids is not None and raw_component['id'] not in wanted_ids:
+                # Avoid looking up sessions for components which are not shown
+                continue
 
             component = {
-                heading: get_val_by_path(raw_component, path) or MISSING_VALUE
-                for heading, path in headings_to_paths.items()
+                heading: get_val(raw_component) or MISSING_VALUE
+                for heading, get_val in headings_to_getters.items()
             }
             component['Most Recent Image'] = self.get_image_for_component(raw_component)
 
@@ -0,0 +1,250 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Repeatedly refreshes the output of the status subcommand.
+"""
+from collections import namedtuple
+from datetime import datetime
+import shutil
+import sys
+import time
+
+# ANSI escape sequences used to update the terminal in place
+CLEAR_SCREEN = '\x1b[H\x1b[2J'
+CLEAR_TO_END = '\x1b[J'
+CLEAR_LINE = '\x1b[2K'
+MOVE_CURSOR = '\x1b[{line};1H'
+HIGHLIGHT = '\x1b[7m{}\x1b[0m'
+
+# The maximum number of changes to list below the table in a terminal
+MAX_CHANGES_SHOWN = 10
+
+StatusChange = namedtuple('StatusChange', ('key', 'field', 'old', 'new'))
+
+
+def get_rows_by_key(reports, primary_key='xname'):
+    """Gets the rows displayed by the given reports keyed by their primary key.
+
+    Args:
+        reports (list of sat.report.Report): the reports.
+        primary_key (str): the heading of the field which identifies each row.
+
+    Returns:
+        dict: a mapping from the str value of the primary key of each row to
+            a dict mapping from each displayed heading to the str value of that
+            field. Rows without the primary key are keyed by their position.
+    """
+    rows_by_key = {}
+    for report in reports:
+        _, rows = report.get_rows_to_print()
+        for row in rows:
+            key = str(row.get(primary_key, len(rows_by_key)))
+            rows_by_key[key] = {heading: str(value) for heading, value in row.items()}
+    return rows_by_key
+
+
+def get_status_changes(old_rows, new_rows):
+    """Gets the changes between two sets of rows.
+
+    Args:
+        old_rows (dict): the previous rows, as returned by `get_rows_by_key`.
+        new_rows (dict): the current rows, as returned by `get_rows_by_key`.
+
+    Returns:
+        list of StatusChange: the changes in the rows. A row which was added
+            has a field of None and an old value of None, and a row which was
+            removed has a field of None and a new value of None.
+    """
+    changes = []
+    for key, new_row in new_rows.items():
+        old_row = old_rows.get(key)
+        if old_row is None:
+            changes.append(StatusChange(key, None, None, 'added'))
+            continue
+        for field, new_value in new_row.items():
+            old_value = old_row.get(field)
+            if old_value != new_value:
+                changes.append(StatusChange(key, field, old_value, new_value))
+    for key in old_rows.keys() - new_rows.keys():
+        changes.append(StatusChange(key, None, 'removed', None))
+    return changes
+
+
+def format_status_change(change):
+    """Gets a one-line description of a change.
+
+    Args:
+        change (StatusChange): the change.
+
+    Returns:
+        str: the description of the change.
+    """
+    if change.field is None:
+        return f'{change.key}: {change.old or change.new}'
+    return f'{change.key}: {change.field} {change.old} -> {change.new}'
+
+
+class StatusWatcher:
+    """Polls component status and shows how it changes over time.
+
+    When writing to a terminal which is tall enough to show the whole table,
+    the table is drawn once, and then only the lines of the table which
+    changed are redrawn and highlighted, followed by a list of the changes.
+    Otherwise, the table is written once, and then a timestamped line is
+    appended for each change.
+    """
+
+    def __init__(self, get_reports, interval, stream=None, session=None):
+        """Create a new StatusWatcher.
+
+        Args:
+            get_reports (Callable[[], list of sat.report.Report]): a function
+                which polls the status modules and returns the reports to show.
+            interval (float): the number of seconds between the start of each
+                poll.
+            stream (io.TextIOBase): the stream to write to. Defaults to stdout.
+            session (sat.session.SATSession): the session used by
+                `get_reports`. Its request deadline is restarted before each
+                poll, so that the deadline applies to each poll rather than
+                to the whole time spent watching.
+        """
+        self.get_reports = get_reports
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stdout
+        self.session = session
+        self.in_place = self.stream.isatty()
+
+        # The lines drawn in place on the terminal, or None if the table is
+        # not currently drawn in place
+        self.lines = None
+        # The indices of the lines which are highlighted on the terminal
+        self.highlighted = set()
+        self.rows = None
+
+    def write(self, text):
+        """Write text to the stream and flush it."""
+        self.stream.write(text)
+        self.stream.flush()
+
+    def get_footer_lines(self, changes):
+        """Get the lines shown below the table in a terminal."""
+        footer = [f'Every {self.interval:g}s. Last updated {datetime.now():%Y-%m-%d %H:%M:%S}. '
+                  f'{len(changes)} change(s).']
+        footer.extend(format_status_change(change) for change in changes[:MAX_CHANGES_SHOWN])
+        if len(changes) > MAX_CHANGES_SHOWN:
+            footer.append(f'... and {len(changes) - MAX_CHANGES_SHOWN} more')
+        return footer
+
+    def fits_terminal(self, lines, changes):
+        """Get whether the lines and footer fit on the terminal without scrolling.
+
+        Args:
+            lines (list of str): the lines of output.
+            changes (list of StatusChange): the changes since the last poll.
+
+        Returns:
+            bool: True if the output fits on the terminal.
+        """
+        # The lines, a blank line, the footer, and the line the cursor is left on
+        height = len(lines) + len(self.get_footer_lines(changes)) + 2
+        return height <= shutil.get_terminal_size().lines
+
+    def redraw(self, lines, changes):
+        """Update the terminal to show the given lines of output.
+
+        If the number of lines is unchanged, only the lines which changed are
+        rewritten and highlighted, and the lines highlighted by the previous
+        redraw are rewritten without highlighting. Otherwise, the screen is
+        cleared and all lines are written.
+
+        Args:
+            lines (list of str): the lines of output.
+            changes (list of StatusChange): the changes since the last poll.
+        """
+        if self.lines is None or len(lines) != len(self.lines):
+            output = [CLEAR_SCREEN]
+            output.extend(f'{line}\n' for line in lines)
+            highlighted = set()
+        else:
+            highlighted = {index for index, (line, old_line) in enumerate(zip(lines, self.lines))
+                           if line != old_line}
+            output = [
+                f'{MOVE_CURSOR.format(line=index + 1)}{CLEAR_LINE}'
+                f'{HIGHLIGHT.format(lines[index]) if index in highlighted else lines[index]}'
+                for index in sorted(highlighted | self.highlighted)
+            ]
+            output.append(MOVE_CURSOR.format(line=len(lines) + 1))
+        footer = '\n'.join(self.get_footer_lines(changes))
+        output.append(f'{CLEAR_TO_END}\n{footer}\n')
+        self.write(''.join(output))
+        self.lines = lines
+        self.highlighted = highlighted
+
+    def append_changes(self, changes):
+        """Write a timestamped line for each change."""
+        timestamp = datetime.now().isoformat(timespec='seconds')
+        self.write(''.join(f'{timestamp} {format_status_change(change)}\n' for change in changes))
+
+    def poll(self):
+        """Poll the status once and show the output or the changes."""
+        if self.session is not None:
+            self.session.reset_request_deadline()
+        reports = self.get_reports()
+        rows = get_rows_by_key(reports)
+        changes = [] if self.rows is None else get_status_changes(self.rows, rows)
+
+        output = '\n\n'.join(str(report) for report in reports)
+        lines = output.splitlines()
+        if self.in_place and self.fits_terminal(lines, changes):
+            self.redraw(lines, changes)
+        else:
+            # The table cannot be updated in place if it has scrolled off the
+            # terminal, so append the changes instead.
+            if self.rows is None:
+                self.write(output + '\n')
+            else:
+                self.append_changes(changes)
+            self.lines = None
+            self.highlighted = set()
+
+        self.rows = rows
+
+    def watch(self, max_polls=None):
+        """Poll the status repeatedly until interrupted.
+
+        Args:
+            max_polls (int or None): the number of times to poll, or None to
+                poll until interrupted.
+        """
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                start = time.monotonic()
+                self.poll()
+                polls += 1
+                if max_polls is None or polls < max_polls:
+                    time.sleep(max(0.0, self.interval - (time.monotonic() - start)))
+        except KeyboardInterrupt:
+            if self.in_place:
+                self.write('\n')
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,27 +25,62 @@
 Contains functions for modifying port configuration via fabric API.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 import re
+from threading import Lock
 
 import inflect
 
 from sat.apiclient import APIError, FabricControllerClient
 from sat.cli.swap.cable_endpoints import JACK_XNAME_REGEX, CableEndpoints
-from sat.session import SATSession
+from sat.session import get_shared_client
 
 LOGGER = logging.getLogger(__name__)
 
 INF = inflect.engine()
 
+# The maximum number of port documents to request from the fabric manager
+# concurrently. This matches the default connection pool size of requests, so
+# that all concurrent requests can share the connections of one session.
+MAX_CONCURRENT_PORT_REQUESTS = 10
+
 
 class PortManager:
-    """Manages port operations that use the Fabric Controller API"""
+    """Manages port operations that use the Fabric Controller API
+
+    Port and switch documents are cached by document link for the lifetime of
+    the PortManager.
+    """
 
     def __init__(self):
-        self.fabric_client = FabricControllerClient(SATSession())
+        self.fabric_client = get_shared_client(FabricControllerClient)
         self.cable_endpoints = CableEndpoints()
+        self._documents_by_link = {}
+        self._documents_lock = Lock()
+
+    def _get_cached_document(self, doc_link):
+        """Get a document that has already been retrieved from the fabric manager.
+
+        Args:
+            doc_link (str): The full path of the document link
+
+        Returns:
+            The dictionary of document data, or None if it is not cached.
+        """
+        with self._documents_lock:
+            return self._documents_by_link.get(doc_link)
+
+    def _cache_document(self, doc_link, document):
+        """Cache a document retrieved from the fabric manager.
+
+        Args:
+            doc_link (str): The full path of the document link
+            document (dict): The document data
+        """
+        with self._documents_lock:
+            self._documents_by_link[doc_link] = document
 
     def get_ports(self):
         """Get a list of port document links
@@ -79,6 +114,9 @@ class PortManager:
         Returns:
             A dictionary of port data or None if there is an error
         """
+        port = self._get_cached_document(port_link)
+        if port is not None:
+            return port
 
         # Get port information from fabric manager via gateway API.
         try:
@@ -94,6 +132,7 @@ class PortManager:
             LOGGER.error('Failed to parse JSON from fabric manager response: {}'.format(err))
             return None
 
+        self._cache_document(port_link, port)
         return port
 
     def get_switches(self):
@@ -128,6 +167,9 @@ class PortManager:
         Returns:
             A dictionary of switch data or None if there is an error
         """
+        switch = self._get_cached_document(switch_link)
+        if switch is not None:
+            return switch
 
         # Get switch information from fabric manager via gateway API.
         try:
@@ -143,6 +185,7 @@ class PortManager:
             LOGGER.error('Failed to parse JSON switch data from fabric manager response: {}'.format(err))
             return None
 
+        self._cache_document(switch_link, switch)
         return switch
 
     def get_port_policies(self):
@@ -171,6 +214,10 @@ class PortManager:
     def get_port_data_list(self, port_links):
         """Get a list of dictionaries for ports using document links for each port
 
+        The port documents are retrieved concurrently. All port documents are
+        retrieved even if some of them fail, and the failures are logged
+        together.
+
         Args:
             port_links (list): a list of port document links
                 Example: [/fabric/ports/x3000c0r15j14p0]
@@ -182,24 +229,35 @@ class PortManager:
                           "policy_links: ["/fabric/port-policies/cassini-policy",
                                           "/fabric/port-policies/qos-ll_be_bd_et-cassini-policy"]}
         """
-        port_data_list = []
-        for port_link in port_links:
-            port = self.get_port(port_link)
+        if not port_links:
+            return []
+
+        max_workers = min(MAX_CONCURRENT_PORT_REQUESTS, len(port_links))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            ports = list(executor.map(self.get_port, port_links))
 
+        port_data_list = []
+        failed_links = []
+        for port_link, port in zip(port_links, ports):
             if port is None:
-                LOGGER.error(f'Failed to get port data for {port_link}.')
-                return None
+                failed_links.append(port_link)
+                continue
 
-            port_data = {}
             try:
-                port_data['xname'] = port['conn_port']
-                port_data['port_link'] = port_link
-                port_data['policy_links'] = port['portPolicyLinks']
+                port_data_list.append({
+                    'xname': port['conn_port'],
+                    'port_link': port_link,
+                    'policy_links': port['portPolicyLinks']
+                })
             except KeyError as err:
-                LOGGER.error('Key %s for port data missing from fabric manager switch information.', err)
-                return None
+                LOGGER.error('Key %s for port data missing from fabric manager '
+                             'information for port %s.', err, port_link)
+                failed_links.append(port_link)
 
-            port_data_list.append(port_data)
+        if failed_links:
+            LOGGER.error(f'Failed to get port data for {len(failed_links)} '
+                         f'{INF.plural("port", len(failed_links))}: {", ".join(failed_links)}')
+            return None
 
         return port_data_list
 
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -29,6 +29,7 @@ import logging
 
 from sat.apiclient import APIError, HSMClient
 from sat.constants import MISSING_VALUE
+from sat.node_directory import NodeDirectory
 from sat.session import SATSession
 from sat.xname import XName
 
@@ -224,17 +225,30 @@ def do_xname2nid(args):
         SystemExit(2): if request to HSM API fails.
     """
 
-    hsm_client = HSMClient(SATSession())
+    node_directory = NodeDirectory(HSMClient(SATSession()))
 
+    # Create a dictionary with the results for each of the xname arguments
+    xname_results = init_xname_results(args.xnames)
+
+    # Node xname arguments are looked up directly in the node directory.
+    # Only container xname arguments need a scan of the node components.
+    container_results = OrderedDict()
     try:
-        components = hsm_client.get_node_components()
+        for arg, result in xname_results.items():
+            if result['type'] == 'NODE':
+                component = node_directory.get_component_by_xname(arg)
+                if component:
+                    process_node_component(arg, component, OrderedDict([(arg, result)]))
+            elif result['type'] != 'UNKNOWN':
+                container_results[arg] = result
+
+        # Get the components after the lookups above, since a lookup which
+        # misses in cached data reloads the components.
+        components = node_directory.get_node_components() if container_results else []
     except APIError as err:
         LOGGER.error('Request to HSM API failed: %s', err)
         raise SystemExit(ERR_HSM_API_FAILED)
 
-    # Create a dictionary with the results for each of the xname arguments
-    xname_results = init_xname_results(args.xnames)
-
     # Loop through the node components sorted by node xname as a string
     for component in sorted(components, key=lambda c: c.get('ID', MISSING_VALUE)):
         node_xname = component.get('ID')
@@ -243,12 +257,10 @@ def do_xname2nid(args):
             continue
 
         # Flag to indicate whether or not a node component matches one or more args
-        node_component_match = process_node_component(node_xname, component, xname_results)
+        node_component_match = process_node_component(node_xname, component, container_results)
 
-        if not node_component_match and \
-           all(result['found'] or result['type'] == 'UNKNOWN' for result in xname_results.values()):
-            # Exit the for loop early if all nodes for all valid xname arguments have been found.
-            # For NODE arguments, there will be only one matching node component.
+        if not node_component_match and all(result['found'] for result in container_results.values()):
+            # Exit the for loop early if all nodes for all container xname arguments have been found.
             # For BMC, SLOT, CHASSIS, and CABINET arguments (container xname), there can be
             # multiple node components that match.
             #
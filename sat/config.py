@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2025, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -26,6 +26,8 @@ Loads configuration from a config file in INI format.
 """
 
 from collections import namedtuple
+from contextlib import contextmanager
+from copy import deepcopy
 import getpass
 import logging
 import os
@@ -122,6 +124,13 @@ SAT_CONFIG_SPEC = {
         'tenant_name': OptionSpec(str, '', None, 'tenant_name'),
         'retries': OptionSpec(int, 5, None, 'api_retries'),
         'backoff': OptionSpec(float, 0.2, None, 'api_backoff'),
+        'connection_pool_size': OptionSpec(int, 16, None, None),
+        'hedge_percentile': OptionSpec(float, 0.0, None, None),
+        'request_deadline': OptionSpec(int, 0, None, None),
+        'circuit_breaker_failures': OptionSpec(int, 0, None, None),
+        'circuit_breaker_timeout': OptionSpec(int, 30, None, None),
+        'rate_limit': OptionSpec(float, 0.0, None, None),
+        'rate_limit_burst': OptionSpec(int, 10, None, None),
     },
     'bos': {
         'api_version': OptionSpec(str, 'v2', validate_bos_api_version, 'bos_version')
@@ -143,6 +152,8 @@ SAT_CONFIG_SPEC = {
         'show_missing': OptionSpec(bool, False, None, 'show_missing'),
     },
     'general': {
+        'cache_dir': OptionSpec(str, '~/.cache/sat', None, None),
+        'node_directory_ttl': OptionSpec(int, 0, None, None),
         'site_info': OptionSpec(str, '/opt/cray/etc/site_info.yml', None, None),
     },
     'logging': {
@@ -376,6 +387,30 @@ def get_config_value(query_string):
     return value
 
 
+@contextmanager
+def command_line_overrides(args):
+    """Temporarily override the loaded config with options given on a command line.
+
+    This is used to run several subcommands with their own options, as with
+    "sat batch", without reading the config file again for each of them. The
+    config is restored when the context exits.
+
+    Args:
+        args: a Namespace object returned by an ArgumentParser.
+    """
+    load_config()
+    saved_sections = deepcopy(CONFIG.sections)
+    try:
+        for section, options in SAT_CONFIG_SPEC.items():
+            for option, spec in options.items():
+                CONFIG.sections[section][option] = _option_value(
+                    args, CONFIG.sections[section][option], spec
+                )
+        yield
+    finally:
+        CONFIG.sections = saved_sections
+
+
 def read_config_value_file(query_string):
     """Loads a configuration value from a filename in the configuration.
 
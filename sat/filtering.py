@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -41,6 +41,8 @@ LOGGER = logging.getLogger(__name__)
 # Note: this comparator matching group is order-dependent because
 # Python's re module is very silly and does not use maximal munch.
 COMPARATOR_RE = r'(>=|<=|<|>|!=|=)'
+# Characters which have a special meaning in patterns compared with '='
+WILDCARD_CHARS = '*?['
 
 
 class BaseFilterFunction(abc.ABC):
@@ -428,6 +430,37 @@ def parse_multiple_query_strings(query_strings, fields, filter_fns=None):
     return CombinedFilter(all, *all_filter_fns)
 
 
+def get_required_equalities(filter_fn):
+    """Gets the exact field values which rows must have to pass a filter.
+
+    These come from the comparisons which are combined with boolean "and" at
+    the top level of the filter, i.e. which are not beneath an "or", and which
+    use "=" to compare a field named exactly (ignoring case) by its query key
+    to a string without wildcards. Any row which passes the filter must have
+    each of these fields equal to the given value, ignoring case.
+
+    Args:
+        filter_fn (BaseFilterFunction or None): the filter.
+
+    Returns:
+        list of tuple: a (field, value) tuple for each equality.
+    """
+    if isinstance(filter_fn, CombinedFilter):
+        if filter_fn.combinator is not all:
+            return []
+        return [equality for child in filter_fn.filter_fns
+                for equality in get_required_equalities(child)]
+
+    if not isinstance(filter_fn, ComparisonFilter):
+        return []
+    if (filter_fn.comparator != '=' or not isinstance(filter_fn.cmpr_val, str)
+            or any(char in filter_fn.cmpr_val for char in WILDCARD_CHARS)):
+        return []
+    if not any(field.lower() == filter_fn._raw_query_key.lower() for field in filter_fn.fields):
+        return []
+    return [(filter_fn.query_key, filter_fn.cmpr_val)]
+
+
 def remove_constant_values(dicts, constant_value, protect=None):
     """Filters the keys in each dict to remove keys that have a constant value
 
@@ -0,0 +1,662 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+An HTTPAdapter which applies request policies to requests to the API gateway.
+"""
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import logging
+import math
+from threading import Lock
+import time
+from urllib.parse import urlparse
+
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.exceptions import ConnectionError, RetryError, Timeout
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+LOGGER = logging.getLogger(__name__)
+
+# Requests using these methods may safely be sent more than once.
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+# The number of recent latencies kept for each service
+LATENCY_SAMPLE_SIZE = 100
+# The number of latencies which must be recorded for a service before its
+# requests are hedged
+MIN_HEDGE_SAMPLES = 10
+# Response status codes which may carry a Retry-After header asking clients to slow down
+RETRY_AFTER_STATUS_CODES = frozenset([429, 503])
+
+
+class CircuitOpenError(ConnectionError):
+    """A request was not sent because the circuit breaker for its service is open."""
+
+
+class DeadlineExceededError(Timeout):
+    """A request was not sent because the request deadline has passed."""
+
+
+def get_service_name(url):
+    """Get the name of the service that a request to the API gateway is for.
+
+    Args:
+        url (str): the URL of the request, e.g.
+            'https://api-gw-service-nmn.local/apis/smd/hsm/v2/State/Components'
+
+    Returns:
+        str: the first component of the path following 'apis/', e.g. 'smd',
+            or the entire path if the URL is not of that form.
+    """
+    path_components = urlparse(url).path.strip('/').split('/')
+    if len(path_components) > 1 and path_components[0] == 'apis':
+        return path_components[1]
+    return '/'.join(path_components)
+
+
+class LatencyTracker:
+    """Records the latencies of recent requests."""
+
+    def __init__(self, size=LATENCY_SAMPLE_SIZE):
+        """Create a new LatencyTracker.
+
+        Args:
+            size (int): the number of most recent latencies to keep.
+        """
+        self.latencies = deque(maxlen=size)
+        self._lock = Lock()
+
+    def record(self, latency):
+        """Record the latency of a request.
+
+        Args:
+            latency (float): the latency of the request, in seconds.
+        """
+        with self._lock:
+            self.latencies.append(latency)
+
+    def percentile(self, percentile, min_samples=MIN_HEDGE_SAMPLES):
+        """Get the given percentile of the recorded latencies.
+
+        Args:
+            percentile (float): the percentile to compute, from 0 to 100.
+            min_samples (int): the minimum number of recorded latencies
+                needed to compute the percentile.
+
+        Returns:
+            float or None: the latency at the given percentile, or None if
+                fewer than `min_samples` latencies have been recorded.
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if not latencies or len(latencies) < min_samples:
+            return None
+        index = max(math.ceil(min(percentile, 100) / 100 * len(latencies)) - 1, 0)
+        return latencies[index]
+
+
+class CircuitBreaker:
+    """Stops sending requests to a service after repeated failures.
+
+    The circuit opens after `failure_threshold` consecutive failures. While
+    it is open, requests fail immediately. Once `reset_timeout` seconds have
+    passed, requests are allowed again; a success closes the circuit, and a
+    failure opens it again.
+    """
+
+    def __init__(self, service, failure_threshold, reset_timeout):
+        """Create a new CircuitBreaker.
+
+        Args:
+            service (str): the name of the service, used in messages.
+            failure_threshold (int): the number of consecutive failures
+                which opens the circuit.
+            reset_timeout (float): the number of seconds the circuit stays
+                open before requests are allowed again.
+        """
+        self.service = service
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = Lock()
+
+    def check(self):
+        """Check whether a request may be sent to the service.
+
+        Raises:
+            CircuitOpenError: if the circuit is open.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f'Not sending request to service {self.service} after {self.failures} '
+                    f'consecutive failures; will retry in {remaining:.0f} seconds.'
+                )
+
+    def record_success(self):
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            if self.opened_at is not None:
+                LOGGER.debug('Closing circuit breaker for service %s.', self.service)
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        """Record a failed request, opening the circuit if the threshold is reached."""
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    LOGGER.debug('Opening circuit breaker for service %s after %s consecutive '
+                                 'failures.', self.service, self.failures)
+                self.opened_at = time.monotonic()
+
+
+def get_urllib3_error(err):
+    """Get the urllib3 error which caused a requests exception.
+
+    Args:
+        err (requests.exceptions.RequestException): the exception raised by
+            HTTPAdapter.send.
+
+    Returns:
+        Exception: the urllib3 error which caused `err`, or `err` itself if
+            it was not caused by a urllib3 error. This is used to classify the
+            error in the same way as urllib3 when deciding whether to retry.
+    """
+    cause = err.args[0] if err.args else None
+    if isinstance(cause, MaxRetryError):
+        cause = cause.reason
+    return cause if isinstance(cause, Exception) else err
+
+
+def get_retry_after(response):
+    """Get the number of seconds a response asks the client to wait before retrying.
+
+    Args:
+        response (requests.Response): the response.
+
+    Returns:
+        float or None: the number of seconds given by the Retry-After header of
+            a 429 or 503 response, or None if there is no valid header.
+    """
+    if response.status_code not in RETRY_AFTER_STATUS_CODES:
+        return None
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        LOGGER.debug('Ignoring invalid Retry-After header: %s', retry_after)
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+class TokenBucket:
+    """Limits the rate of requests to a service.
+
+    The bucket holds up to `capacity` tokens, and is refilled at `rate`
+    tokens per second. Each request takes one token, waiting for one to
+    become available if the bucket is empty.
+    """
+
+    def __init__(self, service, rate, capacity):
+        """Create a new TokenBucket.
+
+        Args:
+            service (str): the name of the service, used in log messages.
+            rate (float): the number of tokens added per second.
+            capacity (int): the maximum number of tokens in the bucket, i.e.
+                the largest burst of requests allowed at once.
+        """
+        self.service = service
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0
+        self.queue_depth = 0
+        self._lock = Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self):
+        """Take a token if one is available without waiting.
+
+        Returns:
+            bool: True if a token was taken, False otherwise.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self.paused_until and self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def acquire(self):
+        """Take a token, waiting until one is available."""
+        with self._lock:
+            self.queue_depth += 1
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if now >= self.paused_until and self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    delay = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+                    queue_depth = self.queue_depth
+                LOGGER.debug('Rate limiting requests to service %s with %s request(s) queued; '
+                             'waiting %.3f seconds.', self.service, queue_depth, delay)
+                time.sleep(delay)
+        finally:
+            with self._lock:
+                self.queue_depth -= 1
+
+    def pause(self, seconds):
+        """Stop handing out tokens for the given number of seconds.
+
+        Args:
+            seconds (float): the number of seconds to wait before the next request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens = 0
+            self.paused_until = max(self.paused_until, now + seconds)
+            queue_depth = self.queue_depth
+        LOGGER.debug('Pausing requests to service %s for %.3f seconds as requested by the '
+                     'Retry-After header with %s request(s) queued.', self.service, seconds,
+                     queue_depth)
+
+
+class RequestPolicyAdapter(HTTPAdapter):
+    """An HTTPAdapter which applies request policies to requests.
+
+    Each policy is disabled by default, and is tracked separately for each
+    service behind the API gateway. Rate limiting applies to all requests,
+    and the other policies apply only to requests using one of the
+    IDEMPOTENT_METHODS.
+
+    Rate limiting: requests to each service, including each retry, are
+        limited to a number per second using a TokenBucket. When a 429 or 503
+        response includes a Retry-After header, requests to that service are
+        paused accordingly, and a retry of the request waits for the pause.
+
+    Retries: the `max_retries` given to the adapter are applied by the
+        adapter rather than by urllib3, so that the other policies apply to
+        each attempt of a request and not only to the first.
+    Hedging: if a request has not completed once the given percentile of
+        recent latencies for its service has elapsed, a duplicate request is
+        sent, and whichever response arrives first is used.
+    Deadline: requests and their retries are not sent, retries do not wait
+        past the deadline, and the timeout of each attempt is shortened, so
+        that no request ends more than a given number of seconds after the
+        adapter is created or its deadline is reset.
+    Circuit breaking: after a number of consecutive failures for a service,
+        further requests to it fail immediately for a period of time.
+    """
+
+    def __init__(self, hedge_percentile=0, deadline=0, circuit_breaker_failures=0,
+                 circuit_breaker_timeout=30, rate_limit=0, rate_limit_burst=1,
+                 pool_maxsize=DEFAULT_POOLSIZE, **kwargs):
+        """Create a new RequestPolicyAdapter.
+
+        Args:
+            hedge_percentile (float): the percentile of recent latencies after
+                which a request is hedged. If 0, requests are not hedged.
+            deadline (float): the number of seconds from now after which
+                requests fail. If 0, there is no deadline.
+            circuit_breaker_failures (int): the number of consecutive failures
+                after which the circuit breaker for a service opens. If 0,
+                circuit breaking is disabled.
+            circuit_breaker_timeout (float): the number of seconds a circuit
+                breaker stays open.
+            rate_limit (float): the maximum number of requests per second to
+                each service. If 0, requests are not rate limited.
+            rate_limit_burst (int): the maximum number of requests to each
+                service which may be sent at once without waiting.
+            pool_maxsize (int): the maximum number of connections to save in
+                the connection pool, which is also the maximum number of
+                hedged requests in flight.
+            **kwargs: additional keyword arguments for HTTPAdapter.
+        """
+        super().__init__(pool_maxsize=pool_maxsize, **kwargs)
+        # Retries are applied by send, so each attempt made by HTTPAdapter.send
+        # is a single request, and its errors are raised rather than retried.
+        self.retries = self.max_retries
+        self.max_retries = Retry(0, read=False)
+        self.hedge_percentile = hedge_percentile
+        self.deadline_seconds = deadline
+        self.deadline = None
+        self.reset_deadline()
+        self.circuit_breaker_failures = circuit_breaker_failures
+        self.circuit_breaker_timeout = circuit_breaker_timeout
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+
+        self._latency_trackers = {}
+        self._token_buckets = {}
+        self._circuit_breakers = {}
+        self._policy_lock = Lock()
+        self._executor = None
+        self._executor_max_workers = pool_maxsize
+
+    def reset_deadline(self):
+        """Restart the deadline so that it ends the configured time from now.
+
+        This is used when one adapter is reused for a new unit of work, e.g.
+        each command of "sat batch", which should have its own deadline.
+        """
+        self.deadline = time.monotonic() + self.deadline_seconds if self.deadline_seconds else None
+
+    def _get_latency_tracker(self, service):
+        with self._policy_lock:
+            return self._latency_trackers.setdefault(service, LatencyTracker())
+
+    def _get_circuit_breaker(self, service):
+        with self._policy_lock:
+            if service not in self._circuit_breakers:
+                self._circuit_breakers[service] = CircuitBreaker(
+                    service, self.circuit_breaker_failures, self.circuit_breaker_timeout
+                )
+            return self._circuit_breakers[service]
+
+    def _get_token_bucket(self, service):
+        if not self.rate_limit:
+            return None
+        with self._policy_lock:
+            if service not in self._token_buckets:
+                self._token_buckets[service] = TokenBucket(
+                    service, self.rate_limit, self.rate_limit_burst
+                )
+            return self._token_buckets[service]
+
+    def _get_executor(self):
+        with self._policy_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._executor_max_workers)
+            return self._executor
+
+    def _get_deadline_timeout(self, timeout):
+        """Shorten a request timeout so the request ends before the deadline.
+
+        Args:
+            timeout (float, tuple, or None): the timeout passed to `send`.
+
+        Returns:
+            float, tuple, or None: the shortened timeout.
+
+        Raises:
+            DeadlineExceededError: if the deadline has already passed.
+        """
+        if self.deadline is None:
+            return timeout
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError('Request deadline exceeded.')
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def _check_deadline_before_retry(self, delay, reason):
+        """Check that a request can be retried after a delay before the deadline.
+
+        Args:
+            delay (float): the number of seconds to wait before retrying.
+            reason (Exception or requests.Response): the error or response of
+                the failed attempt, used in the error message.
+
+        Raises:
+            DeadlineExceededError: if the deadline passes before the delay ends.
+        """
+        if self.deadline is not None and time.monotonic() + delay >= self.deadline:
+            if not isinstance(reason, Exception):
+                reason = f'status {reason.status_code}'
+            raise DeadlineExceededError(f'Request deadline exceeded before retrying request '
+                                        f'which failed with {reason}.')
+
+    @staticmethod
+    def _increment_retries_for_error(retries, request, err):
+        """Count a failed attempt of a request against its retries.
+
+        Args:
+            retries (urllib3.util.retry.Retry): the remaining retries.
+            request (requests.PreparedRequest): the request.
+            err (requests.exceptions.RequestException): the error of the attempt.
+
+        Returns:
+            urllib3.util.retry.Retry: the retries remaining after this attempt.
+
+        Raises:
+            requests.exceptions.RequestException: `err`, if the request should
+                not be retried.
+        """
+        try:
+            return retries.increment(request.method, request.url, error=get_urllib3_error(err))
+        except Exception:
+            # The retries are exhausted, or the error cannot be retried for this method
+            pass
+        raise err
+
+    def _send_with_retries(self, request, send_attempt, token_bucket, timeout, use_deadline):
+        """Send a request, retrying it according to the retries of the adapter.
+
+        Args:
+            request (requests.PreparedRequest): the request to send.
+            send_attempt (Callable): a function which sends a single attempt
+                of the request, given the request and the timeout.
+            token_bucket (TokenBucket or None): the rate limit of the service.
+            timeout (float, tuple, or None): the timeout for each attempt.
+            use_deadline (bool): whether the deadline applies to the request.
+
+        Returns:
+            requests.Response: the response to the last attempt.
+
+        Raises:
+            DeadlineExceededError: if the deadline passes before an attempt
+                or before a retry.
+            requests.exceptions.RetryError: if the retries are exhausted by
+                responses with a status in the retried statuses.
+            requests.exceptions.RequestException: if the last attempt fails.
+        """
+        retries = self.retries
+        while True:
+            if token_bucket:
+                if use_deadline:
+                    # Fail before waiting for the rate limit if the deadline has already passed
+                    self._get_deadline_timeout(timeout)
+                token_bucket.acquire()
+            attempt_timeout = self._get_deadline_timeout(timeout) if use_deadline else timeout
+
+            try:
+                response = send_attempt(request, attempt_timeout)
+            except (ConnectionError, Timeout) as err:
+                retries = self._increment_retries_for_error(retries, request, err)
+                delay = sleep_time = retries.get_backoff_time()
+                reason = err
+            else:
+                self._handle_retry_after(token_bucket, response)
+                has_retry_after = 'Retry-After' in response.headers
+                if not retries.is_retry(request.method, response.status_code, has_retry_after):
+                    return response
+                try:
+                    retries = retries.increment(request.method, request.url, response=response.raw)
+                except MaxRetryError as err:
+                    if retries.raise_on_status:
+                        response.close()
+                        raise RetryError(err, request=request)
+                    return response
+                retry_after = get_retry_after(response) if retries.respect_retry_after_header else None
+                if retry_after is None:
+                    delay = sleep_time = retries.get_backoff_time()
+                else:
+                    delay = retry_after
+                    # The token bucket was paused by the Retry-After header, so
+                    # waiting for a token waits for the requested time.
+                    sleep_time = 0 if token_bucket else retry_after
+                response.close()
+                reason = response
+
+            LOGGER.debug('Retrying request to %s after %.3f seconds: %s', request.url, delay, reason)
+            if use_deadline:
+                self._check_deadline_before_retry(delay, reason)
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+
+    def _send_hedged(self, hedge_delay, token_bucket, request, **kwargs):
+        """Send a request, and send it again if it takes longer than `hedge_delay`.
+
+        If requests are rate limited, the hedged request is only sent if it
+        does not need to wait for the rate limit.
+
+        Returns:
+            requests.Response: the first response received.
+
+        Raises:
+            requests.exceptions.RequestException: if every request fails.
+        """
+        executor = self._get_executor()
+        futures = {executor.submit(super().send, request, **kwargs)}
+        done, _ = wait(futures, timeout=hedge_delay)
+        if not done and (token_bucket is None or token_bucket.try_acquire()):
+            LOGGER.debug('Request to %s took longer than %.3f seconds; sending hedged request.',
+                         request.url, hedge_delay)
+            futures.add(executor.submit(super().send, request.copy(), **kwargs))
+
+        error = None
+        pending = futures
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                for other in pending:
+                    other.add_done_callback(_close_response)
+                return future.result()
+        raise error
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        """Send a request, applying the policies that apply to it.
+
+        Args:
+            request (requests.PreparedRequest): the request to send.
+            stream (bool): whether to stream the response content.
+            timeout (float, tuple, or None): the timeout for the request.
+            **kwargs: additional keyword arguments for HTTPAdapter.send.
+
+        Returns:
+            requests.Response: the response to the request.
+
+        Raises:
+            CircuitOpenError: if the circuit breaker for the service is open.
+            DeadlineExceededError: if the request deadline has passed.
+            requests.exceptions.RequestException: if the request fails.
+        """
+        service = get_service_name(request.url)
+        token_bucket = self._get_token_bucket(service)
+        send = super().send
+
+        if request.method not in IDEMPOTENT_METHODS:
+            def send_attempt(request, timeout):
+                return send(request, stream=stream, timeout=timeout, **kwargs)
+            return self._send_with_retries(request, send_attempt, token_bucket, timeout,
+                                           use_deadline=False)
+
+        circuit_breaker = None
+        if self.circuit_breaker_failures:
+            circuit_breaker = self._get_circuit_breaker(service)
+            circuit_breaker.check()
+
+        latency_tracker = self._get_latency_tracker(service)
+        hedge_delay = None
+        if self.hedge_percentile and not stream:
+            hedge_delay = latency_tracker.percentile(self.hedge_percentile)
+
+        def send_attempt(request, timeout):
+            start_time = time.monotonic()
+            if hedge_delay is None:
+                response = send(request, stream=stream, timeout=timeout, **kwargs)
+            else:
+                response = self._send_hedged(hedge_delay, token_bucket, request,
+                                             stream=stream, timeout=timeout, **kwargs)
+            if response.status_code < 500:
+                latency_tracker.record(time.monotonic() - start_time)
+            return response
+
+        try:
+            response = self._send_with_retries(request, send_attempt, token_bucket, timeout,
+                                               use_deadline=True)
+        except Exception:
+            if circuit_breaker:
+                circuit_breaker.record_failure()
+            raise
+
+        if circuit_breaker:
+            if response.status_code >= 500:
+                circuit_breaker.record_failure()
+            else:
+                circuit_breaker.record_success()
+        return response
+
+    @staticmethod
+    def _handle_retry_after(token_bucket, response):
+        """Pause requests to a service if its response includes a Retry-After header."""
+        if token_bucket is None:
+            return
+        retry_after = get_retry_after(response)
+        if retry_after:
+            token_bucket.pause(retry_after)
+
+    def close(self):
+        """Close the connection pool and stop any hedged requests."""
+        with self._policy_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        super().close()
+
+
+def _close_response(future):
+    """Close the response of a hedged request which was not used."""
+    if future.exception() is None:
+        future.result().close()
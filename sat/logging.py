@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2020, 2023-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2020, 2023-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -24,10 +24,13 @@
 """
 Sets up logging for SAT.
 """
+import atexit
 import logging
 import os
 from copy import copy
 from logging import Formatter, LogRecord
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 from sat.config import get_config_value
 
@@ -38,6 +41,9 @@ CONSOLE_LOG_FORMAT = '%(levelname)s: %(message)s'
 FILE_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
 LOGGER = logging.getLogger(__name__)
 
+# The listener which writes queued log records to the log file
+_LOG_FILE_LISTENER = None
+
 
 class LineSplittingFormatter(Formatter):
     """Formatter which splits multi-line messages and formats each line individually."""
@@ -50,6 +56,24 @@ class LineSplittingFormatter(Formatter):
         return '\n'.join(formatted_records)
 
 
+class LogFileQueueHandler(QueueHandler):
+    """Handler which queues log records to be formatted by another thread.
+
+    Unlike QueueHandler, this keeps any exception text separate from the
+    message, so that the formatter on the other end of the queue formats it
+    the same way it would for an unqueued record.
+    """
+    def prepare(self, record: LogRecord) -> LogRecord:
+        record = copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
 def _add_console_handler(logger, log_level):
     """Adds a handler that prints to stderr to the given logger
 
@@ -64,6 +88,25 @@ def _add_console_handler(logger, log_level):
     logger.addHandler(console_handler)
 
 
+def stop_log_file_listener():
+    """Stops the background thread which writes log records to the log file.
+
+    Any log records which are already queued are written before returning.
+    This is registered to run at exit, so it only needs to be called directly
+    when reconfiguring logging.
+
+    Returns:
+        None
+    """
+    global _LOG_FILE_LISTENER
+    if _LOG_FILE_LISTENER is not None:
+        _LOG_FILE_LISTENER.stop()
+        _LOG_FILE_LISTENER = None
+
+
+atexit.register(stop_log_file_listener)
+
+
 def bootstrap_logging():
     """Sets up logging just enough to log warnings and errors to stderr.
 
@@ -85,7 +128,11 @@ def configure_logging():
     """Configures logging according to the config file and command-line options
 
     This sets up two handlers, one that logs to a log file and one that logs to
-    stderr.
+    stderr. Records for the log file are put on a queue and formatted and
+    written by a background thread, so that threads which log many messages,
+    e.g. while waiting on HTTP retries, are not held up by file I/O. Records
+    for stderr are written immediately, so that they stay in order with other
+    output and prompts.
 
     For a module within sat to log, the module should obtain a logger object
     as shown below:
@@ -101,6 +148,8 @@ def configure_logging():
     Returns:
         None
     """
+    global _LOG_FILE_LISTENER
+
     sat_logger_name = __name__.split('.', 1)[0]
     sat_logger = logging.getLogger(sat_logger_name)
 
@@ -127,6 +176,7 @@ def configure_logging():
 
     # Remove all handlers to configure handlers according to config file
     sat_logger.handlers = []
+    stop_log_file_listener()
 
     _add_console_handler(sat_logger, log_stderr_level)
     _add_console_handler(csm_client_logger, log_stderr_level)
@@ -149,7 +199,13 @@ def configure_logging():
         file_handler.setLevel(log_file_level)
         file_formatter = LineSplittingFormatter(FILE_LOG_FORMAT)
         file_handler.setFormatter(file_formatter)
-        sat_logger.addHandler(file_handler)
-        csm_client_logger.addHandler(file_handler)
-        warnings_logger.addHandler(file_handler)
-        urllib3_logger.addHandler(file_handler)
+
+        queue_handler = LogFileQueueHandler(SimpleQueue())
+        queue_handler.setLevel(log_file_level)
+        _LOG_FILE_LISTENER = QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+        _LOG_FILE_LISTENER.start()
+
+        sat_logger.addHandler(queue_handler)
+        csm_client_logger.addHandler(queue_handler)
+        warnings_logger.addHandler(queue_handler)
+        urllib3_logger.addHandler(queue_handler)
@@ -0,0 +1,604 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+A directory of the nodes in the system for translating between identifiers.
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+
+from csm_api_client.service.gateway import APIError
+
+from sat.apiclient import HSMClient
+from sat.apiclient.sls import SLSClient
+from sat.config import get_config_value
+from sat.xname import XName
+
+LOGGER = logging.getLogger(__name__)
+
+# The version of the format of the cache file
+CACHE_VERSION = 1
+CACHE_FILE_NAME = 'node_directory.json'
+
+# The sections of the directory, each of which is loaded with one request
+COMPONENTS_SECTION = 'components'
+ALIASES_SECTION = 'aliases'
+GROUPS_SECTION = 'groups'
+
+
+class NodeDirectoryError(Exception):
+    """An error occurred loading or saving the node directory."""
+    pass
+
+
+def get_default_cache_path():
+    """Get the path to the node directory cache file in the SAT cache directory.
+
+    Returns:
+        str: the path to the cache file.
+    """
+    return os.path.join(os.path.expanduser(get_config_value('general.cache_dir')), CACHE_FILE_NAME)
+
+
+class NodeDirectory:
+    """An index of the nodes in the system.
+
+    The node components from HSM, the node aliases from SLS and the group
+    memberships from HSM are each loaded with a single request the first time
+    they are needed, and then indexed so that NIDs, xnames, aliases, roles,
+    subroles and groups can be looked up in constant time.
+
+    When the TTL is greater than zero, the loaded data is also saved to a
+    cache file and reused by later commands until the TTL expires. A lookup
+    which fails against cached data discards that data and retries once with
+    data loaded from the API, so a stale mapping is never returned silently.
+    """
+
+    def __init__(self, hsm_client, sls_client=None, ttl=None, cache_path=None):
+        """Create a new NodeDirectory.
+
+        Args:
+            hsm_client (csm_api_client.service.hsm.HSMClient): the HSM client
+                used to load node components and groups.
+            sls_client (sat.apiclient.sls.SLSClient): the SLS client used to
+                load node aliases. Defaults to an SLSClient with the same
+                session as `hsm_client`.
+            ttl (int): the number of seconds for which cached data is valid,
+                or 0 to never read or write the cache file. Defaults to the
+                value of general.node_directory_ttl in the config file.
+            cache_path (str): the path to the cache file. Defaults to a file
+                in the directory given by general.cache_dir in the config file.
+        """
+        self.hsm_client = hsm_client
+        self._sls_client = sls_client
+        self.ttl = get_config_value('general.node_directory_ttl') if ttl is None else ttl
+        self._cache_path = cache_path
+
+        # Maps from section name to the raw data loaded for that section
+        self._data = {}
+        # The names of the sections whose data was read from the cache file
+        self._cached_sections = set()
+
+        self._components = None
+        self._components_by_nid = None
+        self._components_by_xname = None
+        self._members_by_role = None
+        self._members_by_subrole = None
+        self._members_by_class = None
+        self._aliases_by_xname = None
+        self._xnames_by_alias = None
+        self._members_by_group = None
+
+    @classmethod
+    def from_session(cls, session):
+        """Create a NodeDirectory which uses new HSM and SLS clients.
+
+        This can be passed to `sat.session.get_shared_client` to share one
+        NodeDirectory between all the callers which use the shared session.
+
+        Args:
+            session (sat.session.SATSession): the session used by the clients.
+
+        Returns:
+            NodeDirectory: the new NodeDirectory.
+        """
+        return cls(HSMClient(session), SLSClient(session))
+
+    @property
+    def sls_client(self):
+        """sat.apiclient.sls.SLSClient: the client used to load aliases"""
+        if self._sls_client is None:
+            self._sls_client = SLSClient(self.hsm_client.session)
+        return self._sls_client
+
+    @property
+    def cache_path(self):
+        """str: the path to the cache file"""
+        if self._cache_path is None:
+            self._cache_path = get_default_cache_path()
+        return self._cache_path
+
+    def _read_cache(self):
+        """Read the sections in the cache file which have not expired.
+
+        Returns:
+            dict: a mapping from section name to a dict with the keys 'time'
+                and 'data'. This is empty if the cache file does not exist or
+                cannot be read.
+        """
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            LOGGER.debug('Ignoring unreadable node directory cache file %s: %s', self.cache_path, err)
+            return {}
+
+        if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+            LOGGER.debug('Ignoring node directory cache file %s with unknown version.', self.cache_path)
+            return {}
+
+        now = time.time()
+        return {
+            name: section for name, section in cache.get('sections', {}).items()
+            if now - section.get('time', 0) < self.ttl
+        }
+
+    def _write_cache(self, sections):
+        """Atomically replace the cache file with the given sections.
+
+        Args:
+            sections (dict): a mapping from section name to a dict with the
+                keys 'time' and 'data'.
+
+        Raises:
+            NodeDirectoryError: if the cache file cannot be written.
+        """
+        cache_dir = os.path.dirname(self.cache_path) or '.'
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f'.{CACHE_FILE_NAME}.')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'version': CACHE_VERSION, 'sections': sections}, f,
+                              separators=(',', ':'))
+                os.replace(tmp_path, self.cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as err:
+            raise NodeDirectoryError(f'Unable to write node directory cache file {self.cache_path}: {err}')
+
+    def _update_cache(self, name, data):
+        """Save the data for one section to the cache file if caching is enabled.
+
+        Failures to write the cache are logged, since the data is still usable.
+
+        Args:
+            name (str): the name of the section.
+            data: the data loaded for the section, or None to remove the
+                section from the cache file.
+        """
+        if self.ttl <= 0:
+            return
+        sections = self._read_cache()
+        if data is None:
+            if name not in sections:
+                return
+            del sections[name]
+        else:
+            sections[name] = {'time': time.time(), 'data': data}
+        try:
+            self._write_cache(sections)
+        except NodeDirectoryError as err:
+            LOGGER.warning(err)
+
+    def _fetch_components(self):
+        """Get the node components from HSM.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        return self.hsm_client.get_node_components()
+
+    def _fetch_aliases(self):
+        """Get a mapping from node xnames to their aliases from SLS.
+
+        Raises:
+            APIError: if the request to SLS fails or its response is invalid.
+        """
+        try:
+            hardware = self.sls_client.get('search', 'hardware', params={'type': 'comptype_node'}).json()
+        except ValueError as err:
+            raise APIError(f'Failed to parse JSON from SLS: {err}')
+
+        return {
+            component['Xname']: component['ExtraProperties']['Aliases']
+            for component in hardware
+            if 'Xname' in component and 'Aliases' in component.get('ExtraProperties', {})
+        }
+
+    def _fetch_groups(self):
+        """Get a mapping from HSM group labels to their member xnames.
+
+        Raises:
+            APIError: if the request to HSM fails or its response is invalid.
+        """
+        try:
+            groups = self.hsm_client.get('groups').json()
+        except ValueError as err:
+            raise APIError(f'Failed to parse JSON from HSM: {err}')
+
+        return {
+            group['label']: group.get('members', {}).get('ids', [])
+            for group in groups if 'label' in group
+        }
+
+    def _get_section(self, name):
+        """Get the data for a section, loading it if needed.
+
+        The data is read from the cache file if it has not expired, or else
+        loaded from the API and saved to the cache file.
+
+        Args:
+            name (str): the name of the section.
+
+        Returns:
+            the data for the section.
+
+        Raises:
+            APIError: if the data cannot be loaded from the API.
+        """
+        if name in self._data:
+            return self._data[name]
+
+        if self.ttl > 0:
+            section = self._read_cache().get(name)
+            if section is not None:
+                LOGGER.debug('Using cached node %s from %s', name, self.cache_path)
+                self._data[name] = section['data']
+                self._cached_sections.add(name)
+                return self._data[name]
+
+        fetch = {
+            COMPONENTS_SECTION: self._fetch_components,
+            ALIASES_SECTION: self._fetch_aliases,
+            GROUPS_SECTION: self._fetch_groups,
+        }[name]
+        self._data[name] = fetch()
+        self._update_cache(name, self._data[name])
+        return self._data[name]
+
+    def invalidate(self, name=None):
+        """Discard loaded and cached data so that it is loaded again when needed.
+
+        Args:
+            name (str): the name of the section to discard, or None to discard
+                all sections.
+        """
+        names = [COMPONENTS_SECTION, ALIASES_SECTION, GROUPS_SECTION] if name is None else [name]
+        for section_name in names:
+            self._data.pop(section_name, None)
+            self._cached_sections.discard(section_name)
+            self._update_cache(section_name, None)
+
+            if section_name == COMPONENTS_SECTION:
+                self._components = None
+                self._components_by_nid = None
+                self._components_by_xname = None
+                self._members_by_role = None
+                self._members_by_subrole = None
+                self._members_by_class = None
+            elif section_name == ALIASES_SECTION:
+                self._aliases_by_xname = None
+                self._xnames_by_alias = None
+            elif section_name == GROUPS_SECTION:
+                self._members_by_group = None
+
+    def _lookup(self, name, lookup):
+        """Look up a value, retrying once with fresh data if cached data has no match.
+
+        Args:
+            name (str): the name of the section the lookup uses.
+            lookup (Callable[[], object]): a function which does the lookup and
+                returns None or an empty collection when nothing is found.
+
+        Returns:
+            the result of the lookup.
+
+        Raises:
+            APIError: if the data cannot be loaded from the API.
+        """
+        result = lookup()
+        if not result and name in self._cached_sections:
+            LOGGER.debug('Lookup in cached node %s failed; reloading.', name)
+            self.invalidate(name)
+            result = lookup()
+        return result
+
+    def _index_components(self):
+        """Build the indexes of the node components if they have not been built."""
+        if self._components is not None:
+            return
+
+        components = self._get_section(COMPONENTS_SECTION)
+        by_nid = {}
+        by_xname = {}
+        by_role = {}
+        by_subrole = {}
+        by_class = {}
+        for component in components:
+            nid = component.get('NID')
+            xname = component.get('ID')
+            if nid is not None:
+                by_nid[nid] = component
+            if not xname:
+                continue
+            by_xname[xname] = component
+            # HSM matches roles, subroles and classes case-insensitively in queries
+            if component.get('Role'):
+                by_role.setdefault(component['Role'].lower(), set()).add(xname)
+            if component.get('SubRole'):
+                by_subrole.setdefault(component['SubRole'].lower(), set()).add(xname)
+            if component.get('Class'):
+                by_class.setdefault(component['Class'].lower(), set()).add(xname)
+
+        self._components = components
+        self._components_by_nid = by_nid
+        self._components_by_xname = by_xname
+        self._members_by_role = by_role
+        self._members_by_subrole = by_subrole
+        self._members_by_class = by_class
+
+    def _index_aliases(self):
+        """Build the indexes of the node aliases if they have not been built."""
+        if self._aliases_by_xname is not None:
+            return
+
+        aliases_by_xname = self._get_section(ALIASES_SECTION)
+        self._xnames_by_alias = {
+            alias: xname for xname, aliases in aliases_by_xname.items() for alias in aliases
+        }
+        self._aliases_by_xname = aliases_by_xname
+
+    def _index_groups(self):
+        """Build the index of the group members if it has not been built."""
+        if self._members_by_group is None:
+            self._members_by_group = {
+                label: set(members) for label, members in self._get_section(GROUPS_SECTION).items()
+            }
+
+    def get_node_components(self):
+        """Get all the node components from HSM.
+
+        Returns:
+            list of dict: the node components.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        self._index_components()
+        return self._components
+
+    def get_component_by_nid(self, nid):
+        """Get the node component with the given NID.
+
+        Args:
+            nid (int): the NID of the node.
+
+        Returns:
+            dict or None: the node component, or None if there is none.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        def lookup():
+            self._index_components()
+            return self._components_by_nid.get(nid)
+        return self._lookup(COMPONENTS_SECTION, lookup)
+
+    def get_component_by_xname(self, xname):
+        """Get the node component with the given xname.
+
+        Args:
+            xname (str): the xname of the node.
+
+        Returns:
+            dict or None: the node component, or None if there is none.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        def lookup():
+            self._index_components()
+            return self._components_by_xname.get(xname)
+        return self._lookup(COMPONENTS_SECTION, lookup)
+
+    def get_descendant_xnames(self, ancestor):
+        """Get the xnames of the nodes contained in the given component.
+
+        Args:
+            ancestor (str): the xname of a component, e.g. 'x3000c0s1'.
+
+        Returns:
+            list of str: the sorted xnames of the nodes, which is empty if no
+                node is contained in the component.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        ancestor_xname = XName(ancestor)
+
+        def lookup():
+            self._index_components()
+            return sorted(xname for xname in self._components_by_xname
+                          if ancestor_xname.contains_component(XName(xname)))
+        return self._lookup(COMPONENTS_SECTION, lookup)
+
+    def get_xname(self, nid):
+        """Get the xname of the node with the given NID.
+
+        Args:
+            nid (int): the NID of the node.
+
+        Returns:
+            str or None: the xname, or None if there is no such node.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        component = self.get_component_by_nid(nid)
+        return component.get('ID') if component else None
+
+    def get_nid(self, xname):
+        """Get the NID of the node with the given xname.
+
+        Args:
+            xname (str): the xname of the node.
+
+        Returns:
+            int or None: the NID, or None if there is no such node.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        component = self.get_component_by_xname(xname)
+        return component.get('NID') if component else None
+
+    def get_aliases(self, xname):
+        """Get the aliases of the node with the given xname.
+
+        Args:
+            xname (str): the xname of the node.
+
+        Returns:
+            list of str: the aliases, which is empty if the node has none.
+
+        Raises:
+            APIError: if the request to SLS fails.
+        """
+        def lookup():
+            self._index_aliases()
+            return self._aliases_by_xname.get(xname, [])
+        return self._lookup(ALIASES_SECTION, lookup)
+
+    def get_all_aliases(self):
+        """Get the aliases of all the nodes which have aliases.
+
+        Returns:
+            dict: a mapping from the xname of each node to its list of aliases.
+
+        Raises:
+            APIError: if the request to SLS fails.
+        """
+        self._index_aliases()
+        return dict(self._aliases_by_xname)
+
+    def get_xname_by_alias(self, alias):
+        """Get the xname of the node with the given alias.
+
+        Args:
+            alias (str): the alias of the node, e.g. 'nid000001'.
+
+        Returns:
+            str or None: the xname, or None if there is no such node.
+
+        Raises:
+            APIError: if the request to SLS fails.
+        """
+        def lookup():
+            self._index_aliases()
+            return self._xnames_by_alias.get(alias)
+        return self._lookup(ALIASES_SECTION, lookup)
+
+    def get_role_members(self, role):
+        """Get the xnames of the nodes with the given role.
+
+        Args:
+            role (str): the HSM role, e.g. 'Compute', matched case-insensitively.
+
+        Returns:
+            set of str: the xnames, which is empty if no node has the role.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        def lookup():
+            self._index_components()
+            return self._members_by_role.get(role.lower(), set())
+        return self._lookup(COMPONENTS_SECTION, lookup)
+
+    def get_subrole_members(self, subrole):
+        """Get the xnames of the nodes with the given subrole.
+
+        Args:
+            subrole (str): the HSM subrole, e.g. 'Worker', matched case-insensitively.
+
+        Returns:
+            set of str: the xnames, which is empty if no node has the subrole.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        def lookup():
+            self._index_components()
+            return self._members_by_subrole.get(subrole.lower(), set())
+        return self._lookup(COMPONENTS_SECTION, lookup)
+
+    def get_class_members(self, node_class):
+        """Get the xnames of the nodes with the given class.
+
+        Args:
+            node_class (str): the HSM class, e.g. 'River', matched case-insensitively.
+
+        Returns:
+            set of str: the xnames, which is empty if no node has the class.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        def lookup():
+            self._index_components()
+            return self._members_by_class.get(node_class.lower(), set())
+        return self._lookup(COMPONENTS_SECTION, lookup)
+
+    def get_group_members(self, label):
+        """Get the xnames of the members of the given HSM group.
+
+        Args:
+            label (str): the label of the HSM group.
+
+        Returns:
+            set of str: the xnames, which is empty if there is no such group.
+
+        Raises:
+            APIError: if the request to HSM fails.
+        """
+        def lookup():
+            self._index_groups()
+            return self._members_by_group.get(label, set())
+        return self._lookup(GROUPS_SECTION, lookup)
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2022, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2022, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -36,12 +36,35 @@ from sat.util import set_val_by_path
 LOGGER = logging.getLogger(__name__)
 
 
-def create_format_options(sort_by_default='0'):
+def non_negative_int(value):
+    """Converts a string to a non-negative integer.
+
+    Args:
+        value (str): The value to convert.
+
+    Returns:
+        int: the converted value.
+
+    Raises:
+        argparse.ArgumentTypeError: if the value is not a non-negative integer.
+    """
+    try:
+        int_value = int(value)
+    except ValueError:
+        int_value = -1
+    if int_value < 0:
+        raise argparse.ArgumentTypeError(f"Expected a non-negative integer, got '{value}'.")
+    return int_value
+
+
+def create_format_options(sort_by_default='0', limit_options=True):
     """Creates a parser containing options for formatting.
 
     sort_by_default: allows for the value of --sort_by to be set
         when calling the method. It is set to 0 or the
         first column of data being sorted.
+    limit_options: if True, include the --limit and --offset options which
+        select a range of the sorted rows.
 
     Returns: an ArgumentParser object configured with options and help
         text for formatting.
@@ -83,6 +106,15 @@ def create_format_options(sort_by_default='0'):
               'name or a 0-based index. Enclose the column name in '
               'double quotes if it contains a space.'))
 
+    if limit_options:
+        group.add_argument(
+            '--limit', metavar='N', type=non_negative_int,
+            help='Display at most N rows, after sorting and filtering.')
+
+        group.add_argument(
+            '--offset', metavar='M', type=non_negative_int, default=0,
+            help='Skip the first M rows, after sorting and filtering.')
+
     group.add_argument(
         '--show-empty',
         help='Show values for columns even if every '
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,6 +25,9 @@
 Class to aid with unified formatting and printing of data.
 """
 from collections import OrderedDict
+import heapq
+from io import StringIO
+from itertools import islice
 import logging
 import sys
 from typing import Any, List
@@ -42,13 +45,20 @@ from sat.filtering import (
 from sat.util import (
     get_rst_header,
     match_query_key,
+    write_fixed_width_table,
     yaml_dump,
     json_dump
 )
+from sat.xname import XName
 
 LOGGER = logging.getLogger(__name__)
 inf = inflect.engine()
 
+# Types whose values can always be compared with other values of the same
+# type, or in the case of numbers, with each other
+ORDERED_TYPES = {str, int, float, XName}
+NUMBER_TYPES = {bool, int, float}
+
 
 def dump_structure(report_format: str, struct: Any) -> str:
     """Dump a Python structure (e.g. a dict) as a serialized string
@@ -87,7 +97,8 @@ class Report:
                  show_empty=None, show_missing=None,
                  force_columns=None,
                  display_headings=None,
-                 print_format='pretty'):
+                 print_format='pretty',
+                 limit=None, offset=0):
         """Create a new Report instance.
 
         Args:
@@ -117,6 +128,10 @@ class Report:
                 output. This list should be a subset of headings.
             print_format: (str) The format to return the report. Expected to be 'pretty',
                 'json', or 'yaml'.
+            limit: the maximum number of rows to include in the output, after
+                sorting and filtering. If None, include all rows.
+            offset: the number of rows to skip at the start of the output,
+                after sorting and filtering.
 
         """
         self.headings = headings
@@ -142,6 +157,8 @@ class Report:
         self.reverse = reverse
         self.align = align
         self.print_format = print_format
+        self.limit = limit
+        self.offset = offset or 0
 
         self.force_columns = set(force_columns if force_columns is not None else [])
 
@@ -290,21 +307,76 @@ class Report:
         new_row = self.convert_row(row)
         self.data.append(new_row)
 
+    def get_sort_key(self):
+        """Gets a key function which sorts rows by all the fields in `self.sort_by`.
+
+        Rows are sorted by the values of each field in turn. The values of a
+        field are compared directly if possible, which keeps the natural order
+        of numbers and xnames. If the values of a field cannot be compared with
+        each other, e.g. because some are numbers and some are strings, then
+        they are all converted to str for comparison.
+
+        Returns:
+            A function which takes a row and returns a tuple to sort it by, or
+            None if `self.sort_by` is None.
+        """
+        if self.sort_by is None:
+            return None
+
+        str_fields = set()
+        for field in self.sort_by:
+            values = [row[field] for row in self.data]
+            value_types = set(map(type, values))
+            if len(value_types) == 1 and value_types <= ORDERED_TYPES or value_types <= NUMBER_TYPES:
+                continue
+            try:
+                sorted(values)
+            except TypeError:
+                str_fields.add(field)
+
+        for field in str_fields:
+            LOGGER.info("Converting all values of '%s' field to str "
+                        "to allow sorting.", field)
+
+        getters = tuple((field, field in str_fields) for field in self.sort_by)
+        return lambda row: tuple(str(row[field]) if to_str else row[field]
+                                 for field, to_str in getters)
+
     def sort_data(self):
         """Sorts the data contained in the report.
 
-        This sorts `self.data` in place using the field specified in
+        This sorts `self.data` in place using the fields specified in
         `self.sort_by` as the key and reversing if specified by `self.reverse`.
         If `self.sort_by` is None, no sorting is done.
         """
-        if self.sort_by is not None:
-            for element in reversed(self.sort_by):
-                try:
-                    self.data.sort(key=lambda d: d[element], reverse=self.reverse)
-                except TypeError:
-                    LOGGER.info("Converting all values of '%s' field to str "
-                                "to allow sorting.", self.sort_by)
-                    self.data.sort(key=lambda d: str(d[element]), reverse=self.reverse)
+        sort_key = self.get_sort_key()
+        if sort_key is not None:
+            self.data.sort(key=sort_key, reverse=self.reverse)
+
+    def select_rows(self, rows):
+        """Sorts the given rows and selects those given by `self.offset` and `self.limit`.
+
+        If there is a limit, only the rows up to the end of the selected rows
+        are sorted, which is faster than sorting all the rows when the limit
+        is small.
+
+        Args:
+            rows (Iterable[OrderedDict]): the rows to sort and select from.
+
+        Returns:
+            list of OrderedDict: the selected rows, in sorted order.
+        """
+        sort_key = self.get_sort_key()
+        if self.limit is None:
+            if sort_key is not None:
+                rows = sorted(rows, key=sort_key, reverse=self.reverse)
+            return list(islice(rows, self.offset, None))
+
+        end = self.offset + self.limit
+        if sort_key is not None:
+            select_fn = heapq.nlargest if self.reverse else heapq.nsmallest
+            rows = select_fn(end, rows, key=sort_key)
+        return list(islice(rows, self.offset, end))
 
     def remove_empty_and_missing(self, data_rows):
         """Removes columns which have only EMPTY_VALUE or MISSING_VALUE.
@@ -347,10 +419,9 @@ class Report:
             whose rows contain only EMPTY or MISSING.
         """
 
-        self.sort_data()
         try:
             selected = [OrderedDict(zip(self.display_headings, [row[column] for column in self.display_headings]))
-                        for row in filter(self.filter_fn, self.data)]
+                        for row in self.select_rows(filter(self.filter_fn, self.data))]
         except KeyError as err:
             LOGGER.error('The query key "%s" does not match '
                          'any fields in the input; returning no output.',
@@ -381,6 +452,18 @@ class Report:
         if not rows_to_print:
             return ''
 
+        return self._build_pretty_table(headings, rows_to_print)
+
+    def _build_pretty_table(self, headings, rows_to_print):
+        """Return a PrettyTable instance created from the given rows and format opts.
+
+        Args:
+            headings ([str]): the headings of the columns of the table.
+            rows_to_print ([OrderedDict]): the rows to include in the table.
+
+        Returns:
+            A prettytable.PrettyTable reference.
+        """
         pt = PrettyTable()
         pt.field_names = headings
         pt.border = not self.no_borders
@@ -433,11 +516,18 @@ class Report:
             if not self.data:
                 return heading
 
-            pt = self.get_pretty_table()
-            if pt is not None:
-                return heading + str(pt)
-            else:
-                return ''
+            headings, rows_to_print = self.get_rows_to_print()
+            if not rows_to_print:
+                return heading
+
+            table_rows = [[str(r) for r in row.values()] for row in rows_to_print]
+            output = StringIO()
+            output.write(heading)
+            if not write_fixed_width_table(output, table_rows,
+                                           headings=None if self.no_headings else headings,
+                                           border=not self.no_borders, align=self.align):
+                return heading + str(self._build_pretty_table(headings, rows_to_print))
+            return output.getvalue()
         else:
             return dump_structure(report_format, self.get_dumpable_structure())
 
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2025, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,25 +25,43 @@
 OAuth2 authentication support.
 """
 
+from contextlib import contextmanager
 import logging
 import os
 import sys
+from threading import RLock
 
 from csm_api_client.session import UserSession
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from sat.config import get_config_value
+from sat.http_adapter import RequestPolicyAdapter
 from sat.util import get_resource_filename
 
 TENANT_HEADER_NAME = 'Cray-Tenant-Name'
 
 LOGGER = logging.getLogger(__name__)
 
+# The process-wide session and API clients returned by get_shared_session
+# and get_shared_client, and the lock that guards their creation.
+_SHARED_SESSION = None
+_SHARED_CLIENTS = {}
+_SHARED_LOCK = RLock()
+
+# Whether every SATSession created is the shared session. See share_all_sessions.
+_SHARE_ALL_SESSIONS = False
+
 
 class SATSession(UserSession):
     """Subclass of the csm-api-client UserSession which follows the config file"""
 
+    def __new__(cls, *args, **kwargs):
+        if _SHARE_ALL_SESSIONS:
+            with _SHARED_LOCK:
+                if _SHARED_SESSION is not None:
+                    return _SHARED_SESSION
+        return super().__new__(cls)
+
     def __init__(self, no_unauth_err=False):
         """Initialize a SATSession.
 
@@ -51,6 +69,9 @@ class SATSession(UserSession):
             no_unauth_err (bool): Suppress session-is-not-authorized warning.
                 used when fetching a new token with "sat auth".
         """
+        # The shared session returned by __new__ is already initialized.
+        if self is _SHARED_SESSION:
+            return
 
         host = get_config_value('api_gateway.host')
         cert_verify = get_config_value('api_gateway.cert_verify')
@@ -61,7 +82,18 @@ class SATSession(UserSession):
             backoff_factor=get_config_value('api_gateway.backoff'),
             status_forcelist=range(500, 601)
         )
-        adapter = HTTPAdapter(max_retries=retries)
+        pool_size = get_config_value('api_gateway.connection_pool_size')
+        adapter = RequestPolicyAdapter(
+            max_retries=retries,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            hedge_percentile=get_config_value('api_gateway.hedge_percentile'),
+            deadline=get_config_value('api_gateway.request_deadline'),
+            circuit_breaker_failures=get_config_value('api_gateway.circuit_breaker_failures'),
+            circuit_breaker_timeout=get_config_value('api_gateway.circuit_breaker_timeout'),
+            rate_limit=get_config_value('api_gateway.rate_limit'),
+            rate_limit_burst=get_config_value('api_gateway.rate_limit_burst'),
+        )
 
         token_filename = get_config_value('api_gateway.token_file')
         if token_filename == '':
@@ -85,3 +117,91 @@ class SATSession(UserSession):
                          'Obtain a token with "auth" ' +
                          'subcommand, or use --token-file on the command line.')
             sys.exit(1)
+
+    def reset_request_deadline(self):
+        """Restart the request deadline of this session, e.g. for a new command."""
+        for adapter in set(self.session.adapters.values()):
+            if isinstance(adapter, RequestPolicyAdapter):
+                adapter.reset_deadline()
+
+
+def get_shared_session():
+    """Get the SATSession shared by all API clients in this process.
+
+    The session is created the first time this is called. Reusing it means
+    the configuration and token file are read once, and that requests made by
+    different API clients, including from different threads, reuse the
+    keep-alive connections in its connection pool.
+
+    Returns:
+        SATSession: the shared session.
+    """
+    global _SHARED_SESSION
+    with _SHARED_LOCK:
+        if _SHARED_SESSION is None:
+            _SHARED_SESSION = SATSession()
+        return _SHARED_SESSION
+
+
+def get_shared_client(client_cls, **kwargs):
+    """Get an API client of the given class which uses the shared session.
+
+    Clients are cached by class and keyword arguments, so repeated calls with
+    the same arguments return the same client.
+
+    Args:
+        client_cls (callable): the API client class, or a function which
+            creates an API client, to be called with the shared session as its
+            first argument.
+        **kwargs: additional keyword arguments to pass to `client_cls`. These
+            must be hashable.
+
+    Returns:
+        The API client created by calling `client_cls`.
+    """
+    session = get_shared_session()
+    key = (client_cls, frozenset(kwargs.items()))
+    with _SHARED_LOCK:
+        if key not in _SHARED_CLIENTS:
+            _SHARED_CLIENTS[key] = client_cls(session, **kwargs)
+        return _SHARED_CLIENTS[key]
+
+
+def clear_shared_session():
+    """Discard the shared session and all API clients which use it.
+
+    The next call to get_shared_session or get_shared_client creates a new
+    session, e.g. to pick up a newly-obtained token.
+    """
+    global _SHARED_SESSION
+    with _SHARED_LOCK:
+        if _SHARED_SESSION is not None:
+            _SHARED_SESSION.session.close()
+        _SHARED_SESSION = None
+        _SHARED_CLIENTS.clear()
+
+
+@contextmanager
+def share_all_sessions():
+    """Make every SATSession created within the context the shared session.
+
+    This lets several subcommands run in one process, as with "sat batch",
+    reuse one session and its connection pool without changing how each of
+    them creates its session. The shared session is created when entering
+    the context, so it uses the config in effect at that time, and it is
+    closed when the context exits.
+
+    Yields:
+        SATSession: the shared session.
+
+    Raises:
+        SystemExit: if the session is not authenticated.
+    """
+    global _SHARE_ALL_SESSIONS
+    session = get_shared_session()
+    _SHARE_ALL_SESSIONS = True
+    try:
+        yield session
+    finally:
+        _SHARE_ALL_SESSIONS = False
+        clear_shared_session()
@@ -0,0 +1,257 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Export and import of the hardware inventory to and from a SQLite database.
+"""
+from collections import defaultdict
+from datetime import datetime, timezone
+from itertools import islice
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import tempfile
+
+from sat.constants import EMPTY_VALUE, MISSING_VALUE
+from sat.system.component import NodeComponent
+from sat.system.constants import EMPTY_STATUS, STATUS_KEY, TYPE_KEY
+from sat.system.system import COMPONENT_TYPES
+from sat.xname import XName
+
+LOGGER = logging.getLogger(__name__)
+
+# The version of the database schema. Increment this when the schema changes
+# in a way which older versions of this module cannot read.
+SCHEMA_VERSION = 1
+
+# The table which stores each type of component, keyed by HSM type
+TABLE_NAMES = {
+    'Chassis': 'chassis',
+    'CMMRectifier': 'cmm_rectifiers',
+    'ComputeModule': 'compute_modules',
+    'Drive': 'drives',
+    'HSNBoard': 'hsn_boards',
+    'Memory': 'memory',
+    'Node': 'nodes',
+    'NodeEnclosure': 'node_enclosures',
+    'NodeEnclosurePowerSupply': 'node_enclosure_power_supplies',
+    'Processor': 'processors',
+    'NodeAccel': 'node_accels',
+    'NodeAccelRiser': 'node_accel_risers',
+    'NodeHsnNic': 'node_hsn_nics',
+    'RouterModule': 'router_modules',
+    'NodeBMC': 'node_bmcs',
+    'RouterBMC': 'router_bmcs',
+    'MgmtSwitch': 'mgmt_switches',
+    'CabinetPDU': 'cabinet_pdus',
+    'CabinetPDUPowerConnector': 'cabinet_pdu_power_connectors',
+}
+
+# The columns of each component table other than the raw HSM data, mapped to
+# the BaseComponent property which supplies the value of each column
+INDEXED_COLUMNS = {
+    'fru_id': 'fruid',
+    'manufacturer': 'manufacturer',
+    'model': 'model',
+    'serial_number': 'serial_number',
+}
+
+# The columns of each component table which are indexed in addition to xname.
+# The node_xname column holds the xname of the parent node of components which
+# belong to a node, e.g. processors and memory, so they can be joined to nodes.
+INDEXES = ('type', 'node_xname', 'fru_id', 'model')
+
+# The number of components inserted into the database at a time
+INSERT_BATCH_SIZE = 1000
+
+
+class InventoryDatabaseError(Exception):
+    """An error occurred while reading or writing a hardware inventory database."""
+
+
+def _get_column_values(component_type, raw_component):
+    """Get the values of the indexed columns for a component.
+
+    Args:
+        component_type (type): the BaseComponent subclass of the component.
+        raw_component (dict): the raw data for the component returned by HSM.
+
+    Returns:
+        list: the values of the columns in INDEXED_COLUMNS, where missing
+            values are None.
+    """
+    component = component_type(raw_component)
+    values = []
+    for attr in INDEXED_COLUMNS.values():
+        try:
+            value = getattr(component, attr)
+        except (KeyError, TypeError):
+            value = None
+        values.append(None if value in (MISSING_VALUE, EMPTY_VALUE) else str(value))
+    return values
+
+
+def _create_tables(connection):
+    """Create the metadata table and a table for each type of component."""
+    connection.execute('CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)')
+    columns = ', '.join(f'{column} TEXT' for column in INDEXED_COLUMNS)
+    for table in TABLE_NAMES.values():
+        connection.execute(f'CREATE TABLE {table} (xname TEXT PRIMARY KEY, type TEXT NOT NULL, '
+                           f'node_xname TEXT, {columns}, raw_data TEXT NOT NULL)')
+
+
+def _create_indexes(connection):
+    """Create the indexes on each component table."""
+    for table in TABLE_NAMES.values():
+        for column in INDEXES:
+            connection.execute(f'CREATE INDEX {table}_{column} ON {table} ({column})')
+
+
+def _iter_rows(raw_components):
+    """Iterate over the table and row values for each populated component.
+
+    Args:
+        raw_components (Iterable): the raw data for each component returned by HSM.
+
+    Yields:
+        tuple: the table name and a tuple of the column values for the component.
+    """
+    component_types = {component_type.hsm_type: component_type for component_type in COMPONENT_TYPES}
+    for raw_component in raw_components:
+        hsm_type = raw_component.get(TYPE_KEY)
+        if raw_component.get(STATUS_KEY) == EMPTY_STATUS:
+            continue
+        component_type = component_types.get(hsm_type)
+        if component_type is None or 'ID' not in raw_component:
+            LOGGER.debug("Skipping component of unknown type '%s' or without an ID.", hsm_type)
+            continue
+        node_xname = None
+        if issubclass(component_type, NodeComponent):
+            parent_node = XName(raw_component['ID']).get_parent_node()
+            node_xname = str(parent_node) if parent_node is not None else None
+        yield TABLE_NAMES[hsm_type], (raw_component['ID'], hsm_type, node_xname,
+                                      *_get_column_values(component_type, raw_component),
+                                      json.dumps(raw_component, separators=(',', ':')))
+
+
+def export_inventory(raw_components, path):
+    """Write the hardware inventory to a new SQLite database.
+
+    The components are inserted in batches as they are read, so the full
+    inventory is never held in memory. The database is written to a
+    temporary file in a single transaction, and only replaces `path` once it
+    is complete, so a failed export never leaves a partial database behind.
+
+    Args:
+        raw_components (Iterable): the raw data for each component returned
+            by HSM. This may be an iterator, which is consumed.
+        path (str): the path of the database file to create or replace.
+
+    Returns:
+        int: the number of components written to the database.
+
+    Raises:
+        InventoryDatabaseError: if the database cannot be written.
+    """
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                         prefix='.hwinv-', suffix='.db')
+        os.close(fd)
+    except OSError as err:
+        raise InventoryDatabaseError(f'Unable to create database {path}: {err}') from err
+
+    count = 0
+    try:
+        connection = sqlite3.connect(temp_path)
+        try:
+            with connection:
+                _create_tables(connection)
+                connection.executemany('INSERT INTO metadata VALUES (?, ?)', [
+                    ('schema_version', str(SCHEMA_VERSION)),
+                    ('created', datetime.now(timezone.utc).isoformat(timespec='seconds')),
+                ])
+                placeholders = ', '.join('?' * (len(INDEXED_COLUMNS) + 4))
+                rows = _iter_rows(raw_components)
+                while True:
+                    batch = list(islice(rows, INSERT_BATCH_SIZE))
+                    if not batch:
+                        break
+                    values_by_table = defaultdict(list)
+                    for table, values in batch:
+                        values_by_table[table].append(values)
+                    for table, table_values in values_by_table.items():
+                        connection.executemany(f'INSERT OR REPLACE INTO {table} VALUES ({placeholders})',
+                                               table_values)
+                    count += len(batch)
+                _create_indexes(connection)
+        finally:
+            connection.close()
+        os.replace(temp_path, path)
+    except (sqlite3.Error, OSError) as err:
+        os.remove(temp_path)
+        raise InventoryDatabaseError(f'Unable to write database {path}: {err}') from err
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return count
+
+
+def iter_database_inventory(path, component_types=None):
+    """Iterate over the components in a hardware inventory database.
+
+    Args:
+        path (str): the path of the database file.
+        component_types (Iterable or None): the BaseComponent subclasses to
+            get. If None, get all components.
+
+    Yields:
+        dict: the raw data for each component, as originally returned by HSM.
+
+    Raises:
+        InventoryDatabaseError: if the database cannot be read or has an
+            unsupported schema version.
+    """
+    if not os.path.isfile(path):
+        raise InventoryDatabaseError(f'Database {path} does not exist.')
+
+    hsm_types = (TABLE_NAMES.keys() if component_types is None
+                 else {component_type.hsm_type for component_type in component_types})
+    try:
+        # Quote the path in the URI, so that characters like '#', '?' and '%'
+        # in the path are not taken as parts of the URI.
+        connection = sqlite3.connect(f'{Path(path).resolve().as_uri()}?mode=ro', uri=True)
+        try:
+            row = connection.execute("SELECT value FROM metadata WHERE key = 'schema_version'").fetchone()
+            if row is None or row[0] != str(SCHEMA_VERSION):
+                raise InventoryDatabaseError(f'Database {path} has unsupported schema version '
+                                             f'{row[0] if row else None}; expected {SCHEMA_VERSION}.')
+            for hsm_type in hsm_types:
+                for (raw_data,) in connection.execute(f'SELECT raw_data FROM {TABLE_NAMES[hsm_type]}'):
+                    yield json.loads(raw_data)
+        finally:
+            connection.close()
+    except (sqlite3.Error, ValueError) as err:
+        raise InventoryDatabaseError(f'Unable to read database {path}: {err}') from err
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2020, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2020, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,8 +25,12 @@
 Class to define the entire system hardware inventory.
 """
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from requests.exceptions import RequestException
+
+from sat.apiclient import APIError
 from sat.system.component import NodeComponent
 from sat.system.constants import EMPTY_STATUS, STATUS_KEY, TYPE_KEY
 from sat.system.chassis import Chassis
@@ -48,47 +52,142 @@ from sat.system.router_bmc import RouterBMC
 from sat.system.mgmt_switch import MgmtSwitch
 from sat.system.cabinet_pdu import CabinetPDU
 from sat.system.cabinet_pdu_power_connector import CabinetPDUPowerConnector
+from sat.util import iter_json_array
 from sat.xname import XName
 
 LOGGER = logging.getLogger(__name__)
 
+# All the types of component in the hardware inventory, in the order in
+# which they are listed and summarized.
+COMPONENT_TYPES = (
+    Chassis,
+    CMMRectifier,
+    ComputeModule,
+    Drive,
+    HSNBoard,
+    MemoryModule,
+    Node,
+    NodeEnclosure,
+    NodeEnclosurePowerSupply,
+    Processor,
+    NodeAccel,
+    NodeAccelRiser,
+    NodeHsnNic,
+    RouterModule,
+    NodeBMC,
+    RouterBMC,
+    MgmtSwitch,
+    CabinetPDU,
+    CabinetPDUPowerConnector,
+)
+
+# The size of the chunks in which the hardware inventory is read from HSM
+HARDWARE_INVENTORY_CHUNK_SIZE = 1024 * 1024
+# The maximum number of queries for hardware inventory of a single type to run at once
+MAX_PARALLEL_INVENTORY_QUERIES = 8
+
+
+def get_required_component_types(component_types):
+    """Get the component types needed to fully describe the given component types.
+
+    Nodes are described in part by their child components, e.g. processors
+    and memory modules, and by their parent chassis, so these are needed
+    whenever nodes are needed.
+
+    Args:
+        component_types (Iterable): the BaseComponent subclasses requested.
+
+    Returns:
+        set: the BaseComponent subclasses which are needed.
+    """
+    required_types = set(component_types)
+    if Node in required_types:
+        required_types.add(Chassis)
+        required_types.update(comp_type for comp_type in COMPONENT_TYPES
+                              if issubclass(comp_type, NodeComponent))
+    return required_types
+
+
+def _iter_hardware_inventory_response(hsm_client, params=None):
+    """Iterate over the components in a single streamed hardware inventory response.
+
+    Args:
+        hsm_client (HSMClient): the HSM API client.
+        params (dict or None): the query parameters for the request.
+
+    Yields:
+        dict: the raw data for each component returned by HSM.
+
+    Raises:
+        APIError: if the request to HSM fails.
+        ValueError: if the response is not a valid JSON array.
+    """
+    response = hsm_client.stream('Inventory', 'Hardware', params=params)
+    try:
+        yield from iter_json_array(response.iter_content(chunk_size=HARDWARE_INVENTORY_CHUNK_SIZE))
+    except RequestException as err:
+        raise APIError(f'Failed to read hardware inventory response: {err}') from err
+    finally:
+        response.close()
+
+
+def iter_hardware_inventory(hsm_client, component_types=None):
+    """Iterate over the components in the HSM hardware inventory.
+
+    The responses are streamed and decoded one component at a time, so the
+    full response body is never held in memory. If only some component types
+    are needed, HSM is queried for each type separately and in parallel, so
+    that components of other types are not transferred at all.
+
+    Args:
+        hsm_client (HSMClient): the HSM API client.
+        component_types (Iterable or None): the BaseComponent subclasses to
+            get. If None, get all components.
+
+    Yields:
+        dict: the raw data for each component returned by HSM.
+
+    Raises:
+        APIError: if a request to HSM fails.
+        ValueError: if a response is not a valid JSON array.
+    """
+    if component_types is None or set(COMPONENT_TYPES) <= set(component_types):
+        yield from _iter_hardware_inventory_response(hsm_client)
+        return
+
+    hsm_types = sorted({comp_type.hsm_type for comp_type in component_types})
+    if not hsm_types:
+        return
+
+    def get_components_of_type(hsm_type):
+        return list(_iter_hardware_inventory_response(hsm_client, {'type': hsm_type}))
+
+    LOGGER.debug('Querying hardware inventory of types: %s', ', '.join(hsm_types))
+    with ThreadPoolExecutor(max_workers=min(len(hsm_types), MAX_PARALLEL_INVENTORY_QUERIES)) as executor:
+        for components in executor.map(get_components_of_type, hsm_types):
+            yield from components
+
 
 class System:
     """The full hardware inventory as returned by the HSM API."""
 
-    def __init__(self, complete_raw_data):
+    def __init__(self, complete_raw_data, component_types=None):
         """Creates a new object representing the full system's hardware inventory.
 
         Args:
-            complete_raw_data (list): The list of dictionaries returned as JSON
-                by the HSM API.
+            complete_raw_data (Iterable): The dictionaries returned as JSON
+                by the HSM API. This may be an iterator, which is consumed.
+            component_types (Iterable or None): The BaseComponent subclasses
+                to keep. The raw data for components of other types is
+                discarded as it is read. If None, keep all components.
         """
-        self.complete_raw_data = complete_raw_data
         self.raw_data_by_type = defaultdict(list)
+        self.components_by_type = {comp_type: {} for comp_type in COMPONENT_TYPES}
+        self.component_types = None if component_types is None else set(component_types)
+        hsm_types = (None if component_types is None
+                     else {comp_type.hsm_type for comp_type in component_types})
 
-        self.components_by_type = {
-            Chassis: {},
-            CMMRectifier: {},
-            ComputeModule: {},
-            Drive: {},
-            HSNBoard: {},
-            MemoryModule: {},
-            Node: {},
-            NodeEnclosure: {},
-            NodeEnclosurePowerSupply: {},
-            Processor: {},
-            NodeAccel: {},
-            NodeAccelRiser: {},
-            NodeHsnNic: {},
-            RouterModule: {},
-            NodeBMC: {},
-            RouterBMC: {},
-            MgmtSwitch: {},
-            CabinetPDU: {},
-            CabinetPDUPowerConnector: {}
-        }
-
-        for component in self.complete_raw_data:
+        for component in complete_raw_data:
             try:
                 comp_type = component[TYPE_KEY]
                 comp_status = component[STATUS_KEY]
@@ -98,6 +197,9 @@ class System:
                                ', '.join(component.keys()))
                 continue
 
+            if hsm_types is not None and comp_type not in hsm_types:
+                continue
+
             if comp_status == EMPTY_STATUS:
                 LOGGER.debug("Skipping empty object of type '%s'.", comp_type)
                 continue
@@ -129,6 +231,11 @@ class System:
 
     def relate_node_children(self):
         """Creates links between nodes and their processors and memory modules."""
+        if self.component_types is not None and Node not in self.component_types:
+            # Only node children were requested, so there are no parents to find.
+            LOGGER.debug('Nodes were not requested; not relating node children to nodes.')
+            return
+
         node_children_dicts = [
             comp_dict for comp_type, comp_dict in self.components_by_type.items()
             if issubclass(comp_type, NodeComponent)
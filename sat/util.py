@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2025, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -26,9 +26,10 @@ Contains structures and code that is generally useful across all of SAT.
 """
 from json.encoder import JSONEncoder
 import sys
+import codecs
 from collections import OrderedDict
 from datetime import timedelta
-from functools import partial
+from functools import lru_cache, partial
 from getpass import getpass
 import logging
 import math
@@ -45,7 +46,7 @@ except ImportError:
     from yaml import SafeDumper
 from yaml.resolver import BaseResolver
 from yaml import dump
-from json import dumps
+from json import JSONDecodeError, JSONDecoder, dumps
 import boto3
 from prettytable import PrettyTable
 
@@ -230,6 +231,79 @@ def get_pretty_table(rows, headings=None, sort_by=None):
     return pt
 
 
+def write_fixed_width_table(stream, rows, headings=None, border=False, align='l'):
+    """Writes rows to a stream as a table formatted the same as a PrettyTable.
+
+    This computes the column widths in a single pass and then writes one line
+    at a time, which is much faster than building a PrettyTable for large
+    tables. The output is identical to that of a PrettyTable with the same
+    options, which should be used instead when this returns False.
+
+    Only tables with left- or right-aligned columns, and with cells which are
+    single-line, printable ASCII strings, can be written. Otherwise PrettyTable
+    wraps lines and measures the display width of characters, so nothing is
+    written.
+
+    Args:
+        stream (io.TextIOBase): the stream to write the table to.
+        rows ([[str]]): the rows of the table, where each row is a list of
+            strings with one per column.
+        headings ([str]): the headings of the table. If omitted, no heading
+            row is included.
+        border (bool): if True, draw borders around the cells.
+        align (str): 'l' to left-align or 'r' to right-align the cells.
+
+    Returns:
+        bool: True if the table was written, False if it could not be
+            written identically to a PrettyTable.
+    """
+    if align not in ('l', 'r') or not rows:
+        return False
+    if headings and len(set(headings)) != len(headings):
+        return False
+
+    num_columns = len(headings) if headings else len(rows[0])
+    widths = [len(heading) for heading in headings] if headings else [0] * num_columns
+    for row in rows:
+        if len(row) != num_columns:
+            return False
+        for index, value in enumerate(row):
+            if not (value.isascii() and value.isprintable()):
+                return False
+            if len(value) > widths[index]:
+                widths[index] = len(value)
+    if headings and not all(heading.isascii() and heading.isprintable() for heading in headings):
+        return False
+
+    justify = str.ljust if align == 'l' else str.rjust
+    separator = '|' if border else ''
+    hrule = '+' + '+'.join('-' * (width + 2) for width in widths) + '+'
+
+    def format_row(row):
+        return separator + ''.join(
+            f' {justify(value, width)} {separator}' for value, width in zip(row, widths)
+        )
+
+    lines = iter(rows)
+    if headings:
+        first_line = format_row(headings)
+        if border:
+            first_line = f'{hrule}\n{first_line}\n{hrule}'
+    else:
+        first_line = format_row(next(lines))
+        if border:
+            first_line = f'{hrule}\n{first_line}'
+
+    stream.write(first_line)
+    for row in lines:
+        stream.write('\n')
+        stream.write(format_row(row))
+    if border:
+        stream.write('\n')
+        stream.write(hrule)
+    return True
+
+
 def get_rst_header(header, header_level=1, min_len=80):
     """Gets a string for the given header at the given level.
 
@@ -386,6 +460,91 @@ class SATEncoder(JSONEncoder):
 # A function to dump json to be used by all SAT code.
 json_dump = partial(dumps, cls=SATEncoder, **JSON_FORMAT_PARAMS)
 
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+JSON_NUMBER_CHARS = frozenset('0123456789+-.eE')
+
+
+def iter_json_array(chunks):
+    """Iterate over the elements of a JSON array as its text is read in chunks.
+
+    Only the element being decoded and the unconsumed part of the most recent
+    chunk are held in memory, so this can be used to process a very large
+    array without loading the whole document.
+
+    Args:
+        chunks (Iterable): the JSON text of an array, as str chunks or as
+            bytes chunks of UTF-8 encoded text.
+
+    Yields:
+        Each element of the array, decoded as by json.loads.
+
+    Raises:
+        ValueError: if the text is not a valid JSON array.
+    """
+    decoder = JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    chunk_iter = iter(chunks)
+    buffer = ''
+    position = 0
+    final = False
+    # One of '[', 'value', 'next_value', 'separator', or 'end'
+    expected = '['
+
+    def read_chunk():
+        nonlocal buffer, position, final
+        try:
+            chunk = next(chunk_iter)
+        except StopIteration:
+            chunk = b''
+            final = True
+        if isinstance(chunk, bytes):
+            chunk = text_decoder.decode(chunk, final)
+        buffer = buffer[position:] + chunk
+        position = 0
+
+    while True:
+        position = JSON_WHITESPACE.match(buffer, position).end()
+        if position == len(buffer):
+            if final:
+                break
+            read_chunk()
+            continue
+
+        char = buffer[position]
+        if expected == 'next_value' or (expected == 'value' and char != ']'):
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except JSONDecodeError:
+                if final:
+                    raise
+                read_chunk()
+                continue
+            # A number may be split across two chunks, so a value is only known
+            # to be complete if it is followed by a character which cannot
+            # continue a number.
+            if not final and (end == len(buffer) or buffer[end] in JSON_NUMBER_CHARS):
+                read_chunk()
+                continue
+            yield element
+            position = end
+            expected = 'separator'
+            continue
+
+        if expected == '[' and char == '[':
+            expected = 'value'
+        elif expected in ('value', 'separator') and char == ']':
+            expected = 'end'
+        elif expected == 'separator' and char == ',':
+            expected = 'next_value'
+        elif expected == 'end':
+            raise ValueError(f'Extra data after end of JSON array: {buffer[position:position + 20]!r}')
+        else:
+            raise ValueError(f'Invalid JSON array: unexpected {char!r}')
+        position += 1
+
+    if expected != 'end':
+        raise ValueError('Invalid JSON array: unexpected end of data')
+
 
 def get_resource_section_path(section):
     """Get the path to a section in the sat resource directory.
@@ -445,6 +604,48 @@ def bytes_to_gib(bytes_val, ndigits=2):
     return round(bytes_val / 2**30, ndigits)
 
 
+@lru_cache(maxsize=1024)
+def compile_path(dotted_path):
+    """Get a function which gets the value at a dotted path in a dictionary.
+
+    The returned function behaves the same as `get_val_by_path` with the given
+    `dotted_path`, but does not need to split the dotted path on each call, so
+    it should be used when getting the value at the same path from many
+    dictionaries. Compiled paths are cached, so compiling the same path again
+    is cheap.
+
+    Args:
+        dotted_path (str): The dotted path. See `get_val_by_path` for an
+            explanation of what a dotted path is.
+
+    Returns:
+        Callable[[dict, Any], Any]: a function which takes a dictionary and an
+            optional default value, and which returns the value at the dotted
+            path in the dictionary, or the default value if no such path exists.
+    """
+    keys = tuple(dotted_path.split('.'))
+
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get_val(dict_val, default_value=None):
+            if dict_val and key in dict_val:
+                return dict_val[key]
+            return default_value
+
+    else:
+        def get_val(dict_val, default_value=None):
+            current_val = dict_val
+            for key in keys:
+                if current_val and key in current_val:
+                    current_val = current_val[key]
+                else:
+                    return default_value
+            return current_val
+
+    return get_val
+
+
 def get_val_by_path(dict_val, dotted_path, default_value=None):
     """Get a value from a dictionary based on a dotted path.
 
@@ -471,13 +672,7 @@ def get_val_by_path(dict_val, dotted_path, default_value=None):
         The value that exists at the dotted path or `default_value` if no such
         path exists in `dict_val`.
     """
-    current_val = dict_val
-    for key in dotted_path.split('.'):
-        if current_val and key in current_val:
-            current_val = current_val[key]
-        else:
-            return default_value
-    return current_val
+    return compile_path(dotted_path)(dict_val, default_value)
 
 
 def set_val_by_path(dict_val, dotted_path, value):
@@ -648,7 +843,7 @@ def get_new_ordered_dict(orig_dict, dotted_paths, default_value=None, strip_path
     """
     return OrderedDict([
         (dotted_path.rsplit('.', 1)[-1] if strip_path else dotted_path,
-         get_val_by_path(orig_dict, dotted_path, default_value))
+         compile_path(dotted_path)(orig_dict, default_value))
         for dotted_path in dotted_paths
     ])
 
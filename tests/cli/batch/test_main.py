@@ -0,0 +1,318 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Unit tests for sat.cli.batch.main
+"""
+from argparse import ArgumentParser, Namespace
+from functools import partial
+import os
+from tempfile import TemporaryDirectory
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from requests import Request
+
+from sat.cli.batch.main import (
+    ERR_COMMAND_FAILED,
+    ERR_INVALID_BATCH,
+    BatchCommand,
+    BatchError,
+    do_batch,
+    get_exit_status,
+    parse_batch_commands,
+    read_batch_commands,
+    run_batch,
+    run_batch_command,
+)
+from sat.http_adapter import RequestPolicyAdapter
+from sat.session import SATSession
+
+
+def get_parser():
+    """Get a parser with subcommands like the sat parser."""
+    parser = ArgumentParser(prog='sat')
+    parser.add_argument('--no-headings', dest='no_headings', action='store_true', default=None)
+    parser.add_argument('-u', '--username')
+    parser.add_argument('--token-file')
+    subparsers = parser.add_subparsers(dest='command')
+    for command in ('status', 'hwinv', 'init'):
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument('--filter', dest='filter_strs', action='append')
+    return parser
+
+
+class TestReadBatchCommands(unittest.TestCase):
+    """Tests for reading the commands of a batch."""
+
+    def test_lines(self):
+        """Test reading one command per line with comments and blank lines"""
+        contents = ('# Check the nodes\n'
+                    'sat status --filter "State = Ready"\n'
+                    '\n'
+                    'hwinv   # inventory\n')
+        self.assertEqual([['status', '--filter', 'State = Ready'], ['hwinv']],
+                         read_batch_commands(contents))
+
+    def test_yaml_list(self):
+        """Test reading a YAML list of command strings and argument lists"""
+        contents = ('- sat status --filter "State = Ready"\n'
+                    '- [hwinv, --filter, 1]\n')
+        self.assertEqual([['status', '--filter', 'State = Ready'], ['hwinv', '--filter', '1']],
+                         read_batch_commands(contents))
+
+    def test_empty(self):
+        """Test reading an empty batch"""
+        self.assertEqual([], read_batch_commands(''))
+
+    def test_unbalanced_quotes(self):
+        """Test that a line with unbalanced quotes is an error"""
+        with self.assertRaisesRegex(BatchError, 'on line 2'):
+            read_batch_commands('status\nstatus --filter "State\n')
+
+    def test_invalid_yaml_entry(self):
+        """Test that a YAML entry which is not a command is an error"""
+        with self.assertRaisesRegex(BatchError, 'entry 2 must be a string or a list'):
+            read_batch_commands('- status\n- {hwinv: true}\n')
+
+
+class TestParseBatchCommands(unittest.TestCase):
+    """Tests for parsing the commands of a batch."""
+
+    def setUp(self):
+        self.parser = get_parser()
+
+    def test_parse(self):
+        """Test parsing valid commands"""
+        commands = parse_batch_commands(self.parser, [['status', '--filter', 'State = Ready'], ['hwinv']])
+        self.assertEqual(["sat status --filter 'State = Ready'", 'sat hwinv'],
+                         [command.command for command in commands])
+        self.assertEqual(['status', 'hwinv'], [command.args.command for command in commands])
+        self.assertEqual(['State = Ready'], commands[0].args.filter_strs)
+
+    def test_invalid_command(self):
+        """Test that an invalid command is an error before any command runs"""
+        with patch('sys.stderr'):
+            with self.assertRaisesRegex(BatchError, 'Invalid command 2: sat hwinv --bogus'):
+                parse_batch_commands(self.parser, [['status'], ['hwinv', '--bogus']])
+
+    def test_batch_level_options(self):
+        """Test that global options for the shared session cannot be given in a command"""
+        with self.assertRaisesRegex(BatchError, r'--username, --token-file apply to the whole batch'):
+            parse_batch_commands(self.parser, [['status'], ['--username', 'u', '--token-file', 't', 'hwinv']])
+
+    def test_command_level_global_option(self):
+        """Test that global options which apply to one command are allowed"""
+        commands = parse_batch_commands(self.parser, [['--no-headings', 'status']])
+        self.assertTrue(commands[0].args.no_headings)
+
+    def test_unsupported_command(self):
+        """Test that a subcommand which cannot run in a batch is an error"""
+        with self.assertRaisesRegex(BatchError, 'init subcommand cannot be run in a batch'):
+            parse_batch_commands(self.parser, [['init']])
+
+
+class TestRunBatchCommand(unittest.TestCase):
+    """Tests for running one command of a batch."""
+
+    def setUp(self):
+        self.mock_subcommand = MagicMock()
+        self.mock_get_subcommand = patch('sat.cli.batch.main.get_subcommand_function',
+                                         return_value=self.mock_subcommand).start()
+        self.mock_overrides = patch('sat.cli.batch.main.command_line_overrides').start()
+        self.args = Namespace(command='status')
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_success(self):
+        """Test running a command which succeeds with its config overrides"""
+        self.assertEqual(0, run_batch_command(self.args))
+        self.mock_get_subcommand.assert_called_once_with('status')
+        self.mock_overrides.assert_called_once_with(self.args)
+        self.mock_subcommand.assert_called_once_with(self.args)
+
+    def test_system_exit(self):
+        """Test that the code of a SystemExit is the exit status"""
+        self.mock_subcommand.side_effect = SystemExit(3)
+        self.assertEqual(3, run_batch_command(self.args))
+
+    def test_unexpected_exception(self):
+        """Test that an unexpected exception fails the command"""
+        self.mock_subcommand.side_effect = RuntimeError('boom')
+        with self.assertLogs(level='ERROR') as logs:
+            self.assertEqual(1, run_batch_command(self.args))
+        self.assertIn('boom', logs.output[0])
+
+    def test_get_exit_status(self):
+        """Test getting the exit status from SystemExit codes"""
+        self.assertEqual(0, get_exit_status(None))
+        self.assertEqual(2, get_exit_status(2))
+        with self.assertLogs(level='ERROR') as logs:
+            self.assertEqual(1, get_exit_status('failed'))
+        self.assertIn('failed', logs.output[0])
+
+
+class TestRunBatch(unittest.TestCase):
+    """Tests for running the commands of a batch."""
+
+    def setUp(self):
+        self.mock_run_command = patch('sat.cli.batch.main.run_batch_command').start()
+        self.mock_share_sessions = patch('sat.cli.batch.main.share_all_sessions').start()
+        patch('sat.cli.batch.main.time.monotonic', side_effect=[0.0, 1.5, 2.0, 2.25]).start()
+        self.mock_print = patch('builtins.print').start()
+        self.commands = [BatchCommand('sat status', Namespace(command='status')),
+                         BatchCommand('sat hwinv', Namespace(command='hwinv'))]
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_run_batch(self):
+        """Test that commands run in order with delimited output in one shared session"""
+        self.mock_run_command.side_effect = [1, 0]
+        results = run_batch(self.commands)
+
+        self.mock_share_sessions.assert_called_once_with()
+        self.mock_run_command.assert_has_calls([call(self.commands[0].args), call(self.commands[1].args)])
+        self.assertEqual([('sat status', 1, 1.5), ('sat hwinv', 0, 0.25)], results)
+        self.mock_print.assert_has_calls([
+            call('==> [1/2] sat status', flush=True),
+            call('<== [1/2] exit status 1 in 1.50s\n', flush=True),
+            call('==> [2/2] sat hwinv', flush=True),
+            call('<== [2/2] exit status 0 in 0.25s\n', flush=True),
+        ])
+
+    def test_session_created_before_commands(self):
+        """Test that the shared session is created before the first command runs"""
+        manager = MagicMock()
+        manager.attach_mock(self.mock_share_sessions, 'share_all_sessions')
+        manager.attach_mock(self.mock_run_command, 'run_batch_command')
+        self.mock_run_command.return_value = 0
+        run_batch(self.commands)
+        self.assertEqual([call.share_all_sessions(), call.share_all_sessions().__enter__()],
+                         manager.mock_calls[:2])
+        self.assertEqual([call.share_all_sessions().__enter__().reset_request_deadline(),
+                          call.run_batch_command(self.commands[0].args)],
+                         manager.mock_calls[2:4])
+
+    def test_deadline_per_command(self):
+        """Test that each command gets the full request deadline of the shared session"""
+        clock = [0.0]
+        patch('sat.cli.batch.main.time.monotonic', side_effect=lambda: clock[0]).start()
+        mock_send = patch('sat.http_adapter.HTTPAdapter.send',
+                          return_value=MagicMock(status_code=200, headers={})).start()
+        adapter = RequestPolicyAdapter(deadline=1)
+        session = MagicMock()
+        session.session.adapters = {'http://': adapter, 'https://': adapter}
+        session.reset_request_deadline = partial(SATSession.reset_request_deadline, session)
+        self.mock_share_sessions.return_value.__enter__.return_value = session
+
+        def run_command(_):
+            # Each command takes 0.75s before it makes a request, so the second
+            # command would be past a deadline covering the whole batch.
+            clock[0] += 0.75
+            adapter.send(Request('GET', 'https://api-gw-service-nmn.local/apis/sls/v1/hardware').prepare(),
+                         timeout=60)
+            return 0
+
+        self.mock_run_command.side_effect = run_command
+        results = run_batch(self.commands)
+        self.assertEqual([0, 0], [result.exit_status for result in results])
+        self.assertEqual(2, mock_send.call_count)
+
+    def test_stop_on_error(self):
+        """Test that no more commands run after a failure with stop_on_error"""
+        self.mock_run_command.return_value = 1
+        with self.assertLogs(level='ERROR'):
+            results = run_batch(self.commands, stop_on_error=True)
+        self.assertEqual(1, len(results))
+        self.mock_run_command.assert_called_once_with(self.commands[0].args)
+
+
+class TestDoBatch(unittest.TestCase):
+    """Tests for the do_batch function."""
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.batch_file = os.path.join(self.tmp_dir.name, 'batch.txt')
+        with open(self.batch_file, 'w') as f:
+            f.write('status\nhwinv\n')
+        self.args = Namespace(file=self.batch_file, stop_on_error=False, parser=get_parser())
+
+        self.mock_run_command = patch('sat.cli.batch.main.run_batch_command', return_value=0).start()
+        patch('sat.cli.batch.main.share_all_sessions').start()
+        self.mock_create_parser = patch('sat.cli.batch.main.create_parent_parser').start()
+        self.mock_print = patch('builtins.print').start()
+
+    def tearDown(self):
+        patch.stopall()
+        self.tmp_dir.cleanup()
+
+    def test_success(self):
+        """Test running a batch from a file with the already-built parser"""
+        do_batch(self.args)
+        self.assertEqual(['status', 'hwinv'],
+                         [c.args[0].command for c in self.mock_run_command.call_args_list])
+        self.mock_create_parser.assert_not_called()
+        self.assertIn('Batch Summary', str(self.mock_print.call_args_list[-2].args[0]))
+        self.assertRegex(self.mock_print.call_args.args[0], r'Ran 2 of 2 command\(s\) in .*s; 0 failed.')
+
+    def test_stdin(self):
+        """Test reading the batch from standard input"""
+        self.args.file = '-'
+        with patch('sys.stdin') as mock_stdin:
+            mock_stdin.read.return_value = '- status\n'
+            do_batch(self.args)
+        self.mock_run_command.assert_called_once()
+
+    def test_command_failed(self):
+        """Test that the batch fails when any command fails"""
+        self.mock_run_command.side_effect = [0, 2]
+        with self.assertRaises(SystemExit) as cm:
+            do_batch(self.args)
+        self.assertEqual(ERR_COMMAND_FAILED, cm.exception.code)
+        self.assertEqual(2, self.mock_run_command.call_count)
+
+    def test_missing_file(self):
+        """Test that a batch file which cannot be read is an error"""
+        self.args.file = os.path.join(self.tmp_dir.name, 'missing.txt')
+        with self.assertLogs(level='ERROR') as logs:
+            with self.assertRaises(SystemExit) as cm:
+                do_batch(self.args)
+        self.assertEqual(ERR_INVALID_BATCH, cm.exception.code)
+        self.assertIn('Unable to read batch file', logs.output[0])
+        self.mock_run_command.assert_not_called()
+
+    def test_invalid_batch(self):
+        """Test that no command runs when any command is invalid"""
+        with open(self.batch_file, 'w') as f:
+            f.write('status\ninit\n')
+        with self.assertLogs(level='ERROR'):
+            with self.assertRaises(SystemExit) as cm:
+                do_batch(self.args)
+        self.assertEqual(ERR_INVALID_BATCH, cm.exception.code)
+        self.mock_run_command.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -35,11 +35,12 @@ from textwrap import indent
 from typing import Any
 from unittest.mock import MagicMock, Mock, call, patch
 
+from sat.apiclient import APIError
 from sat.cli.bootsys.bos import (BOSFailure, BOSLimitString, BOSSessionThread,
                                  BOSV2SessionWaiter, boa_job_successful,
                                  do_bos_reboots, do_bos_shutdowns,
                                  get_session_templates)
-from tests.common import ExtendedTestCase
+from tests.common import ExtendedTestCase, patch_shared_client
 from sat.waiting import WaitingFailure
 
 
@@ -176,11 +177,12 @@ class TestBOSLimitString(unittest.TestCase):
     def setUp(self):
         self.blade_xname = 'x3000c0s0'
         self.nodes_on_blade_xnames = [f'{self.blade_xname}b0n{node}' for node in range(4)]
-        self.mock_hsm_client = patch('sat.cli.bootsys.bos.HSMClient').start()
-        self.mock_sat_session = patch('sat.cli.bootsys.bos.SATSession').start()
+        self.mock_hsm_client = patch('sat.node_directory.HSMClient').start()
+        patch('sat.node_directory.SLSClient').start()
+        self.mock_sat_session = patch_shared_client('sat.cli.bootsys.bos')
         self.mock_get_node_components = self.mock_hsm_client.return_value.get_node_components
         self.mock_get_node_components.return_value = [
-            {'ID': xname} for xname in self.nodes_on_blade_xnames
+            {'ID': xname} for xname in self.nodes_on_blade_xnames + ['x3000c0s1b0n0']
         ]
 
     def tearDown(self):
@@ -210,9 +212,21 @@ class TestBOSLimitString(unittest.TestCase):
         """Test expanding a limit string to its constituent xnames"""
         blade_xname = 'x3000c0s0'
         limit_str = BOSLimitString.from_string(f'{blade_xname},Application', recursive=True)
-        self.mock_get_node_components.assert_called_once_with(ancestor=blade_xname)
-        for xname in self.nodes_on_blade_xnames + ['Application']:
-            self.assertIn(xname, str(limit_str))
+        self.mock_get_node_components.assert_called_once_with()
+        self.assertEqual(set(self.nodes_on_blade_xnames), limit_str.xnames)
+        self.assertEqual({'Application'}, limit_str.roles_groups)
+
+    def test_recursive_limit_string_one_hsm_request(self):
+        """Test expanding several xnames recursively uses one HSM request"""
+        limit_str = BOSLimitString.from_string('x3000c0s0b0,x3000c0s1,x3000c0s0b0n1', recursive=True)
+        self.mock_get_node_components.assert_called_once_with()
+        self.assertEqual(set(self.nodes_on_blade_xnames + ['x3000c0s1b0n0']), limit_str.xnames)
+
+    def test_recursive_limit_string_api_error(self):
+        """Test that an HSM API error while expanding an xname raises BOSFailure"""
+        self.mock_get_node_components.side_effect = APIError('HSM failed')
+        with self.assertRaisesRegex(BOSFailure, 'Could not retrieve node xnames from HSM: HSM failed'):
+            BOSLimitString.from_string('x3000c0s0', recursive=True)
 
     def test_expanding_empty_component(self):
         """Test expanding component with no node descendants"""
@@ -220,7 +234,7 @@ class TestBOSLimitString(unittest.TestCase):
         self.mock_get_node_components.return_value = []
         with self.assertRaises(BOSFailure):
             BOSLimitString.from_string(blade_xname, recursive=True)
-        self.mock_get_node_components.assert_called_once_with(ancestor=blade_xname)
+        self.mock_get_node_components.assert_called_once_with()
 
     def test_non_recursive_limit_string_with_non_node_xname(self):
         """Test that creating a limit string non-recursively only works with nodes"""
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -27,11 +27,11 @@ Unit tests for the sat.cli.bootsys.cabinet_power module.
 import logging
 import unittest
 from argparse import Namespace
-from unittest.mock import call, patch
+from unittest.mock import patch
 
 from sat.cli.bootsys.cabinet_power import (do_air_cooled_cabinets_power_off,
                                            do_cabinets_power_off)
-from tests.common import ExtendedTestCase
+from tests.common import ExtendedTestCase, patch_shared_client
 
 
 class TestAirCooledCabinetsPowerOff(unittest.TestCase):
@@ -40,8 +40,9 @@ class TestAirCooledCabinetsPowerOff(unittest.TestCase):
     def setUp(self):
         self.args = Namespace()
         patch_prefix = 'sat.cli.bootsys.cabinet_power'
-        self.mock_sat_session = patch(f'{patch_prefix}.SATSession').start().return_value
-        self.mock_hsm_client = patch(f'{patch_prefix}.HSMClient').start().return_value
+        self.mock_sat_session = patch_shared_client(patch_prefix)
+        self.mock_hsm_client = patch('sat.node_directory.HSMClient').start().return_value
+        patch('sat.node_directory.SLSClient').start()
         self.mock_pcs_client = patch(f'{patch_prefix}.PCSClient').start().return_value
         self.mock_pcs_waiter = patch(f'{patch_prefix}.PCSPowerWaiter').start().return_value
 
@@ -52,30 +53,26 @@ class TestAirCooledCabinetsPowerOff(unittest.TestCase):
         self.mock_river_non_mgmt_nodes = self.mock_river_nodes[-self.num_non_mgmt_river_nodes:]
         self.timed_out_xnames = []
 
-        def mock_get_component_xnames(params):
-            if params.get('class') == 'River':
-                if params.get('role') == 'Management':
-                    return self.mock_river_mgmt_nodes
-                else:
-                    return self.mock_river_nodes
-            else:
-                return []
-
-        self.mock_hsm_client.get_component_xnames.side_effect = mock_get_component_xnames
+        def mock_get_node_components():
+            river_nodes = [
+                {'ID': xname, 'Type': 'Node', 'Class': 'River',
+                 'Role': 'Management' if xname in self.mock_river_mgmt_nodes else 'Compute'}
+                for xname in self.mock_river_nodes
+            ]
+            mountain_nodes = [
+                {'ID': 'x1000c0s0b0n0', 'Type': 'Node', 'Class': 'Mountain', 'Role': 'Compute'}
+            ]
+            return river_nodes + mountain_nodes
+
+        self.mock_hsm_client.get_node_components.side_effect = mock_get_node_components
         self.mock_pcs_waiter.wait_for_completion.return_value = self.timed_out_xnames
 
     def tearDown(self):
         patch.stopall()
 
     def assert_hsm_client_calls(self):
-        """Helper function to assert the expected HSMClient method calls are made."""
-        river_call_params = {'type': 'Node', 'class': 'River'}
-        mgmt_call_params = {'type': 'Node', 'class': 'River', 'role': 'Management'}
-
-        self.mock_hsm_client.get_component_xnames.assert_has_calls([
-            call(river_call_params),
-            call(mgmt_call_params)
-        ])
+        """Helper function to assert the node components are queried from HSM once."""
+        self.mock_hsm_client.get_node_components.assert_called_once_with()
 
     def test_do_ac_cab_off_non_empty_success(self):
         """Test do_air_cooled_cabinets_power_off with a non-empty set of non-mgmt river nodes"""
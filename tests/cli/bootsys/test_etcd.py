@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021, 2023 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2023, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -131,6 +131,28 @@ class TestSaveEtcdSnapshotOnHost(unittest.TestCase):
         self.assert_ssh_client_connect()
         self.mock_ssh_client.exec_command.assert_not_called()
 
+    def test_save_etcd_snapshot_with_ssh_pool(self):
+        """Test saving an etcd snapshot using a pooled SSH session."""
+        mock_ssh_pool = mock.Mock()
+        mock_ssh_pool.get_client.return_value = self.mock_ssh_client
+
+        save_etcd_snapshot_on_host(self.hostname, ssh_pool=mock_ssh_pool)
+
+        mock_ssh_pool.get_client.assert_called_once_with(self.hostname)
+        self.mock_get_ssh_client.assert_not_called()
+        self.mock_ssh_client.connect.assert_not_called()
+        self.assert_exec_commands()
+
+    def test_save_etcd_snapshot_ssh_pool_connect_failure(self):
+        """Test saving an etcd snapshot when the SSH session pool fails to connect."""
+        mock_ssh_pool = mock.Mock()
+        mock_ssh_pool.get_client.side_effect = SSHException
+
+        with self.assertRaisesRegex(EtcdSnapshotFailure, f'Failed to connect to {self.hostname}'):
+            save_etcd_snapshot_on_host(self.hostname, ssh_pool=mock_ssh_pool)
+
+        self.mock_ssh_client.exec_command.assert_not_called()
+
     def test_save_etcd_snapshot_systemctl_failure(self):
         """Test saving an etcd snapshot on a host when systemctl command raises SSHException."""
         self.systemctl_raises = True
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -24,17 +24,21 @@
 """
 Unit tests for the sat.cli.bootsys.hsn module.
 """
+import logging
+import os
+import time
 import unittest
 from unittest.mock import patch
 
 from sat.cli.bootsys.hsn import HSNBringupWaiter, HSNPort
 from sat.cli.bootsys.state_recorder import StateError
+from tests.common import patch_shared_client
 
 
 class TestHSNBringupWaiter(unittest.TestCase):
     """Test the HSN bringup waiter"""
     def setUp(self):
-        self.mock_session = patch('sat.cli.bootsys.hsn.SATSession').start()
+        self.mock_session = patch_shared_client('sat.cli.bootsys.hsn')
         mock_fabric_client_cls = patch('sat.cli.bootsys.hsn.FabricControllerClient').start()
         self.mock_fabric_client = mock_fabric_client_cls.return_value
         self.mock_fabric_client.get_fabric_edge_ports.return_value = {
@@ -176,3 +180,64 @@ class TestHSNBringupWaiter(unittest.TestCase):
         """Test that a port that was missing before shutdown, disabled after is not complete."""
         self.waiter.on_check_action()
         self.assertFalse(self.waiter.member_has_completed(HSNPort('edge-ports', 'x3000c0r24j16p1')))
+
+    def test_get_completed_ports(self):
+        """Test that get_completed_ports finds all ports in their desired state in one pass."""
+        self.waiter.on_check_action()
+        self.assertEqual(
+            {
+                HSNPort('fabric-ports', 'x3000c0r24j4p0'),
+                HSNPort('fabric-ports', 'x3000c0r24j4p1'),
+                HSNPort('fabric-ports', 'x3000c0r24j8p1'),
+                HSNPort('edge-ports', 'x3000c0r24j14p0')
+            },
+            self.waiter.completed_ports
+        )
+
+    def test_progress_counts_per_port_set(self):
+        """Test that the number of ports not in their desired state is logged per port set."""
+        self.waiter.pre_wait_action()
+        self.waiter.pending = set(self.waiter.members)
+        with self.assertLogs(level=logging.INFO) as cm:
+            self.waiter.on_check_action()
+
+        self.assertEqual({'fabric-ports': 1, 'edge-ports': 3}, self.waiter.outstanding_port_counts)
+        self.assertEqual(
+            ['Waiting for 3 of 4 ports in port set edge-ports to reach desired state.',
+             'Waiting for 1 of 4 ports in port set fabric-ports to reach desired state.'],
+            [record.getMessage() for record in cm.records]
+        )
+
+    def test_progress_not_logged_when_unchanged(self):
+        """Test that progress is not logged again when the counts have not changed."""
+        self.waiter.pre_wait_action()
+        self.waiter.pending = set(self.waiter.members)
+        with self.assertLogs(level=logging.INFO):
+            self.waiter.on_check_action()
+        with self.assertRaises(AssertionError):
+            with self.assertLogs(level=logging.INFO):
+                self.waiter.on_check_action()
+
+    @unittest.skipIf(os.getenv('SAT_SKIP_PERF_TESTS'), 'SAT_SKIP_PERF_TESTS is set in environment')
+    def test_large_fabric_performance(self):
+        """Test that a check of a fabric with tens of thousands of ports is fast."""
+        num_ports = 50000
+        xnames = [f'x3000c0r{idx // 64}j{idx % 64}p0' for idx in range(num_ports)]
+        self.mock_fabric_client.get_fabric_edge_ports.return_value = {'fabric-ports': xnames}
+        # Every tenth port is still down
+        self.mock_fabric_client.get_fabric_edge_ports_enabled_status.return_value = {
+            'fabric-ports': {xname: bool(idx % 10) for idx, xname in enumerate(xnames)}
+        }
+        self.mock_hsn_recorder.get_stored_state.return_value = {
+            'fabric-ports': {xname: True for xname in xnames}
+        }
+        self.waiter.pre_wait_action()
+        self.waiter.pending = set(self.waiter.members)
+
+        start = time.monotonic()
+        with self.assertLogs(level=logging.INFO):
+            self.waiter.on_check_action()
+        elapsed = time.monotonic() - start
+
+        self.assertEqual({'fabric-ports': num_ports // 10}, self.waiter.outstanding_port_counts)
+        self.assertLess(elapsed, 1)
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020, 2023 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020, 2023, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -27,6 +27,8 @@ Unit tests for the sat.cli.bootsys.k8s module.
 import unittest
 from unittest.mock import MagicMock, patch
 
+from kubernetes.client.rest import ApiException
+
 from sat.cli.bootsys.k8s import KubernetesPodStatusWaiter
 
 
@@ -58,6 +60,10 @@ class TestK8sPodWaiter(unittest.TestCase):
         mock_recorder.get_state_data.return_value = self.mocked_pod_dump
         self.timeout = 1
 
+        self.mock_watch = patch('sat.cli.bootsys.k8s.Watch').start()
+        self.mock_watch.return_value.stream.return_value = []
+        self.mock_watch.return_value.resource_version = '200'
+
     def tearDown(self):
         patch.stopall()
 
@@ -87,3 +93,80 @@ class TestK8sPodWaiter(unittest.TestCase):
 
         waiter = KubernetesPodStatusWaiter(self.timeout)
         self.assertFalse(waiter.member_has_completed(('galaxies', 'andromeda')))
+
+    def test_k8s_pod_waiter_watch_updates_phase(self):
+        """Test that a watch event updates the phase of a pod."""
+        self.mock_k8s_api.return_value.list_pod_for_all_namespaces.return_value.items = [
+            generate_mock_pod('galaxies', 'm83', 'Pending')
+        ]
+        self.mock_watch.return_value.stream.return_value = [
+            {'type': 'MODIFIED', 'object': generate_mock_pod('galaxies', 'm83', 'Succeeded')}
+        ]
+
+        waiter = KubernetesPodStatusWaiter(self.timeout)
+        self.assertFalse(waiter.member_has_completed(('galaxies', 'm83')))
+        waiter.on_check_action()
+
+        self.mock_watch.return_value.stream.assert_called_once_with(
+            self.mock_k8s_api.return_value.list_pod_for_all_namespaces,
+            resource_version=waiter.k8s_api.list_pod_for_all_namespaces.return_value.metadata.resource_version,
+            timeout_seconds=waiter.watch_timeout
+        )
+        self.assertEqual({('galaxies', 'm83')}, waiter.changed_members)
+        self.assertTrue(waiter.member_has_completed(('galaxies', 'm83')))
+        self.assertEqual('200', waiter.resource_version)
+        self.mock_k8s_api.return_value.list_pod_for_all_namespaces.assert_called_once_with()
+
+    def test_k8s_pod_waiter_watch_deleted_pod(self):
+        """Test that a deleted pod is not considered completed."""
+        self.mock_k8s_api.return_value.list_pod_for_all_namespaces.return_value.items = [
+            generate_mock_pod('galaxies', 'm83', 'Succeeded')
+        ]
+        self.mock_watch.return_value.stream.return_value = [
+            {'type': 'DELETED', 'object': generate_mock_pod('galaxies', 'm83', 'Succeeded')}
+        ]
+
+        waiter = KubernetesPodStatusWaiter(self.timeout)
+        waiter.on_check_action()
+        self.assertNotIn('m83', waiter.k8s_pod_status['galaxies'])
+        self.assertFalse(waiter.member_has_completed(('galaxies', 'm83')))
+
+    def test_k8s_pod_waiter_unchanged_member_not_reevaluated(self):
+        """Test that a pod without watch events reuses the previous result."""
+        self.mock_k8s_api.return_value.list_pod_for_all_namespaces.return_value.items = [
+            generate_mock_pod('galaxies', 'm83', 'Pending')
+        ]
+
+        waiter = KubernetesPodStatusWaiter(self.timeout)
+        self.assertFalse(waiter.member_has_completed(('galaxies', 'm83')))
+        waiter.on_check_action()
+
+        with patch.object(waiter, '_pod_has_completed') as mock_pod_has_completed:
+            self.assertFalse(waiter.member_has_completed(('galaxies', 'm83')))
+        mock_pod_has_completed.assert_not_called()
+
+    def test_k8s_pod_waiter_relist_on_gone(self):
+        """Test that pods are listed again when the watch resourceVersion has expired."""
+        self.mock_k8s_api.return_value.list_pod_for_all_namespaces.return_value.items = [
+            generate_mock_pod('galaxies', 'm83', 'Pending')
+        ]
+        waiter = KubernetesPodStatusWaiter(self.timeout)
+        self.assertFalse(waiter.member_has_completed(('galaxies', 'm83')))
+
+        self.mock_k8s_api.return_value.list_pod_for_all_namespaces.return_value.items = [
+            generate_mock_pod('galaxies', 'm83', 'Succeeded')
+        ]
+        self.mock_watch.return_value.stream.side_effect = ApiException(status=410, reason='Gone')
+        waiter.on_check_action()
+
+        self.assertEqual(2, self.mock_k8s_api.return_value.list_pod_for_all_namespaces.call_count)
+        self.assertTrue(waiter.member_has_completed(('galaxies', 'm83')))
+
+    def test_k8s_pod_waiter_other_api_error(self):
+        """Test that errors other than 410 Gone from the watch are raised."""
+        self.mock_k8s_api.return_value.list_pod_for_all_namespaces.return_value.items = []
+        waiter = KubernetesPodStatusWaiter(self.timeout)
+        self.mock_watch.return_value.stream.side_effect = ApiException(status=500, reason='Error')
+
+        with self.assertRaises(ApiException):
+            waiter.on_check_action()
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021, 2024-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2024-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -26,6 +26,7 @@ Tests for the sat.cli.bootsys.mgmt_power module.
 """
 import logging
 from argparse import Namespace
+import subprocess
 import unittest
 from unittest.mock import MagicMock, patch, call
 from unittest import mock
@@ -34,6 +35,7 @@ from paramiko.ssh_exception import SSHException, NoValidConnectionsError
 
 from sat.cli.bootsys.mgmt_power import (
     do_power_off_ncns,
+    IPMICommandExecutor,
     SSHAvailableWaiter,
     IPMIPowerStateWaiter,
     do_mgmt_shutdown_power,
@@ -81,6 +83,39 @@ class TestSSHAvailableWaiter(unittest.TestCase):
             {('127.0.0.1', '22'): 'Something happened'})
         self.assertFalse(waiter.member_has_completed(self.members[0]))
 
+    def test_on_check_action_only_handshakes_accepting_hosts(self):
+        """Test the SSH waiter only attempts SSH handshakes with hosts accepting connections."""
+        mock_get_accepting = patch('sat.cli.bootsys.mgmt_power.get_hosts_accepting_connections',
+                                   return_value={'ncn-w002'}).start()
+        waiter = SSHAvailableWaiter(self.members, self.timeout, probe_timeout=3)
+        self.mock_get_ssh_client.reset_mock()
+
+        waiter.on_check_action()
+
+        mock_get_accepting.assert_called_once_with(set(self.members), 22, 3)
+        self.mock_get_ssh_client.assert_called_once_with(
+            host_keys=self.mock_filtered_host_keys.return_value, load_host_keys=False
+        )
+        self.mock_ssh_client.connect.assert_called_once_with('ncn-w002', timeout=3)
+        self.mock_ssh_client.close.assert_called_once_with()
+        self.assertEqual({'ncn-w002': True, 'ncn-s001': False}, waiter.probe_results)
+
+        self.assertTrue(waiter.member_has_completed('ncn-w002'))
+        self.assertFalse(waiter.member_has_completed('ncn-s001'))
+        # The probe results should have been used rather than connecting again
+        self.mock_ssh_client.connect.assert_called_once()
+
+    def test_on_check_action_handshake_fails(self):
+        """Test the SSH waiter when a host accepts connections but the SSH handshake fails."""
+        patch('sat.cli.bootsys.mgmt_power.get_hosts_accepting_connections',
+              return_value=set(self.members)).start()
+        self.mock_ssh_client.connect.side_effect = SSHException('Error reading SSH protocol banner')
+        waiter = SSHAvailableWaiter(self.members, self.timeout)
+
+        waiter.on_check_action()
+
+        self.assertEqual({member: False for member in self.members}, waiter.probe_results)
+
 
 class TestIPMIPowerStateWaiter(unittest.TestCase):
     def setUp(self):
@@ -155,6 +190,96 @@ class TestIPMIPowerStateWaiter(unittest.TestCase):
             for _ in range(self.threshold):
                 waiter.member_has_completed(self.members[0])
 
+    def test_ipmi_command_timeout_counts_as_failure(self):
+        """Test that an ipmitool command which times out counts as a failure."""
+        self.mock_subprocess_run.side_effect = subprocess.TimeoutExpired('ipmitool', 30)
+        waiter = IPMIPowerStateWaiter(self.members, 'on', self.timeout, self.username, self.password,
+                                      failure_threshold=self.threshold)
+        with self.assertLogs(level='WARNING') as cm:
+            for _ in range(self.threshold - 1):
+                self.assertFalse(waiter.member_has_completed(self.members[0]))
+        self.assertIn('timed out after 30 seconds', cm.output[0])
+
+        with self.assertRaisesRegex(WaitingFailure, 'failed 3 time'):
+            waiter.member_has_completed(self.members[0])
+
+    def test_on_check_action_queries_pending_members(self):
+        """Test that on_check_action queries all pending members and caches the results."""
+        waiter = IPMIPowerStateWaiter(self.members, 'on', self.timeout, self.username, self.password)
+        waiter.failed = {'ncn-m001'}
+        waiter.on_check_action()
+
+        self.assertEqual({'ncn-w002', 'ncn-s003'}, set(waiter.power_status_results))
+        self.assertEqual(2, self.mock_subprocess_run.call_count)
+        for member in ('ncn-w002', 'ncn-s003'):
+            self.assertTrue(waiter.member_has_completed(member))
+        # The cached results should have been used rather than querying again
+        self.assertEqual(2, self.mock_subprocess_run.call_count)
+        self.assertEqual({}, waiter.power_status_results)
+
+    def test_sending_ipmi_commands_continues_after_failure(self):
+        """Test that a power command is sent to every member even if it fails for one."""
+        def fake_run(cmd, **kwargs):
+            return MagicMock(returncode=int('ncn-s003-mgmt' in cmd), stderr='error')
+
+        self.mock_subprocess_run.side_effect = fake_run
+        waiter = IPMIPowerStateWaiter(self.members, 'on', self.timeout, self.username, self.password,
+                                      send_command=True)
+        with self.assertLogs(level='ERROR') as cm:
+            waiter.pre_wait_action()
+
+        self.assertEqual(len(self.members), self.mock_subprocess_run.call_count)
+        self.assertEqual(set(self.members), set(waiter.send_command_results))
+        self.assertEqual(1, len(cm.output))
+        self.assertIn('ncn-s003 failed with code 1', cm.output[0])
+
+
+class TestIPMICommandExecutor(unittest.TestCase):
+    """Tests for the IPMICommandExecutor class."""
+
+    def setUp(self):
+        self.mock_subprocess_run = patch('sat.cli.bootsys.mgmt_power.subprocess.run').start()
+        self.hosts = ['ncn-m002', 'ncn-w001', 'ncn-s001']
+        self.executor = IPMICommandExecutor('root', 'pass', timeout=10, max_workers=2)
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_run_on_host(self):
+        """Test running an ipmitool command against a single host with a timeout."""
+        result = self.executor.run_on_host('ncn-m002', 'chassis power status')
+
+        self.assertEqual(self.mock_subprocess_run.return_value, result)
+        self.mock_subprocess_run.assert_called_once_with(
+            ['ipmitool', '-I', 'lanplus', '-U', 'root', '-P', 'pass', '-H', 'ncn-m002-mgmt',
+             'chassis', 'power', 'status'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8', timeout=10
+        )
+
+    def test_run_on_hosts_collects_all_results(self):
+        """Test that results and errors are collected for every host."""
+        timeout_err = subprocess.TimeoutExpired('ipmitool', 10)
+        not_found_err = FileNotFoundError('ipmitool')
+        completed = MagicMock(returncode=0)
+
+        def fake_run(cmd, **kwargs):
+            if 'ncn-w001-mgmt' in cmd:
+                raise timeout_err
+            if 'ncn-s001-mgmt' in cmd:
+                raise not_found_err
+            return completed
+
+        self.mock_subprocess_run.side_effect = fake_run
+        results = self.executor.run_on_hosts(self.hosts, 'chassis power on')
+
+        self.assertEqual({'ncn-m002': completed, 'ncn-w001': timeout_err, 'ncn-s001': not_found_err},
+                         results)
+
+    def test_run_on_hosts_no_hosts(self):
+        """Test running a command against no hosts does nothing."""
+        self.assertEqual({}, self.executor.run_on_hosts([], 'chassis power status'))
+        self.mock_subprocess_run.assert_not_called()
+
 
 class TestDoPowerOffNcns(unittest.TestCase):
     """Tests for the do_power_off_ncns() function"""
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021, 2023-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2023-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -50,6 +50,7 @@ from sat.cli.bootsys.platform import (CONTAINER_STOP_SCRIPT,
                                       do_platform_stop,
                                       do_service_action_on_hosts,
                                       do_stop_containers)
+from sat.cli.bootsys.ssh_pool import SSHSessionPool
 from sat.cli.bootsys.util import FatalBootsysError
 
 
@@ -637,6 +638,21 @@ class TestRemoteServiceWaiter(unittest.TestCase):
             with self.assertLogs(level=logging.ERROR):
                 self.assertFalse(self.waiter.wait_for_completion())
 
+    def test_wait_for_stop_with_ssh_pool(self):
+        """When given an SSH session pool, the waiter should use its session for the host."""
+        mock_ssh_pool = mock.Mock()
+        mock_ssh_pool.get_client.return_value = self.ssh_client
+        self.get_ssh_client.reset_mock()
+        waiter = RemoteServiceWaiter(self.host, self.service_name, 'inactive', self.timeout,
+                                     ssh_pool=mock_ssh_pool)
+        self.assertTrue(waiter.wait_for_completion())
+        self.get_ssh_client.assert_not_called()
+        mock_ssh_pool.get_client.assert_called_once_with(self.host)
+        self.ssh_client.connect.assert_not_called()
+        self.ssh_client.exec_command.assert_has_calls([mock.call(f'systemctl is-active {self.service_name}'),
+                                                       mock.call(f'systemctl stop {self.service_name}'),
+                                                       mock.call(f'systemctl is-active {self.service_name}')])
+
 
 class TestDoPlatformAction(unittest.TestCase):
     """Tests for the do_platform_action function."""
@@ -658,6 +674,8 @@ class TestDoPlatformAction(unittest.TestCase):
 
         self.mock_get_and_verify_ncn_groups = mock.patch(
             'sat.cli.bootsys.platform.get_and_verify_ncn_groups').start()
+        self.mock_ssh_session_pool = mock.patch('sat.cli.bootsys.platform.SSHSessionPool').start()
+        self.mock_ssh_pool = self.mock_ssh_session_pool.return_value.__enter__.return_value
 
     def tearDown(self):
         mock.patch.stopall()
@@ -692,6 +710,17 @@ class TestDoPlatformAction(unittest.TestCase):
         self.assertEqual(cm.records[0].message, 'Executing step: first step')
         self.assertEqual(cm.records[1].message, 'Executing step: second step')
 
+    def test_do_platform_action_shares_ssh_pool(self):
+        """Test do_platform_action passes one SSH session pool to every step."""
+        ncn_groups = self.mock_get_and_verify_ncn_groups.return_value
+        with self.assertLogs(level=logging.INFO):
+            do_platform_action(self.mock_args, self.known_action)
+
+        self.mock_ssh_session_pool.assert_called_once_with(ncn_groups['kubernetes'])
+        for step in (self.mock_first_step, self.mock_second_step):
+            step.assert_called_once_with(ncn_groups, ssh_pool=self.mock_ssh_pool)
+        self.mock_ssh_session_pool.return_value.__exit__.assert_called_once()
+
     def test_do_platform_action_fatal_step(self):
         """Test do_platform_action when a step fails fatally."""
         self.mock_first_step.side_effect = FatalPlatformError('fail')
@@ -938,7 +967,7 @@ class TestDoServiceActionOnHosts(unittest.TestCase):
         self.mock_waiter.assert_has_calls([
             mock.call(host, self.service, target_state=self.target_state,
                       timeout=SERVICE_ACTION_TIMEOUT, target_enabled=self.target_enabled,
-                      host_keys=self.mock_host_keys.return_value)
+                      host_keys=self.mock_host_keys.return_value, ssh_pool=None)
             for host in self.hosts
         ])
         for waiter in self.mock_waiters:
@@ -957,13 +986,26 @@ class TestDoServiceActionOnHosts(unittest.TestCase):
         self.mock_waiter.assert_has_calls([
             mock.call(host, self.service, target_state=self.target_state,
                       timeout=SERVICE_ACTION_TIMEOUT, target_enabled=self.target_enabled,
-                      host_keys=self.mock_host_keys.return_value)
+                      host_keys=self.mock_host_keys.return_value, ssh_pool=None)
             for host in self.hosts
         ])
         for waiter in self.mock_waiters:
             waiter.wait_for_completion_async.assert_called_once_with()
             waiter.wait_for_completion_await.assert_called_once_with()
 
+    def test_with_ssh_pool(self):
+        """Test doing a service action using a pool of SSH sessions."""
+        mock_ssh_pool = mock.Mock()
+        do_service_action_on_hosts(self.hosts, self.service, self.target_state,
+                                   target_enabled=self.target_enabled, ssh_pool=mock_ssh_pool)
+        self.mock_waiter.assert_has_calls([
+            mock.call(host, self.service, target_state=self.target_state,
+                      timeout=SERVICE_ACTION_TIMEOUT, target_enabled=self.target_enabled,
+                      host_keys=None, ssh_pool=mock_ssh_pool)
+            for host in self.hosts
+        ])
+        self.mock_host_keys.assert_not_called()
+
 
 class TestDoEtcdSnapshotStartStop(unittest.TestCase):
     """Test the do_etcd_snapshot, do_etcd_stop, and do_etcd_start functions."""
@@ -973,24 +1015,40 @@ class TestDoEtcdSnapshotStartStop(unittest.TestCase):
         self.managers = ['ncn-m001', 'ncn-m002', 'ncn-m003']
         self.ncn_groups = {'managers': self.managers}
 
+        # A dict mapping from manager hostnames to the exception raised when saving a snapshot
+        self.snapshot_errs = {}
         self.mock_save_snapshot = mock.patch('sat.cli.bootsys.platform'
-                                             '.save_etcd_snapshot_on_host').start()
+                                             '.save_etcd_snapshot_on_host',
+                                             side_effect=self._fake_save_snapshot).start()
+        mock.patch('sat.cli.bootsys.ssh_pool.get_ssh_client').start()
+        mock.patch('sat.cli.bootsys.ssh_pool.FilteredHostKeys').start()
         self.mock_do_service_action = mock.patch('sat.cli.bootsys.platform'
                                                  '.do_service_action_on_hosts').start()
 
     def tearDown(self):
         mock.patch.stopall()
 
+    def _fake_save_snapshot(self, hostname, ssh_pool=None):
+        """Fake save_etcd_snapshot_on_host, raising the error in self.snapshot_errs if present."""
+        if hostname in self.snapshot_errs:
+            raise self.snapshot_errs[hostname]
+
     def test_do_etcd_snapshot_success(self):
         """Test do_etcd_snapshot in with no errors."""
-        with mock.patch('sat.cli.bootsys.platform.FilteredHostKeys') as mock_hk:
-            do_etcd_snapshot(self.ncn_groups)
-            self.mock_save_snapshot.assert_has_calls([mock.call(manager, host_keys=mock_hk.return_value)
-                                                      for manager in self.managers])
+        do_etcd_snapshot(self.ncn_groups)
+        self.mock_save_snapshot.assert_has_calls([mock.call(manager, ssh_pool=mock.ANY)
+                                                  for manager in self.managers], any_order=True)
+
+    def test_do_etcd_snapshot_with_ssh_pool(self):
+        """Test do_etcd_snapshot uses the given SSH session pool."""
+        ssh_pool = SSHSessionPool(self.managers)
+        do_etcd_snapshot(self.ncn_groups, ssh_pool=ssh_pool)
+        self.mock_save_snapshot.assert_has_calls([mock.call(manager, ssh_pool=ssh_pool)
+                                                  for manager in self.managers], any_order=True)
 
     def test_do_etcd_snapshot_all_etcd_inactive(self):
         """Test do_etcd_snapshot when etcd is inactive on all managers."""
-        self.mock_save_snapshot.side_effect = [EtcdInactiveFailure('etcd inactive')] * len(self.managers)
+        self.snapshot_errs = {manager: EtcdInactiveFailure('etcd inactive') for manager in self.managers}
         err_regex = f'Failed to create etcd snapshot on hosts: {", ".join(self.managers)}'
 
         with self.assertRaisesRegex(NonFatalPlatformError, err_regex):
@@ -1005,11 +1063,7 @@ class TestDoEtcdSnapshotStartStop(unittest.TestCase):
 
     def test_do_etcd_snapshot_one_etcd_inactive(self):
         """Test do_etcd_snapshot when etcd is inactive on one manager."""
-        self.mock_save_snapshot.side_effect = [
-            None,                                  # ncn-m001
-            EtcdInactiveFailure('etcd inactive'),  # ncn-m002
-            None,                                  # ncn-m003
-        ]
+        self.snapshot_errs = {'ncn-m002': EtcdInactiveFailure('etcd inactive')}
         err_regex = 'Failed to create etcd snapshot on hosts: ncn-m002'
 
         with self.assertRaisesRegex(NonFatalPlatformError, err_regex):
@@ -1022,11 +1076,7 @@ class TestDoEtcdSnapshotStartStop(unittest.TestCase):
 
     def test_do_etcd_snapshot_one_failure(self):
         """Test do_etcd_snapshot when etcd ommand failed on one manager."""
-        self.mock_save_snapshot.side_effect = [
-            None,                                  # ncn-m001
-            EtcdSnapshotFailure('etcd failure'),   # ncn-m002
-            None,                                  # ncn-m003
-        ]
+        self.snapshot_errs = {'ncn-m002': EtcdSnapshotFailure('etcd failure')}
         err_regex = 'Failed to create etcd snapshot on hosts: ncn-m002'
 
         with self.assertRaisesRegex(FatalPlatformError, err_regex):
@@ -1039,11 +1089,10 @@ class TestDoEtcdSnapshotStartStop(unittest.TestCase):
 
     def test_do_etcd_snapshot_one_inactive_one_failure(self):
         """Test do_etcd_snapshot when etcd inactive on on manager, failed command on another."""
-        self.mock_save_snapshot.side_effect = [
-            None,                                  # ncn-m001
-            EtcdInactiveFailure('etcd inactive'),  # ncn-m002
-            EtcdSnapshotFailure('etcd failure'),   # ncn-m003
-        ]
+        self.snapshot_errs = {
+            'ncn-m002': EtcdInactiveFailure('etcd inactive'),
+            'ncn-m003': EtcdSnapshotFailure('etcd failure'),
+        }
         err_regex = 'Failed to create etcd snapshot on hosts: ncn-m002, ncn-m003'
 
         with self.assertRaisesRegex(FatalPlatformError, err_regex):
@@ -1062,11 +1111,13 @@ class TestDoEtcdSnapshotStartStop(unittest.TestCase):
         """Test that do_etcd_stop function properly calls do_service_action_on_hosts."""
         do_etcd_stop(self.ncn_groups)
         self.mock_do_service_action.assert_called_once_with(self.managers, 'etcd',
-                                                            target_state='inactive')
+                                                            target_state='inactive',
+                                                            ssh_pool=None)
 
     def test_do_etcd_start(self):
         """Test that do_etcd_start function properly calls do_service_action_on_hosts."""
         do_etcd_start(self.ncn_groups)
         self.mock_do_service_action.assert_called_once_with(self.managers, 'etcd',
                                                             target_state='active',
-                                                            target_enabled='enabled')
+                                                            target_enabled='enabled',
+                                                            ssh_pool=None)
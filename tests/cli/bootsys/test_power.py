@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -31,7 +31,7 @@ from unittest.mock import patch
 from sat.apiclient import APIError
 from sat.cli.bootsys.power import (PCSPowerWaiter,
                                    get_nodes_by_role_and_state)
-from tests.common import ExtendedTestCase
+from tests.common import ExtendedTestCase, patch_shared_client
 
 
 class TestPCSPowerWaiter(ExtendedTestCase):
@@ -41,7 +41,7 @@ class TestPCSPowerWaiter(ExtendedTestCase):
         """Set up some patches and shared objects."""
         self.mock_pcs_client_cls = patch('sat.cli.bootsys.power.PCSClient').start()
         self.mock_pcs_client = self.mock_pcs_client_cls.return_value
-        self.mock_sat_session = patch('sat.cli.bootsys.power.SATSession').start()
+        self.mock_sat_session = patch_shared_client('sat.cli.bootsys.power')
 
         self.members = {'x5000c0s0b0n0', 'x5000c0s1b0n0'}
         self.power_state = 'off'
@@ -61,7 +61,7 @@ class TestPCSPowerWaiter(ExtendedTestCase):
         self.assertEqual(self.power_state, self.waiter.power_state)
         self.assertEqual(self.timeout, self.waiter.timeout)
         self.assertEqual(self.poll_interval, self.waiter.poll_interval)
-        self.mock_pcs_client_cls.assert_called_once_with(self.mock_sat_session.return_value)
+        self.mock_pcs_client_cls.assert_called_once_with(self.mock_sat_session)
         self.assertEqual(self.mock_pcs_client, self.waiter.pcs_client)
 
     def test_condition_name(self):
@@ -113,20 +113,21 @@ class TestGetNodesByRoleAndState(unittest.TestCase):
             'off': self.compute_nodes + self.application_nodes[1:]
         }
 
-        def mock_get_xnames(params):
-            return self.nodes_by_role.get(params.get('role'), [])
-
         def mock_get_xnames_power_state(xnames):
             return {
                 'on': [node for node in self.all_nodes_by_state['on'] if node in xnames],
                 'off': [node for node in self.all_nodes_by_state['off'] if node in xnames],
             }
 
-        self.mock_hsm_client = patch('sat.cli.bootsys.power.HSMClient').start().return_value
-        self.mock_hsm_client.get_component_xnames = mock_get_xnames
+        self.mock_hsm_client = patch('sat.node_directory.HSMClient').start().return_value
+        self.mock_hsm_client.get_node_components.return_value = [
+            {'ID': xname, 'Type': 'Node', 'Role': role.capitalize()}
+            for role, xnames in self.nodes_by_role.items() for xname in xnames
+        ]
+        patch('sat.node_directory.SLSClient').start()
         self.mock_pcs_client = patch('sat.cli.bootsys.power.PCSClient').start().return_value
         self.mock_pcs_client.get_xnames_power_state = mock_get_xnames_power_state
-        self.mock_sat_session = patch('sat.cli.bootsys.power.SATSession').start()
+        self.mock_sat_session = patch_shared_client('sat.cli.bootsys.power')
 
     def tearDown(self):
         """Stop all patches."""
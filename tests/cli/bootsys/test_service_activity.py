@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -29,12 +29,13 @@ from kubernetes.config.config_exception import ConfigException
 from kubernetes.client.rest import ApiException
 import logging
 import socket
+import threading
 import unittest
 from unittest.mock import call, MagicMock, Mock, patch
 
 from paramiko.ssh_exception import BadHostKeyException, AuthenticationException, SSHException
 
-from tests.common import ExtendedTestCase
+from tests.common import ExtendedTestCase, FakeChannel
 from sat.apiclient import APIError
 from sat.cli.bootsys.service_activity import (
     ServiceActivityChecker,
@@ -102,27 +103,45 @@ class TestServiceActivityChecker(unittest.TestCase):
 class TestSDUActivityChecker(ExtendedTestCase):
     """Test the SDUActivityChecker class."""
     def setUp(self):
-        self.mock_channel = MagicMock()
-        self.mock_channel.recv_exit_status.side_effect = [1, 1, 1]
+        self.managers = ['ncn-m001', 'ncn-m002', 'ncn-m003']
+        # The exit status of the pgrep command on each manager; defaults to 1 (no session)
+        self.exit_statuses = {}
+        # The error raised by exec_command on every manager, if any
+        self.exec_command_err = None
+        self.mock_ssh_clients = []
 
-        self.mock_transport = MagicMock()
-        self.mock_transport.open_session.return_value = self.mock_channel
-
-        self.mock_ssh_client_instance = MagicMock()
-        self.mock_ssh_client_instance.get_transport.return_value = self.mock_transport
-
-        self.mock_ssh_client = patch('sat.cli.bootsys.service_activity.get_ssh_client').start()
-        self.mock_ssh_client.return_value = self.mock_ssh_client_instance
+        patch('sat.cli.bootsys.ssh_pool.FilteredHostKeys').start()
+        self.mock_get_ssh_client = patch('sat.cli.bootsys.ssh_pool.get_ssh_client',
+                                         side_effect=self._fake_get_ssh_client).start()
 
         self.mock_get_mgmt_ncn_groups = patch('sat.cli.bootsys.service_activity.get_mgmt_ncn_groups').start()
-        self.mock_get_mgmt_ncn_groups.return_value = ({'managers': ['ncn-m001', 'ncn-m002', 'ncn-m003']}, {})
+        self.mock_get_mgmt_ncn_groups.return_value = ({'managers': self.managers}, {})
 
     def tearDown(self):
         patch.stopall()
 
+    def _fake_get_ssh_client(self, **kwargs):
+        """Create a fake SSH client which runs the pgrep command on the host it connected to."""
+        ssh_client = MagicMock()
+
+        def fake_exec_command(command, timeout=None):
+            if self.exec_command_err:
+                raise self.exec_command_err
+            host = ssh_client.connect.call_args[0][0]
+            stdout = MagicMock()
+            stdout.channel = FakeChannel(stderr=b'pgrep error', exit_status=self.exit_statuses.get(host, 1))
+            return MagicMock(), stdout, MagicMock()
+
+        ssh_client.exec_command.side_effect = fake_exec_command
+        self.mock_ssh_clients.append(ssh_client)
+        return ssh_client
+
     def assert_ssh_client_set_up(self):
-        self.mock_ssh_client_instance.connect.assert_called()
-        self.mock_ssh_client_instance.close.assert_called()
+        """Assert that each manager was connected to once and every connection was closed."""
+        self.assertEqual(sorted(self.managers),
+                         sorted(client.connect.call_args[0][0] for client in self.mock_ssh_clients))
+        for client in self.mock_ssh_clients:
+            client.close.assert_called()
 
     def test_getting_sdu_sessions_none_running(self):
         """Test no active SDU sessions returned when no dumps are occurring."""
@@ -134,52 +153,60 @@ class TestSDUActivityChecker(ExtendedTestCase):
     def test_getting_sdu_sessions_one_running(self):
         """Test active SDU sessions are returned when remote dumps are occurring."""
         s = SDUActivityChecker()
-        self.mock_channel.recv_exit_status.side_effect = [1, 0, 1]
+        self.exit_statuses['ncn-m002'] = 0
 
         self.assertEqual(s.get_active_sessions(), [OrderedDict([('ncn', 'ncn-m002')])])
         self.assert_ssh_client_set_up()
 
+    def test_getting_sdu_sessions_all_running(self):
+        """Test active SDU sessions are returned in manager order when all managers are dumping."""
+        s = SDUActivityChecker()
+        self.exit_statuses = {manager: 0 for manager in self.managers}
+
+        self.assertEqual(s.get_active_sessions(),
+                         [OrderedDict([('ncn', manager)]) for manager in self.managers])
+
     def test_exception_thrown_on_ssh_error(self):
         """Test an exception is thrown when SSH error occurs when checking SDU sessions."""
         mock_bad_host_key_exception = BadHostKeyException('ncn-m002', MagicMock(), MagicMock())
         for err_type in [mock_bad_host_key_exception, AuthenticationException,
                          SSHException, socket.error]:
+            def fake_get_ssh_client(**kwargs):
+                ssh_client = self._fake_get_ssh_client(**kwargs)
+                ssh_client.connect.side_effect = err_type
+                return ssh_client
+
+            self.mock_get_ssh_client.side_effect = fake_get_ssh_client
             s = SDUActivityChecker()
-            self.mock_ssh_client_instance.connect.side_effect = err_type
-            with self.assertRaises(ServiceCheckError):
-                self.assertEqual(s.get_active_sessions(), [])
-        self.assert_ssh_client_set_up()
+            with self.assertRaisesRegex(ServiceCheckError, 'Unable to connect to management NCN "ncn-m001"'):
+                s.get_active_sessions()
 
-    def test_exception_thrown_on_open_session_error(self):
-        """Test an exception is thrown when there is a problem opening the SSH channel."""
-        self.mock_transport.open_session.side_effect = SSHException
+    def test_exception_thrown_on_exec_command_error(self):
+        """Test an exception is thrown when there is a problem executing remote commands."""
+        self.exec_command_err = SSHException
         with self.assertRaises(ServiceCheckError):
             SDUActivityChecker().get_active_sessions()
         self.assert_ssh_client_set_up()
 
-    def test_exception_thrown_on_exec_command_error(self):
-        """Test an exception is thrown when there is a problem executing remote commands."""
-        self.mock_channel.exec_command.side_effect = SSHException
-        with self.assertRaises(ServiceCheckError):
+    def test_all_managers_checked_on_error(self):
+        """Test that every manager is checked even when the check fails on one of them."""
+        self.exit_statuses['ncn-m001'] = 3
+        with self.assertRaisesRegex(ServiceCheckError, 'Fatal error running pgrep on ncn-m001. pgrep error'):
             SDUActivityChecker().get_active_sessions()
         self.assert_ssh_client_set_up()
 
     def test_exception_thrown_on_remote_pgrep_error(self):
         """Test that exceptions are thrown when error return codes are given from remote pgrep."""
-        self.mock_channel.recv_exit_status.side_effect = None
-
         for returncode in [2, 3, 5]:
-            self.mock_channel.recv_exit_status.return_value = returncode
+            self.exit_statuses = {manager: returncode for manager in self.managers}
             s = SDUActivityChecker()
             with self.assertRaises(ServiceCheckError):
                 s.get_active_sessions()
 
     def test_exception_not_thrown_when_sdu_not_installed_or_configured(self):
         """Test that exceptions are not thrown when SDU cannot be accessed."""
-        self.mock_channel.recv_exit_status.side_effect = None
-
         for returncode in [125, 127]:
-            self.mock_channel.recv_exit_status.return_value = returncode
+            self.exit_statuses = {manager: returncode for manager in self.managers}
             s = SDUActivityChecker()
             try:
                 s.get_active_sessions()
@@ -866,6 +893,30 @@ class TestReportActiveSessions(ExtendedTestCase):
             checkers[3].get_active_sessions.return_value
         )
 
+    def test_report_active_sessions_concurrent(self):
+        """Test _report_active_sessions queries all checkers at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_all_checkers():
+            # Each checker only returns once all of them have started
+            barrier.wait()
+            return []
+
+        checkers = [
+            self.get_mock_service_checker(service_name=name, active_sessions_desc=f'active {name} sessions')
+            for name in ('CFS', 'FOO', 'BAR')
+        ]
+        for checker in checkers:
+            checker.get_active_sessions.side_effect = wait_for_all_checkers
+
+        with self.assertLogs(level=logging.INFO):
+            active, failed = _report_active_sessions(checkers)
+
+        self.assertEqual([], active)
+        self.assertEqual([], failed)
+        for checker in checkers:
+            checker.get_active_sessions.assert_called_once_with()
+
     def test_report_active_sessions_none_active(self):
         """Test _report_active_sessions when no sessions are active."""
         checkers = [
@@ -0,0 +1,200 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Unit tests for the sat.cli.bootsys.ssh_pool module.
+"""
+import socket
+import threading
+import unittest
+from unittest import mock
+
+from paramiko import SSHException
+
+from sat.cli.bootsys.ssh_pool import RemoteCommandResult, SSHSessionPool
+from tests.common import FakeChannel, WINDOW_SIZE
+
+
+class TestSSHSessionPool(unittest.TestCase):
+    """Tests for the SSHSessionPool class."""
+
+    def setUp(self):
+        """Set up mocks."""
+        self.hosts = ['ncn-m001', 'ncn-m002', 'ncn-w001']
+        self.mock_host_keys_cls = mock.patch('sat.cli.bootsys.ssh_pool.FilteredHostKeys').start()
+        self.mock_get_ssh_client = mock.patch('sat.cli.bootsys.ssh_pool.get_ssh_client',
+                                              side_effect=self._fake_get_ssh_client).start()
+        # A dict mapping from hostnames to the exit status of commands run there
+        self.exit_statuses = {}
+        self.clients = []
+        self.pool = SSHSessionPool(self.hosts, keepalive_interval=15)
+
+    def tearDown(self):
+        mock.patch.stopall()
+
+    def _fake_get_ssh_client(self, host_keys=None, load_host_keys=True):
+        """Create a fake SSH client which records the host it connects to."""
+        ssh_client = mock.Mock()
+        ssh_client.get_transport.return_value.is_active.return_value = True
+
+        def fake_exec_command(command, timeout=None):
+            host = ssh_client.connect.call_args[0][0]
+            stdout = mock.Mock()
+            stdout.channel = FakeChannel(f'{command} on {host}'.encode(),
+                                         exit_status=self.exit_statuses.get(host, 0))
+            return mock.Mock(), stdout, mock.Mock()
+
+        ssh_client.exec_command.side_effect = fake_exec_command
+        self.clients.append(ssh_client)
+        return ssh_client
+
+    def test_host_keys_loaded_once(self):
+        """Test that host keys are loaded once for all hosts in the pool."""
+        for host in self.hosts:
+            self.pool.get_client(host)
+
+        self.mock_host_keys_cls.assert_called_once_with(hostnames=self.hosts)
+        self.mock_host_keys_cls.return_value.load.assert_called_once()
+        self.mock_get_ssh_client.assert_has_calls([
+            mock.call(host_keys=self.mock_host_keys_cls.return_value, load_host_keys=False)
+        ] * len(self.hosts))
+
+    def test_get_client_lazy_connect(self):
+        """Test that no connections are made until a client is requested."""
+        self.mock_get_ssh_client.assert_not_called()
+        ssh_client = self.pool.get_client('ncn-m001')
+        ssh_client.connect.assert_called_once_with('ncn-m001')
+        ssh_client.get_transport.return_value.set_keepalive.assert_called_once_with(15)
+
+    def test_get_client_reused(self):
+        """Test that an active connection to a host is reused."""
+        first_client = self.pool.get_client('ncn-m001')
+        second_client = self.pool.get_client('ncn-m001')
+
+        self.assertIs(first_client, second_client)
+        self.mock_get_ssh_client.assert_called_once()
+        first_client.connect.assert_called_once_with('ncn-m001')
+
+    def test_get_client_reconnects_inactive(self):
+        """Test that an inactive connection to a host is replaced."""
+        first_client = self.pool.get_client('ncn-m001')
+        first_client.get_transport.return_value.is_active.return_value = False
+        second_client = self.pool.get_client('ncn-m001')
+
+        self.assertIsNot(first_client, second_client)
+        first_client.close.assert_called_once_with()
+        second_client.connect.assert_called_once_with('ncn-m001')
+
+    def test_get_client_concurrent(self):
+        """Test that concurrent requests for the same host open a single connection."""
+        threads = [threading.Thread(target=self.pool.get_client, args=('ncn-m001',))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.mock_get_ssh_client.assert_called_once()
+
+    def test_run_on_host(self):
+        """Test running a command on a single host."""
+        result = self.pool.run_on_host('ncn-m002', 'uptime', timeout=10)
+
+        self.assertEqual(RemoteCommandResult(0, 'uptime on ncn-m002', ''), result)
+        self.clients[0].exec_command.assert_called_once_with('uptime', timeout=10)
+
+    def _set_channel(self, host, channel):
+        """Make the next command run on the given host use the given channel."""
+        ssh_client = self.pool.get_client(host)
+        stdout = mock.Mock()
+        stdout.channel = channel
+        ssh_client.exec_command.side_effect = None
+        ssh_client.exec_command.return_value = mock.Mock(), stdout, mock.Mock()
+
+    def test_run_on_host_timeout(self):
+        """Test running a command on a host which does not complete in time."""
+        channel = FakeChannel(b'partial output', exits=False)
+        self._set_channel('ncn-m001', channel)
+
+        with self.assertRaisesRegex(socket.timeout, 'did not complete within 0.2 seconds'):
+            self.pool.run_on_host('ncn-m001', 'sleep 60', timeout=0.2)
+        self.assertTrue(channel.closed)
+
+    def test_run_on_host_output_larger_than_window(self):
+        """Test running a command whose output does not fit in the channel's window."""
+        stdout = b'o' * (WINDOW_SIZE * 2 + 1)
+        stderr = b'e' * (WINDOW_SIZE + 1)
+        self._set_channel('ncn-m001', FakeChannel(stdout, stderr, exit_status=3))
+
+        result = self.pool.run_on_host('ncn-m001', 'cat big-file', timeout=5)
+
+        self.assertEqual(RemoteCommandResult(3, stdout.decode(), stderr.decode()), result)
+
+    def test_run_on_hosts(self):
+        """Test running a command on all hosts in the pool."""
+        self.exit_statuses['ncn-w001'] = 1
+        results = self.pool.run_on_hosts('hostname')
+
+        self.assertEqual(self.hosts, list(results))
+        for host in self.hosts:
+            self.assertEqual(f'hostname on {host}', results[host].stdout)
+        self.assertEqual(0, results['ncn-m001'].exit_status)
+        self.assertEqual(1, results['ncn-w001'].exit_status)
+
+    def test_run_on_hosts_connect_failure(self):
+        """Test that a failure to connect to one host does not affect the others."""
+        def fake_get_ssh_client(**kwargs):
+            ssh_client = self._fake_get_ssh_client(**kwargs)
+            ssh_client.connect.side_effect = lambda host: self._fail_on_host(host, 'ncn-m002')
+            return ssh_client
+
+        self.mock_get_ssh_client.side_effect = fake_get_ssh_client
+        results = self.pool.run_on_hosts('hostname', hosts=['ncn-m001', 'ncn-m002'])
+
+        self.assertEqual('hostname on ncn-m001', results['ncn-m001'].stdout)
+        self.assertIsInstance(results['ncn-m002'], SSHException)
+
+    @staticmethod
+    def _fail_on_host(host, failing_host):
+        """Raise an SSHException if the given host is the failing host."""
+        if host == failing_host:
+            raise SSHException(f'Unable to connect to {host}')
+
+    def test_map_hosts_no_hosts(self):
+        """Test that mapping over no hosts does nothing."""
+        func = mock.Mock()
+        self.assertEqual({}, self.pool.map_hosts(func, hosts=[]))
+        func.assert_not_called()
+
+    def test_close(self):
+        """Test that closing the pool closes every open connection."""
+        with self.pool as pool:
+            pool.run_on_hosts('hostname')
+
+        self.assertEqual(len(self.hosts), len(self.clients))
+        for ssh_client in self.clients:
+            ssh_client.close.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
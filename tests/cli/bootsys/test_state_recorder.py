@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020, 2023 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020, 2023, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,8 +25,10 @@
 Unit tests for the service_activity module.
 """
 from boto3.exceptions import Boto3Error
+from kubernetes.client.rest import ApiException
 from kubernetes.config import ConfigException
 import datetime
+import json
 import os
 import unittest
 from unittest.mock import call, patch, Mock
@@ -37,6 +39,7 @@ from sat.cli.bootsys.state_recorder import (
     PodStateError, PodStateRecorder,
     StateError, StateRecorder,
 )
+from tests.common import patch_shared_client
 
 
 class SimpleRecorder(StateRecorder):
@@ -378,22 +381,22 @@ class TestStateRecorder(unittest.TestCase):
 
 
 def get_fake_pod_list(pods):
-    """Get a mock object that looks like a V1PodList.
+    """Get a mock object that looks like a raw response listing pods.
 
     Args:
         pods (list): A list of tuples where each tuple has the following three
             components:
                 (namespace, name, phase)
     """
-    v1_pod_list = Mock()
-    v1_pod_list.items = []
-    for pod in pods:
-        mock_pod = Mock()
-        mock_pod.metadata.namespace = pod[0]
-        mock_pod.metadata.name = pod[1]
-        mock_pod.status.phase = pod[2]
-        v1_pod_list.items.append(mock_pod)
-    return v1_pod_list
+    response = Mock()
+    response.data = json.dumps({
+        'metadata': {},
+        'items': [
+            {'metadata': {'namespace': pod[0], 'name': pod[1]}, 'status': {'phase': pod[2]}}
+            for pod in pods
+        ]
+    }).encode()
+    return response
 
 
 class TestPodStateRecorder(unittest.TestCase):
@@ -463,6 +466,23 @@ class TestPodStateRecorder(unittest.TestCase):
         }
         state_data = dict(psr.get_state_data())
         self.assertEqual(expected, state_data)
+        self.mock_k8s_client.list_pod_for_all_namespaces.assert_called_once_with(
+            limit=500, _preload_content=False
+        )
+
+    def test_get_state_data_api_err(self):
+        """Test get_state_data when listing pods fails."""
+        self.mock_k8s_client.list_pod_for_all_namespaces.side_effect = ApiException
+
+        with self.assertRaisesRegex(PodStateError, 'Failed to list kubernetes pods'):
+            PodStateRecorder().get_state_data()
+
+    def test_get_state_data_bad_json(self):
+        """Test get_state_data when the pod list is not valid JSON."""
+        self.mock_k8s_client.list_pod_for_all_namespaces.return_value.data = b'not json'
+
+        with self.assertRaisesRegex(PodStateError, 'Failed to parse JSON'):
+            PodStateRecorder().get_state_data()
 
     def test_get_state_data_kube_config_err(self):
         """Test get_state_data with a ConfigException when loading k8s config."""
@@ -489,7 +509,7 @@ class TestHSNStateRecorder(unittest.TestCase):
                                            side_effect=self.fake_get_config_value).start()
         self.mock_s3 = patch('sat.cli.bootsys.state_recorder.get_s3_resource').start().return_value
 
-        patch('sat.cli.bootsys.state_recorder.SATSession').start()
+        patch_shared_client('sat.cli.bootsys.state_recorder')
         mock_fc_class = patch('sat.cli.bootsys.state_recorder.FabricControllerClient').start()
         self.mock_fc_client = mock_fc_class.return_value
 
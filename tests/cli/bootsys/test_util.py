@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -24,14 +24,18 @@
 """
 Tests for common bootsys code.
 """
+import json
 import logging
+import socket
 from textwrap import dedent
 import unittest
 from unittest.mock import call, mock_open, patch, Mock
 
 from sat.cli.bootsys.util import (
+    get_k8s_pod_status_dict,
     get_mgmt_ncn_hostnames,
     get_and_verify_ncn_groups,
+    get_hosts_accepting_connections,
     get_mgmt_ncn_groups,
     get_ssh_client,
     prompt_for_ncn_verification,
@@ -373,3 +377,124 @@ class TestGetSSHClient(unittest.TestCase):
         self.mock_ssh_client.set_missing_host_key_policy.assert_called_once_with(
             self.mock_auto_add_policy
         )
+
+    def test_get_ssh_client_preloaded_host_keys(self):
+        """Test get_ssh_client does not reload host keys which are already loaded."""
+        host_keys = Mock()
+        ssh_client = get_ssh_client(host_keys=host_keys, load_host_keys=False)
+
+        self.assertEqual(host_keys, ssh_client._system_host_keys)
+        self.mock_ssh_client.load_system_host_keys.assert_not_called()
+
+
+class TestGetHostsAcceptingConnections(unittest.TestCase):
+    """Tests for the get_hosts_accepting_connections function."""
+
+    def setUp(self):
+        """Listen on a local port, and find another local port that is closed."""
+        self.listener = socket.socket()
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen()
+        self.open_port = self.listener.getsockname()[1]
+
+        closed = socket.socket()
+        closed.bind(('127.0.0.1', 0))
+        self.closed_port = closed.getsockname()[1]
+        closed.close()
+
+    def tearDown(self):
+        self.listener.close()
+        patch.stopall()
+
+    def test_host_accepting(self):
+        """Test that a host listening on the port is found."""
+        self.assertEqual({'127.0.0.1'},
+                         get_hosts_accepting_connections(['127.0.0.1'], self.open_port, timeout=5))
+
+    def test_host_refusing(self):
+        """Test that a host which refuses connections on the port is not found."""
+        self.assertEqual(set(),
+                         get_hosts_accepting_connections(['127.0.0.1'], self.closed_port, timeout=5))
+
+    def test_unresolvable_host(self):
+        """Test that a host which cannot be resolved is skipped."""
+        real_getaddrinfo = socket.getaddrinfo
+
+        def fake_getaddrinfo(host, *args, **kwargs):
+            if host == 'ncn-w099':
+                raise socket.gaierror('Name or service not known')
+            return real_getaddrinfo(host, *args, **kwargs)
+
+        patch('sat.cli.bootsys.util.socket.getaddrinfo', side_effect=fake_getaddrinfo).start()
+        self.assertEqual({'127.0.0.1'},
+                         get_hosts_accepting_connections(['ncn-w099', '127.0.0.1'], self.open_port, timeout=5))
+
+    def test_no_hosts(self):
+        """Test that probing no hosts finds no hosts."""
+        self.assertEqual(set(), get_hosts_accepting_connections([], self.open_port, timeout=5))
+
+
+class TestGetK8sPodStatusDict(unittest.TestCase):
+    """Tests for the get_k8s_pod_status_dict function."""
+
+    @staticmethod
+    def get_raw_page(pods, continue_token=None):
+        """Get a mock raw response containing a page of pods."""
+        page = {
+            'metadata': {'continue': continue_token} if continue_token else {},
+            'items': [
+                {'metadata': {'namespace': ns, 'name': name}, 'status': {'phase': phase}}
+                for ns, name, phase in pods
+            ]
+        }
+        return Mock(data=json.dumps(page).encode())
+
+    def setUp(self):
+        """Set up a mock k8s API client."""
+        self.mock_k8s_api = Mock()
+
+    def test_single_page(self):
+        """Test getting pod status from a single page of pods."""
+        response = self.get_raw_page([('services', 'cfs', 'Running'), ('user', 'uai', 'Pending')])
+        self.mock_k8s_api.list_pod_for_all_namespaces.return_value = response
+
+        result = get_k8s_pod_status_dict(self.mock_k8s_api, page_size=10)
+
+        self.assertEqual({'services': {'cfs': 'Running'}, 'user': {'uai': 'Pending'}}, result)
+        self.mock_k8s_api.list_pod_for_all_namespaces.assert_called_once_with(
+            limit=10, _preload_content=False
+        )
+        response.release_conn.assert_called_once_with()
+
+    def test_multiple_pages(self):
+        """Test getting pod status from multiple pages of pods."""
+        self.mock_k8s_api.list_pod_for_all_namespaces.side_effect = [
+            self.get_raw_page([('services', 'cfs', 'Running')], continue_token='abc'),
+            self.get_raw_page([('services', 'bos', 'Succeeded')], continue_token='def'),
+            self.get_raw_page([('user', 'uai', 'Failed')])
+        ]
+
+        result = get_k8s_pod_status_dict(self.mock_k8s_api, page_size=1)
+
+        self.assertEqual(
+            {'services': {'cfs': 'Running', 'bos': 'Succeeded'}, 'user': {'uai': 'Failed'}},
+            result
+        )
+        self.assertEqual(
+            [call(limit=1, _preload_content=False),
+             call(limit=1, _preload_content=False, _continue='abc'),
+             call(limit=1, _preload_content=False, _continue='def')],
+            self.mock_k8s_api.list_pod_for_all_namespaces.mock_calls
+        )
+
+    def test_no_pods(self):
+        """Test getting pod status when there are no pods."""
+        self.mock_k8s_api.list_pod_for_all_namespaces.return_value = self.get_raw_page([])
+        self.assertEqual({}, get_k8s_pod_status_dict(self.mock_k8s_api))
+
+    def test_bad_json(self):
+        """Test that a ValueError is raised when the response is not valid JSON."""
+        self.mock_k8s_api.list_pod_for_all_namespaces.return_value = Mock(data=b'{')
+        with self.assertRaises(ValueError):
+            get_k8s_pod_status_dict(self.mock_k8s_api)
+        self.mock_k8s_api.list_pod_for_all_namespaces.return_value.release_conn.assert_called_once_with()
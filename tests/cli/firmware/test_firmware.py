@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -97,7 +97,8 @@ class TestFirmware(ExtendedTestCase):
             self.fake_config['format.no_borders']
         ]
         self.mock_get_config_value.assert_has_calls([mock.call('format.no_headings'), mock.call('format.no_borders')])
-        report_kwargs = {'filter_strs': args.filter_strs, 'display_headings': args.fields, 'print_format': args.format}
+        report_kwargs = {'filter_strs': args.filter_strs, 'display_headings': args.fields, 'print_format': args.format,
+                         'limit': args.limit, 'offset': args.offset}
         self.mock_report.assert_any_call(*report_args, **report_kwargs)
 
         # Test that the rows were added to the Report
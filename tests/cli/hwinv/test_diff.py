@@ -0,0 +1,160 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Unit tests for sat.cli.hwinv.diff
+"""
+import unittest
+
+from sat.cli.hwinv.diff import (
+    ADDED,
+    CHANGED,
+    MOVED,
+    REMOVED,
+    REPLACED,
+    HardwareChange,
+    get_inventory_changes,
+)
+from sat.system.system import System
+from sat.xname import XName
+from tests.system.component_data import get_component_raw_data
+from tests.system.test_memory_module import get_memory_module_raw_data
+
+
+def get_system(raw_components):
+    """Get a parsed System from the given raw component data."""
+    system = System(raw_components)
+    system.parse_all()
+    return system
+
+
+def get_dimm(xname, serial_number, model='DDR4-3200'):
+    """Get the raw data for a memory module."""
+    return get_memory_module_raw_data(xname, serial_number=serial_number, model=model)
+
+
+class TestGetInventoryChanges(unittest.TestCase):
+    """Tests for comparing two hardware inventories."""
+
+    def setUp(self):
+        self.old_inventory = [
+            get_component_raw_data('Node', 'x1000c0s0b0n0', serial_number='NODE0'),
+            get_component_raw_data('Node', 'x1000c0s0b0n1', serial_number='NODE1'),
+            get_dimm('x1000c0s0b0n0d0', 'DIMM0'),
+            get_dimm('x1000c0s0b0n0d1', 'DIMM1'),
+            get_dimm('x1000c0s0b0n1d0', 'DIMM2'),
+            get_component_raw_data('Processor', 'x1000c0s0b0n0p0', serial_number='PROC0'),
+        ]
+
+    def get_changes(self, new_inventory, component_type=None):
+        """Get the changes from the old inventory to the given new inventory.
+
+        If component_type is given, only get changes to that type of component.
+        """
+        changes = get_inventory_changes(get_system(self.old_inventory), get_system(new_inventory))
+        if component_type is None:
+            return changes
+        return [change for change in changes if change.type == component_type]
+
+    def test_no_changes(self):
+        """Test that identical inventories have no changes"""
+        self.assertEqual([], self.get_changes(list(self.old_inventory)))
+
+    def test_replaced_dimm(self):
+        """Test that a DIMM replaced by a different FRU at the same xname is reported as replaced"""
+        new_inventory = list(self.old_inventory)
+        new_inventory[3] = get_dimm('x1000c0s0b0n0d1', 'DIMM9')
+
+        self.assertEqual(
+            [HardwareChange(XName('x1000c0s0b0n0d1'), 'memory module', REPLACED, 'Memory.DIMM9',
+                            'replaced Memory.DIMM1')],
+            self.get_changes(new_inventory)
+        )
+
+    def test_moved_fru(self):
+        """Test that a DIMM found at a different xname is reported as moved"""
+        new_inventory = list(self.old_inventory)
+        new_inventory[3] = get_dimm('x1000c0s0b0n1d1', 'DIMM1')
+
+        self.assertEqual(
+            [HardwareChange(XName('x1000c0s0b0n1d1'), 'memory module', MOVED, 'Memory.DIMM1',
+                            'from x1000c0s0b0n0d1')],
+            self.get_changes(new_inventory, 'memory module')
+        )
+        # The memory of both nodes changes too
+        self.assertEqual(['x1000c0s0b0n0', 'x1000c0s0b0n1'],
+                         sorted(str(change.xname) for change in self.get_changes(new_inventory, 'node')))
+
+    def test_swapped_frus(self):
+        """Test that DIMMs which swapped xnames are both reported as moved"""
+        new_inventory = list(self.old_inventory)
+        new_inventory[2] = get_dimm('x1000c0s0b0n0d0', 'DIMM1')
+        new_inventory[3] = get_dimm('x1000c0s0b0n0d1', 'DIMM0')
+
+        changes = self.get_changes(new_inventory)
+        self.assertEqual([MOVED, MOVED], [change.change for change in changes])
+        self.assertEqual({'x1000c0s0b0n0d0', 'x1000c0s0b0n0d1'},
+                         {str(change.xname) for change in changes})
+
+    def test_added_and_removed(self):
+        """Test that FRUs at new and vacated xnames are reported as added and removed"""
+        new_inventory = self.old_inventory[:-1] + [
+            get_component_raw_data('Processor', 'x1000c0s0b0n1p0', serial_number='PROC1')
+        ]
+        new_inventory.remove(self.old_inventory[4])
+
+        changes = self.get_changes(new_inventory, 'memory module') + self.get_changes(new_inventory, 'processor')
+        self.assertEqual(
+            {('x1000c0s0b0n1d0', REMOVED, 'Memory.DIMM2'),
+             ('x1000c0s0b0n0p0', REMOVED, 'Processor.PROC0'),
+             ('x1000c0s0b0n1p0', ADDED, 'Processor.PROC1')},
+            {(str(change.xname), change.change, change.fruid) for change in changes}
+        )
+
+    def test_changed_attributes(self):
+        """Test that changed fields of a FRU at the same xname are reported"""
+        new_inventory = list(self.old_inventory)
+        new_inventory[4] = get_dimm('x1000c0s0b0n1d0', 'DIMM2', model='DDR5-4800')
+
+        changes = self.get_changes(new_inventory)
+        memory_change = next(change for change in changes if change.type == 'memory module')
+        self.assertEqual(CHANGED, memory_change.change)
+        self.assertEqual('Model: DDR4-3200 -> DDR5-4800', memory_change.details)
+        # The node's summary of its memory models changes too
+        node_change = next(change for change in changes if change.type == 'node')
+        self.assertEqual('x1000c0s0b0n1', str(node_change.xname))
+        self.assertIn('Memory Model: DDR4-3200 -> DDR5-4800', node_change.details)
+
+    def test_duplicate_fru_ids(self):
+        """Test that components with duplicate FRU IDs are matched by xname"""
+        self.old_inventory.append(get_dimm('x1000c0s0b0n1d1', 'DIMM2'))
+        new_inventory = list(self.old_inventory)
+        new_inventory[-1] = get_dimm('x1000c0s0b0n1d1', 'DIMM2', model='DDR5-4800')
+
+        changes = self.get_changes(new_inventory, 'memory module')
+        self.assertEqual([('x1000c0s0b0n1d1', CHANGED)],
+                         [(str(change.xname), change.change) for change in changes])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,12 +25,19 @@
 Unit tests for sat.cli.hwinv.main.
 """
 
+from argparse import ArgumentParser
 from functools import wraps
 import unittest
 from unittest.mock import MagicMock, patch
 
 import sat.cli.hwinv.main
-from sat.cli.hwinv.main import get_display_fields
+from sat.cli.hwinv.main import get_display_fields, get_requested_component_types, set_default_args
+from sat.cli.hwinv.parser import add_hwinv_subparser
+from sat.system.chassis import Chassis
+from sat.system.database import InventoryDatabaseError
+from sat.system.node import Node
+from sat.system.processor import Processor
+from sat.system.system import COMPONENT_TYPES
 
 
 # TODO: Add actual tests of code in sat.cli.hwinv.main. See SAT-224.
@@ -42,6 +49,97 @@ class TestHwinvMain(unittest.TestCase):
         self.assertTrue(True)
 
 
+class TestGetRequestedComponentTypes(unittest.TestCase):
+    """Tests for the get_requested_component_types function."""
+
+    def parse_args(self, *hwinv_args):
+        """Parse the given hwinv arguments and apply the default args."""
+        parser = ArgumentParser()
+        add_hwinv_subparser(parser.add_subparsers())
+        args = parser.parse_args(['hwinv', *hwinv_args])
+        set_default_args(args)
+        return args
+
+    def test_default_args(self):
+        """Test that all component types are requested by default"""
+        self.assertEqual(set(COMPONENT_TYPES), get_requested_component_types(self.parse_args()))
+
+    def test_list_one_type(self):
+        """Test that only the listed component type is requested"""
+        args = self.parse_args('--list-nodes')
+        self.assertEqual({Node}, get_requested_component_types(args))
+
+    def test_list_and_summarize(self):
+        """Test that listed and summarized component types are requested"""
+        args = self.parse_args('--list-chassis', '--summarize-procs')
+        self.assertEqual({Chassis, Processor}, get_requested_component_types(args))
+
+
+class TestDoHwinvSqlite(unittest.TestCase):
+    """Tests for do_hwinv with the --export-sqlite, --from-sqlite and --diff options."""
+
+    def setUp(self):
+        self.mock_hsm_client_cls = patch('sat.cli.hwinv.main.HSMClient').start()
+        patch('sat.cli.hwinv.main.SATSession').start()
+        self.mock_iter_hardware_inventory = patch('sat.cli.hwinv.main.iter_hardware_inventory').start()
+        self.mock_export_inventory = patch('sat.cli.hwinv.main.export_inventory', return_value=2).start()
+        self.mock_iter_database_inventory = patch('sat.cli.hwinv.main.iter_database_inventory',
+                                                  return_value=iter([])).start()
+        self.mock_get_all_output = patch('sat.cli.hwinv.main.get_all_output', return_value='').start()
+
+    def tearDown(self):
+        patch.stopall()
+
+    def parse_args(self, *hwinv_args):
+        """Parse the given hwinv arguments."""
+        parser = ArgumentParser()
+        add_hwinv_subparser(parser.add_subparsers())
+        return parser.parse_args(['hwinv', *hwinv_args])
+
+    def test_export_sqlite(self):
+        """Test that --export-sqlite exports the full inventory without printing it"""
+        sat.cli.hwinv.main.do_hwinv(self.parse_args('--export-sqlite', 'hwinv.db'))
+        self.mock_iter_hardware_inventory.assert_called_once_with(self.mock_hsm_client_cls.return_value)
+        self.mock_export_inventory.assert_called_once_with(
+            self.mock_iter_hardware_inventory.return_value, 'hwinv.db'
+        )
+        self.mock_get_all_output.assert_not_called()
+
+    def test_export_sqlite_error(self):
+        """Test that a failed export exits with an error"""
+        self.mock_export_inventory.side_effect = InventoryDatabaseError('Unable to write')
+        with self.assertLogs(level='ERROR'), self.assertRaises(SystemExit):
+            sat.cli.hwinv.main.do_hwinv(self.parse_args('--export-sqlite', 'hwinv.db'))
+
+    def test_from_sqlite(self):
+        """Test that --from-sqlite reads the inventory from the database instead of HSM"""
+        sat.cli.hwinv.main.do_hwinv(self.parse_args('--from-sqlite', 'hwinv.db', '--list-nodes'))
+        self.mock_iter_database_inventory.assert_called_once()
+        self.assertEqual('hwinv.db', self.mock_iter_database_inventory.call_args[0][0])
+        self.mock_hsm_client_cls.assert_not_called()
+        self.mock_get_all_output.assert_called_once()
+
+    def test_diff(self):
+        """Test that --diff prints the diff report without printing the inventory"""
+        with patch('sat.cli.hwinv.main.get_diff_report') as mock_get_diff_report, \
+                patch('builtins.print') as mock_print:
+            sat.cli.hwinv.main.do_hwinv(self.parse_args('--diff', 'old.db', 'new.db'))
+        self.assertEqual(['old.db', 'new.db'], mock_get_diff_report.call_args[0][0].diff)
+        mock_print.assert_called_once_with(mock_get_diff_report.return_value)
+        self.mock_get_all_output.assert_not_called()
+
+    def test_diff_error(self):
+        """Test that --diff exits with an error when a database cannot be read"""
+        self.mock_iter_database_inventory.side_effect = InventoryDatabaseError('does not exist')
+        with self.assertLogs(level='ERROR'), self.assertRaises(SystemExit):
+            sat.cli.hwinv.main.do_hwinv(self.parse_args('--diff', 'old.db', 'new.db'))
+
+    def test_export_and_from_sqlite_exclusive(self):
+        """Test that --export-sqlite and --from-sqlite cannot be used together"""
+        with patch('sys.stderr'), self.assertRaises(SystemExit):
+            self.parse_args('--export-sqlite', 'a.db', '--from-sqlite', 'b.db')
+
+
 def list_and_summary(fn):
     """Helper function to run test cases for both list and summary operations"""
     @wraps(fn)
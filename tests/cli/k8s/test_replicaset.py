@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020, 2023 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020, 2023, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -30,7 +30,7 @@ from argparse import Namespace
 from unittest import mock
 
 import kubernetes
-from kubernetes.client import AppsV1Api
+from kubernetes.client import AppsV1Api, CoreV1Api
 from kubernetes.client.rest import ApiException
 from kubernetes.config.config_exception import ConfigException
 
@@ -43,6 +43,7 @@ class FakeReplicaSet(kubernetes.client.models.v1_replica_set.V1ReplicaSet):
         self.metadata.name = name
         self.metadata.namespace = namespace
         self.metadata.labels = {'pod-template-hash': hash_}
+        self.metadata.uid = f'{hash_}-uid'
 
 
 class FakeReplicaSets:
@@ -55,9 +56,10 @@ class FakeReplicaSets:
 
 
 class FakePod:
-    def __init__(self, name, node_name, status):
+    def __init__(self, name, node_name, status, owner_uid, owner_kind='ReplicaSet'):
         self.metadata = Namespace()
         self.metadata.name = name
+        self.metadata.owner_references = [Namespace(kind=owner_kind, uid=owner_uid)]
 
         self.spec = Namespace()
         self.spec.node_name = node_name
@@ -72,11 +74,12 @@ class FakePod:
 class FakePods:
     def __init__(self):
         self.items = [
-            FakePod('replica1-dupes-hash-1', 'w001', 'Running'),
-            FakePod('replica1-dupes-hash-2', 'w001', 'Running'),
-            FakePod('replica1-dupes-hash-3', 'w002', 'Running'),
-            FakePod('replica1-dupes-hash-4', 'w001', 'Terminated'),
-            FakePod('replica1-other-hash-1', 'w001', 'Terminated'),
+            FakePod('replica1-dupes-hash-1', 'w001', 'Running', 'dupes-hash-uid'),
+            FakePod('replica1-dupes-hash-2', 'w001', 'Running', 'dupes-hash-uid'),
+            FakePod('replica1-dupes-hash-3', 'w002', 'Running', 'dupes-hash-uid'),
+            FakePod('replica1-dupes-hash-4', 'w001', 'Terminated', 'dupes-hash-uid'),
+            FakePod('replica1-other-hash-1', 'w001', 'Terminated', 'other-hash-uid'),
+            FakePod('statefulset-pod-1', 'w001', 'Running', 'dupes-hash-uid', owner_kind='StatefulSet'),
         ]
 
 
@@ -85,15 +88,19 @@ class TestReplicaset(unittest.TestCase):
     """
     def setUp(self):
         self.mock_appsv1_api = mock.MagicMock(autospec=AppsV1Api)
-        self.mock_corev1_api = mock.patch('sat.cli.k8s.replicaset.kubernetes.client.CoreV1Api') \
-            .start() \
-            .return_value
+        self.mock_corev1_api = mock.MagicMock(autospec=CoreV1Api)
         self.mock_appsv1_api.list_replica_set_for_all_namespaces.return_value = \
             FakeReplicaSets()
-        self.mock_corev1_api.list_namespaced_pod.return_value = FakePods()
+        self.mock_corev1_api.list_pod_for_all_namespaces.return_value = FakePods()
+
+        def fake_load_kube_api(api_cls=CoreV1Api):
+            if api_cls is AppsV1Api:
+                return self.mock_appsv1_api
+            return self.mock_corev1_api
+
         self.mock_load_kube_api = mock.patch(
             'sat.cli.k8s.replicaset.load_kube_api',
-            return_value=self.mock_appsv1_api
+            side_effect=fake_load_kube_api
         ).start()
 
     def tearDown(self):
@@ -107,13 +114,39 @@ class TestReplicaset(unittest.TestCase):
             rs = ReplicaSet().get_all_replica_sets()
 
     def test_pods(self):
-        """The pods property should return all pods with matching hash.
+        """The pods property should return all pods owned by the replica set.
         """
-        expected = FakePods().items
-        actual = ReplicaSet.get_all_replica_sets()[0].pods[0:4]
+        expected = FakePods().items[0:4]
+        actual = ReplicaSet.get_all_replica_sets()[0].pods
 
-        for e, a in zip(expected, actual):
-            self.assertEqual(e.metadata.name, a.metadata.name)
+        self.assertEqual([e.metadata.name for e in expected],
+                         [a.metadata.name for a in actual])
+
+    def test_pods_single_query(self):
+        """Pods should be listed once for all replica sets with a Running field selector.
+        """
+        self.mock_appsv1_api.list_replica_set_for_all_namespaces.return_value.items = [
+            FakeReplicaSet('replica-set1', 'namespace', 'dupes-hash'),
+            FakeReplicaSet('replica-set2', 'namespace', 'other-hash'),
+            FakeReplicaSet('replica-set3', 'namespace', 'no-pods-hash'),
+        ]
+        replica_sets = ReplicaSet.get_all_replica_sets()
+
+        self.assertEqual(4, len(replica_sets[0].pods))
+        self.assertEqual(['replica1-other-hash-1'],
+                         [p.metadata.name for p in replica_sets[1].pods])
+        self.assertEqual([], replica_sets[2].pods)
+        self.mock_corev1_api.list_pod_for_all_namespaces.assert_called_once_with(
+            field_selector='status.phase=Running'
+        )
+        self.mock_corev1_api.list_namespaced_pod.assert_not_called()
+
+    def test_get_all_replica_sets_pods_api_exception(self):
+        """It should re-raise an ApiException raised when listing pods.
+        """
+        self.mock_corev1_api.list_pod_for_all_namespaces.side_effect = ApiException
+        with self.assertRaises(ApiException):
+            ReplicaSet.get_all_replica_sets()
 
     def test_running_pods(self):
         """It should return all pods with status of "Running".
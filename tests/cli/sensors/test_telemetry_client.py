@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -33,6 +33,7 @@ from unittest import mock
 from sat.cli.sensors.telemetry_client import (
     TelemetryClient
 )
+from tests.common import patch_shared_client
 
 
 class TestTelemetryClient(unittest.TestCase):
@@ -44,7 +45,7 @@ class TestTelemetryClient(unittest.TestCase):
         self.mock_api_client = mock.Mock()
         mock.patch('sat.cli.sensors.telemetry_client.TelemetryAPIClient',
                    return_value=self.mock_api_client).start()
-        mock.patch('sat.cli.sensors.telemetry_client.SATSession').start()
+        patch_shared_client('sat.cli.sensors.telemetry_client')
 
         self.mock_api_client.ping.return_value = True
 
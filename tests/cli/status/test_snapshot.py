@@ -0,0 +1,205 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Unit tests for sat.cli.status.snapshot
+"""
+import json
+import os
+from tempfile import TemporaryDirectory
+import time
+import unittest
+
+from sat.cli.status.snapshot import (
+    CHANGE_HEADING,
+    SNAPSHOT_VERSION,
+    SnapshotError,
+    StatusSnapshot,
+    diff_snapshots,
+    get_changed_rows,
+)
+from sat.constants import MISSING_VALUE
+from sat.xname import XName
+
+
+def get_rows(num_nodes, **overrides):
+    """Get synthetic status rows, with fields of some xnames overridden."""
+    rows = []
+    for index in range(num_nodes):
+        xname = f'x1000c{index // 512}s{index // 8 % 64}b0n{index % 8}'
+        row = {'xname': XName(xname), 'Aliases': f'nid{index:06}', 'Type': 'Node',
+               'NID': index, 'State': 'Ready', 'Flag': 'OK', 'Enabled': True,
+               'Arch': 'X86', 'Class': 'Mountain', 'Role': 'Compute',
+               'SubRole': MISSING_VALUE, 'Net Type': 'Sling'}
+        row.update(overrides.get(xname, {}))
+        rows.append(row)
+    return rows
+
+
+class TestStatusSnapshotFile(unittest.TestCase):
+    """Tests for saving and loading snapshot files."""
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'status.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_snapshot(self, contents):
+        """Write the given contents to the snapshot file."""
+        with open(self.path, 'w') as f:
+            json.dump(contents, f)
+
+    def test_save_and_load(self):
+        """Test that a saved snapshot can be loaded"""
+        rows = get_rows(3)
+        StatusSnapshot.from_rows(rows).save(self.path)
+        loaded = StatusSnapshot.load(self.path)
+
+        self.assertEqual('xname', loaded.primary_key)
+        self.assertEqual(list(rows[0]), loaded.headings)
+        self.assertEqual({str(row['xname']): {**row, 'xname': str(row['xname'])} for row in rows},
+                         loaded.rows)
+
+    def test_saved_format(self):
+        """Test that the snapshot is saved as a versioned list of values per row"""
+        StatusSnapshot.from_rows([{'xname': XName('x1000c0s0b0n0'), 'State': 'Ready'}]).save(self.path)
+        with open(self.path) as f:
+            contents = json.load(f)
+        self.assertEqual(SNAPSHOT_VERSION, contents['version'])
+        self.assertEqual(['xname', 'State'], contents['headings'])
+        self.assertEqual([['x1000c0s0b0n0', 'Ready']], contents['rows'])
+
+    def test_save_missing_fields(self):
+        """Test that fields missing from some rows are saved as MISSING"""
+        StatusSnapshot.from_rows([{'xname': 'a', 'State': 'Ready'}, {'xname': 'b'}]).save(self.path)
+        self.assertEqual(MISSING_VALUE, StatusSnapshot.load(self.path).rows['b']['State'])
+
+    def test_load_nonexistent(self):
+        """Test loading a snapshot file which does not exist"""
+        with self.assertRaisesRegex(SnapshotError, 'Unable to read'):
+            StatusSnapshot.load(self.path)
+
+    def test_load_invalid_json(self):
+        """Test loading a snapshot file which is not JSON"""
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+        with self.assertRaisesRegex(SnapshotError, 'Unable to parse'):
+            StatusSnapshot.load(self.path)
+
+    def test_load_unsupported_version(self):
+        """Test loading a snapshot file with an unsupported version"""
+        self.write_snapshot({'version': SNAPSHOT_VERSION + 1, 'primary_key': 'xname',
+                             'headings': ['xname'], 'rows': []})
+        with self.assertRaisesRegex(SnapshotError, 'unsupported version'):
+            StatusSnapshot.load(self.path)
+
+    def test_load_missing_primary_key(self):
+        """Test loading a snapshot file whose headings do not include the primary key"""
+        self.write_snapshot({'version': SNAPSHOT_VERSION, 'primary_key': 'xname',
+                             'headings': ['State'], 'rows': [['Ready']]})
+        with self.assertRaisesRegex(SnapshotError, 'not a valid snapshot'):
+            StatusSnapshot.load(self.path)
+
+
+class TestDiffSnapshots(unittest.TestCase):
+    """Tests for comparing snapshots."""
+
+    def test_no_changes(self):
+        """Test comparing identical snapshots"""
+        diff = diff_snapshots(StatusSnapshot.from_rows(get_rows(10)),
+                              StatusSnapshot.from_rows(get_rows(10)))
+        self.assertEqual(({}, [], []), diff)
+
+    def test_changed_added_removed(self):
+        """Test finding changed, added, and removed components"""
+        old = StatusSnapshot.from_rows(get_rows(10)[1:])
+        new = StatusSnapshot.from_rows(get_rows(9, x1000c0s0b0n3={'State': 'Off', 'Flag': 'Alert'}))
+        diff = diff_snapshots(old, new)
+
+        self.assertEqual({'x1000c0s0b0n3': ['State', 'Flag']}, diff.changed)
+        self.assertEqual(['x1000c0s0b0n0'], diff.added)
+        self.assertEqual(['x1000c0s1b0n1'], diff.removed)
+
+    def test_only_common_headings_compared(self):
+        """Test that headings in only one snapshot are not compared"""
+        old_rows = [{key: value for key, value in row.items() if key != 'Aliases'}
+                    for row in get_rows(10)]
+        diff = diff_snapshots(StatusSnapshot.from_rows(old_rows),
+                              StatusSnapshot.from_rows(get_rows(10)))
+        self.assertEqual(({}, [], []), diff)
+
+    @unittest.skipIf(os.getenv('SAT_SKIP_PERF_TESTS'), 'SAT_SKIP_PERF_TESTS is set in environment')
+    def test_diff_large_snapshots(self):
+        """Test that comparing two 50k-node snapshots is fast"""
+        num_nodes = 50000
+        overrides = {f'x1000c{index // 512}s{index // 8 % 64}b0n{index % 8}': {'State': 'Off'}
+                     for index in range(0, num_nodes, 100)}
+        old = StatusSnapshot.from_rows(get_rows(num_nodes))
+        new = StatusSnapshot.from_rows(get_rows(num_nodes, **overrides))
+
+        start = time.monotonic()
+        diff = diff_snapshots(old, new)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(len(overrides), len(diff.changed))
+        self.assertLess(elapsed, 1.0)
+
+
+class TestGetChangedRows(unittest.TestCase):
+    """Tests for getting the rows to show for changes since a snapshot."""
+
+    def test_get_changed_rows(self):
+        """Test that changed, added and removed rows are returned with the change"""
+        old = StatusSnapshot.from_rows(get_rows(10)[1:])
+        rows = get_rows(9, x1000c0s0b0n3={'State': 'Off'})
+        changed_rows = get_changed_rows(old, rows, primary_key_type=XName)
+
+        self.assertEqual(
+            [('x1000c0s0b0n0', 'added'), ('x1000c0s0b0n3', 'changed: State'),
+             ('x1000c0s1b0n1', 'removed')],
+            [(str(row['xname']), row[CHANGE_HEADING]) for row in changed_rows]
+        )
+        self.assertEqual('Off', changed_rows[1]['State'])
+        self.assertIsInstance(changed_rows[2]['xname'], XName)
+        self.assertEqual(9, changed_rows[2]['NID'])
+
+    def test_removed_rows_of_queried_types(self):
+        """Test that only rows of the queried component types are returned as removed"""
+        old_rows = get_rows(3)
+        old_rows[1]['Type'] = 'NodeBMC'
+        changed_rows = get_changed_rows(StatusSnapshot.from_rows(old_rows), [],
+                                        component_types=['Node'])
+        self.assertEqual(
+            [('x1000c0s0b0n0', 'removed'), ('x1000c0s0b0n2', 'removed')],
+            [(str(row['xname']), row[CHANGE_HEADING]) for row in changed_rows]
+        )
+
+    def test_no_changed_rows(self):
+        """Test that no rows are returned when nothing changed"""
+        self.assertEqual([], get_changed_rows(StatusSnapshot.from_rows(get_rows(5)), get_rows(5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2022 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2022, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -24,11 +24,15 @@
 """
 Unit tests for sat.cli.status
 """
+from argparse import Namespace
 from copy import deepcopy
-
+import os
+from tempfile import TemporaryDirectory
 import unittest
+from unittest.mock import MagicMock, patch
 
-from sat.cli.status.main import group_dicts_by
+from sat.cli.status.main import do_status, get_bos_template_filter_fn, get_hsm_filter_params, group_dicts_by
+from sat.cli.status.snapshot import CHANGE_HEADING, StatusSnapshot
 from sat.constants import MISSING_VALUE
 from sat.xname import XName
 
@@ -263,3 +267,141 @@ class TestGroupDictsBy(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
+
+
+class TestGetHSMFilterParams(unittest.TestCase):
+    """Tests for the get_hsm_filter_params function"""
+
+    def test_no_filters(self):
+        """Test that no parameters are returned without filters"""
+        self.assertEqual({}, get_hsm_filter_params(None, ['Node']))
+        self.assertEqual({}, get_hsm_filter_params([], ['Node']))
+
+    def test_hsm_equalities(self):
+        """Test that equalities on HSM fields become query parameters"""
+        self.assertEqual({'role': 'Compute', 'state': 'Ready'},
+                         get_hsm_filter_params(['role=Compute and state=Ready'], ['Node']))
+
+    def test_enabled_lowercased(self):
+        """Test that the Enabled value is lower-cased and other values are ignored"""
+        self.assertEqual({'enabled': 'false'}, get_hsm_filter_params(['enabled=False'], ['Node']))
+        self.assertEqual({}, get_hsm_filter_params(['enabled=no'], ['Node']))
+
+    def test_non_hsm_fields(self):
+        """Test that equalities on fields from other services are not parameters"""
+        self.assertEqual({}, get_hsm_filter_params(['xname=x1000c0s0b0n0'], ['Node']))
+
+    def test_or_not_pushed_down(self):
+        """Test that alternatives are not turned into query parameters"""
+        self.assertEqual({}, get_hsm_filter_params(['role=Compute or role=Application'], ['Node']))
+
+    def test_conflicting_values(self):
+        """Test that conflicting values for the same parameter are dropped"""
+        self.assertEqual({'state': 'Ready'},
+                         get_hsm_filter_params(['state=Ready', 'role=Compute', 'role=Application'], ['Node']))
+
+    def test_multiple_types(self):
+        """Test that only parameters applying to every type are returned"""
+        self.assertEqual({'state': 'Ready'},
+                         get_hsm_filter_params(['state=Ready and role=Compute'], ['Node', 'NodeBMC']))
+
+    def test_invalid_filter(self):
+        """Test that no parameters are returned for an invalid filter"""
+        self.assertEqual({}, get_hsm_filter_params(['role=Compute and'], ['Node']))
+
+
+class TestGetBOSTemplateFilterFn(unittest.TestCase):
+    """Tests for the get_bos_template_filter_fn function"""
+
+    def setUp(self):
+        self.mock_bos_client = patch('sat.cli.status.main.BOSClientCommon.get_bos_client').start().return_value
+        self.mock_bos_client.get_session_template.return_value = {
+            'boot_sets': {
+                'compute': {'node_groups': ['blue']},
+                'uan': {'node_roles_groups': ['Application'], 'node_list': ['x3000c0s19b0n0']},
+            }
+        }
+        self.mock_node_directory = MagicMock()
+        self.mock_node_directory.get_group_members.return_value = {'x1000c0s0b0n0'}
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_filter_uses_node_directory_groups(self):
+        """Test that the members of node groups are looked up in the node directory"""
+        filter_fn = get_bos_template_filter_fn('template', MagicMock(), self.mock_node_directory)
+        self.mock_node_directory.get_group_members.assert_called_once_with('blue')
+        rows = [
+            {'xname': 'x1000c0s0b0n0', 'Role': 'Compute'},
+            {'xname': 'x1000c0s0b0n1', 'Role': 'Compute'},
+            {'xname': 'x3000c0s19b0n0', 'Role': 'Application'},
+            {'xname': 'x3000c0s17b0n0', 'Role': 'Application'},
+        ]
+        self.assertEqual(['x1000c0s0b0n0', 'x3000c0s19b0n0', 'x3000c0s17b0n0'],
+                         [row['xname'] for row in rows if filter_fn(row)])
+
+
+class TestDoStatusSince(unittest.TestCase):
+    """Tests for do_status comparing with a snapshot"""
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.tmp_dir.name, 'snapshot.json')
+        patch('sat.cli.status.main.SATSession').start()
+        self.mock_get_populated_rows = patch(
+            'sat.cli.status.main.StatusModule.get_populated_rows').start()
+        self.mock_get_status_reports = patch('sat.cli.status.main.get_status_reports',
+                                             return_value=[]).start()
+        patch('builtins.print').start()
+
+    def tearDown(self):
+        patch.stopall()
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def status_row(xname, component_type='Node', state='Ready'):
+        """Get a status row for a component."""
+        return {'xname': XName(xname), 'Type': component_type, 'State': state}
+
+    def do_status_since(self, old_rows, current_rows, types, filter_strs=None):
+        """Run do_status with --since a snapshot of old_rows, and get the changed components shown."""
+        StatusSnapshot.from_rows(old_rows).save(self.snapshot_path)
+        self.mock_get_populated_rows.return_value = current_rows
+        args = Namespace(watch=None, since=self.snapshot_path, save_snapshot=None,
+                         status_module_names=None, types=types, filter_strs=filter_strs,
+                         bos_template=None)
+        do_status(args)
+        components = self.mock_get_status_reports.call_args.args[1]
+        return {str(component['xname']): component[CHANGE_HEADING] for component in components}
+
+    def test_since_with_filter(self):
+        """Test that a component which no longer matches a filter is shown as changed, not removed"""
+        changes = self.do_status_since(
+            [self.status_row('x1000c0s0b0n0', state='Off'), self.status_row('x1000c0s0b0n1', state='Off')],
+            [self.status_row('x1000c0s0b0n0', state='Ready'), self.status_row('x1000c0s0b0n1', state='Off')],
+            ['Node'], filter_strs=['State=Off']
+        )
+        self.assertEqual({'x1000c0s0b0n0': 'changed: State'}, changes)
+        # The filter is not pushed down to HSM, so components which no longer match are queried
+        self.assertEqual({}, self.mock_get_populated_rows.call_args.kwargs['hsm_filter_params'])
+
+    def test_save_snapshot_with_filter(self):
+        """Test that the filter is not pushed down to HSM when saving a snapshot"""
+        args = Namespace(watch=None, since=None, save_snapshot=self.snapshot_path,
+                         status_module_names=None, types=['Node'], filter_strs=['State=Off'],
+                         bos_template=None)
+        self.mock_get_populated_rows.return_value = [self.status_row('x1000c0s0b0n0')]
+        do_status(args)
+        self.assertEqual({}, self.mock_get_populated_rows.call_args.kwargs['hsm_filter_params'])
+        self.assertEqual(['x1000c0s0b0n0'], list(StatusSnapshot.load(self.snapshot_path).rows))
+
+    def test_since_with_fewer_types(self):
+        """Test that components of types which were not queried are not shown as removed"""
+        changes = self.do_status_since(
+            [self.status_row('x1000c0s0b0n0'), self.status_row('x1000c0s1b0n0'),
+             self.status_row('x1000c0s0b0', component_type='NodeBMC'),
+             self.status_row('x1000c0', component_type='Chassis')],
+            [self.status_row('x1000c0s0b0n0')],
+            ['Node']
+        )
+        self.assertEqual({'x1000c0s1b0n0': 'removed'}, changes)
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2022, 2024-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2022, 2024-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -28,13 +28,14 @@ from abc import ABC
 import inspect
 import unittest
 import logging
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from csm_api_client.service.gateway import APIError
 import sat.cli.status.status_module as status_module_module
 from sat.cli.status.status_module import (
     BOSStatusModule,
     HSMStatusModule,
+    SLSStatusModule,
     StatusModule,
     StatusModuleException,
 )
@@ -290,6 +291,31 @@ class TestGettingRows(BaseStatusModuleTestCase):
         if not row_had_missing_config:
             self.fail('Rows with missing "state" field were omitted')
 
+    def test_static_module_rows_cached(self):
+        """Test that rows from static modules are only retrieved once when a row cache is given"""
+        self.TestStatusModuleTwo.static = True
+        row_cache = {}
+        StatusModule.get_populated_rows(primary_key='xname', session=MagicMock(),
+                                        component_types=['Node'], row_cache=row_cache)
+        self.all_rows[0]['state'] = 'off'
+        self.all_rows[0]['config'] = 'changed_config'
+        rows = StatusModule.get_populated_rows(primary_key='xname', session=MagicMock(),
+                                               component_types=['Node'], row_cache=row_cache)
+
+        self.assertEqual(list(row_cache), [self.TestStatusModuleTwo])
+        self.assertEqual(rows[0]['state'], 'off')
+        self.assertEqual(rows[0]['config'], 'some_config')
+
+    def test_static_module_rows_not_cached_without_cache(self):
+        """Test that rows from static modules are retrieved each time without a row cache"""
+        self.TestStatusModuleTwo.static = True
+        StatusModule.get_populated_rows(primary_key='xname', session=MagicMock(),
+                                        component_types=['Node'])
+        self.all_rows[0]['config'] = 'changed_config'
+        rows = StatusModule.get_populated_rows(primary_key='xname', session=MagicMock(),
+                                               component_types=['Node'])
+        self.assertEqual(rows[0]['config'], 'changed_config')
+
 
 class TestBOSStatusModule(BaseStatusModuleTestCase):
     """Tests for the BOSStatusModule class"""
@@ -454,6 +480,27 @@ class TestBOSStatusModule(BaseStatusModuleTestCase):
             'Most Recent Image': self.img_id,
         })
 
+    def test_components_not_in_primary_keys_skipped(self):
+        """Test that BOS components without a matching primary key are skipped"""
+        rows = BOSStatusModule(session=self.session, primary_keys=['x1000c0s0b0n0']).rows
+
+        self.assertEqual(rows, [])
+        self.mock_bos_client.get_components.assert_called_once_with()
+        self.mock_bos_client.get_session.assert_not_called()
+
+    def test_narrowed_components_requested_by_id(self):
+        """Test that only the primary keys are requested from BOS when HSM was narrowed"""
+        primary_keys = [f'x1000c0s{slot}b0n0' for slot in range(3)] + [self.xname]
+        with patch.object(BOSStatusModule, 'COMPONENT_ID_BATCH_SIZE', 3):
+            rows = BOSStatusModule(session=self.session, primary_keys=primary_keys,
+                                   hsm_filter_params={'role': 'Compute'}).rows
+
+        self.assertEqual(self.mock_bos_client.get_components.mock_calls, [
+            call(params={'ids': 'x1000c0s0b0n0,x1000c0s0b1n0,x1000c0s1b0n0'}),
+            call(params={'ids': 'x1000c0s2b0n0'}),
+        ])
+        self.assertEqual([row['xname'] for row in rows], [self.xname, self.xname])
+
 
 class TestHSMStatusModule(BaseStatusModuleTestCase):
     """Tests for the HSMStatusModule class"""
@@ -482,3 +529,62 @@ class TestHSMStatusModule(BaseStatusModuleTestCase):
         for heading in HSMStatusModule.headings:
             with self.subTest(heading=heading):
                 self.assertTrue(HSMStatusModule.include_heading(heading, component_type=DEFAULT_TYPE))
+
+    def test_rows_with_filter_params(self):
+        """Test that HSM filter parameters are added to the HSM query"""
+        mock_hsm_client = patch('sat.cli.status.status_module.HSMClient').start().return_value
+        mock_hsm_client.get.return_value.json.return_value = {'Components': []}
+
+        rows = HSMStatusModule(session=MagicMock(), component_types=['Node'],
+                               hsm_filter_params={'role': 'Compute'}).rows
+
+        self.assertEqual(rows, [])
+        mock_hsm_client.get.assert_called_once_with('State', 'Components',
+                                                    params={'type': ['Node'], 'role': 'Compute'})
+
+    def test_rows_with_rejected_filter_params(self):
+        """Test that HSM is queried without filter parameters if it rejects them"""
+        mock_hsm_client = patch('sat.cli.status.status_module.HSMClient').start().return_value
+        mock_response = MagicMock()
+        mock_response.json.return_value = {'Components': [{'ID': 'x1000c0s0b0n0'}]}
+        mock_hsm_client.get.side_effect = [APIError('bad request'), mock_response]
+
+        rows = HSMStatusModule(session=MagicMock(), component_types=['Node'],
+                               hsm_filter_params={'state': 'Bogus'}).rows
+
+        self.assertEqual(rows, [{'ID': 'x1000c0s0b0n0'}])
+        self.assertEqual(mock_hsm_client.get.mock_calls, [
+            call('State', 'Components', params={'type': ['Node'], 'state': 'Bogus'}),
+            call('State', 'Components', params={'type': ['Node']}),
+        ])
+
+
+class TestSLSStatusModule(unittest.TestCase):
+    """Tests for the SLSStatusModule class."""
+
+    def test_rows_from_node_directory(self):
+        """Test that the aliases are retrieved from the node directory"""
+        mock_node_directory = MagicMock()
+        mock_node_directory.get_all_aliases.return_value = {
+            'x3000c0s1b0n0': ['ncn-m001', 'mgmt1'],
+            'x1000c0s0b0n0': ['nid000001'],
+        }
+        rows = SLSStatusModule(session=MagicMock(), node_directory=mock_node_directory).rows
+        self.assertEqual([{'xname': 'x3000c0s1b0n0', 'Aliases': 'ncn-m001, mgmt1'},
+                          {'xname': 'x1000c0s0b0n0', 'Aliases': 'nid000001'}], rows)
+
+    def test_rows_api_error(self):
+        """Test that an error getting the aliases raises a StatusModuleException"""
+        mock_node_directory = MagicMock()
+        mock_node_directory.get_all_aliases.side_effect = APIError('SLS failed')
+        with self.assertRaisesRegex(StatusModuleException,
+                                    'Could not query SLS for component aliases: SLS failed'):
+            SLSStatusModule(session=MagicMock(), node_directory=mock_node_directory).rows
+
+    def test_node_directory_created(self):
+        """Test that a node directory is created with the session if none is given"""
+        mock_session = MagicMock()
+        with patch('sat.cli.status.status_module.NodeDirectory') as mock_node_directory_cls:
+            module = SLSStatusModule(session=mock_session)
+        mock_node_directory_cls.from_session.assert_called_once_with(mock_session)
+        self.assertIs(mock_node_directory_cls.from_session.return_value, module.node_directory)
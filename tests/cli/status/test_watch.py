@@ -0,0 +1,219 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Unit tests for sat.cli.status.watch
+"""
+from io import StringIO
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sat.cli.status.watch import (
+    CLEAR_LINE,
+    CLEAR_SCREEN,
+    HIGHLIGHT,
+    StatusChange,
+    StatusWatcher,
+    format_status_change,
+    get_rows_by_key,
+    get_status_changes,
+)
+from sat.report import Report
+
+
+def get_report(states):
+    """Get a report showing the given state of each xname."""
+    report = Report(['xname', 'State'], no_headings=False, no_borders=False,
+                    show_empty=True, show_missing=True)
+    report.add_rows([{'xname': xname, 'State': state} for xname, state in states.items()])
+    return report
+
+
+class MockStream(StringIO):
+    """A StringIO which can pretend to be a terminal."""
+
+    def __init__(self, tty=False):
+        super().__init__()
+        self.tty = tty
+
+    def isatty(self):
+        return self.tty
+
+
+class TestGetStatusChanges(unittest.TestCase):
+    """Tests for finding changes between polls."""
+
+    def test_rows_by_key(self):
+        """Test getting rows from reports keyed by xname"""
+        rows = get_rows_by_key([get_report({'x1000c0s0b0n0': 'Ready'}),
+                                get_report({'x1000c0s0b0': 'On'})])
+        self.assertEqual({'x1000c0s0b0n0': {'xname': 'x1000c0s0b0n0', 'State': 'Ready'},
+                          'x1000c0s0b0': {'xname': 'x1000c0s0b0', 'State': 'On'}},
+                         rows)
+
+    def test_no_changes(self):
+        """Test that identical rows have no changes"""
+        rows = {'x1000c0s0b0n0': {'State': 'Ready'}}
+        self.assertEqual([], get_status_changes(rows, dict(rows)))
+
+    def test_changed_added_removed(self):
+        """Test finding changed, added, and removed rows"""
+        old_rows = {'a': {'State': 'Ready', 'Flag': 'OK'}, 'b': {'State': 'Ready', 'Flag': 'OK'}}
+        new_rows = {'a': {'State': 'Off', 'Flag': 'OK'}, 'c': {'State': 'On', 'Flag': 'OK'}}
+        self.assertEqual(
+            [StatusChange('a', 'State', 'Ready', 'Off'),
+             StatusChange('c', None, None, 'added'),
+             StatusChange('b', None, 'removed', None)],
+            get_status_changes(old_rows, new_rows)
+        )
+
+    def test_format_status_change(self):
+        """Test formatting changes"""
+        self.assertEqual('a: State Ready -> Off',
+                         format_status_change(StatusChange('a', 'State', 'Ready', 'Off')))
+        self.assertEqual('c: added', format_status_change(StatusChange('c', None, None, 'added')))
+        self.assertEqual('b: removed', format_status_change(StatusChange('b', None, 'removed', None)))
+
+
+class TestStatusWatcher(unittest.TestCase):
+    """Tests for the StatusWatcher class."""
+
+    def setUp(self):
+        self.polls = [
+            {'x1000c0s0b0n0': 'Ready', 'x1000c0s0b0n1': 'Ready'},
+            {'x1000c0s0b0n0': 'Ready', 'x1000c0s0b0n1': 'Off'},
+            {'x1000c0s0b0n0': 'Ready', 'x1000c0s0b0n1': 'Off'},
+        ]
+        self.get_reports = MagicMock(side_effect=[[get_report(states)] for states in self.polls])
+        self.mock_sleep = patch('sat.cli.status.watch.time.sleep').start()
+        self.mock_terminal_size = patch('sat.cli.status.watch.shutil.get_terminal_size',
+                                        return_value=os.terminal_size((120, 40))).start()
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_not_tty(self):
+        """Test that the table is printed once followed by change lines when not a terminal"""
+        stream = MockStream()
+        StatusWatcher(self.get_reports, 5, stream=stream).watch(max_polls=3)
+
+        output = stream.getvalue()
+        self.assertEqual(3, self.get_reports.call_count)
+        self.assertEqual(2, self.mock_sleep.call_count)
+        self.assertEqual(1, output.count('x1000c0s0b0n0'))
+        self.assertEqual(1, output.count('x1000c0s0b0n1: State Ready -> Off'))
+        self.assertNotIn('\x1b[', output)
+
+    def test_tty_redraws_changed_lines(self):
+        """Test that only changed lines are redrawn and highlighted on a terminal"""
+        stream = MockStream(tty=True)
+        watcher = StatusWatcher(self.get_reports, 5, stream=stream)
+
+        watcher.poll()
+        first_output = stream.getvalue()
+        self.assertTrue(first_output.startswith(CLEAR_SCREEN))
+        self.assertIn('0 change(s)', first_output)
+
+        stream.seek(0)
+        stream.truncate()
+        watcher.poll()
+        second_output = stream.getvalue()
+        changed_line = next(line for line in str(get_report(self.polls[1])).splitlines()
+                            if 'x1000c0s0b0n1' in line)
+        self.assertNotIn(CLEAR_SCREEN, second_output)
+        self.assertIn(HIGHLIGHT.format(changed_line), second_output)
+        self.assertNotIn('x1000c0s0b0n0 ', second_output)
+        self.assertIn('x1000c0s0b0n1: State Ready -> Off', second_output)
+
+        stream.seek(0)
+        stream.truncate()
+        watcher.poll()
+        third_output = stream.getvalue()
+        self.assertIn('0 change(s)', third_output)
+        # The line highlighted by the previous poll is rewritten without highlighting
+        self.assertIn(f'{CLEAR_LINE}{changed_line}', third_output)
+        self.assertNotIn(HIGHLIGHT.format(changed_line), third_output)
+        self.assertNotIn('x1000c0s0b0n0 ', third_output)
+
+    def test_tty_too_short_appends_changes(self):
+        """Test that changes are appended when the table does not fit on the terminal"""
+        self.mock_terminal_size.return_value = os.terminal_size((120, 5))
+        stream = MockStream(tty=True)
+        StatusWatcher(self.get_reports, 5, stream=stream).watch(max_polls=2)
+
+        output = stream.getvalue()
+        self.assertNotIn('\x1b[', output)
+        self.assertEqual(1, output.count('x1000c0s0b0n0'))
+        self.assertEqual(1, output.count('x1000c0s0b0n1: State Ready -> Off'))
+
+    def test_tty_redraws_all_when_table_fits_again(self):
+        """Test that the table is redrawn in place once it fits on the terminal again"""
+        self.mock_terminal_size.return_value = os.terminal_size((120, 5))
+        stream = MockStream(tty=True)
+        watcher = StatusWatcher(self.get_reports, 5, stream=stream)
+        watcher.poll()
+        self.mock_terminal_size.return_value = os.terminal_size((120, 40))
+        stream.seek(0)
+        stream.truncate()
+        watcher.poll()
+        self.assertTrue(stream.getvalue().startswith(CLEAR_SCREEN))
+
+    def test_tty_redraws_all_when_row_count_changes(self):
+        """Test that the screen is cleared when the number of lines changes"""
+        self.get_reports.side_effect = [[get_report({'x1000c0s0b0n0': 'Ready'})],
+                                        [get_report(self.polls[0])]]
+        stream = MockStream(tty=True)
+        watcher = StatusWatcher(self.get_reports, 5, stream=stream)
+        watcher.poll()
+        stream.seek(0)
+        stream.truncate()
+        watcher.poll()
+
+        self.assertTrue(stream.getvalue().startswith(CLEAR_SCREEN))
+        self.assertIn('x1000c0s0b0n1: added', stream.getvalue())
+
+    def test_sleeps_for_remaining_interval(self):
+        """Test that the time spent polling is subtracted from the interval"""
+        with patch('sat.cli.status.watch.time.monotonic', side_effect=[10.0, 12.0, 15.0]):
+            StatusWatcher(self.get_reports, 5, stream=MockStream()).watch(max_polls=2)
+        self.mock_sleep.assert_called_once_with(3.0)
+
+    def test_deadline_reset_each_poll(self):
+        """Test that the request deadline of the session is restarted before each poll"""
+        mock_session = MagicMock()
+        mock_session.reset_request_deadline.side_effect = lambda: self.assertEqual(
+            mock_session.reset_request_deadline.call_count - 1, self.get_reports.call_count
+        )
+        StatusWatcher(self.get_reports, 5, stream=MockStream(), session=mock_session).watch(max_polls=3)
+        self.assertEqual(3, mock_session.reset_request_deadline.call_count)
+
+    def test_keyboard_interrupt(self):
+        """Test that watching stops when interrupted"""
+        self.mock_sleep.side_effect = KeyboardInterrupt
+        StatusWatcher(self.get_reports, 5, stream=MockStream()).watch()
+        self.assertEqual(1, self.get_reports.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
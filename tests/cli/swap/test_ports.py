@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2020-2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2020-2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -31,8 +31,9 @@ import unittest
 from unittest import mock
 from unittest.mock import call
 
+from sat.apiclient import APIError
 from sat.cli.swap.ports import PortManager
-from tests.common import ExtendedTestCase
+from tests.common import ExtendedTestCase, patch_shared_client
 
 
 # Constants used in the tests
@@ -127,7 +128,7 @@ class TestGetSwitchPortDataList(unittest.TestCase):
         }
         self.mock_get_switch = mock.patch('sat.cli.swap.ports.PortManager.get_switch',
                                           autospec=True).start()
-        self.mock_sat_session = mock.patch('sat.cli.swap.ports.SATSession').start()
+        self.mock_sat_session = patch_shared_client('sat.cli.swap.ports')
         self.mock_get_switch.side_effect = lambda _, switch_xname: self.mock_switches.get(switch_xname)
         self.pm = PortManager()
 
@@ -179,12 +180,11 @@ class TestGetJackPortDataList(unittest.TestCase):
     def setUp(self):
         """Mock functions called."""
 
-        self.mock_sat_session = mock.patch('sat.cli.swap.ports.SATSession').start()
+        self.mock_sat_session = patch_shared_client('sat.cli.swap.ports')
         self.mock_fc_client = mock.patch('sat.cli.swap.ports.FabricControllerClient').start().return_value
-        # The data that will be returned for the ports
-        # Each call for the mock_fc_client will return an item from the list in order
+        # The data that will be returned for the ports, keyed by the port xname in the link
         # Example URL: https://api-gw-service-nmn.local/apis/fabric-manager/fabric/ports/x9000c1r3j16p0
-        self.mock_fc_client.get.return_value.json.side_effect = [
+        self.set_port_documents([
             {'id': 'x9000c1r3a0l14',
              'conn_port': 'x9000c1r3j16p0',
              'portPolicyLinks': [FABRIC_POLICY_LINK, QOS_POLICY_LINK]},
@@ -197,7 +197,7 @@ class TestGetJackPortDataList(unittest.TestCase):
             {'id': 'x9000c3r3a0214',
              'conn_port': 'x9000c3r5j16p1',
              'portPolicyLinks': [FABRIC_POLICY_LINK, QOS_POLICY_LINK]},
-        ]
+        ])
 
         self.mock_cable_endpoints = mock.patch('sat.cli.swap.ports.CableEndpoints',
                                                autospec=True).start().return_value
@@ -245,6 +245,28 @@ class TestGetJackPortDataList(unittest.TestCase):
         self.maxDiff = None
         self.pm = PortManager()
 
+    def set_port_documents(self, port_documents):
+        """Set the port documents returned by the mock fabric controller client.
+
+        Args:
+            port_documents (list): the port documents, each of which is returned
+                when getting the port link for the port's 'conn_port'.
+        """
+        documents_by_link = {f'/fabric/ports/{doc["conn_port"]}': doc
+                             for doc in port_documents}
+
+        def fake_get(port_link):
+            response = mock.Mock()
+            response.json.return_value = documents_by_link[port_link]
+            return response
+
+        self.mock_fc_client.get.side_effect = fake_get
+
+    def assert_ports_requested(self, port_links):
+        """Assert that each of the given port links was requested exactly once."""
+        self.assertCountEqual([call(port_link) for port_link in port_links],
+                              self.mock_fc_client.get.call_args_list)
+
     def test_basic(self):
         """get_jack_port_data_list() with a single jack returns the endpoint data for the jacks"""
 
@@ -255,11 +277,11 @@ class TestGetJackPortDataList(unittest.TestCase):
         self.mock_cable_endpoints.get_cable.assert_called()
         self.mock_cable_endpoints.get_linked_jack_list.assert_called()
         self.mock_get_ports.assert_called()
-        self.mock_fc_client.get.assert_has_calls(
-            [call('/fabric/ports/x9000c1r3j16p0'), call().json(),
-             call('/fabric/ports/x9000c1r3j16p1'), call().json(),
-             call('/fabric/ports/x9000c3r5j16p0'), call().json(),
-             call('/fabric/ports/x9000c3r5j16p1'), call().json()]
+        self.assert_ports_requested(
+            ['/fabric/ports/x9000c1r3j16p0',
+             '/fabric/ports/x9000c1r3j16p1',
+             '/fabric/ports/x9000c3r5j16p0',
+             '/fabric/ports/x9000c3r5j16p1']
         )
 
     def test_both_jacks(self):
@@ -288,11 +310,11 @@ class TestGetJackPortDataList(unittest.TestCase):
         self.assertEqual(self.mock_cable_endpoints.get_cable.call_count, 2)
         self.assertEqual(self.mock_cable_endpoints.get_linked_jack_list.call_count, 2)
         self.mock_get_ports.assert_called()
-        self.mock_fc_client.get.assert_has_calls(
-            [call('/fabric/ports/x9000c1r3j16p0'), call().json(),
-             call('/fabric/ports/x9000c1r3j16p1'), call().json(),
-             call('/fabric/ports/x9000c3r5j16p0'), call().json(),
-             call('/fabric/ports/x9000c3r5j16p1'), call().json()]
+        self.assert_ports_requested(
+            ['/fabric/ports/x9000c1r3j16p0',
+             '/fabric/ports/x9000c1r3j16p1',
+             '/fabric/ports/x9000c3r5j16p0',
+             '/fabric/ports/x9000c3r5j16p1']
         )
 
     def test_invalid_jack_xname(self):
@@ -339,9 +361,9 @@ class TestGetJackPortDataList(unittest.TestCase):
         self.mock_cable_endpoints.get_cable.assert_not_called()
         self.mock_cable_endpoints.get_linked_jack_list.assert_not_called()
         self.mock_get_ports.assert_called()
-        self.mock_fc_client.get.assert_has_calls(
-            [call('/fabric/ports/x9000c1r3j16p0'), call().json(),
-             call('/fabric/ports/x9000c1r3j16p1'), call().json()]
+        self.assert_ports_requested(
+            ['/fabric/ports/x9000c1r3j16p0',
+             '/fabric/ports/x9000c1r3j16p1']
         )
 
     def test_jack_not_valid_using_p2p_file(self):
@@ -368,11 +390,11 @@ class TestGetJackPortDataList(unittest.TestCase):
         self.assertEqual(self.mock_cable_endpoints.get_cable.call_count, 1)
         self.assertEqual(self.mock_cable_endpoints.get_linked_jack_list.call_count, 1)
         self.mock_get_ports.assert_called()
-        self.mock_fc_client.get.assert_has_calls(
-            [call('/fabric/ports/x9000c1r3j16p0'), call().json(),
-             call('/fabric/ports/x9000c1r3j16p1'), call().json(),
-             call('/fabric/ports/x9000c3r5j16p0'), call().json(),
-             call('/fabric/ports/x9000c3r5j16p1'), call().json()]
+        self.assert_ports_requested(
+            ['/fabric/ports/x9000c1r3j16p0',
+             '/fabric/ports/x9000c1r3j16p1',
+             '/fabric/ports/x9000c3r5j16p0',
+             '/fabric/ports/x9000c3r5j16p1']
         )
 
     def test_jacks_two_cables_with_force(self):
@@ -395,7 +417,7 @@ class TestGetJackPortDataList(unittest.TestCase):
             ['x9000c1r3j18',
              'x9000c3r3j16']
         ]
-        self.mock_fc_client.get.return_value.json.side_effect = [
+        self.set_port_documents([
             {'id': 'x9000c1r3a0l14',
              'conn_port': 'x9000c1r3j16p0',
              'portPolicyLinks': [FABRIC_POLICY_LINK]},
@@ -420,7 +442,7 @@ class TestGetJackPortDataList(unittest.TestCase):
             {'id': 'x9000c3r3a0214',
              'conn_port': 'x9000c3r5j16p1',
              'portPolicyLinks': [FABRIC_POLICY_LINK]}
-        ]
+        ])
         expected = [
             {'xname': 'x9000c1r3j16p0',
              'port_link': '/fabric/ports/x9000c1r3j16p0',
@@ -454,15 +476,15 @@ class TestGetJackPortDataList(unittest.TestCase):
         self.assertEqual(self.mock_cable_endpoints.get_cable.call_count, 2)
         self.assertEqual(self.mock_cable_endpoints.get_linked_jack_list.call_count, 2)
         self.mock_get_ports.assert_called()
-        self.mock_fc_client.get.assert_has_calls(
-            [call('/fabric/ports/x9000c1r3j16p0'), call().json(),
-             call('/fabric/ports/x9000c1r3j16p1'), call().json(),
-             call('/fabric/ports/x9000c1r3j18p0'), call().json(),
-             call('/fabric/ports/x9000c1r3j18p1'), call().json(),
-             call('/fabric/ports/x9000c3r3j16p0'), call().json(),
-             call('/fabric/ports/x9000c3r3j16p1'), call().json(),
-             call('/fabric/ports/x9000c3r5j16p0'), call().json(),
-             call('/fabric/ports/x9000c3r5j16p1'), call().json()]
+        self.assert_ports_requested(
+            ['/fabric/ports/x9000c1r3j16p0',
+             '/fabric/ports/x9000c1r3j16p1',
+             '/fabric/ports/x9000c1r3j18p0',
+             '/fabric/ports/x9000c1r3j18p1',
+             '/fabric/ports/x9000c3r3j16p0',
+             '/fabric/ports/x9000c3r3j16p1',
+             '/fabric/ports/x9000c3r5j16p0',
+             '/fabric/ports/x9000c3r5j16p1']
         )
 
     def test_jack_not_in_port_list(self):
@@ -482,14 +504,92 @@ class TestGetJackPortDataList(unittest.TestCase):
         mock.patch.stopall()
 
 
+class TestGetPortDataList(unittest.TestCase):
+    """Unit tests for PortManager get_port_data_list() and document caching."""
+
+    def setUp(self):
+        """Mock functions called."""
+        patch_shared_client('sat.cli.swap.ports')
+        mock.patch('sat.cli.swap.ports.CableEndpoints').start()
+        self.mock_fc_client = mock.patch('sat.cli.swap.ports.FabricControllerClient').start().return_value
+
+        self.port_links = [f'/fabric/ports/x1000c0r1j{jack}p0' for jack in range(100, 120)]
+        self.failing_links = {self.port_links[3], self.port_links[15]}
+
+        def fake_get(doc_link):
+            if doc_link in self.failing_links:
+                raise APIError('Service unavailable')
+            response = mock.Mock()
+            response.json.return_value = {
+                'conn_port': doc_link.split('/')[-1],
+                'portPolicyLinks': [EDGE_POLICY_LINK]
+            }
+            return response
+
+        self.mock_fc_client.get.side_effect = fake_get
+        self.pm = PortManager()
+
+    def tearDown(self):
+        mock.patch.stopall()
+
+    def test_get_port_data_list_preserves_order(self):
+        """get_port_data_list() returns port data in the order of the given links"""
+        self.failing_links = set()
+        result = self.pm.get_port_data_list(self.port_links)
+        self.assertEqual([port_data['port_link'] for port_data in result], self.port_links)
+        self.assertEqual(len(self.port_links), self.mock_fc_client.get.call_count)
+
+    def test_get_port_data_list_collects_failures(self):
+        """get_port_data_list() requests every port and logs all failures together"""
+        with self.assertLogs(level=logging.ERROR) as logs_cm:
+            result = self.pm.get_port_data_list(self.port_links)
+
+        self.assertIsNone(result)
+        self.assertEqual(len(self.port_links), self.mock_fc_client.get.call_count)
+        summary = logs_cm.records[-1].message
+        self.assertIn('Failed to get port data for 2 ports', summary)
+        for failing_link in self.failing_links:
+            self.assertIn(failing_link, summary)
+
+    def test_get_port_data_list_empty(self):
+        """get_port_data_list() with no port links returns an empty list"""
+        self.assertEqual([], self.pm.get_port_data_list([]))
+        self.mock_fc_client.get.assert_not_called()
+
+    def test_port_documents_cached(self):
+        """get_port() only requests each port document once"""
+        port_link = self.port_links[0]
+        first = self.pm.get_port(port_link)
+        second = self.pm.get_port(port_link)
+        self.assertEqual(first, second)
+        self.mock_fc_client.get.assert_called_once_with(port_link)
+
+    def test_failed_port_documents_not_cached(self):
+        """get_port() requests a port document again if it previously failed"""
+        port_link = self.port_links[3]
+        with self.assertLogs(level=logging.ERROR):
+            self.assertIsNone(self.pm.get_port(port_link))
+        self.failing_links = set()
+        self.assertIsNotNone(self.pm.get_port(port_link))
+        self.assertEqual(2, self.mock_fc_client.get.call_count)
+
+    def test_switch_documents_cached(self):
+        """get_switch() only requests each switch document once"""
+        switch_link = '/fabric/switches/x1000c0r1b0'
+        self.mock_fc_client.get.side_effect = None
+        self.mock_fc_client.get.return_value.json.return_value = {'edgePortLinks': []}
+        self.pm.get_switch(switch_link)
+        self.pm.get_switch(switch_link)
+        self.mock_fc_client.get.assert_called_once_with(switch_link)
+
+
 class TestCreateOfflinePortPolicy(ExtendedTestCase):
     """Unit test for Switch create_offline_port_policy()."""
 
     def setUp(self):
         """Mock functions called."""
 
-        self.mock_sat_session = mock.Mock()
-        self.mock_fc_client_cls = mock.patch('sat.cli.swap.ports.SATSession').start()
+        patch_shared_client('sat.cli.swap.ports')
 
         self.mock_fc_response = mock.Mock()
         self.mock_fc_response.json.return_value = {}
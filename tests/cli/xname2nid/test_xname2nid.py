@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2021 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2021, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -312,6 +312,31 @@ class TestDoXname2nid(ExtendedTestCase):
         self.mock_hsm_client.get_node_components.assert_called_once_with()
         self.mock_print.assert_called_once_with('nid[001069,001073-001074]')
 
+    def test_node_xname_in_container_xname(self):
+        """Test do_xname2nid with a node xname which is also in a container xname argument."""
+        self.fake_args.xnames = ['x1000c2s2b0n1', 'x1000c2s2b0']
+        self.fake_args.format = 'nid'
+        do_xname2nid(self.fake_args)
+        self.mock_hsm_client.get_node_components.assert_called_once_with()
+        self.mock_print.assert_called_once_with('nid001074,nid001073,nid001074')
+
+    def test_components_reloaded_by_node_lookup(self):
+        """Test that container xnames are matched against components reloaded by a node lookup."""
+        stale_components = [node for node in self.node_data if node['ID'] != 'x1000c2s2b0n1']
+        mock_node_directory = mock.patch('sat.cli.xname2nid.main.NodeDirectory').start().return_value
+        mock_node_directory.get_node_components.return_value = stale_components
+
+        def get_component_by_xname(xname):
+            # A miss in cached data reloads the components
+            mock_node_directory.get_node_components.return_value = self.node_data
+            return next(node for node in self.node_data if node['ID'] == xname)
+
+        mock_node_directory.get_component_by_xname.side_effect = get_component_by_xname
+        self.fake_args.xnames = ['x1000c2s2b0n1', 'x1000c2s2b0']
+        self.fake_args.format = 'nid'
+        do_xname2nid(self.fake_args)
+        self.mock_print.assert_called_once_with('nid001074,nid001073,nid001074')
+
     def test_xname2nid_api_error(self):
         """Test xname2nid logs an error and exits when an APIError occurs."""
         self.mock_hsm_client.get_node_components.side_effect = APIError('HSM failed')
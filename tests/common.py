@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2021, 2023 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2021, 2023, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -26,8 +26,12 @@ A helper subclass of TestCase that implements additional assertions.
 """
 import contextlib
 import copy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import re
+import threading
+import time
 import unittest
+from unittest.mock import MagicMock, patch
 
 from sat.util import deep_update_dict
 
@@ -114,3 +118,122 @@ def config(sections):
         yield
     finally:
         sat.config.CONFIG.sections = _saved
+
+
+def patch_shared_client(module_name):
+    """Patch get_shared_client in a module so that it creates new clients with a mock session.
+
+    The patch is started, so the caller is responsible for stopping it, e.g.
+    with `unittest.mock.patch.stopall`.
+
+    Args:
+        module_name (str): the name of the module which imports get_shared_client.
+
+    Returns:
+        MagicMock: the mock session passed to each client class.
+    """
+    mock_session = MagicMock()
+    patch(f'{module_name}.get_shared_client',
+          side_effect=lambda client_cls, **kwargs: client_cls(mock_session, **kwargs)).start()
+    return mock_session
+
+
+class FakeServer:
+    """An HTTP server on localhost which responds to GET requests in a given way.
+
+    Each request is handled by calling `respond` with the number of the
+    request, starting at 1, which returns a tuple of the number of seconds to
+    wait before responding, the status code and the headers of the response.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.request_count = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.request_count += 1
+                delay, status, headers = server.respond(server.request_count)
+                time.sleep(delay)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self):
+        """str: the URL of a service on the server"""
+        return f'http://127.0.0.1:{self.httpd.server_port}/apis/smd/hsm/v2/State/Components'
+
+    def stop(self):
+        """Stop the server."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# The default size of a paramiko channel's receive window
+WINDOW_SIZE = 2097152
+
+
+class FakeChannel:
+    """A fake paramiko.Channel for a command which writes the given output.
+
+    As with a real channel, the command cannot write more than WINDOW_SIZE
+    bytes that have not been read yet, so it only exits once enough of its
+    output has been read. If `exits` is False, the command never exits.
+    """
+
+    def __init__(self, stdout=b'', stderr=b'', exit_status=0, exits=True):
+        self.unsent = {'stdout': stdout, 'stderr': stderr}
+        self.buffers = {'stdout': b'', 'stderr': b''}
+        self.exit_status = exit_status
+        self.exits = exits
+        self.closed = False
+        self.status_event = threading.Event()
+        self._send()
+
+    def _send(self):
+        """Move as much unsent output into the buffers as the window allows."""
+        for stream in ('stdout', 'stderr'):
+            space = WINDOW_SIZE - len(self.buffers['stdout']) - len(self.buffers['stderr'])
+            self.buffers[stream] += self.unsent[stream][:space]
+            self.unsent[stream] = self.unsent[stream][space:]
+        if self.exits and not any(self.unsent.values()):
+            self.status_event.set()
+
+    def _recv(self, stream, nbytes):
+        data, self.buffers[stream] = self.buffers[stream][:nbytes], self.buffers[stream][nbytes:]
+        self._send()
+        return data
+
+    def recv_ready(self):
+        return bool(self.buffers['stdout'])
+
+    def recv_stderr_ready(self):
+        return bool(self.buffers['stderr'])
+
+    def recv(self, nbytes):
+        return self._recv('stdout', nbytes)
+
+    def recv_stderr(self, nbytes):
+        return self._recv('stderr', nbytes)
+
+    def exit_status_ready(self):
+        return self.status_event.is_set()
+
+    def recv_exit_status(self):
+        self.status_event.wait()
+        return self.exit_status
+
+    def close(self):
+        self.closed = True
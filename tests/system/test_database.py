@@ -0,0 +1,171 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Unit tests for sat.system.database.
+"""
+import os
+import sqlite3
+from tempfile import TemporaryDirectory
+import unittest
+from unittest.mock import patch
+
+from sat.system.database import (
+    InventoryDatabaseError,
+    export_inventory,
+    iter_database_inventory,
+)
+from sat.system.memory_module import MemoryModule
+from sat.system.node import Node
+from sat.system.processor import Processor
+from sat.system.system import System
+from sat.xname import XName
+from tests.system.component_data import get_component_raw_data
+
+
+class TestInventoryDatabase(unittest.TestCase):
+    """Tests for exporting and reading the hardware inventory database."""
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'hwinv.db')
+        self.node = get_component_raw_data('Node', 'x1000c0s0b0n0', model='EX425')
+        self.processor = get_component_raw_data('Processor', 'x1000c0s0b0n0p0', model='AMD EPYC')
+        self.memory = get_component_raw_data('Memory', 'x1000c0s0b0n0d0', serial_number='MEM0')
+        self.empty_memory = dict(get_component_raw_data('Memory', 'x1000c0s0b0n0d1'), Status='Empty')
+        self.unknown = get_component_raw_data('Unknown', 'x1000c0s0b0n0z0')
+        self.raw_components = [self.node, self.processor, self.memory, self.empty_memory, self.unknown]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def query(self, sql):
+        """Run a query against the exported database."""
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(sql).fetchall()
+        finally:
+            connection.close()
+
+    def test_export_and_read(self):
+        """Test that populated components of known types are read back from the database"""
+        count = export_inventory(iter(self.raw_components), self.path)
+        self.assertEqual(3, count)
+        self.assertCountEqual([self.node, self.processor, self.memory],
+                              list(iter_database_inventory(self.path)))
+
+    def test_export_columns(self):
+        """Test that the indexed columns are extracted from the raw data"""
+        export_inventory(self.raw_components, self.path)
+        self.assertEqual([('x1000c0s0b0n0', 'Node', 'Node.BQWT83500291', 'EX425')],
+                         self.query('SELECT xname, type, fru_id, model FROM nodes'))
+        self.assertEqual([('x1000c0s0b0n0d0', 'MEM0')],
+                         self.query('SELECT xname, serial_number FROM memory'))
+
+    def test_export_node_xname(self):
+        """Test that node components can be joined to their parent nodes"""
+        export_inventory(self.raw_components, self.path)
+        self.assertEqual([(None,)], self.query('SELECT node_xname FROM nodes'))
+        self.assertEqual(
+            [('x1000c0s0b0n0', 'EX425', 'x1000c0s0b0n0d0', 'x1000c0s0b0n0p0')],
+            self.query('SELECT nodes.xname, nodes.model, memory.xname, processors.xname FROM nodes '
+                       'JOIN memory ON memory.node_xname = nodes.xname '
+                       'JOIN processors ON processors.node_xname = nodes.xname')
+        )
+
+    def test_export_indexes(self):
+        """Test that the type, node xname, FRU ID and model columns are indexed"""
+        export_inventory(self.raw_components, self.path)
+        index_names = {name for (name,) in self.query("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({'processors_type', 'processors_node_xname', 'processors_fru_id',
+                         'processors_model'} <= index_names)
+
+    def test_export_in_batches(self):
+        """Test that components are exported in several batches"""
+        raw_components = (get_component_raw_data('Processor', f'x1000c0s0b0n{index}p0', serial_number=str(index))
+                          for index in range(25))
+        with patch('sat.system.database.INSERT_BATCH_SIZE', 10):
+            self.assertEqual(25, export_inventory(raw_components, self.path))
+        self.assertEqual([(25,)], self.query('SELECT COUNT(*) FROM processors'))
+
+    def test_failed_export_keeps_existing_database(self):
+        """Test that a failed export leaves an existing database in place"""
+        export_inventory(self.raw_components, self.path)
+
+        def failing_components():
+            yield self.node
+            raise ValueError('Truncated response')
+
+        with self.assertRaises(ValueError):
+            export_inventory(failing_components(), self.path)
+
+        self.assertEqual(['hwinv.db'], os.listdir(self.temp_dir.name))
+        self.assertEqual(3, len(list(iter_database_inventory(self.path))))
+
+    def test_read_component_types(self):
+        """Test that only the requested component types are read"""
+        export_inventory(self.raw_components, self.path)
+        self.assertCountEqual([self.processor, self.memory],
+                              list(iter_database_inventory(self.path, [Processor, MemoryModule])))
+
+    def test_system_from_database(self):
+        """Test that a System can be created from the database"""
+        export_inventory(self.raw_components, self.path)
+        system = System(iter_database_inventory(self.path))
+        system.parse_all()
+        node = system.components_by_type[Node][XName('x1000c0s0b0n0')]
+        self.assertEqual(1, len(node.processors))
+        self.assertEqual(1, len(node.memory_modules))
+
+    def test_read_path_with_uri_characters(self):
+        """Test reading a database whose path contains characters which are special in URIs"""
+        path = os.path.join(self.temp_dir.name, 'a#1?x=%20.db')
+        export_inventory(self.raw_components, path)
+        self.assertEqual(3, len(list(iter_database_inventory(path))))
+        self.assertEqual(['a#1?x=%20.db'], os.listdir(self.temp_dir.name))
+
+    def test_read_nonexistent_database(self):
+        """Test reading a database which does not exist"""
+        with self.assertRaisesRegex(InventoryDatabaseError, 'does not exist'):
+            list(iter_database_inventory(self.path))
+
+    def test_read_unsupported_version(self):
+        """Test reading a database with an unsupported schema version"""
+        export_inventory(self.raw_components, self.path)
+        connection = sqlite3.connect(self.path)
+        with connection:
+            connection.execute("UPDATE metadata SET value = '0' WHERE key = 'schema_version'")
+        connection.close()
+        with self.assertRaisesRegex(InventoryDatabaseError, 'unsupported schema version'):
+            list(iter_database_inventory(self.path))
+
+    def test_read_invalid_database(self):
+        """Test reading a file which is not a database"""
+        with open(self.path, 'w') as f:
+            f.write('not a database')
+        with self.assertRaisesRegex(InventoryDatabaseError, 'Unable to read'):
+            list(iter_database_inventory(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2020 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2020, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,18 +25,164 @@
 Unit tests for sat.system.system.
 """
 
+import json
 import unittest
+from unittest.mock import MagicMock
 
-import sat.system.system
+from requests.exceptions import ChunkedEncodingError
+
+from sat.apiclient import APIError
+from sat.system.chassis import Chassis
+from sat.system.drive import Drive
+from sat.system.memory_module import MemoryModule
+from sat.system.node import Node
+from sat.system.node_hsn_nic import NodeHsnNic
+from sat.system.processor import Processor
+from sat.system.router_bmc import RouterBMC
+from sat.system.system import (
+    COMPONENT_TYPES,
+    System,
+    get_required_component_types,
+    iter_hardware_inventory,
+)
+from sat.xname import XName
+
+
+def get_raw_component(xname, hsm_type, status='Populated'):
+    """Get minimal raw HSM data for a component."""
+    return {'ID': xname, 'Type': hsm_type, 'Status': status}
 
 
-# TODO: Add actual tests of code in sat.system.system. See SAT-223.
-# Having this test file that imports sat.system.system forces the coverage
-# module to report coverage on that file.
 class TestSystem(unittest.TestCase):
+    """Tests for the System class."""
+
+    def setUp(self):
+        self.raw_data = [
+            get_raw_component('x1000c0', 'Chassis'),
+            get_raw_component('x1000c0s0b0n0', 'Node'),
+            get_raw_component('x1000c0s0b0n0p0', 'Processor'),
+            get_raw_component('x1000c0s0b0n0d0', 'Memory'),
+            get_raw_component('x1000c0s0b0n0d1', 'Memory', status='Empty'),
+            get_raw_component('x1000c0s0b0n0g0k0', 'Drive'),
+            get_raw_component('x1000c0r0b0', 'RouterBMC'),
+        ]
+
+    def test_all_component_types(self):
+        """Test that all components are kept by default"""
+        system = System(self.raw_data)
+        self.assertEqual(
+            {'Chassis': 1, 'Node': 1, 'Processor': 1, 'Memory': 1, 'Drive': 1, 'RouterBMC': 1},
+            {hsm_type: len(comps) for hsm_type, comps in system.raw_data_by_type.items()}
+        )
+
+    def test_component_types_filtered(self):
+        """Test that components of types which are not requested are discarded"""
+        system = System(iter(self.raw_data), {Node, Processor})
+        self.assertEqual({'Node', 'Processor'}, set(system.raw_data_by_type))
+        system.parse_all()
+        self.assertEqual(list(COMPONENT_TYPES), list(system.components_by_type))
+        node = system.components_by_type[Node][XName('x1000c0s0b0n0')]
+        self.assertEqual(1, node.processor_count)
+        self.assertEqual({}, system.components_by_type[RouterBMC])
+
+    def test_node_children_without_nodes(self):
+        """Test that listing only node children does not warn about missing parent nodes"""
+        system = System(iter(self.raw_data), {Processor})
+        with self.assertRaises(AssertionError):
+            with self.assertLogs('sat.system.system', level='WARNING'):
+                system.parse_all()
+        self.assertEqual([XName('x1000c0s0b0n0p0')], list(system.components_by_type[Processor]))
+
+    def test_parse_all_relates_nodes(self):
+        """Test that nodes are related to their children and chassis"""
+        system = System(self.raw_data)
+        system.parse_all()
+        node = system.components_by_type[Node][XName('x1000c0s0b0n0')]
+        self.assertEqual(1, node.processor_count)
+        self.assertEqual(1, node.memory_module_count)
+        self.assertEqual(1, node.drive_count)
+        self.assertIs(system.components_by_type[Chassis][XName('x1000c0')], node.chassis)
+
+
+class TestGetRequiredComponentTypes(unittest.TestCase):
+    """Tests for the get_required_component_types function."""
+
+    def test_no_node(self):
+        """Test that only the requested types are required when nodes are not requested"""
+        self.assertEqual({Processor, RouterBMC},
+                         get_required_component_types([Processor, RouterBMC]))
+
+    def test_node(self):
+        """Test that node children and chassis are required when nodes are requested"""
+        required_types = get_required_component_types([Node])
+        self.assertTrue({Node, Chassis, Processor, MemoryModule, Drive, NodeHsnNic} <= required_types)
+        self.assertNotIn(RouterBMC, required_types)
+
+
+class TestIterHardwareInventory(unittest.TestCase):
+    """Tests for the iter_hardware_inventory function."""
+
+    def setUp(self):
+        self.components = [get_raw_component(f'x1000c0s0b0n{i}', 'Node') for i in range(10)]
+        self.mock_response = MagicMock()
+        body = json.dumps(self.components).encode()
+        self.mock_response.iter_content.return_value = [body[i:i + 16] for i in range(0, len(body), 16)]
+        self.mock_client = MagicMock()
+        self.mock_client.stream.return_value = self.mock_response
+
+    def test_iter_hardware_inventory(self):
+        """Test iterating over the components in a streamed response"""
+        self.assertEqual(self.components, list(iter_hardware_inventory(self.mock_client)))
+        self.mock_client.stream.assert_called_once_with('Inventory', 'Hardware', params=None)
+        self.mock_response.close.assert_called_once_with()
+
+    def test_iter_hardware_inventory_all_types(self):
+        """Test that a single query is made when all component types are needed"""
+        list(iter_hardware_inventory(self.mock_client, COMPONENT_TYPES))
+        self.mock_client.stream.assert_called_once_with('Inventory', 'Hardware', params=None)
+
+    def test_iter_hardware_inventory_by_type(self):
+        """Test that HSM is queried separately for each needed component type"""
+        components_by_type = {
+            hsm_type: [get_raw_component(f'x1000c0s0b0n0{suffix}', hsm_type)]
+            for hsm_type, suffix in [('Node', ''), ('Processor', 'p0'), ('Memory', 'd0')]
+        }
+
+        def stream(*args, params=None):
+            response = MagicMock()
+            response.iter_content.return_value = [json.dumps(components_by_type[params['type']])]
+            return response
+
+        self.mock_client.stream.side_effect = stream
+        components = list(iter_hardware_inventory(self.mock_client, [Node, Processor, MemoryModule]))
+
+        self.assertCountEqual(
+            [comp for type_comps in components_by_type.values() for comp in type_comps],
+            components
+        )
+        self.assertEqual(
+            {'Node', 'Processor', 'Memory'},
+            {call.kwargs['params']['type'] for call in self.mock_client.stream.mock_calls}
+        )
+
+    def test_iter_hardware_inventory_by_type_error(self):
+        """Test that a failed query for one component type raises an APIError"""
+        self.mock_client.stream.side_effect = APIError('HSM unavailable')
+        with self.assertRaisesRegex(APIError, 'HSM unavailable'):
+            list(iter_hardware_inventory(self.mock_client, [Processor, MemoryModule]))
+
+    def test_iter_hardware_inventory_read_error(self):
+        """Test that an error reading the streamed response raises an APIError"""
+        self.mock_response.iter_content.side_effect = ChunkedEncodingError('connection broken')
+        with self.assertRaisesRegex(APIError, 'connection broken'):
+            list(iter_hardware_inventory(self.mock_client))
+        self.mock_response.close.assert_called_once_with()
 
-    def test_something(self):
-        self.assertTrue(True)
+    def test_iter_hardware_inventory_invalid_json(self):
+        """Test that an invalid response raises a ValueError"""
+        self.mock_response.iter_content.return_value = [b'{"not": "a list"}']
+        with self.assertRaises(ValueError):
+            list(iter_hardware_inventory(self.mock_client))
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2022, 2024-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2022, 2024-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,6 +25,7 @@
 Unit tests for sat.config
 """
 
+from argparse import Namespace
 from collections import OrderedDict
 import os
 from textwrap import dedent
@@ -40,6 +41,7 @@ from sat.config import (
     SATConfig,
     SAT_CONFIG_SPEC,
     _option_value,
+    command_line_overrides,
     generate_default_config,
     get_config_value,
     load_config,
@@ -341,6 +343,35 @@ class TestGetConfigValue(unittest.TestCase):
         self.assertEqual(expected_value, option_value)
 
 
+class TestCommandLineOverrides(unittest.TestCase):
+    """Tests for the command_line_overrides context manager."""
+
+    def setUp(self):
+        load_config()
+
+    def test_overrides_restored(self):
+        """Test that options given on a command line apply only within the context"""
+        original_no_headings = get_config_value('format.no_headings')
+        original_username = get_config_value('api_gateway.username')
+        args = Namespace(no_headings=not original_no_headings, username=None)
+
+        with mock.patch('sat.config.SATConfig') as mock_sat_config_cls:
+            with command_line_overrides(args):
+                self.assertEqual(not original_no_headings, get_config_value('format.no_headings'))
+                self.assertEqual(original_username, get_config_value('api_gateway.username'))
+        mock_sat_config_cls.assert_not_called()
+
+        self.assertEqual(original_no_headings, get_config_value('format.no_headings'))
+
+    def test_overrides_restored_after_exception(self):
+        """Test that the config is restored when the context exits with an exception"""
+        original_no_borders = get_config_value('format.no_borders')
+        with self.assertRaises(SystemExit):
+            with command_line_overrides(Namespace(no_borders=not original_no_borders)):
+                raise SystemExit(1)
+        self.assertEqual(original_no_borders, get_config_value('format.no_borders'))
+
+
 class TestGetConfigValueFromFile(unittest.TestCase):
 
     def setUp(self):
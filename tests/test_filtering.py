@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2021, 2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2021, 2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -362,6 +362,48 @@ class TestParseMultipleStrings(unittest.TestCase):
         self.assertIn(custom_filter, combined_filter.filter_fns)
 
 
+class TestGetRequiredEqualities(unittest.TestCase):
+    """Test the get_required_equalities function."""
+
+    def setUp(self):
+        self.fields = ['xname', 'State', 'Role', 'SubRole', 'NID']
+
+    def get_equalities(self, *query_strings):
+        """Parse the given query strings and get their required equalities."""
+        return filtering.get_required_equalities(
+            filtering.parse_multiple_query_strings(list(query_strings), self.fields)
+        )
+
+    def test_single_equality(self):
+        """Test getting the equality from a single comparison."""
+        self.assertEqual([('Role', 'Compute')], self.get_equalities('role=Compute'))
+
+    def test_and_equalities(self):
+        """Test getting the equalities combined with "and" and across filter strings."""
+        self.assertEqual([('State', 'Ready'), ('Role', 'Compute'), ('SubRole', 'UAN')],
+                         self.get_equalities('state=Ready and role=Compute', 'subrole=UAN'))
+
+    def test_or_equalities(self):
+        """Test that comparisons beneath an "or" are not required."""
+        self.assertEqual([], self.get_equalities('state=Ready and role=Compute or role=Application'))
+        self.assertEqual([('State', 'Ready')],
+                         self.get_equalities('state=Ready', 'role=Compute or role=Application'))
+
+    def test_non_equalities(self):
+        """Test that other comparators, numbers, and wildcards are not required equalities."""
+        for query_string in ['state!=Ready', 'nid=5', 'nid>5', 'role=Comp*', 'role=Compute?', 'role=[CA]*']:
+            with self.subTest(query_string=query_string):
+                self.assertEqual([], self.get_equalities(query_string))
+
+    def test_abbreviated_query_key(self):
+        """Test that abbreviated query keys are not required equalities."""
+        self.assertEqual([], self.get_equalities('sub=UAN'))
+
+    def test_no_filter(self):
+        """Test getting the required equalities of no filter."""
+        self.assertEqual([], filtering.get_required_equalities(None))
+
+
 class TestRemoveConstantValues(unittest.TestCase):
     """Test the remove_constant_values function."""
 
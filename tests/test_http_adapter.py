@@ -0,0 +1,499 @@
+#
+# MIT License
+#
+# (C) Copyright 2023-2024, 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Tests for the HTTPAdapter which applies request policies.
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from requests import Request, Session
+from requests.exceptions import ConnectionError, RetryError
+from urllib3.util.retry import Retry
+
+from sat.http_adapter import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    LatencyTracker,
+    RequestPolicyAdapter,
+    TokenBucket,
+    get_retry_after,
+    get_service_name,
+)
+from tests.common import FakeServer
+
+URL = 'https://api-gw-service-nmn.local/apis/smd/hsm/v2/State/Components'
+
+
+def get_request(method='GET', url=URL):
+    """Get a PreparedRequest with the given method and URL."""
+    return Request(method, url).prepare()
+
+
+def get_response(status_code=200, headers=None):
+    """Get a mock response with the given status code and headers."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestGetServiceName(unittest.TestCase):
+    """Tests for the get_service_name function."""
+
+    def test_get_service_name(self):
+        """Test getting the service name from an API gateway URL"""
+        self.assertEqual('smd', get_service_name(URL))
+
+    def test_get_service_name_other_url(self):
+        """Test getting the service name from a URL not under 'apis/'"""
+        self.assertEqual('keycloak/realms',
+                         get_service_name('https://api-gw-service-nmn.local/keycloak/realms'))
+
+
+class TestLatencyTracker(unittest.TestCase):
+    """Tests for the LatencyTracker class."""
+
+    def test_percentile(self):
+        """Test computing a percentile of recorded latencies"""
+        tracker = LatencyTracker()
+        for latency in range(1, 101):
+            tracker.record(latency / 100)
+        self.assertEqual(0.95, tracker.percentile(95))
+        self.assertEqual(0.5, tracker.percentile(50))
+        self.assertEqual(1.0, tracker.percentile(100))
+
+    def test_percentile_too_few_samples(self):
+        """Test that no percentile is computed before enough latencies are recorded"""
+        tracker = LatencyTracker()
+        for _ in range(5):
+            tracker.record(1)
+        self.assertIsNone(tracker.percentile(95, min_samples=10))
+
+    def test_only_recent_latencies_kept(self):
+        """Test that only the most recent latencies are used"""
+        tracker = LatencyTracker(size=10)
+        for _ in range(10):
+            tracker.record(100)
+        for _ in range(10):
+            tracker.record(1)
+        self.assertEqual(1, tracker.percentile(100))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for the CircuitBreaker class."""
+
+    def setUp(self):
+        self.mock_monotonic = patch('sat.http_adapter.time.monotonic', return_value=0).start()
+        self.circuit_breaker = CircuitBreaker('smd', failure_threshold=3, reset_timeout=30)
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_closed_below_threshold(self):
+        """Test that the circuit stays closed below the failure threshold"""
+        for _ in range(2):
+            self.circuit_breaker.record_failure()
+        self.circuit_breaker.check()
+
+    def test_success_resets_failures(self):
+        """Test that a success resets the count of consecutive failures"""
+        for _ in range(2):
+            self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_success()
+        for _ in range(2):
+            self.circuit_breaker.record_failure()
+        self.circuit_breaker.check()
+
+    def test_opens_at_threshold(self):
+        """Test that the circuit opens at the failure threshold"""
+        for _ in range(3):
+            self.circuit_breaker.record_failure()
+        with self.assertRaisesRegex(CircuitOpenError, 'service smd after 3 consecutive failures'):
+            self.circuit_breaker.check()
+
+    def test_allows_requests_after_reset_timeout(self):
+        """Test that requests are allowed after the reset timeout"""
+        for _ in range(3):
+            self.circuit_breaker.record_failure()
+        self.mock_monotonic.return_value = 31
+        self.circuit_breaker.check()
+
+    def test_reopens_on_failure_after_reset_timeout(self):
+        """Test that a failure after the reset timeout opens the circuit again"""
+        for _ in range(3):
+            self.circuit_breaker.record_failure()
+        self.mock_monotonic.return_value = 31
+        self.circuit_breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            self.circuit_breaker.check()
+
+
+class TestGetRetryAfter(unittest.TestCase):
+    """Tests for the get_retry_after function."""
+
+    def test_retry_after_seconds(self):
+        """Test getting a Retry-After header given in seconds"""
+        self.assertEqual(5, get_retry_after(get_response(429, {'Retry-After': '5'})))
+
+    def test_retry_after_date(self):
+        """Test getting a Retry-After header given as an HTTP date"""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        response = get_response(503, {'Retry-After': format_datetime(retry_at, usegmt=True)})
+        self.assertAlmostEqual(60, get_retry_after(response), delta=2)
+
+    def test_retry_after_past_date(self):
+        """Test that a Retry-After date in the past gives no wait"""
+        response = get_response(503, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        self.assertEqual(0, get_retry_after(response))
+
+    def test_retry_after_invalid(self):
+        """Test that an invalid Retry-After header is ignored"""
+        self.assertIsNone(get_retry_after(get_response(429, {'Retry-After': 'soon'})))
+
+    def test_retry_after_missing(self):
+        """Test a 429 response without a Retry-After header"""
+        self.assertIsNone(get_retry_after(get_response(429)))
+
+    def test_retry_after_other_status(self):
+        """Test that Retry-After is ignored for statuses other than 429 and 503"""
+        self.assertIsNone(get_retry_after(get_response(301, {'Retry-After': '5'})))
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for the TokenBucket class."""
+
+    def setUp(self):
+        self.now = 0
+        patch('sat.http_adapter.time.monotonic', side_effect=lambda: self.now).start()
+        self.mock_sleep = patch('sat.http_adapter.time.sleep', side_effect=self.advance).start()
+        self.bucket = TokenBucket('smd', rate=2, capacity=3)
+
+    def tearDown(self):
+        patch.stopall()
+
+    def advance(self, seconds):
+        """Advance the mock clock."""
+        self.now += seconds
+
+    def test_burst_without_waiting(self):
+        """Test that a burst up to the capacity is allowed without waiting"""
+        for _ in range(3):
+            self.bucket.acquire()
+        self.mock_sleep.assert_not_called()
+
+    def test_wait_when_empty(self):
+        """Test that acquiring from an empty bucket waits for a token"""
+        for _ in range(4):
+            self.bucket.acquire()
+        self.mock_sleep.assert_called_once_with(0.5)
+        self.assertEqual(0.5, self.now)
+
+    def test_rate_sustained(self):
+        """Test that the sustained request rate is limited to the rate"""
+        for _ in range(23):
+            self.bucket.acquire()
+        self.assertEqual(10, self.now)
+
+    def test_try_acquire(self):
+        """Test that try_acquire does not wait for a token"""
+        for _ in range(3):
+            self.assertTrue(self.bucket.try_acquire())
+        self.assertFalse(self.bucket.try_acquire())
+        self.mock_sleep.assert_not_called()
+
+    def test_pause(self):
+        """Test that no tokens are given out while paused"""
+        self.bucket.pause(10)
+        self.assertFalse(self.bucket.try_acquire())
+        self.bucket.acquire()
+        self.assertEqual(10, self.now)
+
+    def test_queue_depth_logged(self):
+        """Test that the number of queued requests is logged while waiting"""
+        self.bucket.tokens = 0
+        self.bucket.queue_depth = 2
+        with self.assertLogs('sat.http_adapter', level='DEBUG') as logs:
+            self.bucket.acquire()
+        self.assertIn('service smd with 3 request(s) queued', logs.output[0])
+        self.assertEqual(2, self.bucket.queue_depth)
+
+
+class TestRequestPolicyAdapter(unittest.TestCase):
+    """Tests for the RequestPolicyAdapter class."""
+
+    def setUp(self):
+        self.mock_send = patch('sat.http_adapter.HTTPAdapter.send').start()
+        self.mock_send.return_value = get_response()
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_send_no_policies(self):
+        """Test that requests are passed through when no policies are enabled"""
+        adapter = RequestPolicyAdapter()
+        request = get_request()
+        response = adapter.send(request, timeout=60)
+        self.assertEqual(self.mock_send.return_value, response)
+        self.mock_send.assert_called_once_with(request, stream=False, timeout=60)
+
+    def test_send_non_idempotent(self):
+        """Test that policies do not apply to non-idempotent requests"""
+        adapter = RequestPolicyAdapter(deadline=10, circuit_breaker_failures=1)
+        adapter.deadline = time.monotonic() - 1
+        self.mock_send.side_effect = ConnectionError
+        for _ in range(3):
+            with self.assertRaises(ConnectionError):
+                adapter.send(get_request('POST'), timeout=60)
+        self.assertEqual(3, self.mock_send.call_count)
+
+    def test_deadline_shortens_timeout(self):
+        """Test that the request timeout is shortened to end at the deadline"""
+        adapter = RequestPolicyAdapter(deadline=10)
+        adapter.send(get_request(), timeout=60)
+        self.assertLessEqual(self.mock_send.call_args.kwargs['timeout'], 10)
+
+    def test_deadline_shortens_tuple_timeout(self):
+        """Test that connect and read timeouts are both shortened to end at the deadline"""
+        adapter = RequestPolicyAdapter(deadline=10)
+        adapter.send(get_request(), timeout=(5, None))
+        connect_timeout, read_timeout = self.mock_send.call_args.kwargs['timeout']
+        self.assertEqual(5, connect_timeout)
+        self.assertLessEqual(read_timeout, 10)
+
+    def test_deadline_exceeded(self):
+        """Test that requests fail immediately once the deadline has passed"""
+        adapter = RequestPolicyAdapter(deadline=10)
+        adapter.deadline = time.monotonic() - 1
+        with self.assertRaises(DeadlineExceededError):
+            adapter.send(get_request(), timeout=60)
+        self.mock_send.assert_not_called()
+
+    def test_reset_deadline(self):
+        """Test that resetting the deadline allows requests again for the full deadline"""
+        with patch('sat.http_adapter.time.monotonic', return_value=100.0) as mock_monotonic:
+            adapter = RequestPolicyAdapter(deadline=10)
+            mock_monotonic.return_value = 111.0
+            with self.assertRaises(DeadlineExceededError):
+                adapter.send(get_request(), timeout=60)
+
+            adapter.reset_deadline()
+            adapter.send(get_request(), timeout=60)
+        self.assertEqual(121.0, adapter.deadline)
+        self.assertEqual(10, self.mock_send.call_args.kwargs['timeout'])
+
+    def test_reset_no_deadline(self):
+        """Test that resetting the deadline does nothing when there is no deadline"""
+        adapter = RequestPolicyAdapter()
+        adapter.reset_deadline()
+        self.assertIsNone(adapter.deadline)
+
+    def test_circuit_breaker_opens(self):
+        """Test that requests to a failing service fail fast"""
+        adapter = RequestPolicyAdapter(circuit_breaker_failures=2)
+        self.mock_send.side_effect = ConnectionError
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                adapter.send(get_request())
+        with self.assertRaises(CircuitOpenError):
+            adapter.send(get_request())
+        self.assertEqual(2, self.mock_send.call_count)
+
+    def test_circuit_breaker_server_errors(self):
+        """Test that server error responses count as failures"""
+        adapter = RequestPolicyAdapter(circuit_breaker_failures=2)
+        self.mock_send.return_value = get_response(503)
+        for _ in range(2):
+            adapter.send(get_request())
+        with self.assertRaises(CircuitOpenError):
+            adapter.send(get_request())
+
+    def test_circuit_breaker_per_service(self):
+        """Test that an open circuit for one service does not affect other services"""
+        adapter = RequestPolicyAdapter(circuit_breaker_failures=1)
+        self.mock_send.side_effect = [ConnectionError, get_response()]
+        with self.assertRaises(ConnectionError):
+            adapter.send(get_request())
+        other_url = 'https://api-gw-service-nmn.local/apis/power-control/v1/power-status'
+        adapter.send(get_request(url=other_url))
+
+    def prime_latencies(self, adapter, latency=0.01, count=20):
+        """Record latencies for requests to the service of URL."""
+        tracker = adapter._get_latency_tracker('smd')
+        for _ in range(count):
+            tracker.record(latency)
+
+    def test_no_hedge_without_samples(self):
+        """Test that requests are not hedged before enough latencies are recorded"""
+        adapter = RequestPolicyAdapter(hedge_percentile=95)
+        adapter.send(get_request())
+        self.mock_send.assert_called_once()
+        self.assertIsNone(adapter._executor)
+
+    def test_hedge_slow_request(self):
+        """Test that a slow request is hedged and the faster response is used"""
+        adapter = RequestPolicyAdapter(hedge_percentile=95)
+        self.prime_latencies(adapter)
+        slow_response = get_response()
+        fast_response = get_response()
+        release_slow = threading.Event()
+
+        def send(request, **kwargs):
+            if self.mock_send.call_count == 1:
+                release_slow.wait(5)
+                return slow_response
+            return fast_response
+
+        self.mock_send.side_effect = send
+        response = adapter.send(get_request())
+        release_slow.set()
+        adapter.close()
+
+        self.assertIs(fast_response, response)
+        self.assertEqual(2, self.mock_send.call_count)
+
+    def test_hedge_not_sent_for_fast_request(self):
+        """Test that a request completing within the threshold is not hedged"""
+        adapter = RequestPolicyAdapter(hedge_percentile=95)
+        self.prime_latencies(adapter, latency=5)
+        response = adapter.send(get_request())
+        self.assertIs(self.mock_send.return_value, response)
+        self.mock_send.assert_called_once()
+
+    def test_hedge_not_sent_for_stream(self):
+        """Test that streamed requests are not hedged"""
+        adapter = RequestPolicyAdapter(hedge_percentile=95)
+        self.prime_latencies(adapter)
+        adapter.send(get_request(), stream=True)
+        self.mock_send.assert_called_once()
+        self.assertIsNone(adapter._executor)
+
+    def test_hedge_both_fail(self):
+        """Test that an error is raised when the original and hedged requests fail"""
+        adapter = RequestPolicyAdapter(hedge_percentile=95)
+        self.prime_latencies(adapter, latency=0.001)
+
+        def send(request, **kwargs):
+            time.sleep(0.05)
+            raise ConnectionError('failed')
+
+        self.mock_send.side_effect = send
+        with self.assertRaisesRegex(ConnectionError, 'failed'):
+            adapter.send(get_request())
+        self.assertEqual(2, self.mock_send.call_count)
+
+    def test_rate_limit_applies_to_all_methods(self):
+        """Test that rate limiting applies to non-idempotent requests"""
+        adapter = RequestPolicyAdapter(rate_limit=1, rate_limit_burst=1)
+        with patch('sat.http_adapter.TokenBucket.acquire') as mock_acquire:
+            adapter.send(get_request('POST'))
+            adapter.send(get_request())
+        self.assertEqual(2, mock_acquire.call_count)
+
+    def test_rate_limit_per_service(self):
+        """Test that each service has its own rate limit"""
+        adapter = RequestPolicyAdapter(rate_limit=1, rate_limit_burst=1)
+        adapter.send(get_request())
+        other_url = 'https://api-gw-service-nmn.local/apis/power-control/v1/power-status'
+        adapter.send(get_request(url=other_url))
+        self.assertEqual({'smd', 'power-control'}, set(adapter._token_buckets))
+
+    def test_rate_limit_retry_after(self):
+        """Test that a Retry-After header pauses requests to the service"""
+        adapter = RequestPolicyAdapter(rate_limit=10, rate_limit_burst=10)
+        self.mock_send.return_value = get_response(429, {'Retry-After': '30'})
+        with patch('sat.http_adapter.TokenBucket.pause') as mock_pause:
+            response = adapter.send(get_request())
+        self.assertEqual(429, response.status_code)
+        mock_pause.assert_called_once_with(30)
+
+    def test_hedge_not_sent_when_rate_limited(self):
+        """Test that a hedged request is not sent if it would exceed the rate limit"""
+        adapter = RequestPolicyAdapter(hedge_percentile=95, rate_limit=0.001, rate_limit_burst=1)
+        self.prime_latencies(adapter)
+
+        def send(request, **kwargs):
+            time.sleep(0.1)
+            return get_response()
+
+        self.mock_send.side_effect = send
+        adapter.send(get_request())
+        self.mock_send.assert_called_once()
+
+
+class TestRequestPolicyAdapterRetries(unittest.TestCase):
+    """Tests for retries by the RequestPolicyAdapter through a real server and Retry."""
+
+    def get_session(self, respond, retries, **kwargs):
+        """Get a requests Session with a RequestPolicyAdapter and a server which responds with `respond`."""
+        self.server = FakeServer(respond)
+        self.addCleanup(self.server.stop)
+        session = Session()
+        session.mount('http://', RequestPolicyAdapter(max_retries=retries, **kwargs))
+        self.addCleanup(session.close)
+        return session
+
+    def test_retries_server_errors(self):
+        """Test that responses with retried statuses are retried"""
+        session = self.get_session(lambda count: (0, 503 if count < 3 else 200, {}),
+                                   Retry(total=3, status_forcelist=range(500, 601)))
+        self.assertEqual(200, session.get(self.server.url).status_code)
+        self.assertEqual(3, self.server.request_count)
+
+    def test_retries_exhausted(self):
+        """Test that a RetryError is raised when retries are exhausted by server errors"""
+        session = self.get_session(lambda count: (0, 500, {}),
+                                   Retry(total=2, status_forcelist=range(500, 601)))
+        with self.assertRaises(RetryError):
+            session.get(self.server.url)
+        self.assertEqual(3, self.server.request_count)
+
+    def test_deadline_covers_slow_retries(self):
+        """Test that retries of requests to a slow server do not run past the deadline"""
+        session = self.get_session(lambda count: (1.5, 200, {}),
+                                   Retry(total=3, status_forcelist=range(500, 601)), deadline=1)
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            session.get(self.server.url, timeout=60)
+        self.assertLess(time.monotonic() - start, 1.4)
+        self.assertEqual(1, self.server.request_count)
+
+    def test_deadline_covers_backoff(self):
+        """Test that retries of server errors with backoff do not run past the deadline"""
+        session = self.get_session(lambda count: (0, 503, {}),
+                                   Retry(total=10, backoff_factor=0.2, status_forcelist=range(500, 601)),
+                                   deadline=1)
+        start = time.monotonic()
+        with self.assertRaisesRegex(DeadlineExceededError, 'failed with status 503'):
+            session.get(self.server.url, timeout=60)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertGreater(self.server.request_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
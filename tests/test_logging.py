@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2020, 2023-2025 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2020, 2023-2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -23,13 +23,22 @@
 #
 """ Unit tests for sat.logging
 """
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 import logging
 import os
+import time
 import unittest
 from unittest import mock
 
-from sat.logging import LineSplittingFormatter, bootstrap_logging, configure_logging
+import sat.logging
+from sat.logging import (
+    LineSplittingFormatter,
+    LogFileQueueHandler,
+    bootstrap_logging,
+    configure_logging,
+    stop_log_file_listener,
+)
 
 
 class MockHandler(logging.Handler):
@@ -44,6 +53,15 @@ class MockHandler(logging.Handler):
         self.messages.append(self.format(record))
 
 
+class SlowMockHandler(MockHandler):
+    """Handler which takes a fixed amount of time to handle each record, like a slow disk"""
+    EMIT_DELAY = 0.01
+
+    def emit(self, record):
+        time.sleep(self.EMIT_DELAY)
+        super().emit(record)
+
+
 class TestLineSplittingFormatter(unittest.TestCase):
     def setUp(self):
         fmt = '%(levelname)s: %(message)s'  # Omit time since that complicates testing
@@ -145,13 +163,17 @@ class TestLogging(unittest.TestCase):
         that may have been added by the tests to ensure a clean slate for tests.
         """
         mock.patch.stopall()
+        stop_log_file_listener()
         self.logger.handlers = []
+        self.csm_api_logger.handlers = []
+        self.urllib3_logger.handlers = []
 
     def assert_configured_handlers(self):
         """Gets the handlers configured on self.logger.
 
         Makes assertions that there is one handler of type StreamHandler and
-        one of type FileHandler on self.logger.
+        one of type LogFileQueueHandler on self.logger, and that the queue is
+        handled by a listener with one handler of type FileHandler.
 
         Returns:
             A tuple of stream_handler, file_handler
@@ -161,16 +183,22 @@ class TestLogging(unittest.TestCase):
         """
         self.assertEqual(len(self.logger.handlers), 2)
         stream_handler = None
-        file_handler = None
+        queue_handler = None
         for handler in self.logger.handlers:
-            # Note that FileHandler is a subclass of StreamHandler, so order is important
-            if isinstance(handler, logging.FileHandler):
-                file_handler = handler
+            if isinstance(handler, LogFileQueueHandler):
+                queue_handler = handler
             elif isinstance(handler, logging.StreamHandler):
                 stream_handler = handler
 
         self.assertIsNotNone(stream_handler)
-        self.assertIsNotNone(file_handler)
+        self.assertIsNotNone(queue_handler)
+
+        listener = sat.logging._LOG_FILE_LISTENER
+        self.assertIsNotNone(listener)
+        self.assertIs(listener.queue, queue_handler.queue)
+        self.assertEqual(len(listener.handlers), 1)
+        file_handler = listener.handlers[0]
+        self.assertIsInstance(file_handler, logging.FileHandler)
         return stream_handler, file_handler
 
     def test_bootstrap_logging(self):
@@ -262,6 +290,102 @@ class TestLogging(unittest.TestCase):
         configure_logging()
         mock_makedirs.assert_not_called()
 
+    @mock.patch('os.makedirs')
+    def test_log_file_queued(self, _):
+        """Test that log records from threads are queued and written when the listener stops"""
+        file_handler = MockHandler(logging.NOTSET)
+        with mock.patch('sat.logging.logging.FileHandler', return_value=file_handler):
+            configure_logging()
+
+        queue_handlers = [handler for handler in self.urllib3_logger.handlers
+                          if isinstance(handler, LogFileQueueHandler)]
+        self.assertEqual(1, len(queue_handlers))
+        self.assertIs(sat.logging._LOG_FILE_LISTENER.queue, queue_handlers[0].queue)
+
+        num_messages = 25
+        num_threads = 4
+
+        def log_messages(thread_num):
+            for i in range(num_messages):
+                self.urllib3_logger.debug('Thread %d retrying request %d', thread_num, i)
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            list(executor.map(log_messages, range(num_threads)))
+
+        # Stopping the listener writes all queued records.
+        stop_log_file_listener()
+        self.assertEqual(len(file_handler.messages), num_messages * num_threads)
+        for thread_num in range(num_threads):
+            self.assertIn(f' - DEBUG - urllib3 - Thread {thread_num} retrying request {num_messages - 1}',
+                          '\n'.join(file_handler.messages))
+
+    @unittest.skipIf(os.getenv('SAT_SKIP_PERF_TESTS'), 'SAT_SKIP_PERF_TESTS is set in environment')
+    @mock.patch('os.makedirs')
+    def test_slow_log_file(self, _):
+        """Test that logging threads are not slowed down by a slow log file"""
+        slow_handler = SlowMockHandler(logging.NOTSET)
+        with mock.patch('sat.logging.logging.FileHandler', return_value=slow_handler):
+            configure_logging()
+
+        num_messages = 25
+        num_threads = 4
+
+        def log_messages(thread_num):
+            for i in range(num_messages):
+                self.urllib3_logger.debug('Thread %d retrying request %d', thread_num, i)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            list(executor.map(log_messages, range(num_threads)))
+        duration = time.monotonic() - start
+
+        # Writing the records synchronously would take this long
+        synchronous_duration = num_messages * num_threads * SlowMockHandler.EMIT_DELAY
+        self.assertLess(duration, synchronous_duration / 5,
+                        f'Logging {num_messages * num_threads} messages took {duration:0.2f} '
+                        f'seconds with a log file which takes {synchronous_duration:0.2f} '
+                        f'seconds to write them')
+
+        # Stopping the listener writes all queued records.
+        stop_log_file_listener()
+        self.assertEqual(len(slow_handler.messages), num_messages * num_threads)
+        self.assertIn(' - DEBUG - urllib3 - Thread 0 retrying request 0', slow_handler.messages[0])
+
+
+class TestLogFileQueueHandler(unittest.TestCase):
+    """Tests for the LogFileQueueHandler class"""
+
+    def setUp(self):
+        self.formatter = LineSplittingFormatter('%(levelname)s: %(message)s')
+        self.handler = LogFileQueueHandler(mock.Mock())
+
+    def get_record(self, msg, *args, exc_info=None):
+        """Get a log record with the given message, arguments and exception info"""
+        return logging.LogRecord('sat', logging.ERROR, __file__, 1, msg, args, exc_info)
+
+    def test_prepare_merges_args(self):
+        """Test that the message arguments are merged into the message"""
+        record = self.get_record('Failed to %s %d times', 'connect', 3)
+        prepared = self.handler.prepare(record)
+        self.assertEqual(prepared.msg, 'Failed to connect 3 times')
+        self.assertIsNone(prepared.args)
+        self.assertEqual(self.formatter.format(prepared), 'ERROR: Failed to connect 3 times')
+        # The original record is not changed
+        self.assertEqual(record.args, ('connect', 3))
+
+    def test_prepare_exception(self):
+        """Test that exception text is formatted the same as an unqueued record"""
+        try:
+            raise ValueError('bad value')
+        except ValueError as err:
+            exc_info = (type(err), err, err.__traceback__)
+
+        prepared = self.handler.prepare(self.get_record('Something\nfailed', exc_info=exc_info))
+        self.assertIsNone(prepared.exc_info)
+        self.assertEqual(self.formatter.format(prepared),
+                         self.formatter.format(self.get_record('Something\nfailed', exc_info=exc_info)))
+        self.assertTrue(self.formatter.format(prepared).endswith('ValueError: bad value'))
+
 
 if __name__ == '__main__':
     unittest.main()
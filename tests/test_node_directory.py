@@ -0,0 +1,244 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Unit tests for the sat.node_directory module.
+"""
+import json
+import os
+from tempfile import TemporaryDirectory
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sat.apiclient import APIError
+from sat.node_directory import (
+    ALIASES_SECTION,
+    CACHE_VERSION,
+    COMPONENTS_SECTION,
+    NodeDirectory,
+)
+
+
+def get_components():
+    """Get node components as returned by HSM."""
+    return [
+        {'ID': 'x3000c0s1b0n0', 'NID': 100001, 'Role': 'Management', 'SubRole': 'Master', 'Class': 'River'},
+        {'ID': 'x3000c0s5b0n0', 'NID': 100005, 'Role': 'Management', 'SubRole': 'Worker', 'Class': 'River'},
+        {'ID': 'x1000c0s0b0n0', 'NID': 1, 'Role': 'Compute', 'Class': 'Mountain'},
+        {'ID': 'x1000c0s0b0n1', 'NID': 2, 'Role': 'Compute', 'Class': 'Mountain'},
+        {'NID': 3, 'Role': 'Compute'},
+    ]
+
+
+class TestNodeDirectory(unittest.TestCase):
+    """Tests for the NodeDirectory class."""
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, 'sat', 'node_directory.json')
+
+        self.mock_hsm_client = MagicMock()
+        self.mock_hsm_client.get_node_components.return_value = get_components()
+        self.mock_hsm_client.get.return_value.json.return_value = [
+            {'label': 'blue', 'members': {'ids': ['x1000c0s0b0n0']}},
+            {'label': 'empty'},
+        ]
+        self.mock_sls_client = MagicMock()
+        self.mock_sls_client.get.return_value.json.return_value = [
+            {'Xname': 'x1000c0s0b0n0', 'ExtraProperties': {'Aliases': ['nid000001']}},
+            {'Xname': 'x3000c0s1b0n0', 'ExtraProperties': {'Aliases': ['ncn-m001', 'mgmt1']}},
+            {'Xname': 'x1000c0s0b0n1', 'ExtraProperties': {}},
+        ]
+
+        self.mock_time = patch('sat.node_directory.time.time', return_value=1000.0).start()
+
+    def tearDown(self):
+        patch.stopall()
+        self.tmp_dir.cleanup()
+
+    def get_directory(self, ttl=0):
+        """Get a NodeDirectory using the mock clients."""
+        return NodeDirectory(self.mock_hsm_client, self.mock_sls_client,
+                             ttl=ttl, cache_path=self.cache_path)
+
+    def test_nid_xname_lookups(self):
+        """Test looking up xnames by NID and NIDs by xname with one HSM request"""
+        directory = self.get_directory()
+        self.assertEqual('x1000c0s0b0n1', directory.get_xname(2))
+        self.assertEqual(100005, directory.get_nid('x3000c0s5b0n0'))
+        self.assertEqual({'NID': 3, 'Role': 'Compute'}, directory.get_component_by_nid(3))
+        self.assertIsNone(directory.get_xname(3))
+        self.assertIsNone(directory.get_xname(4))
+        self.assertIsNone(directory.get_nid('x9000c0s0b0n0'))
+        self.mock_hsm_client.get_node_components.assert_called_once_with()
+        self.mock_sls_client.get.assert_not_called()
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_role_and_subrole_members(self):
+        """Test getting the members of roles and subroles"""
+        directory = self.get_directory()
+        self.assertEqual({'x1000c0s0b0n0', 'x1000c0s0b0n1'}, directory.get_role_members('Compute'))
+        self.assertEqual({'x3000c0s5b0n0'}, directory.get_subrole_members('Worker'))
+        self.assertEqual(set(), directory.get_role_members('Application'))
+        self.mock_hsm_client.get_node_components.assert_called_once_with()
+
+    def test_members_case_insensitive(self):
+        """Test that roles, subroles and classes are matched case-insensitively like HSM queries"""
+        directory = self.get_directory()
+        self.assertEqual({'x1000c0s0b0n0', 'x1000c0s0b0n1'}, directory.get_role_members('compute'))
+        self.assertEqual({'x3000c0s1b0n0'}, directory.get_subrole_members('MASTER'))
+        self.assertEqual({'x3000c0s1b0n0', 'x3000c0s5b0n0'}, directory.get_class_members('river'))
+
+    def test_class_members(self):
+        """Test getting the members of classes"""
+        directory = self.get_directory()
+        self.assertEqual({'x1000c0s0b0n0', 'x1000c0s0b0n1'}, directory.get_class_members('Mountain'))
+        self.assertEqual(set(), directory.get_class_members('Hill'))
+        self.mock_hsm_client.get_node_components.assert_called_once_with()
+
+    def test_descendant_xnames(self):
+        """Test getting the xnames of the nodes contained in components"""
+        directory = self.get_directory()
+        self.assertEqual(['x1000c0s0b0n0', 'x1000c0s0b0n1'], directory.get_descendant_xnames('x1000c0s0'))
+        self.assertEqual(['x3000c0s1b0n0'], directory.get_descendant_xnames('x3000c0s1b0n0'))
+        self.assertEqual([], directory.get_descendant_xnames('x1000c1'))
+        self.mock_hsm_client.get_node_components.assert_called_once_with()
+
+    def test_alias_lookups(self):
+        """Test looking up aliases by xname and xnames by alias with one SLS request"""
+        directory = self.get_directory()
+        self.assertEqual('x3000c0s1b0n0', directory.get_xname_by_alias('mgmt1'))
+        self.assertEqual(['nid000001'], directory.get_aliases('x1000c0s0b0n0'))
+        self.assertEqual([], directory.get_aliases('x1000c0s0b0n1'))
+        self.assertIsNone(directory.get_xname_by_alias('ncn-w001'))
+        self.mock_sls_client.get.assert_called_once_with('search', 'hardware',
+                                                         params={'type': 'comptype_node'})
+        self.mock_hsm_client.get_node_components.assert_not_called()
+
+    def test_all_aliases(self):
+        """Test getting the aliases of all nodes"""
+        self.assertEqual({'x1000c0s0b0n0': ['nid000001'], 'x3000c0s1b0n0': ['ncn-m001', 'mgmt1']},
+                         self.get_directory().get_all_aliases())
+        self.mock_sls_client.get.assert_called_once_with('search', 'hardware',
+                                                         params={'type': 'comptype_node'})
+
+    def test_from_session(self):
+        """Test creating a NodeDirectory with new clients for a session"""
+        mock_session = MagicMock()
+        with patch('sat.node_directory.HSMClient') as mock_hsm_client_cls, \
+                patch('sat.node_directory.SLSClient') as mock_sls_client_cls:
+            directory = NodeDirectory.from_session(mock_session)
+        mock_hsm_client_cls.assert_called_once_with(mock_session)
+        mock_sls_client_cls.assert_called_once_with(mock_session)
+        self.assertIs(mock_hsm_client_cls.return_value, directory.hsm_client)
+        self.assertIs(mock_sls_client_cls.return_value, directory.sls_client)
+
+    def test_group_members(self):
+        """Test getting the members of HSM groups"""
+        directory = self.get_directory()
+        self.assertEqual({'x1000c0s0b0n0'}, directory.get_group_members('blue'))
+        self.assertEqual(set(), directory.get_group_members('empty'))
+        self.assertEqual(set(), directory.get_group_members('red'))
+        self.mock_hsm_client.get.assert_called_once_with('groups')
+
+    def test_api_error(self):
+        """Test that an APIError from HSM is raised"""
+        self.mock_hsm_client.get_node_components.side_effect = APIError('HSM failed')
+        with self.assertRaisesRegex(APIError, 'HSM failed'):
+            self.get_directory().get_xname(1)
+
+    def test_bad_sls_json(self):
+        """Test that bad JSON from SLS raises an APIError"""
+        self.mock_sls_client.get.return_value.json.side_effect = ValueError('bad')
+        with self.assertRaisesRegex(APIError, 'Failed to parse JSON from SLS'):
+            self.get_directory().get_aliases('x1000c0s0b0n0')
+
+    def test_cache_reused_within_ttl(self):
+        """Test that a second directory uses the cache file within the TTL"""
+        self.assertEqual('x1000c0s0b0n0', self.get_directory(ttl=60).get_xname(1))
+        with open(self.cache_path) as f:
+            cache = json.load(f)
+        self.assertEqual(CACHE_VERSION, cache['version'])
+        self.assertEqual(get_components(), cache['sections'][COMPONENTS_SECTION]['data'])
+
+        self.mock_time.return_value = 1059.0
+        self.assertEqual('x1000c0s0b0n0', self.get_directory(ttl=60).get_xname(1))
+        self.mock_hsm_client.get_node_components.assert_called_once_with()
+
+    def test_cache_expired(self):
+        """Test that the cache file is not used after the TTL"""
+        self.get_directory(ttl=60).get_xname(1)
+        self.mock_time.return_value = 1061.0
+        self.get_directory(ttl=60).get_xname(1)
+        self.assertEqual(2, self.mock_hsm_client.get_node_components.call_count)
+
+    def test_failed_lookup_invalidates_cache(self):
+        """Test that a failed lookup in cached data reloads the data from the API"""
+        self.get_directory(ttl=60).get_xname(1)
+        components = get_components() + [{'ID': 'x1000c0s1b0n0', 'NID': 5, 'Role': 'Compute'}]
+        self.mock_hsm_client.get_node_components.return_value = components
+
+        directory = self.get_directory(ttl=60)
+        self.assertEqual('x1000c0s1b0n0', directory.get_xname(5))
+        self.assertEqual(2, self.mock_hsm_client.get_node_components.call_count)
+        self.assertIn('x1000c0s1b0n0', directory.get_role_members('Compute'))
+
+        # The reloaded data is not invalidated again by a lookup which fails
+        self.assertIsNone(directory.get_xname(6))
+        self.assertEqual(2, self.mock_hsm_client.get_node_components.call_count)
+
+        # The reloaded data replaces the stale data in the cache file
+        with open(self.cache_path) as f:
+            self.assertEqual(components, json.load(f)['sections'][COMPONENTS_SECTION]['data'])
+
+    def test_invalidate_keeps_other_sections(self):
+        """Test that invalidating one section keeps the others in the cache file"""
+        directory = self.get_directory(ttl=60)
+        directory.get_xname(1)
+        directory.get_aliases('x1000c0s0b0n0')
+        directory.invalidate(COMPONENTS_SECTION)
+
+        with open(self.cache_path) as f:
+            self.assertEqual([ALIASES_SECTION], list(json.load(f)['sections']))
+        directory.get_xname(1)
+        self.assertEqual(2, self.mock_hsm_client.get_node_components.call_count)
+
+    def test_unreadable_cache_ignored(self):
+        """Test that an invalid cache file is ignored and replaced"""
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, 'w') as f:
+            f.write('not json')
+        self.assertEqual('x1000c0s0b0n0', self.get_directory(ttl=60).get_xname(1))
+        with open(self.cache_path) as f:
+            self.assertEqual(CACHE_VERSION, json.load(f)['version'])
+
+    def test_cache_write_failure(self):
+        """Test that a failure to write the cache file is logged"""
+        with patch('sat.node_directory.os.makedirs', side_effect=PermissionError('denied')):
+            with self.assertLogs('sat.node_directory', level='WARNING') as logs:
+                self.assertEqual('x1000c0s0b0n0', self.get_directory(ttl=60).get_xname(1))
+        self.assertIn('Unable to write node directory cache file', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
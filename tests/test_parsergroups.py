@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2020 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2020, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -29,7 +29,7 @@ import os
 import unittest
 from unittest import mock
 
-from sat.parsergroups import create_xname_options
+from sat.parsergroups import create_format_options, create_xname_options
 
 
 xnames_file = os.path.join(os.path.dirname(__file__), 'resources', 'xnames.txt')
@@ -137,5 +137,34 @@ class TestCreateXnameOptions(unittest.TestCase):
         self.assertEqual(expected, args.xnames)
 
 
+class TestCreateFormatOptions(unittest.TestCase):
+    """Tests for the format options."""
+
+    def test_limit_and_offset(self):
+        """Test that --limit and --offset are parsed as integers."""
+        args = create_format_options().parse_args(['--limit', '10', '--offset', '20'])
+        self.assertEqual(10, args.limit)
+        self.assertEqual(20, args.offset)
+
+    def test_limit_and_offset_defaults(self):
+        """Test the default values of --limit and --offset."""
+        args = create_format_options().parse_args([])
+        self.assertIsNone(args.limit)
+        self.assertEqual(0, args.offset)
+
+    def test_invalid_limit(self):
+        """Test that negative or non-integer values of --limit are rejected."""
+        for value in ['-1', 'ten']:
+            with self.subTest(value=value):
+                with self.assertRaises(SystemExit), mock.patch('sys.stderr'):
+                    create_format_options().parse_args(['--limit', value])
+
+    def test_without_limit_options(self):
+        """Test that --limit and --offset can be left out."""
+        args = create_format_options(limit_options=False).parse_args([])
+        self.assertFalse(hasattr(args, 'limit'))
+        self.assertFalse(hasattr(args, 'offset'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -26,6 +26,7 @@ Unit tests for sat/report.py.
 """
 from collections import defaultdict
 from copy import deepcopy
+import heapq
 from itertools import combinations_with_replacement, permutations, repeat
 import unittest
 from unittest.mock import call, Mock, patch
@@ -368,6 +369,21 @@ class TestReportFormatting(unittest.TestCase):
         report = Report(self.headings)
         self.assertEqual('', str(report))
 
+    def test_pretty_print_matches_pretty_table(self):
+        """The pretty format should match the Report's PrettyTable for every style."""
+        for no_borders in [True, False]:
+            for no_headings in [True, False]:
+                with self.subTest(no_borders=no_borders, no_headings=no_headings):
+                    report = Report(self.headings, no_borders=no_borders, no_headings=no_headings)
+                    report.add_rows(self.out_of_order)
+                    self.assertEqual(str(report.get_pretty_table()), str(report))
+
+    def test_pretty_print_wide_characters(self):
+        """The pretty format should fall back to PrettyTable for wide characters."""
+        report = Report(self.headings, no_borders=True)
+        report.add_rows(self.out_of_order + [['\u7231\u4e3d\u4e1d', 'mars', 'red']])
+        self.assertEqual(str(report.get_pretty_table()), str(report))
+
     def test_regular_print(self):
         """The internal PT should not sort.
         """
@@ -636,6 +652,93 @@ class TestReportFormatting(unittest.TestCase):
             self.assertEqual(expected, actual)
 
 
+class TestReportSortingAndLimits(unittest.TestCase):
+    """Tests for sorting Reports with a composite key and selecting rows with limits."""
+
+    def setUp(self):
+        self.headings = ['xname', 'NID', 'State']
+        self.rows = [
+            [XName('x1000c0s1b0n0'), 12, 'Ready'],
+            [XName('x1000c0s10b0n0'), 'MISSING', 'Off'],
+            [XName('x1000c0s2b0n0'), 2, 'Ready'],
+            [XName('x1000c0s1b0n1'), 100, 'Off'],
+            [XName('x1000c0s2b0n1'), 'MISSING', 'Ready'],
+            [XName('x1000c0s1b1n0'), 9, 'Standby'],
+            [XName('x1000c0s3b0n0'), 2, 'Off'],
+        ]
+
+    @staticmethod
+    def multi_pass_sort(rows, sort_by, reverse):
+        """Sort rows with one stable sort per field, as Report previously did."""
+        rows = list(rows)
+        for field in reversed(sort_by):
+            try:
+                rows.sort(key=lambda d: d[field], reverse=reverse)
+            except TypeError:
+                rows.sort(key=lambda d: str(d[field]), reverse=reverse)
+        return rows
+
+    def get_report(self, **kwargs):
+        """Get a Report containing the rows, with the given options."""
+        report = Report(self.headings, no_headings=False, no_borders=False, **kwargs)
+        report.add_rows(self.rows)
+        return report
+
+    def test_composite_sort_matches_multi_pass_sort(self):
+        """Sorting with a composite key matches sorting once per field on mixed-type fields."""
+        for num_fields in range(1, len(self.headings) + 1):
+            for sort_by in permutations(self.headings, num_fields):
+                for reverse in [False, True]:
+                    with self.subTest(sort_by=sort_by, reverse=reverse):
+                        report = self.get_report(sort_by=list(sort_by), reverse=reverse)
+                        expected = self.multi_pass_sort(report.data, sort_by, reverse)
+                        report.sort_data()
+                        self.assertEqual(expected, report.data)
+
+    def test_natural_xname_order(self):
+        """Sorting by xname keeps the natural order of xnames."""
+        report = self.get_report(sort_by=['xname'])
+        _, rows = report.get_rows_to_print()
+        self.assertEqual(['x1000c0s1b0n0', 'x1000c0s1b0n1', 'x1000c0s1b1n0', 'x1000c0s2b0n0',
+                          'x1000c0s2b0n1', 'x1000c0s3b0n0', 'x1000c0s10b0n0'],
+                         [str(row['xname']) for row in rows])
+
+    def test_limit_and_offset_match_slice_of_sorted_rows(self):
+        """The rows selected with a limit and offset match a slice of all the sorted rows."""
+        for sort_by in [None, ['NID'], ['State', 'xname']]:
+            for reverse in [False, True]:
+                _, all_rows = self.get_report(sort_by=sort_by, reverse=reverse).get_rows_to_print()
+                all_xnames = [row['xname'] for row in all_rows]
+                for limit in [0, 1, 3, 10]:
+                    for offset in [0, 2, 10]:
+                        with self.subTest(sort_by=sort_by, reverse=reverse, limit=limit, offset=offset):
+                            report = self.get_report(sort_by=sort_by, reverse=reverse,
+                                                     limit=limit, offset=offset)
+                            _, rows = report.get_rows_to_print()
+                            self.assertEqual(all_xnames[offset:offset + limit], [row['xname'] for row in rows])
+
+    def test_offset_without_limit(self):
+        """An offset without a limit skips rows at the start."""
+        _, rows = self.get_report(sort_by=['xname'], offset=5).get_rows_to_print()
+        self.assertEqual(['x1000c0s3b0n0', 'x1000c0s10b0n0'], [str(row['xname']) for row in rows])
+
+    def test_limit_applies_after_filter(self):
+        """The limit applies to the rows which match the filter."""
+        report = self.get_report(sort_by=['xname'], filter_strs=['state=Off'], limit=2)
+        _, rows = report.get_rows_to_print()
+        self.assertEqual(['x1000c0s1b0n1', 'x1000c0s3b0n0'], [str(row['xname']) for row in rows])
+
+    @patch('sat.report.heapq.nsmallest', wraps=heapq.nsmallest)
+    def test_limit_uses_partial_sort(self, mock_nsmallest):
+        """A limit selects the rows without sorting all of them."""
+        report = self.get_report(sort_by=['NID'], limit=2, offset=1)
+        _, rows = report.get_rows_to_print()
+        mock_nsmallest.assert_called_once()
+        self.assertEqual(3, mock_nsmallest.call_args[0][0])
+        # NID values are a mix of numbers and strings, so they are sorted as strings
+        self.assertEqual(['x1000c0s1b0n0', 'x1000c0s2b0n0'], [str(row['xname']) for row in rows])
+
+
 class TestReportEmptyMissingRemoval(unittest.TestCase):
     """Test the remove_empty_and_missing method."""
 
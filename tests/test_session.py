@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2023-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2023-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -25,11 +25,25 @@
 Tests for SAT session handling
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from tempfile import TemporaryDirectory
+import time
 import unittest
+from unittest.mock import MagicMock, patch
 
 from sat.config import load_config
-from sat.session import TENANT_HEADER_NAME, SATSession
-from tests.common import config
+from sat.http_adapter import TokenBucket
+from sat.session import (
+    TENANT_HEADER_NAME,
+    SATSession,
+    clear_shared_session,
+    get_shared_client,
+    get_shared_session,
+    share_all_sessions,
+)
+from tests.common import FakeServer, config
 
 
 class TestSessionTenantHandling(unittest.TestCase):
@@ -48,3 +62,195 @@ class TestSessionTenantHandling(unittest.TestCase):
         with config({'api_gateway': {'tenant_name': ''}}):
             s = SATSession(no_unauth_err=True)
             self.assertIsNone(s.session.headers.get(TENANT_HEADER_NAME))
+
+
+class TestSessionConnectionPool(unittest.TestCase):
+    def setUp(self):
+        load_config()
+
+    def test_connection_pool_size_from_config(self):
+        """Test that the HTTPAdapter connection pool is sized from the config"""
+        with config({'api_gateway': {'connection_pool_size': 32}}):
+            s = SATSession(no_unauth_err=True)
+        adapter = s.session.get_adapter('https://api-gw-service-nmn.local')
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter._pool_connections, 32)
+
+
+class TestSessionRateLimitRetries(unittest.TestCase):
+    """Tests for retries of rate limited requests through the adapter and retries of SATSession."""
+
+    def setUp(self):
+        load_config()
+        self.mock_acquire = patch.object(TokenBucket, 'acquire', autospec=True,
+                                         side_effect=TokenBucket.acquire).start()
+
+    def tearDown(self):
+        patch.stopall()
+
+    def get_session(self, respond):
+        """Get a rate limited SATSession and a server which responds with `respond`."""
+        self.server = FakeServer(respond)
+        self.addCleanup(self.server.stop)
+        with config({'api_gateway': {'retries': 3, 'backoff': 0, 'rate_limit': 100,
+                                     'rate_limit_burst': 10}}):
+            return SATSession(no_unauth_err=True)
+
+    def get_token_bucket(self, session):
+        """Get the token bucket for the service of the fake server."""
+        return session.session.get_adapter(self.server.url)._token_buckets['smd']
+
+    def assert_retry_after_honored(self, status):
+        """Assert that a response with the given status and Retry-After header pauses requests."""
+        session = self.get_session(lambda count: (0, status, {'Retry-After': '0.3'}) if count < 3
+                                   else (0, 200, {}))
+        start = time.monotonic()
+        response = session.session.get(self.server.url)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, self.server.request_count)
+        self.assertGreaterEqual(elapsed, 0.6)
+        self.assertGreater(self.get_token_bucket(session).paused_until, 0)
+        # Every attempt, including each retry, takes a token.
+        self.assertEqual(3, self.mock_acquire.call_count)
+
+    def test_service_unavailable_retry_after(self):
+        """Test that a 503 response with Retry-After pauses the rate limit before retrying"""
+        self.assert_retry_after_honored(503)
+
+    def test_too_many_requests_retry_after(self):
+        """Test that a 429 response with Retry-After pauses the rate limit before retrying"""
+        self.assert_retry_after_honored(429)
+
+    def test_server_error_retries_take_tokens(self):
+        """Test that retries of server errors without Retry-After each take a token"""
+        session = self.get_session(lambda count: (0, 500 if count < 4 else 200, {}))
+        self.assertEqual(200, session.session.get(self.server.url).status_code)
+        self.assertEqual(4, self.server.request_count)
+        self.assertEqual(4, self.mock_acquire.call_count)
+        self.assertEqual(0, self.get_token_bucket(session).paused_until)
+
+
+class TestSharedSession(unittest.TestCase):
+    def setUp(self):
+        self.mock_sat_session_cls = patch('sat.session.SATSession').start()
+        self.mock_sat_session_cls.side_effect = lambda: MagicMock()
+
+    def tearDown(self):
+        clear_shared_session()
+        patch.stopall()
+
+    def test_get_shared_session_created_once(self):
+        """Test that get_shared_session only creates a single session"""
+        session = get_shared_session()
+        self.assertIs(session, get_shared_session())
+        self.mock_sat_session_cls.assert_called_once_with()
+
+    def test_get_shared_session_threads(self):
+        """Test that get_shared_session returns the same session to all threads"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(executor.map(lambda _: get_shared_session(), range(32)))
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+        self.mock_sat_session_cls.assert_called_once_with()
+
+    def test_get_shared_client_reused(self):
+        """Test that get_shared_client returns the same client for the same class"""
+        mock_client_cls = MagicMock()
+        client = get_shared_client(mock_client_cls)
+        self.assertIs(client, get_shared_client(mock_client_cls))
+        mock_client_cls.assert_called_once_with(get_shared_session())
+
+    def test_get_shared_client_kwargs(self):
+        """Test that get_shared_client creates separate clients for different kwargs"""
+        mock_client_cls = MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+        v1_client = get_shared_client(mock_client_cls, version='v1')
+        v2_client = get_shared_client(mock_client_cls, version='v2')
+        self.assertIsNot(v1_client, v2_client)
+        self.assertIs(v2_client, get_shared_client(mock_client_cls, version='v2'))
+        mock_client_cls.assert_any_call(get_shared_session(), version='v1')
+        mock_client_cls.assert_any_call(get_shared_session(), version='v2')
+
+    def test_get_shared_client_different_classes(self):
+        """Test that clients of different classes share a single session"""
+        mock_hsm_client_cls = MagicMock()
+        mock_pcs_client_cls = MagicMock()
+        get_shared_client(mock_hsm_client_cls)
+        get_shared_client(mock_pcs_client_cls)
+        self.assertIs(mock_hsm_client_cls.call_args.args[0], mock_pcs_client_cls.call_args.args[0])
+
+    def test_clear_shared_session(self):
+        """Test that clear_shared_session closes the session and discards clients"""
+        mock_client_cls = MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+        session = get_shared_session()
+        client = get_shared_client(mock_client_cls)
+        clear_shared_session()
+        session.session.close.assert_called_once_with()
+        self.assertIsNot(session, get_shared_session())
+        self.assertIsNot(client, get_shared_client(mock_client_cls))
+
+
+class TestShareAllSessions(unittest.TestCase):
+    def setUp(self):
+        load_config()
+        self.tmp_dir = TemporaryDirectory()
+        self.token_file = os.path.join(self.tmp_dir.name, 'token.json')
+        with open(self.token_file, 'w') as f:
+            json.dump({'access_token': 'token'}, f)
+        self.mock_close = patch('sat.session.clear_shared_session', wraps=clear_shared_session).start()
+
+    def tearDown(self):
+        patch.stopall()
+        self.tmp_dir.cleanup()
+
+    def test_sessions_shared_in_context(self):
+        """Test that every SATSession created in the context is the same session"""
+        with config({'api_gateway': {'token_file': self.token_file}}):
+            with share_all_sessions():
+                session = SATSession(no_unauth_err=True)
+                self.assertIs(session, SATSession(no_unauth_err=True))
+                self.assertIs(session, get_shared_session())
+        self.mock_close.assert_called_once_with()
+
+    def test_session_created_with_config_on_entry(self):
+        """Test that the shared session uses the config in effect when entering the context"""
+        with config({'api_gateway': {'token_file': self.token_file, 'username': 'batch_user'}}):
+            with share_all_sessions():
+                with config({'api_gateway': {'username': 'command_user'}}):
+                    self.assertEqual('batch_user', SATSession().username)
+
+    def test_shared_session_not_reinitialized(self):
+        """Test that the shared session is only initialized once"""
+        with config({'api_gateway': {'token_file': self.token_file}}):
+            with share_all_sessions():
+                session = get_shared_session()
+                with patch('sat.session.get_config_value') as mock_get_config_value:
+                    SATSession(no_unauth_err=True)
+                mock_get_config_value.assert_not_called()
+                self.assertIsNotNone(session.session.get_adapter('https://api-gw-service-nmn.local'))
+
+    def test_sessions_not_shared_outside_context(self):
+        """Test that new sessions are created before and after the context"""
+        with config({'api_gateway': {'token_file': self.token_file}}):
+            with share_all_sessions():
+                shared_session = SATSession(no_unauth_err=True)
+        self.assertIsNot(shared_session, SATSession(no_unauth_err=True))
+        self.assertIsNot(SATSession(no_unauth_err=True), SATSession(no_unauth_err=True))
+
+    def test_reset_request_deadline(self):
+        """Test that resetting the request deadline resets it in the session's adapter"""
+        with config({'api_gateway': {'token_file': self.token_file, 'request_deadline': 10}}):
+            session = SATSession()
+        adapter = session.session.get_adapter('https://api-gw-service-nmn.local')
+        adapter.deadline = 0
+        session.reset_request_deadline()
+        self.assertGreater(adapter.deadline, 0)
+
+    def test_unauthenticated(self):
+        """Test that entering the context fails if the session is not authenticated"""
+        missing_token_file = os.path.join(self.tmp_dir.name, 'missing.json')
+        with config({'api_gateway': {'token_file': missing_token_file}}):
+            with self.assertLogs(level='ERROR'):
+                with self.assertRaises(SystemExit):
+                    with share_all_sessions():
+                        pass
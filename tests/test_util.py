@@ -1,7 +1,7 @@
 #
 # MIT License
 #
-# (C) Copyright 2019-2024 Hewlett Packard Enterprise Development LP
+# (C) Copyright 2019-2024, 2026 Hewlett Packard Enterprise Development LP
 #
 # Permission is hereby granted, free of charge, to any person obtaining a
 # copy of this software and associated documentation files (the "Software"),
@@ -26,14 +26,19 @@ Unit tests for sat/util.py.
 """
 import copy
 from collections import OrderedDict
+from io import StringIO
 from itertools import combinations, repeat
+import json
 import logging
 import os
 from textwrap import dedent
+import time
 from unittest import mock
 import unittest
 from unittest.mock import call, patch
 
+from prettytable import PrettyTable
+
 from sat import util
 from tests.common import ExtendedTestCase
 
@@ -41,6 +46,7 @@ PT_BORDERS_ON = False
 PT_ALIGN = 'l'
 PT_L_PAD_WIDTH = 1
 SORT_BY = 1
+TABLES_DIR = os.path.join(os.path.dirname(__file__), 'resources', 'tables')
 
 
 class TestPrettyTables(unittest.TestCase):
@@ -114,6 +120,75 @@ class TestPrettyTables(unittest.TestCase):
         self.assertTrue(all(pt.align[x] == PT_ALIGN for x in pt.align))
 
 
+class TestWriteFixedWidthTable(unittest.TestCase):
+    """Tests for the write_fixed_width_table function."""
+
+    def setUp(self):
+        self.headings = ['xname', 'Type', 'NID', 'State', 'Role']
+        self.rows = [['x3000c0s1b0n0', 'Node', '100001', 'Ready', 'Management'],
+                     ['x1000c0s0b0n0', 'Node', '1', 'Off', 'Compute'],
+                     ['x1000c0s0b0n1', 'Node', '2', 'Standby', ''],
+                     ['x1000c0s0b1', 'NodeBMC', 'MISSING', 'Ready', 'MISSING']]
+
+    def get_pretty_table_output(self, rows, border, header, align='l'):
+        """Get the output of a PrettyTable with the given rows and options."""
+        pt = PrettyTable()
+        pt.field_names = self.headings
+        pt.border = border
+        pt.header = header
+        for heading in self.headings:
+            pt.align[heading] = align
+        for row in rows:
+            pt.add_row(row)
+        return str(pt)
+
+    def get_fixed_width_table_output(self, rows, border, header, align='l'):
+        """Get the output of write_fixed_width_table with the given rows and options."""
+        stream = StringIO()
+        written = util.write_fixed_width_table(stream, rows, headings=self.headings if header else None,
+                                               border=border, align=align)
+        self.assertTrue(written)
+        return stream.getvalue()
+
+    def test_golden_tables(self):
+        """Test that both PrettyTable and write_fixed_width_table produce the expected tables."""
+        for border in [True, False]:
+            for header in [True, False]:
+                file_name = (f'{"bordered" if border else "borderless"}_'
+                             f'{"headings" if header else "no_headings"}.txt')
+                with open(os.path.join(TABLES_DIR, file_name)) as f:
+                    expected = f.read().rstrip('\n')
+                with self.subTest(file_name=file_name):
+                    self.assertEqual(expected, self.get_pretty_table_output(self.rows, border, header))
+                    self.assertEqual(expected, self.get_fixed_width_table_output(self.rows, border, header))
+
+    def test_right_aligned(self):
+        """Test that right-aligned tables match PrettyTable."""
+        for border in [True, False]:
+            with self.subTest(border=border):
+                self.assertEqual(self.get_pretty_table_output(self.rows, border, True, align='r'),
+                                 self.get_fixed_width_table_output(self.rows, border, True, align='r'))
+
+    def test_single_row(self):
+        """Test that a table with a single row and no headings matches PrettyTable."""
+        for border in [True, False]:
+            with self.subTest(border=border):
+                self.assertEqual(self.get_pretty_table_output(self.rows[:1], border, False),
+                                 self.get_fixed_width_table_output(self.rows[:1], border, False))
+
+    def test_unsupported_tables(self):
+        """Test that tables which PrettyTable would format differently are not written."""
+        wide_row = ['x1000c0s0b0n0', 'Node', '1', 'Ready', '\u8ba1\u7b97']
+        multiline_row = ['x1000c0s0b0n0', 'Node', '1', 'Ready', 'Compute\nUAN']
+        colored_row = ['x1000c0s0b0n0', 'Node', '1', '\x1b[32mReady\x1b[0m', 'Compute']
+        for rows, align in [([wide_row], 'l'), ([multiline_row], 'l'), ([colored_row], 'l'),
+                            (self.rows, 'c'), ([], 'l')]:
+            with self.subTest(rows=rows, align=align):
+                stream = StringIO()
+                self.assertFalse(util.write_fixed_width_table(stream, rows, headings=self.headings, align=align))
+                self.assertEqual('', stream.getvalue())
+
+
 class TestMiscFormatters(unittest.TestCase):
     def test_get_rst_header(self):
         """Test the header string for the given header level is correct."""
@@ -234,6 +309,53 @@ class TestBytesToGibibytes(unittest.TestCase):
         self.assertEqual(util.bytes_to_gib(bytes_val, 4), 468.8506)
 
 
+class TestIterJsonArray(unittest.TestCase):
+    """Test the iter_json_array function."""
+
+    def setUp(self):
+        self.elements = [
+            {'ID': f'x3000c0s{i}b0n0', 'Type': 'Node', 'Count': i, 'Note': 'caf\u00e9 "[,]"'}
+            for i in range(50)
+        ] + [12345, 1.5e3, [], {}, 'str', None, True]
+        self.text = json.dumps(self.elements)
+
+    @staticmethod
+    def split(text, size):
+        """Split text into chunks of the given size."""
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    def test_str_chunks(self):
+        """Test iterating over an array split into str chunks of various sizes"""
+        for size in (1, 2, 7, 64, len(self.text)):
+            with self.subTest(size=size):
+                self.assertEqual(self.elements, list(util.iter_json_array(self.split(self.text, size))))
+
+    def test_bytes_chunks(self):
+        """Test iterating over UTF-8 bytes chunks which split multi-byte characters"""
+        data = self.text.encode()
+        for size in (1, 3, 64):
+            with self.subTest(size=size):
+                self.assertEqual(self.elements, list(util.iter_json_array(self.split(data, size))))
+
+    def test_empty_array(self):
+        """Test iterating over an empty array with surrounding whitespace"""
+        self.assertEqual([], list(util.iter_json_array([' [ ', '\n] '])))
+
+    def test_invalid_arrays(self):
+        """Test that invalid JSON arrays raise ValueError"""
+        for text in ('', '{}', '[1,]', '[1 2]', '[1', '[1]x', '[,1]', '[}'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    list(util.iter_json_array(self.split(text, 1)))
+
+    def test_lazy(self):
+        """Test that elements are yielded before the whole array is read"""
+        chunks = iter(['[{"a": 1}, ', '{"b": 2}', ']'])
+        elements = util.iter_json_array(chunks)
+        self.assertEqual({'a': 1}, next(elements))
+        self.assertEqual('{"b": 2}', next(chunks))
+
+
 class TestGetValByPath(unittest.TestCase):
     """Test the get_val_by_path function."""
 
@@ -268,6 +390,92 @@ class TestGetValByPath(unittest.TestCase):
         self.assertIsNone(util.get_val_by_path(d, 'foo.bar'))
 
 
+class TestCompilePath(unittest.TestCase):
+    """Test the compile_path function."""
+
+    def setUp(self):
+        self.data = {
+            'foo': {
+                'bar': {
+                    'baz': 'bat'
+                },
+                'empty': {},
+                'none': None,
+            },
+            'top': 'level',
+        }
+
+    def test_same_as_get_val_by_path(self):
+        """Test that compiled paths get the same values as get_val_by_path."""
+        for path in ['top', 'foo', 'foo.bar.baz', 'foo.empty.key', 'foo.none.key',
+                     'nope', 'does.not.exist']:
+            with self.subTest(path=path):
+                get_val = util.compile_path(path)
+                self.assertEqual(util.get_val_by_path(self.data, path), get_val(self.data))
+                self.assertEqual(util.get_val_by_path(self.data, path, 'DNE'), get_val(self.data, 'DNE'))
+
+    def test_compiled_values(self):
+        """Test the values of compiled paths."""
+        self.assertEqual('level', util.compile_path('top')(self.data))
+        self.assertEqual('bat', util.compile_path('foo.bar.baz')(self.data))
+        self.assertEqual('DNE', util.compile_path('foo.none.key')(self.data, 'DNE'))
+        self.assertIsNone(util.compile_path('nope')(self.data))
+        self.assertIsNone(util.compile_path('nope')(None))
+
+    def test_compiled_paths_cached(self):
+        """Test that compiling the same path twice returns the same function."""
+        self.assertIs(util.compile_path('foo.bar.baz'), util.compile_path('foo.bar.baz'))
+
+    def test_get_val_by_path_compiles_once(self):
+        """Test that repeated lookups of a path reuse the compiled path."""
+        util.compile_path.cache_clear()
+        for _ in range(10):
+            util.get_val_by_path(self.data, 'foo.bar.baz')
+        cache_info = util.compile_path.cache_info()
+        self.assertEqual(1, cache_info.misses)
+        self.assertEqual(9, cache_info.hits)
+
+    @unittest.skipIf(os.getenv('SAT_SKIP_PERF_TESTS'), 'SAT_SKIP_PERF_TESTS is set in environment')
+    def test_compiled_path_performance(self):
+        """Test that compiled paths are faster than splitting the path for each value."""
+        def split_get_val_by_path(dict_val, dotted_path, default_value=None):
+            # The implementation of get_val_by_path before paths were compiled
+            current_val = dict_val
+            for key in dotted_path.split('.'):
+                if current_val and key in current_val:
+                    current_val = current_val[key]
+                else:
+                    return default_value
+            return current_val
+
+        num_rows = 100000
+        paths = [f'section{i % 4}.group{i % 5}.field{i}' for i in range(20)]
+        row_template = {}
+        for path in paths:
+            util.set_val_by_path(row_template, path, None)
+        distinct_rows = [
+            {section: {group: dict.fromkeys(fields, row_num) for group, fields in groups.items()}
+             for section, groups in row_template.items()}
+            for row_num in range(100)
+        ]
+        rows = [distinct_rows[row_num % len(distinct_rows)] for row_num in range(num_rows)]
+
+        start_time = time.perf_counter()
+        expected = [[split_get_val_by_path(row, path) for path in paths] for row in rows]
+        split_duration = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        getters = [util.compile_path(path) for path in paths]
+        result = [[get_val(row) for get_val in getters] for row in rows]
+        compiled_duration = time.perf_counter() - start_time
+
+        self.assertEqual(expected, result)
+        self.assertLess(compiled_duration, split_duration,
+                        f'Getting {len(paths)} compiled paths from {num_rows} rows took '
+                        f'{compiled_duration:0.2f} seconds, compared to {split_duration:0.2f} '
+                        f'seconds when splitting the paths for each row')
+
+
 class TestSetValByPath(unittest.TestCase):
     """Tests for set_val_by_path"""
 